@@ -123,8 +123,12 @@ mcp = FastMCP(
     instructions=(
         "Tools for reading data from Expense Manager Service (EMS). "
         "Use list_accounts / list_periods to discover available data. "
-        "Use list_spending_entries or list_spending_entries_for_account to fetch "
-        "balance and spending data, optionally filtered by month, year, or account name."
+        "For totals and trends, use get_spending_totals (grouped by month, year or "
+        "account, with an optional rolling average) or get_spending_summary (overall, "
+        "per-year, per-month and per-account totals in one call) instead of paging "
+        "through entries. Use list_spending_entries or list_spending_entries_for_account "
+        "to fetch individual balance and spending entries, optionally filtered by month, "
+        "year, or account name."
     ),
     auth=auth_provider,
     lifespan=mcp_lifespan,
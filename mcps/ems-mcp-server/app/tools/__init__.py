@@ -65,6 +65,8 @@ from app.tools.spending_entries import (
     add_spending_entry,
     delete_spending_entry,
     edit_spending_entry,
+    get_spending_summary,
+    get_spending_totals,
     list_spending_entries,
     list_spending_entries_for_account,
 )
@@ -127,6 +129,8 @@ __all__ = [
     "add_spending_entry",
     "delete_spending_entry",
     "edit_spending_entry",
+    "get_spending_summary",
+    "get_spending_totals",
     "list_spending_entries",
     "list_spending_entries_for_account",
     "get_historical_net_worth",
@@ -82,6 +82,61 @@ async def list_spending_entries_for_account(
     )
 
 
+async def get_spending_totals(
+    group_by: Annotated[
+        str,
+        "Dimension to aggregate by. Must be exactly one of: 'month', 'year', 'account'. Defaults to 'month'.",
+    ] = "month",
+    rolling_window: Annotated[
+        int | None,
+        "Trailing number of months/years (2-36) to average totalSpent over. Ignored for 'account'. Omit for none.",
+    ] = None,
+    month: Annotated[
+        int | None, "Filter by month (1-12). Omit to include all months."
+    ] = None,
+    year: Annotated[
+        int | None, "Filter by year (e.g. 2025). Omit to include all years."
+    ] = None,
+    account_name: Annotated[
+        str | None, "Filter by account name (e.g. 'ICICI'). Omit for all accounts."
+    ] = None,
+) -> dict[str, Any]:
+    """Retrieve spending totals aggregated by month, year or account, computed by EMS.
+
+    Prefer this over paging through list_spending_entries for trends and totals.
+    Each total includes: accountName, year, month, totalSpent, totalCredit,
+    entryCount and rollingAverageSpent (when rolling_window is given).
+    """
+    params = clean_params(
+        groupBy=group_by,
+        rollingWindow=rolling_window,
+        month=month,
+        year=year,
+        accountName=account_name,
+    )
+    return await request_ems("GET", "/v1/spending_account/totals", params=params)
+
+
+async def get_spending_summary(
+    month: Annotated[
+        int | None, "Filter by month (1-12). Omit to include all months."
+    ] = None,
+    year: Annotated[
+        int | None, "Filter by year (e.g. 2025). Omit to include all years."
+    ] = None,
+    account_name: Annotated[
+        str | None, "Filter by account name (e.g. 'ICICI'). Omit for all accounts."
+    ] = None,
+) -> dict[str, Any]:
+    """Retrieve overall, per-year, per-month and per-account spending totals in one call.
+
+    Returns total, byYear, byMonth and byAccount, each with totalSpent,
+    totalCredit and entryCount.
+    """
+    params = clean_params(month=month, year=year, accountName=account_name)
+    return await request_ems("GET", "/v1/spending_account/summary", params=params)
+
+
 async def add_spending_entry(
     account_name: Annotated[str, "Name of the spending account"],
     month: Annotated[int, "Month of the entry (1-12)"],
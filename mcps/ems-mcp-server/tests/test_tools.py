@@ -48,6 +48,8 @@ from app.tools.spending_entries import (
     add_spending_entry,
     delete_spending_entry,
     edit_spending_entry,
+    get_spending_summary,
+    get_spending_totals,
     list_spending_entries,
     list_spending_entries_for_account,
 )
@@ -206,6 +208,25 @@ async def test_spending_entries_tools(ems_url: str) -> None:
     res = await list_spending_entries_for_account("acc1")
     assert "spending_entries" in res
 
+    # Totals
+    respx.get(
+        f"{ems_url}/v1/spending_account/totals?groupBy=year&rollingWindow=3&accountName=ICICI"
+    ).mock(
+        return_value=Response(status_code=200, json={"groupBy": "year", "totals": []})
+    )
+    res = await get_spending_totals(group_by="year", rolling_window=3, account_name="ICICI")
+    assert res["groupBy"] == "year"
+
+    # Summary
+    respx.get(f"{ems_url}/v1/spending_account/summary?year=2026").mock(
+        return_value=Response(
+            status_code=200,
+            json={"total": {}, "byYear": [], "byMonth": [], "byAccount": []},
+        )
+    )
+    res = await get_spending_summary(year=2026)
+    assert "byAccount" in res
+
     # Add Entry
     json_payload = {
         "account_name": "ICICI",
@@ -0,0 +1,32 @@
+#!/usr/bin/env bash
+# Runs expense-manager-service performance benchmarks against a seeded database.
+#
+# Usage:
+#   scripts/run-benchmarks.sh            Compare against the latest stored baseline and fail on regressions
+#   scripts/run-benchmarks.sh --save     Record a new baseline
+#
+# Environment:
+#   EMS_BENCH_DATABASE_URL     Database to seed (default: the unit test database). All tables are dropped.
+#   EMS_BENCH_ROUNDS           Rounds per benchmark (default: 5)
+#   EMS_BENCH_MAX_REGRESSION   Allowed mean slowdown in percent before failing (default: 25)
+
+set -euo pipefail
+
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+SERVICE_DIR="$REPO_ROOT/services/expense-manager-service"
+MAX_REGRESSION="${EMS_BENCH_MAX_REGRESSION:-25}"
+
+cd "$SERVICE_DIR"
+
+if [[ "${1:-}" == "--save" ]]; then
+    shift
+    echo "Recording benchmark baseline..."
+    uv run --group test --group bench pytest -c benchmarks/pytest.ini benchmarks --benchmark-save=baseline "$@"
+elif ls benchmarks/.baselines/*/*.json >/dev/null 2>&1; then
+    echo "Running benchmarks against stored baseline (max mean regression: ${MAX_REGRESSION}%)..."
+    uv run --group test --group bench pytest -c benchmarks/pytest.ini benchmarks \
+        --benchmark-compare --benchmark-compare-fail="mean:${MAX_REGRESSION}%" "$@"
+else
+    echo "No stored baseline found; run with --save first. Running benchmarks without comparison..."
+    uv run --group test --group bench pytest -c benchmarks/pytest.ini benchmarks "$@"
+fi
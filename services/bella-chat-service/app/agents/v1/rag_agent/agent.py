@@ -1,6 +1,7 @@
 """RAG agent for handling retrieval-augmented generation tasks."""
 
 import json
+import time
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -8,6 +9,7 @@ from typing import (
 from uuid import uuid4
 
 from langchain_core.messages import (
+    AIMessage,
     HumanMessage,
     SystemMessage,
 )
@@ -23,7 +25,10 @@ from app.agents.v1.rag_agent.prompts import (
     GENERATE_RESPONSE_PROMPT_TEMPLATE,
     RAG_AGENT_SYSTEM_PROMPT,
 )
+from app.core.answer_cache import CachedAnswer, document_ids
 from app.dependencies.ai_dependencies import (
+    answer_cache_scope,
+    get_app_answer_cache,
     get_app_vector_store,
 )
 from utilities.logger import GetAppLogger
@@ -52,6 +57,7 @@ class RAGAgent(BaseAgent):
         """
         super().__init__(model=model)
         self.vector_store = get_app_vector_store()
+        self.answer_cache = get_app_answer_cache()
         self._logger = GetAppLogger().get_logger()
 
     def _compile(self):
@@ -74,7 +80,7 @@ class RAGAgent(BaseAgent):
             dict: A dictionary containing relevant contexts.
         """
         question = state["messages"][-1].content
-        relevant_docs = self.vector_store.similarity_search(query=question, k=3)
+        relevant_docs = await self.vector_store.asimilarity_search_with_score(query=question, k=3)
         self._logger.debug(f"Found {len(relevant_docs)} relevant documents for the question.")
 
         return {"retrieved_nodes": relevant_docs}
@@ -119,9 +125,28 @@ class RAGAgent(BaseAgent):
         if len(state["messages"]) > 1:
             messages += state["messages"][:-1]
 
+        # Follow-up questions depend on the earlier messages, so only standalone questions use the answer cache
+        question = state["messages"][-1].content
+        doc_ids = document_ids([doc for doc, _score in state["retrieved_nodes"]])
+        answer_cache = self.answer_cache if len(state["messages"]) == 1 else None
+        if answer_cache is not None:
+            cached = await answer_cache.lookup(answer_cache_scope("rag_agent"), question, doc_ids)
+            if cached is not None:
+                return {"messages": [AIMessage(content=cached.answer)], "sources": cached.sources}
+
         _logger.info("Generating response for your query...")
+        started_at = time.perf_counter()
+        response = await self.model.ainvoke(messages)
+        if answer_cache is not None:
+            entry = CachedAnswer(
+                question=question,
+                answer=response.text,
+                generation_ms=(time.perf_counter() - started_at) * 1000,
+                sources=sources_list,
+            )
+            await answer_cache.store(answer_cache_scope("rag_agent"), entry, doc_ids)
         return {
-            "messages": [await self.model.ainvoke(messages)],
+            "messages": [response],
             "sources": sources_list,
         }
 
@@ -36,6 +36,15 @@ class SimpleChatAgent(BaseAgent):
         """
         super().__init__(model=model)
 
+    def _compile(self):
+        """Compile the simple chat agent without a checkpointer for per-invocation pattern.
+
+        When it answers turns routed off the deep agent, the conversation lives in the deep agent's thread, so
+        the simple chat agent keeps no memory of its own. Each call starts fresh with the messages it is given.
+        """
+        if self.graph:
+            self.chain = self.graph.compile(checkpointer=None)
+
     async def _generate_response(self, state: State) -> dict:
         """Generate a response based on user input.
 
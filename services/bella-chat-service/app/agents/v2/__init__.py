@@ -1,5 +1,21 @@
 """V2 Deep Agents package initialization."""
 
-from app.agents.v2.deep_orchestrator import create_deep_orchestrator_agent, stream_deep_agent
+from app.agents.v2.deep_orchestrator import (
+    DeepAgentContext,
+    create_deep_orchestrator_agent,
+    stream_deep_agent,
+    stream_routed_turn,
+)
+from app.agents.v2.routing import Route, RouteDecision, TurnRouter
+from app.agents.v2.streaming import StreamFraming
 
-__all__ = ["create_deep_orchestrator_agent", "stream_deep_agent"]
+__all__ = [
+    "DeepAgentContext",
+    "Route",
+    "RouteDecision",
+    "StreamFraming",
+    "TurnRouter",
+    "create_deep_orchestrator_agent",
+    "stream_deep_agent",
+    "stream_routed_turn",
+]
@@ -0,0 +1,112 @@
+"""Semantic answer cache for the knowledge_wiki sub-agent.
+
+The sub-agent receives one task description from the orchestrator and answers it from the wiki. Before it starts,
+`AnswerCacheMiddleware` retrieves the wiki points for the task, as the retriever tool would, and looks up a cached
+answer to a similar task retrieving the same points. On a hit, the sub-agent ends at once with that answer; on a miss,
+its final answer is cached when it finishes, under the same points the lookup compared.
+
+The sub-agent may search with its own queries, so the points its retriever calls returned, the ones the answer was
+generated from, are stored with the entry as its sources. When one of them changes, its point id changes, the source
+no longer exists and the entry is not served.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, NotRequired
+
+from langchain.agents.middleware import AgentMiddleware, AgentState, hook_config
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.core.answer_cache import CachedAnswer, document_ids
+
+if TYPE_CHECKING:
+    from langgraph.runtime import Runtime
+
+    from app.core.answer_cache import SemanticAnswerCache
+    from app.core.vector_store import CustomQdrantVectorStore
+
+
+class AnswerCacheState(AgentState):
+    """Agent state extended with what is needed to cache the answer after a miss."""
+
+    answer_cache_doc_ids: NotRequired[list[str]]
+    answer_cache_started_at: NotRequired[float]
+
+
+def _task(state: AgentState) -> str | None:
+    """The task description the sub-agent was started with."""
+    messages = state["messages"]
+    if len(messages) != 1 or not isinstance(messages[0], HumanMessage):
+        return None
+    return messages[0].text or None
+
+
+def _retrieved_doc_ids(messages: list) -> list[str]:
+    """Point ids of the documents returned by the sub-agent's retriever calls, in order of first retrieval."""
+    ids: list[str] = []
+    for message in messages:
+        if isinstance(message, ToolMessage) and isinstance(message.artifact, list):
+            ids += document_ids([doc for doc in message.artifact if isinstance(doc, Document)])
+    return list(dict.fromkeys(ids))
+
+
+class AnswerCacheMiddleware(AgentMiddleware[AnswerCacheState]):
+    """Answer a sub-agent task from the semantic answer cache, and cache the answers it generates."""
+
+    state_schema = AnswerCacheState
+
+    def __init__(self, cache: SemanticAnswerCache, vector_store: CustomQdrantVectorStore, scope: str, k: int = 3):
+        """Initialize the middleware.
+
+        Args:
+            cache (SemanticAnswerCache): Where answers are looked up and stored.
+            vector_store (CustomQdrantVectorStore): The wiki vector store the sub-agent retrieves from.
+            scope (str): Scope of the cached answers, e.g. from `answer_cache_scope`.
+            k (int): Documents retrieved per task; matches the retriever tool. Defaults to 3.
+        """
+        super().__init__()
+        self.cache = cache
+        self.vector_store = vector_store
+        self.scope = scope
+        self.k = k
+
+    async def _sources_exist(self, ids: list[str]) -> bool:
+        """Whether every wiki point an answer was generated from is still indexed."""
+        return len(await self.vector_store.aget_by_ids(ids)) == len(set(ids))
+
+    @hook_config(can_jump_to=["end"])
+    async def abefore_agent(self, state: AnswerCacheState, runtime: Runtime) -> dict[str, Any] | None:
+        """End with the cached answer on a hit; otherwise remember the retrieved documents."""
+        task = _task(state)
+        if task is None:
+            return None
+        docs = await self.vector_store.asimilarity_search_with_score(task, k=self.k)
+        doc_ids = document_ids([doc for doc, _score in docs])
+        cached = await self.cache.lookup(self.scope, task, doc_ids, sources_exist=self._sources_exist)
+        if cached is not None:
+            return {"messages": [AIMessage(content=cached.answer)], "jump_to": "end"}
+        return {"answer_cache_doc_ids": doc_ids, "answer_cache_started_at": time.perf_counter()}
+
+    async def aafter_agent(self, state: AnswerCacheState, runtime: Runtime) -> dict[str, Any] | None:
+        """Cache the final answer of a task that missed the cache, with the documents it was generated from."""
+        task = _task({"messages": state["messages"][:1]})
+        doc_ids = state.get("answer_cache_doc_ids")
+        started_at = state.get("answer_cache_started_at")
+        final = state["messages"][-1]
+        if task is None or doc_ids is None or started_at is None:
+            return None
+        if not isinstance(final, AIMessage) or final.tool_calls:
+            return None
+        # An answer that retrieved nothing is not grounded in the wiki, so there is nothing to invalidate it by
+        source_ids = _retrieved_doc_ids(state["messages"])
+        if not source_ids:
+            return None
+        entry = CachedAnswer(
+            question=task,
+            answer=final.text,
+            generation_ms=(time.perf_counter() - started_at) * 1000,
+        )
+        await self.cache.store(self.scope, entry, doc_ids, source_ids=source_ids)
+        return None
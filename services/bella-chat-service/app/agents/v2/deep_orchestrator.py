@@ -2,31 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from deepagents import create_deep_agent
-from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 from langgraph.types import Command
 
+from app.agents.v2.fan_out import FanOutMiddleware, ToolTimeouts
+from app.agents.v2.streaming import ResponseCoalescer, StreamFraming
 from app.agents.v2.tools.retrieval import get_personal_wiki_retriever_tool
+from app.core.llms.admission import llm_queue_listener
+from app.core.llms.metrics import LLMTurnMetrics
+from app.settings import get_settings
 from utilities.logger import GetAppLogger
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, AsyncIterator
 
     from langchain_core.language_models.chat_models import BaseChatModel
     from langchain_core.tools import BaseTool
     from langgraph.checkpoint.base import BaseCheckpointSaver
 
+    from app.agents.v1.base_agent import BaseAgent
+    from app.agents.v2.answer_cache import AnswerCacheMiddleware
+    from app.agents.v2.history import ConversationHistory
+
 _logger = GetAppLogger().get_logger()
 
+DEEP_ORCHESTRATOR_NAME = "bella_deep_agent"
+
+# Graph items read ahead of the SSE writer while response tokens are being coalesced
+_STREAM_QUEUE_SIZE = 256
+_END_OF_STREAM = object()
+# Node a routed turn's exchange is recorded as, so the thread looks like the model answered it
+_MODEL_NODE = "model"
+
 DEEP_ORCHESTRATOR_PROMPT = """You are Bella v2, an advanced AI Personal Assistant.
 Coordinate tasks using specialized sub-agents (expense_analyst, knowledge_wiki) and tools to help the user.
+When a request needs several independent pieces of work, such as an expense figure and a wiki fact, or two lookups
+that do not depend on each other's results, issue all of their sub-agent tasks and tool calls together in one step:
+they run at the same time. Only wait for a result first when the next call needs it.
 """
 
 
+@dataclass(frozen=True)
+class DeepAgentContext:
+    """Per-invocation runtime context for the deep orchestrator.
+
+    Passed to `astream` as LangGraph runtime context rather than baked into the tools, so a single
+    compiled graph can serve every user. Runtime context is not persisted in checkpoints. `framing` is read
+    by the stream functions to coalesce response tokens into SSE frames, and `route` names the path that
+    answers the turn in the `done` frame.
+    """
+
+    ems_access_token: str | None = None
+    framing: StreamFraming = StreamFraming()
+    route: str = "deep"
+
+
 def _sse(event_type: str, **fields: object) -> str:
     """Format an SSE frame."""
     return f"data: {json.dumps({'type': event_type, **fields})}\n\n"
@@ -36,22 +75,39 @@ def create_deep_orchestrator_agent(
     model: BaseChatModel,
     mcp_tools: list[BaseTool],
     checkpointer: BaseCheckpointSaver,
+    history: ConversationHistory | None = None,
+    wiki_answer_cache: AnswerCacheMiddleware | None = None,
 ):
-    """Create a native Deep Agent using deepagents.create_deep_agent."""
+    """Create a native Deep Agent using deepagents.create_deep_agent.
+
+    When `history` is given, the orchestrator keeps a bounded history with a rolling summary, and tool results are
+    trimmed for the orchestrator and its sub-agents. When `wiki_answer_cache` is given, the knowledge_wiki sub-agent
+    serves cached answers to near-duplicate tasks whose wiki documents have not changed.
+
+    Sub-agent tasks and tool calls issued in one step run concurrently, each within the `SUBAGENT_TIMEOUT_S` or
+    `TOOL_TIMEOUT_S` limit; sub-agent tasks report their progress as `subagent_call` custom stream events.
+    """
     retriever_tool = get_personal_wiki_retriever_tool()
+    fan_out = FanOutMiddleware(ToolTimeouts.from_settings(get_settings()))
+    subagent_middleware = [history.tool_result_middleware, fan_out] if history else [fan_out]
 
     subagents = [
         {
             "name": "expense_analyst",
             "description": "Queries financial records, expense summaries, and budget entries.",
-            "system_prompt": "You analyze user expense queries and financial data.",
+            "system_prompt": (
+                "You analyze user expense queries and financial data. Prefer the spending totals and summary "
+                "tools over paging through entry lists when answering trend or aggregate questions."
+            ),
             "tools": mcp_tools,
+            "middleware": subagent_middleware,
         },
         {
             "name": "knowledge_wiki",
             "description": "Searches personal notes, wiki facts, and document archives.",
             "system_prompt": "You retrieve answers from personal notes and wiki facts.",
             "tools": [retriever_tool],
+            "middleware": [*subagent_middleware, wiki_answer_cache] if wiki_answer_cache else subagent_middleware,
         },
     ]
 
@@ -62,8 +118,10 @@ def create_deep_orchestrator_agent(
         tools=all_tools,
         system_prompt=DEEP_ORCHESTRATOR_PROMPT,
         subagents=subagents,
+        middleware=[*history.middleware, fan_out] if history else [fan_out],
+        context_schema=DeepAgentContext,
         checkpointer=checkpointer,
-        name="bella_deep_agent",
+        name=DEEP_ORCHESTRATOR_NAME,
     )
 
 
@@ -120,66 +178,164 @@ def _extract_interrupt_events(state: object) -> list[str]:
     return frames
 
 
-def _process_stream_item(item: object) -> tuple[list[str], bool]:
-    """Process a single astream item tuple and return list of SSE frames and text flag."""
+def _process_stream_item(item: object) -> tuple[list[str], str]:
+    """Process a single astream item and return its non-response SSE frames and its response text."""
     frames = []
-    has_text = False
-    if not isinstance(item, (tuple, list)):
-        return frames, has_text
-
-    mode = item[0]
-    data = item[1] if len(item) > 1 else None
+    text = ""
+    # astream(version="v2") yields {"type", "ns", "data"} parts; v1 yields (mode, data) tuples
+    if isinstance(item, dict):
+        mode = item.get("type")
+        data = item.get("data")
+    elif isinstance(item, (tuple, list)):
+        mode = item[0]
+        data = item[1] if len(item) > 1 else None
+    else:
+        return frames, text
 
     if mode == "messages" and data is not None:
-        msg = data[0] if isinstance(data, (tuple, list)) else data
-        if isinstance(msg, AIMessageChunk) and msg.content:
+        msg, metadata = data if isinstance(data, (tuple, list)) else (data, {})
+        # Only the orchestrator's own tokens are user-facing; sub-agent output reaches it as tool results
+        agent_name = metadata.get("lc_agent_name", DEEP_ORCHESTRATOR_NAME) if isinstance(metadata, dict) else None
+        if isinstance(msg, AIMessage) and msg.content and agent_name == DEEP_ORCHESTRATOR_NAME:
             text = _extract_text(msg.content)
-            if text:
-                has_text = True
-                frames.append(_sse("response", content=text))
-    elif mode == "updates" and isinstance(data, dict):
-        for node_name, node_state in data.items():
-            if node_name in ("expense_analyst", "knowledge_wiki", "bella_deep_agent"):
-                frames.append(
-                    _sse(
-                        "subagent_call",
-                        subagent=node_name,
-                        status="running",
-                        details=f"Executing node task: {node_name}",
-                    )
-                )
-            if isinstance(node_state, dict) and "messages" in node_state:
-                msgs = node_state["messages"]
-                if isinstance(msgs, list):
-                    for msg in msgs:
-                        if isinstance(msg, (AIMessage, AIMessageChunk)) and msg.content:
-                            text = _extract_text(msg.content)
-                            if text:
-                                has_text = True
-                                frames.append(_sse("response", content=text))
-    return frames, has_text
+    elif mode == "custom" and isinstance(data, dict) and data.get("type") == "subagent_call":
+        # Written by FanOutMiddleware from each sub-agent task as it starts and finishes, so the events of
+        # concurrent tasks arrive interleaved in the order they happen
+        frames.append(_sse("subagent_call", **{key: value for key, value in data.items() if key != "type"}))
+    elif mode == "queued" and isinstance(data, dict):
+        # A model call of this turn waiting for, or just given, an admission slot
+        position = data.get("position", 0)
+        frames.append(_sse("queued", position=position, status="waiting" if position else "admitted"))
+    return frames, text
+
+
+def _queue_position_listener(queue: asyncio.Queue):
+    """Return an admission queue listener that feeds queue positions into the stream as `queued` items."""
+
+    def listener(position: int) -> None:
+        # Position updates are advisory: drop them rather than block the admission controller
+        with contextlib.suppress(asyncio.QueueFull):
+            queue.put_nowait({"type": "queued", "data": {"position": position}})
+
+    return listener
+
+
+async def _pump_stream(items: AsyncIterator[object], queue: asyncio.Queue) -> None:
+    """Move astream items into `queue`, ending with `_END_OF_STREAM` or the exception that stopped the stream."""
+    try:
+        async for item in items:
+            await queue.put(item)
+    except Exception as exc:
+        await queue.put(exc)
+    else:
+        await queue.put(_END_OF_STREAM)
+
+
+def _frame_item(item: object, coalescer: ResponseCoalescer) -> list[tuple[str, bool]]:
+    """Frame one astream item as `(frame, is_response)` pairs; buffered text is flushed before other events."""
+    frames, text = _process_stream_item(item)
+    flushed = coalescer.add(text) if text else coalescer.flush()
+    response = [(_sse("response", content=flushed), True)] if flushed is not None else []
+    return response + [(frame, False) for frame in frames]
+
+
+async def _coalesce_stream(items: AsyncIterator[object], framing: StreamFraming) -> AsyncGenerator[tuple[str, bool]]:
+    """Turn astream items into SSE frames, coalescing response tokens according to `framing`.
+
+    Yields `(frame, is_response)` pairs. The graph is read by a pump task so that buffered text can be flushed
+    when its time window expires even while the model stalls; it is also flushed before any item that is not
+    response text (tool calls, sub-agent progress), so events keep their order. Admission queue positions of the turn's
+    model calls are put on the same queue and framed as `queued` events.
+    """
+    coalescer = ResponseCoalescer(framing)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+    # The pump task, and the graph tasks it starts, inherit the listener: queued model calls report into `queue`
+    listener_token = llm_queue_listener.set(_queue_position_listener(queue))
+    try:
+        pump = asyncio.create_task(_pump_stream(items, queue))
+    finally:
+        llm_queue_listener.reset(listener_token)
+    try:
+        while True:
+            timeout = coalescer.time_to_flush()
+            try:
+                async with asyncio.timeout(timeout):
+                    item = await queue.get()
+            except TimeoutError:
+                yield _sse("response", content=coalescer.flush()), True
+                continue
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, Exception):
+                if coalescer.pending:
+                    yield _sse("response", content=coalescer.flush()), True
+                raise item
+            for framed in _frame_item(item, coalescer):
+                yield framed
+    finally:
+        pump.cancel()
+
+    if coalescer.pending:
+        yield _sse("response", content=coalescer.flush()), True
+
+
+def _log_time_to_first_token(thread_id: str, started_at: float | None) -> None:
+    """Log the time from request arrival to the first streamed response frame."""
+    if started_at is not None:
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        _logger.info(f"Deep agent time to first token for thread {thread_id}: {elapsed_ms:.0f} ms")
+
+
+def _done_frame(
+    thread_id: str, context: DeepAgentContext, metrics: LLMTurnMetrics, started_at: float, first_token_at: float | None
+) -> str:
+    """Log the turn's route and LLM metrics and return the `done` frame carrying them."""
+    summary = {
+        "route": context.route,
+        **metrics.summary(),
+        "time_to_first_token_ms": round((first_token_at - started_at) * 1000) if first_token_at else None,
+        "duration_ms": round((time.perf_counter() - started_at) * 1000),
+    }
+    _logger.info(f"Turn metrics for thread {thread_id}: {summary}")
+    return _sse("done", metrics=summary)
 
 
 async def stream_deep_agent(
     agent,
     user_input: str,
     conversation_id: UUID,
+    context: DeepAgentContext | None = None,
+    started_at: float | None = None,
 ) -> AsyncGenerator[str]:
-    """Stream events from the deep agent formatted as SSE."""
+    """Stream events from the deep agent formatted as SSE.
+
+    `started_at` is the `time.perf_counter()` reading taken when the request arrived; when given, the
+    time to the first response frame is logged. The `done` frame carries the turn's time to first token,
+    duration, token counts and tokens per second, measured from `started_at` or from the stream start.
+    """
     thread_id = str(conversation_id) if conversation_id else str(uuid4())
     config = {"configurable": {"thread_id": thread_id}}
     inputs = {"messages": [{"role": "user", "content": user_input}]}
+    context = context or DeepAgentContext()
+    metrics = LLMTurnMetrics()
+    turn_started_at = started_at if started_at is not None else time.perf_counter()
+    first_token_at = None
 
     try:
         has_response = False
-        async for item in agent.astream(
-            inputs, config, stream_mode=["messages", "updates"], version="v2"
-        ):
-            frames, text_found = _process_stream_item(item)
-            if text_found:
+        items = agent.astream(
+            inputs,
+            {**config, "callbacks": [metrics]},
+            context=context,
+            stream_mode=["messages", "custom"],
+            version="v2",
+        )
+        async for frame, is_response in _coalesce_stream(items, context.framing):
+            if is_response and not has_response:
+                _log_time_to_first_token(thread_id, started_at)
+                first_token_at = time.perf_counter()
                 has_response = True
-            for frame in frames:
-                yield frame
+            yield frame
 
         state = await agent.aget_state(config)
         for intr_sse in _extract_interrupt_events(state):
@@ -197,7 +353,57 @@ async def stream_deep_agent(
         _logger.exception(f"Deep agent stream error for thread {thread_id}")
         yield _sse("error", content=str(exc))
 
-    yield _sse("done")
+    yield _done_frame(thread_id, context, metrics, turn_started_at, first_token_at)
+
+
+async def stream_routed_turn(
+    agent,
+    fast_agent: BaseAgent,
+    user_input: str,
+    conversation_id: UUID,
+    context: DeepAgentContext,
+) -> AsyncGenerator[str]:
+    """Stream a turn routed off the deep agent, e.g. to the simple chat or RAG agent, formatted as SSE.
+
+    Frames are the same as `stream_deep_agent`'s; the `done` frame names `context.route` and is timed from the
+    stream start. The fast-path agents keep no conversation state, so the exchange is then appended to the deep
+    agent's thread: later turns see it.
+    """
+    thread_id = str(conversation_id) if conversation_id else str(uuid4())
+    config = {"configurable": {"thread_id": thread_id}}
+    metrics = LLMTurnMetrics()
+    started_at = time.perf_counter()
+    first_token_at = None
+    answer: list[str] = []
+
+    async def collect_answer(items: AsyncIterator[object]) -> AsyncGenerator[object]:
+        async for item in items:
+            answer.append(_process_stream_item(item)[1])
+            yield item
+
+    try:
+        items = fast_agent.chain.astream(
+            {"messages": [HumanMessage(content=user_input)]},
+            {"callbacks": [metrics]},
+            stream_mode="messages",
+            version="v2",
+        )
+        async for frame, is_response in _coalesce_stream(collect_answer(items), context.framing):
+            if is_response and first_token_at is None:
+                first_token_at = time.perf_counter()
+            yield frame
+
+        if text := "".join(answer):
+            await agent.aupdate_state(
+                config,
+                {"messages": [HumanMessage(content=user_input), AIMessage(content=text)]},
+                as_node=_MODEL_NODE,
+            )
+    except Exception as exc:
+        _logger.exception(f"Routed turn ({context.route}) stream error for thread {thread_id}")
+        yield _sse("error", content=str(exc))
+
+    yield _done_frame(thread_id, context, metrics, started_at, first_token_at)
 
 
 async def resume_deep_agent(
@@ -205,6 +411,7 @@ async def resume_deep_agent(
     conversation_id: UUID,
     decision: str = "approve",
     edited_args: dict[str, object] | None = None,
+    context: DeepAgentContext | None = None,
 ) -> AsyncGenerator[str]:
     """Resume execution of a deep agent thread paused by an interrupt."""
     thread_id = str(conversation_id) if conversation_id else str(uuid4())
@@ -215,17 +422,25 @@ async def resume_deep_agent(
         decision_payload["edited_args"] = edited_args
 
     command = Command(resume={"decisions": [decision_payload]})
+    context = context or DeepAgentContext()
+    metrics = LLMTurnMetrics()
+    started_at = time.perf_counter()
+    first_token_at = None
 
     try:
         has_response = False
-        async for item in agent.astream(
-            command, config, stream_mode=["messages", "updates"], version="v2"
-        ):
-            frames, text_found = _process_stream_item(item)
-            if text_found:
+        items = agent.astream(
+            command,
+            {**config, "callbacks": [metrics]},
+            context=context,
+            stream_mode=["messages", "custom"],
+            version="v2",
+        )
+        async for frame, is_response in _coalesce_stream(items, context.framing):
+            if is_response and not has_response:
+                first_token_at = time.perf_counter()
                 has_response = True
-            for frame in frames:
-                yield frame
+            yield frame
 
         # Fallback to state check if streaming didn't produce text
         state = await agent.aget_state(config)
@@ -241,4 +456,4 @@ async def resume_deep_agent(
         _logger.exception(f"Deep agent resume error for thread {thread_id}")
         yield _sse("error", content=str(exc))
 
-    yield _sse("done")
+    yield _done_frame(thread_id, context, metrics, started_at, first_token_at)
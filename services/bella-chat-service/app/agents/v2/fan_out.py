@@ -0,0 +1,118 @@
+"""Concurrent sub-agent and tool dispatch for the deep orchestrator.
+
+The tool calls of one model response run concurrently: LangGraph dispatches each as its own task in the same step,
+so two `task` calls (one per sub-agent) or several independent MCP tool calls overlap instead of queueing behind one
+another. The orchestrator prompt asks the model to issue independent work that way. `FanOutMiddleware` makes the
+concurrent calls safe to rely on:
+
+- every call gets a timeout, `ToolTimeouts.subagent_s` for `task` calls and `ToolTimeouts.tool_s` for the others, so
+  one slow branch cannot hold the whole step; a call that runs out of time returns an error result the model can act on,
+- every `task` call reports `subagent_call` events to the stream (`running`, then `completed`, `timeout`, `error` or
+  `cancelled`) from the branch itself, so events of concurrent sub-agents are interleaved in the order things happen.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import ToolMessage
+
+from utilities.logger import GetAppLogger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from langgraph.prebuilt.tool_node import ToolCallRequest
+    from langgraph.types import Command
+
+    from app.settings.base import BellaChatBaseSettings
+
+_logger = GetAppLogger().get_logger()
+
+# Name of the deepagents tool that runs a sub-agent
+SUBAGENT_TOOL_NAME = "task"
+# Characters of the task description repeated in `subagent_call` events
+_EVENT_DETAILS_MAX_CHARS = 200
+
+
+@dataclass(frozen=True)
+class ToolTimeouts:
+    """How long a sub-agent task and any other tool call may run.
+
+    Examples:
+        ### Imports
+        >>> from app.agents.v2.fan_out import ToolTimeouts
+
+        ### Give sub-agents two minutes and MCP tools thirty seconds
+        >>> timeouts = ToolTimeouts(subagent_s=120, tool_s=30)
+    """
+
+    subagent_s: float = 180.0
+    tool_s: float = 60.0
+
+    @classmethod
+    def from_settings(cls, settings: BellaChatBaseSettings) -> ToolTimeouts:
+        """Build the timeouts from the `SUBAGENT_TIMEOUT_S` and `TOOL_TIMEOUT_S` settings."""
+        return cls(subagent_s=settings.SUBAGENT_TIMEOUT_S, tool_s=settings.TOOL_TIMEOUT_S)
+
+
+class FanOutMiddleware(AgentMiddleware):
+    """Bound every tool call with a timeout and report sub-agent tasks as `subagent_call` stream events."""
+
+    def __init__(self, timeouts: ToolTimeouts):
+        """Initialize the middleware.
+
+        Args:
+            timeouts (ToolTimeouts): Per-call time limits.
+        """
+        super().__init__()
+        self.timeouts = timeouts
+
+    async def awrap_tool_call(
+        self, request: ToolCallRequest, handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]]
+    ) -> ToolMessage | Command:
+        """Run the tool call within its timeout, reporting sub-agent tasks as they start and finish."""
+        tool_call = request.tool_call
+        is_task = tool_call["name"] == SUBAGENT_TOOL_NAME
+        timeout_s = self.timeouts.subagent_s if is_task else self.timeouts.tool_s
+        subagent = str(tool_call["args"].get("subagent_type", "")) if is_task else ""
+        write = request.runtime.stream_writer if is_task else None
+        started_at = time.perf_counter()
+        if write is not None:
+            details = str(tool_call["args"].get("description", ""))[:_EVENT_DETAILS_MAX_CHARS]
+            write(_subagent_event(subagent, tool_call["id"], "running", details=details))
+
+        status = "completed"
+        try:
+            async with asyncio.timeout(timeout_s):
+                return await handler(request)
+        except TimeoutError:
+            status = "timeout"
+            label = f"The {subagent} sub-agent" if is_task else f"The {tool_call['name']} tool"
+            _logger.warning(f"{label} timed out after {timeout_s:g} s (call {tool_call['id']})")
+            return ToolMessage(
+                content=f"{label} did not finish within {timeout_s:g} s. Answer without it, or retry with a "
+                "narrower request.",
+                tool_call_id=tool_call["id"],
+                name=tool_call["name"],
+                status="error",
+            )
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            if write is not None:
+                duration_ms = round((time.perf_counter() - started_at) * 1000)
+                write(_subagent_event(subagent, tool_call["id"], status, duration_ms=duration_ms))
+
+
+def _subagent_event(subagent: str, task_id: str | None, status: str, **fields: object) -> dict[str, object]:
+    """A `subagent_call` event as written to the custom stream."""
+    return {"type": "subagent_call", "subagent": subagent, "task_id": task_id, "status": status, **fields}
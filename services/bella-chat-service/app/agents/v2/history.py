@@ -0,0 +1,308 @@
+"""Bounded conversation history for long-running deep agent threads.
+
+Every turn on a `thread_id` replays the whole checkpointed `messages` list to the model, so prompt size, checkpoint
+volume and latency would grow with the conversation. `ConversationHistory` keeps them bounded:
+
+- the last `keep_turns` turns stay verbatim; once `summary_batch_turns` older turns have accumulated, they are folded
+  into a rolling summary by a background task after the response has been sent,
+- the finished summary is applied at the start of the thread's next turn, inside the graph: the summarized messages
+  are removed from the state and the summary is stored next to it, then added to the system prompt of every model
+  call,
+- tool results larger than `max_tool_result_chars` (e.g. big MCP JSON payloads) are trimmed before they enter the
+  state.
+
+Summaries are computed off the request path and never block a turn; until one is ready, the older turns simply stay
+in the prompt.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NotRequired
+
+from langchain.agents.middleware import AgentMiddleware, AgentState
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, SystemMessage, ToolMessage
+from langgraph.config import get_config
+
+from app.core.llms.admission import Priority, use_priority
+from utilities.logger import GetAppLogger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+    from uuid import UUID
+
+    from langchain.agents.middleware import ModelRequest, ModelResponse
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.messages import AnyMessage
+    from langgraph.prebuilt.tool_node import ToolCallRequest
+    from langgraph.runtime import Runtime
+    from langgraph.types import Command
+
+    from app.settings.base import BellaChatBaseSettings
+
+_logger = GetAppLogger().get_logger()
+
+SUMMARY_PROMPT = """You maintain the running summary of a conversation between a user and Bella, their personal \
+assistant. Update the summary with the new messages below.
+
+Keep facts the user shared about themselves, their preferences, decisions and open tasks, and the key figures and \
+conclusions from earlier answers (amounts, dates, names). Drop greetings, tool call mechanics and anything \
+superseded by a later message. Write at most {max_words} words of plain prose, no headings.
+
+<current_summary>
+{summary}
+</current_summary>
+
+<new_messages>
+{messages}
+</new_messages>
+
+Updated summary:"""
+
+# Per message, when rendering summarized messages into the summary prompt
+_SUMMARY_MESSAGE_MAX_CHARS = 2000
+# Finished summaries waiting for their thread's next turn; oldest are dropped first
+_MAX_PENDING_SUMMARIES = 1024
+
+
+@dataclass(frozen=True)
+class HistoryPolicy:
+    """How much conversation history a thread keeps verbatim.
+
+    Examples:
+        ### Imports
+        >>> from app.agents.v2.history import HistoryPolicy
+
+        ### Keep the last 4 turns; summarize older ones two at a time
+        >>> policy = HistoryPolicy(keep_turns=4, summary_batch_turns=2)
+    """
+
+    keep_turns: int = 6
+    summary_batch_turns: int = 4
+    summary_max_words: int = 250
+    max_tool_result_chars: int = 8000
+
+    @classmethod
+    def from_settings(cls, settings: BellaChatBaseSettings) -> HistoryPolicy:
+        """Build the policy from the `HISTORY_*` settings."""
+        return cls(
+            keep_turns=settings.HISTORY_KEEP_TURNS,
+            summary_batch_turns=settings.HISTORY_SUMMARY_BATCH_TURNS,
+            summary_max_words=settings.HISTORY_SUMMARY_MAX_WORDS,
+            max_tool_result_chars=settings.HISTORY_MAX_TOOL_RESULT_CHARS,
+        )
+
+
+def split_turns(messages: Sequence[AnyMessage], keep_turns: int) -> tuple[list[AnyMessage], list[AnyMessage]]:
+    """Split messages into (older, recent), where `recent` starts at the user message of the last `keep_turns` turns.
+
+    Cutting only at user messages keeps every tool call together with its result.
+    """
+    turn_starts = [index for index, message in enumerate(messages) if isinstance(message, HumanMessage)]
+    if len(turn_starts) <= keep_turns:
+        return [], list(messages)
+    cut = turn_starts[-keep_turns] if keep_turns > 0 else len(messages)
+    return list(messages[:cut]), list(messages[cut:])
+
+
+def _message_text(message: AnyMessage) -> str:
+    """Plain text of a message's content (strings and text blocks)."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else str(block.get("text", ""))
+        for block in content
+        if isinstance(block, str | dict)
+    )
+
+
+def trim_tool_result(message: ToolMessage, max_chars: int) -> ToolMessage:
+    """Return the tool result with its text cut to `max_chars` characters, or unchanged if it fits."""
+    text = _message_text(message)
+    if len(text) <= max_chars:
+        return message
+    omitted = len(text) - max_chars
+    trimmed = f"{text[:max_chars]}\n... [{omitted} of {len(text)} characters trimmed; ask for a narrower result]"
+    return message.model_copy(update={"content": trimmed})
+
+
+def _render_for_summary(messages: Sequence[AnyMessage]) -> str:
+    """Render messages as a compact transcript for the summary prompt."""
+    lines = []
+    for message in messages:
+        text = _message_text(message).strip()[:_SUMMARY_MESSAGE_MAX_CHARS]
+        if isinstance(message, HumanMessage):
+            lines.append(f"User: {text}")
+        elif isinstance(message, ToolMessage):
+            lines.append(f"Tool result ({message.name or 'tool'}): {text}")
+        elif isinstance(message, AIMessage):
+            calls = ", ".join(call["name"] for call in message.tool_calls)
+            if text:
+                lines.append(f"Bella: {text}")
+            if calls:
+                lines.append(f"Bella called: {calls}")
+    return "\n".join(lines)
+
+
+class HistoryState(AgentState):
+    """Agent state extended with the rolling summary of the turns removed from `messages`."""
+
+    history_summary: NotRequired[str]
+
+
+@dataclass(frozen=True)
+class _PendingSummary:
+    summary: str
+    message_ids: tuple[str, ...]
+
+
+class ToolResultTrimMiddleware(AgentMiddleware):
+    """Trim oversized tool results before they are added to the agent state."""
+
+    def __init__(self, max_chars: int):
+        """Initialize the middleware.
+
+        Args:
+            max_chars (int): Longest tool result, in characters, kept as is.
+        """
+        super().__init__()
+        self.max_chars = max_chars
+
+    def _trim(self, result: ToolMessage | Command) -> ToolMessage | Command:
+        return trim_tool_result(result, self.max_chars) if isinstance(result, ToolMessage) else result
+
+    def wrap_tool_call(
+        self, request: ToolCallRequest, handler: Callable[[ToolCallRequest], ToolMessage | Command]
+    ) -> ToolMessage | Command:
+        """Run the tool and trim its result."""
+        return self._trim(handler(request))
+
+    async def awrap_tool_call(
+        self, request: ToolCallRequest, handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]]
+    ) -> ToolMessage | Command:
+        """Run the tool and trim its result."""
+        return self._trim(await handler(request))
+
+
+class _BoundedHistoryMiddleware(AgentMiddleware):
+    """Apply finished summaries at the start of a turn and add the summary to every model call."""
+
+    state_schema = HistoryState
+
+    def __init__(self, history: ConversationHistory):
+        super().__init__()
+        self._history = history
+
+    async def abefore_agent(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        """Replace the summarized messages with the thread's finished summary, if one is waiting."""
+        thread_id = get_config().get("configurable", {}).get("thread_id")
+        pending = self._history.pop_summary(thread_id)
+        if pending is None:
+            return None
+        present = {message.id for message in state["messages"]}
+        removals = [RemoveMessage(id=message_id) for message_id in pending.message_ids if message_id in present]
+        _logger.info(f"Compacted {len(removals)} messages of thread {thread_id} into the conversation summary")
+        return {"messages": removals, "history_summary": pending.summary}
+
+    async def awrap_model_call(
+        self, request: ModelRequest, handler: Callable[[ModelRequest], Awaitable[ModelResponse]]
+    ) -> ModelResponse:
+        """Add the conversation summary to the system prompt."""
+        summary = request.state.get("history_summary")
+        if not summary:
+            return await handler(request)
+        addition = f"\n\n<conversation_summary>\nEarlier in this conversation:\n{summary}\n</conversation_summary>"
+        content = request.system_message.content if request.system_message else ""
+        content = content + addition if isinstance(content, str) else [*content, {"type": "text", "text": addition}]
+        return await handler(request.override(system_message=SystemMessage(content=content)))
+
+
+class ConversationHistory:
+    """Keep deep agent threads to a bounded number of verbatim turns plus a rolling summary.
+
+    Examples:
+        ### Imports
+        >>> from app.agents.v2.history import ConversationHistory, HistoryPolicy
+
+        ### Wire into the agent, then summarize after each response
+        >>> history = ConversationHistory(model=llm, policy=HistoryPolicy(keep_turns=6))
+        >>> agent = create_deep_orchestrator_agent(model=llm, mcp_tools=[], checkpointer=saver, history=history)
+        >>> await history.summarize(agent, conversation_id)
+    """
+
+    def __init__(self, model: BaseChatModel, policy: HistoryPolicy | None = None):
+        """Initialize the history manager.
+
+        Args:
+            model (BaseChatModel): Model used to write the summaries.
+            policy (HistoryPolicy | None): History limits. Defaults to `HistoryPolicy()`.
+        """
+        self.policy = policy or HistoryPolicy()
+        self._model = model
+        self._pending: OrderedDict[str, _PendingSummary] = OrderedDict()
+        self._in_flight: set[str] = set()
+
+    @property
+    def middleware(self) -> list[AgentMiddleware]:
+        """Middleware for the orchestrator: summary handling and tool result trimming."""
+        return [_BoundedHistoryMiddleware(self), self.tool_result_middleware]
+
+    @property
+    def tool_result_middleware(self) -> ToolResultTrimMiddleware:
+        """Tool result trimming alone, for sub-agents, whose history is not checkpointed."""
+        return ToolResultTrimMiddleware(self.policy.max_tool_result_chars)
+
+    def pop_summary(self, thread_id: str | None) -> _PendingSummary | None:
+        """Take the finished summary waiting for a thread, if any."""
+        return self._pending.pop(thread_id, None) if thread_id else None
+
+    async def summarize(self, agent, conversation_id: UUID) -> None:
+        """Fold the thread's older turns into its rolling summary, once enough of them have accumulated.
+
+        Meant to run after the response has been sent. The result is applied at the start of the next turn, so it
+        never races with a running turn. Failures are logged and leave the history as it is.
+        """
+        thread_id = str(conversation_id)
+        if thread_id in self._in_flight or thread_id in self._pending:
+            return
+        self._in_flight.add(thread_id)
+        try:
+            await self._summarize(agent, thread_id)
+        except Exception:
+            _logger.exception(f"Conversation summary failed for thread {thread_id}")
+        finally:
+            self._in_flight.discard(thread_id)
+
+    async def _summarize(self, agent, thread_id: str) -> None:
+        state = await agent.aget_state({"configurable": {"thread_id": thread_id}})
+        if state.next:
+            # Paused on an interrupt: the turn is not over yet
+            return
+        older, _ = split_turns(state.values.get("messages", []), self.policy.keep_turns)
+        older_turns = sum(isinstance(message, HumanMessage) for message in older)
+        if older_turns < self.policy.summary_batch_turns:
+            return
+
+        started_at = time.perf_counter()
+        prompt = SUMMARY_PROMPT.format(
+            max_words=self.policy.summary_max_words,
+            summary=state.values.get("history_summary") or "(none yet)",
+            messages=_render_for_summary(older),
+        )
+        # Summaries are never awaited by a user: let chat turns go first when the model is busy
+        with use_priority(Priority.BACKGROUND):
+            response = await self._model.ainvoke([HumanMessage(content=prompt)])
+        summary = _message_text(response).strip()
+        if not summary:
+            return
+
+        self._pending[thread_id] = _PendingSummary(summary, tuple(message.id for message in older if message.id))
+        while len(self._pending) > _MAX_PENDING_SUMMARIES:
+            self._pending.popitem(last=False)
+        _logger.info(
+            f"Summarized {older_turns} turns ({len(older)} messages) of thread {thread_id} "
+            f"in {(time.perf_counter() - started_at) * 1000:.0f} ms"
+        )
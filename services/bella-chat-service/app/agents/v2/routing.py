@@ -0,0 +1,229 @@
+"""Routing of chat turns to the cheapest agent that can answer them.
+
+Every turn used to run through the deep agent harness on the synthesis model, even a greeting. `TurnRouter` picks one
+of three routes before the deep agent is built:
+
+- `chat`: greetings, thanks and questions about Bella, answered by the simple chat agent on the fast model,
+- `rag`: standalone questions about the personal wiki, answered by the RAG agent with one retrieval and one model call,
+- `deep`: everything else, in particular expense and loan questions, tool actions, multi-step requests and follow-ups
+  that depend on the conversation.
+
+Keyword heuristics decide most turns in microseconds. Turns they cannot place are classified by the fast model when
+one is configured, and go to the deep agent otherwise, so a turn is only taken off the deep agent when something
+positively says it is simple.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from langchain_core.messages import HumanMessage
+
+from utilities.logger import GetAppLogger
+
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+_logger = GetAppLogger().get_logger()
+
+CLASSIFIER_PROMPT = """Classify the user's message to Bella, a personal assistant, into exactly one label:
+
+chat: greetings, thanks, small talk or questions about Bella herself
+rag: a self-contained question answered from the user's personal wiki notes (experience, projects, documents)
+deep: anything about expenses, spending, budgets, loans or accounts, requests to take an action, or tasks that need \
+several steps
+
+Answer with the label only.
+
+Message: {message}
+Label:"""
+
+# Longer messages are treated as multi-step requests
+_MAX_SIMPLE_WORDS = 40
+# Words allowed after a greeting or thanks for the turn to still be chit-chat, e.g. "thanks a lot Bella"
+_MAX_CHAT_TAIL_WORDS = 3
+_MAX_ABOUT_BELLA_WORDS = 8
+# The only words allowed after thanks or a goodbye in an ongoing conversation, where any other tail may be an answer
+# to the deep agent, e.g. "thanks, go ahead"
+_FOLLOW_UP_FILLER_WORDS = frozenset({"a", "lot", "so", "much", "very", "again", "bella"})
+
+_GREETING_PATTERN = re.compile(
+    r"^\W*(hi+|hello|hey|yo|good (morning|afternoon|evening|night)|thanks?( you)?|thank you|thx|ty|bye|goodbye|"
+    r"see you|cheers)\b(?P<tail>.*)$",
+    re.IGNORECASE,
+)
+# Acknowledgements are chit-chat at the start of a conversation only: later, "ok" or "great, do that" may confirm an
+# action the deep agent proposed
+_ACKNOWLEDGEMENT_PATTERN = re.compile(
+    r"^\W*(ok(ay)?|alright|sure|cool|great|nice|awesome|perfect|got it)\b(?P<tail>.*)$", re.IGNORECASE
+)
+_ABOUT_BELLA_PATTERN = re.compile(
+    r"\b(who are you|what are you|what('s| is) your name|what can you do|how are you)\b", re.IGNORECASE
+)
+_DEEP_PATTERN = re.compile(
+    r"\b(expenses?|spen[dt]|spending|transactions?|budgets?|loans?|emis?|interest|salary|income|payments?|paid|"
+    r"bills?|invest(ment|ments|ed|ing)?|balance|accounts?|categor(y|ies)|merchants?|refunds?|tax(es)?|savings?|"
+    r"debt|credit|rent|subscriptions?|prepay(ment)?|compare|calculate|total|average|monthly|yearly|"
+    r"add|create|update|delete|remove|record|log|plan|schedule)\b|[₹$€£]|\d+(\.\d+)?\s*(k|rs|inr|usd|eur)\b",
+    re.IGNORECASE,
+)
+_RAG_PATTERN = re.compile(
+    r"\b(wiki|notes?|documents?|docs|pages?|resume|cv|experience|projects?|skills?|portfolio|"
+    r"according to|what do (i|my notes) (know|say)|key'?s)\b",
+    re.IGNORECASE,
+)
+
+
+class Route(StrEnum):
+    """Where a chat turn is answered."""
+
+    CHAT = "chat"
+    RAG = "rag"
+    DEEP = "deep"
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """The route of a turn, what decided it and how long deciding took."""
+
+    route: Route
+    method: str  # "heuristic", "classifier" or "fallback"
+    reason: str
+    latency_ms: float
+
+
+def _chit_chat(message: str, follow_up: bool) -> str | None:
+    """Return why a message is chit-chat, or None when it is not."""
+    greeting = _GREETING_PATTERN.match(message)
+    if greeting is None and not follow_up:
+        greeting = _ACKNOWLEDGEMENT_PATTERN.match(message)
+    if greeting is not None:
+        tail = re.findall(r"\w+", greeting.group("tail").lower())
+        if len(tail) <= _MAX_CHAT_TAIL_WORDS and (not follow_up or _FOLLOW_UP_FILLER_WORDS.issuperset(tail)):
+            return "chit-chat"
+    if len(message.split()) <= _MAX_ABOUT_BELLA_WORDS and _ABOUT_BELLA_PATTERN.search(message):
+        return "about Bella"
+    return None
+
+
+def heuristic_route(message: str, follow_up: bool = False) -> tuple[Route, str] | None:
+    """Route a turn from its wording alone.
+
+    Args:
+        message (str): The user's message.
+        follow_up (bool): Whether the conversation already has turns. Defaults to False.
+
+    Returns:
+        tuple[Route, str] | None: The route and the rule that chose it, or None when no rule applies.
+    """
+    if _DEEP_PATTERN.search(message):
+        return Route.DEEP, "financial or action terms"
+    if reason := _chit_chat(message, follow_up):
+        return Route.CHAT, reason
+    if len(message.split()) > _MAX_SIMPLE_WORDS:
+        return Route.DEEP, "long request"
+    if follow_up:
+        # The RAG agent only sees the latest message, so follow-ups need the deep agent's thread
+        return Route.DEEP, "follow-up"
+    if _RAG_PATTERN.search(message):
+        return Route.RAG, "wiki terms"
+    return None
+
+
+def parse_route_label(text: str) -> Route | None:
+    """Return the route named by a classifier answer, or None when it names none."""
+    match = re.search(r"\b(chat|rag|deep)\b", text.lower())
+    return Route(match.group(1)) if match else None
+
+
+class TurnRouter:
+    """Choose the route of each chat turn and keep per-route counters.
+
+    Examples:
+        ### Imports
+        >>> from app.agents.v2.routing import Route, TurnRouter
+
+        ### Heuristics only
+        >>> router = TurnRouter()
+        >>> (await router.route("Thanks a lot!")).route
+        <Route.CHAT: 'chat'>
+
+        ### Classify the turns the heuristics cannot place with a small model
+        >>> router = TurnRouter(classifier=fast_llm_client, classifier_timeout_s=2.0)
+    """
+
+    def __init__(self, classifier: BaseChatModel | None = None, classifier_timeout_s: float = 2.0):
+        """Initialize the router.
+
+        Args:
+            classifier (BaseChatModel | None): Model classifying the turns the heuristics cannot place. Defaults to
+                None (those turns go to the deep agent).
+            classifier_timeout_s (float): Give up on the classifier after this long and use the deep agent.
+                Defaults to 2.0.
+        """
+        self.classifier = classifier
+        self.classifier_timeout_s = classifier_timeout_s
+        self._counts: dict[str, int] = {}
+        self._latency_ms = 0.0
+        self._decisions = 0
+
+    async def _classify(self, classifier: BaseChatModel, message: str) -> Route | None:
+        prompt = CLASSIFIER_PROMPT.format(message=message)
+        async with asyncio.timeout(self.classifier_timeout_s):
+            response = await classifier.ainvoke([HumanMessage(content=prompt)])
+        return parse_route_label(response.text)
+
+    async def route(self, message: str, follow_up: bool = False, paused: bool = False) -> RouteDecision:
+        """Decide where a turn is answered; never raises.
+
+        Args:
+            message (str): The user's message.
+            follow_up (bool): Whether the conversation already has turns. Defaults to False.
+            paused (bool): Whether the conversation is waiting for a tool approval. Defaults to False.
+
+        Returns:
+            RouteDecision: The route, the method and rule that chose it, and the decision time.
+        """
+        started_at = time.perf_counter()
+        decided = (Route.DEEP, "awaiting approval") if paused else heuristic_route(message, follow_up)
+        if decided is not None:
+            route, reason = decided
+            method = "heuristic"
+        elif self.classifier is None:
+            route, method, reason = Route.DEEP, "fallback", "no rule matched"
+        else:
+            try:
+                label = await self._classify(self.classifier, message)
+            except Exception as err:
+                label = None
+                _logger.warning(f"Turn classifier failed, using the deep agent: {err!r}")
+            route, method = (label, "classifier") if label is not None else (Route.DEEP, "fallback")
+            reason = "classified" if label is not None else "classifier gave no label"
+
+        decision = RouteDecision(route, method, reason, (time.perf_counter() - started_at) * 1000)
+        self._record(decision)
+        _logger.info(
+            f"Routed turn to `{decision.route}` by {decision.method} ({decision.reason}) "
+            f"in {decision.latency_ms:.1f} ms"
+        )
+        return decision
+
+    def _record(self, decision: RouteDecision) -> None:
+        for key in (decision.route.value, decision.method):
+            self._counts[key] = self._counts.get(key, 0) + 1
+        self._decisions += 1
+        self._latency_ms += decision.latency_ms
+
+    def stats(self) -> dict[str, float]:
+        """Return the turns per route and per method, and the average decision time."""
+        return {
+            "decisions": self._decisions,
+            **{route.value: self._counts.get(route.value, 0) for route in Route},
+            **{method: self._counts.get(method, 0) for method in ("heuristic", "classifier", "fallback")},
+            "latency_ms_avg": round(self._latency_ms / self._decisions, 2) if self._decisions else 0.0,
+        }
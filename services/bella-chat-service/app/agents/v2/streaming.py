@@ -0,0 +1,104 @@
+"""Coalescing of streamed response tokens into SSE frames.
+
+Local models emit one- or two-character chunks, so framing every chunk turns a long answer into thousands of tiny
+frames, each with its own `json.dumps`, socket write and client-side parse. The coalescer buffers response text and
+emits it as one frame once the buffer reaches `max_bytes` or has been held for `interval_ms`. The first token is
+framed immediately so time to first token is unaffected, and callers flush before any non-response event (tool,
+sub-agent, interrupt, error) so events keep their order relative to the text.
+"""
+
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.settings.base import BellaChatBaseSettings
+
+
+@dataclass(frozen=True)
+class StreamFraming:
+    """Flush thresholds for coalesced response frames; a zero threshold frames every token on its own.
+
+    Examples:
+        ### Imports
+        >>> from app.agents.v2.streaming import StreamFraming
+
+        ### Batch tokens for up to 50 ms or 2 KiB
+        >>> framing = StreamFraming(interval_ms=50, max_bytes=2048)
+        >>> framing.with_overrides(interval_ms=0).enabled
+        False
+    """
+
+    interval_ms: int = 16
+    max_bytes: int = 512
+
+    @classmethod
+    def from_settings(cls, settings: "BellaChatBaseSettings") -> "StreamFraming":
+        """Build the framing from the `STREAM_FLUSH_*` settings."""
+        return cls(interval_ms=settings.STREAM_FLUSH_INTERVAL_MS, max_bytes=settings.STREAM_FLUSH_MAX_BYTES)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tokens are coalesced at all."""
+        return self.interval_ms > 0 and self.max_bytes > 0
+
+    def with_overrides(self, interval_ms: int | None = None, max_bytes: int | None = None) -> "StreamFraming":
+        """Return a copy with the given thresholds replaced; `None` keeps the current value."""
+        overrides = {"interval_ms": interval_ms, "max_bytes": max_bytes}
+        return dataclasses.replace(self, **{name: value for name, value in overrides.items() if value is not None})
+
+
+class ResponseCoalescer:
+    """Buffer response text and release it in frames according to a `StreamFraming`."""
+
+    def __init__(self, framing: StreamFraming):
+        """Initialize the coalescer.
+
+        Args:
+            framing (StreamFraming): Flush thresholds.
+        """
+        self._framing = framing
+        self._interval_s = framing.interval_ms / 1000
+        self._parts: list[str] = []
+        self._size = 0
+        self._buffered_at: float | None = None
+        self._first_emitted = False
+
+    @property
+    def pending(self) -> bool:
+        """Whether text is buffered."""
+        return bool(self._parts)
+
+    def add(self, text: str) -> str | None:
+        """Buffer `text` and return the text to frame now, or None while the buffer is below both thresholds."""
+        self._parts.append(text)
+        self._size += len(text.encode())
+        now = time.perf_counter()
+        if self._buffered_at is None:
+            self._buffered_at = now
+        if (
+            not self._first_emitted
+            or not self._framing.enabled
+            or self._size >= self._framing.max_bytes
+            or now - self._buffered_at >= self._interval_s
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """Return all buffered text, or None if nothing is buffered."""
+        if not self._parts:
+            return None
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._buffered_at = None
+        self._first_emitted = True
+        return text
+
+    def time_to_flush(self) -> float | None:
+        """Seconds until the buffered text is due, or None when nothing is buffered."""
+        if self._buffered_at is None:
+            return None
+        return max(0.0, self._interval_s - (time.perf_counter() - self._buffered_at))
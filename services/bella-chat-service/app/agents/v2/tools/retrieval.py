@@ -17,4 +17,6 @@ def get_personal_wiki_retriever_tool() -> BaseTool:
         retriever=retriever,
         name="search_personal_wiki",
         description="Searches user's personal notes, wiki facts, and document archive for relevant information.",
+        # The documents ride along as the tool message's artifact, so the answer cache knows which points were used
+        response_format="content_and_artifact",
     )
@@ -0,0 +1,278 @@
+"""Semantic answer cache for wiki questions.
+
+Many wiki questions are near-duplicates of earlier ones. `SemanticAnswerCache` stores each answer in a dedicated
+Qdrant collection with the embedding of its question and the ids of the wiki points it was generated from. A later
+question is served the cached answer when:
+
+- its embedding is at least `threshold` similar to a cached question of the same scope,
+- the entry is younger than `ttl_s`,
+- retrieval for the new question returns exactly the same wiki points,
+- when the entry records the points its answer was generated from and the caller can check them, they all still exist.
+
+The wiki ETL derives every point id from the file path and its content hash, so an edited file gets new point ids and
+the answers generated from its old version no longer match. Lookups and stores never raise: on any error the caller
+just generates the answer.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import NAMESPACE_URL, uuid5
+
+from langchain_core.documents import Document
+from qdrant_client import AsyncQdrantClient, models
+
+from app.core.embeddings.cache import normalize_text
+from app.core.embeddings.clients.base import EmbeddingsClientInterface
+from utilities.logger import GetAppLogger
+
+_logger = GetAppLogger().get_logger()
+
+# Cached questions compared per lookup; the best one whose documents still match wins
+_CANDIDATES = 3
+# Expired entries are deleted once every this many stores
+_PURGE_EVERY_STORES = 100
+
+
+def document_ids(documents: list[Document]) -> list[str]:
+    """Return the vector store point ids of retrieved documents, falling back to the ETL `id` metadata."""
+    return [str(doc.metadata.get("_id") or doc.metadata.get("id")) for doc in documents]
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """A generated answer, as stored in the cache and as served from it."""
+
+    question: str
+    answer: str
+    generation_ms: float  # How long generating the answer took; reported as saved on hits
+    sources: dict[str, str] = field(default_factory=dict)
+    similarity: float = 1.0  # Of the new question to the cached one, on hits
+
+
+@dataclass
+class AnswerCacheStats:
+    """Counters describing how often the cache answers and how much model time it saves."""
+
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0  # Similar question found, but its documents changed, differ or no longer exist
+    stores: int = 0
+    errors: int = 0
+    lookup_ms: float = 0.0
+    saved_ms: float = 0.0  # Generation time of the cached answers served, minus the lookups that served them
+
+
+class SemanticAnswerCache:
+    """Cache of generated answers keyed by question similarity and the documents they were generated from.
+
+    Examples:
+        ### Imports
+        >>> from app.core.answer_cache import CachedAnswer, SemanticAnswerCache, document_ids
+
+        ### Look up, and store on a miss
+        >>> cache = SemanticAnswerCache(client=async_qdrant, collection_name="bella-answer-cache",
+        ...                             embeddings=embedding_client)
+        >>> cached = await cache.lookup("rag", question, document_ids(docs))
+        >>> if cached is None:
+        ...     entry = CachedAnswer(question=question, answer=answer, generation_ms=1800)
+        ...     await cache.store("rag", entry, document_ids(docs))
+    """
+
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        collection_name: str,
+        embeddings: EmbeddingsClientInterface,
+        threshold: float = 0.92,
+        ttl_s: float = 7 * 24 * 3600,
+    ):
+        """Initialize the cache; its collection is created on first use, sized to the first question embedding.
+
+        Args:
+            client (AsyncQdrantClient): Async Qdrant client.
+            collection_name (str): Collection holding the cached answers.
+            embeddings (EmbeddingsClientInterface): Embeddings client used for the questions, e.g. the app's cached
+                client.
+            threshold (float): Minimum cosine similarity between questions for a hit. Defaults to 0.92.
+            ttl_s (float): Age after which an entry is no longer served. Defaults to 7 days.
+        """
+        self.client = client
+        self.collection_name = collection_name
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.ttl_s = ttl_s
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
+        self._stats = AnswerCacheStats()
+
+    async def _ensure_collection(self, dimension: int) -> None:
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if self._ready:
+                return
+            if not await self.client.collection_exists(self.collection_name):
+                await self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=models.VectorParams(size=dimension, distance=models.Distance.COSINE),
+                )
+                await self.client.create_payload_index(
+                    self.collection_name, "scope", field_schema=models.PayloadSchemaType.KEYWORD
+                )
+                await self.client.create_payload_index(
+                    self.collection_name, "created_at", field_schema=models.PayloadSchemaType.FLOAT
+                )
+                _logger.info(f"Created answer cache collection `{self.collection_name}`.")
+            self._ready = True
+
+    def _filter(self, scope: str, now: float) -> models.Filter:
+        return models.Filter(
+            must=[
+                models.FieldCondition(key="scope", match=models.MatchValue(value=scope)),
+                models.FieldCondition(key="created_at", range=models.Range(gte=now - self.ttl_s)),
+            ]
+        )
+
+    async def lookup(
+        self,
+        scope: str,
+        question: str,
+        doc_ids: list[str],
+        sources_exist: Callable[[list[str]], Awaitable[bool]] | None = None,
+    ) -> CachedAnswer | None:
+        """Return the cached answer to a similar question generated from the same documents, if any.
+
+        Args:
+            scope (str): Who answered, e.g. the agent and model; answers never cross scopes.
+            question (str): The new question.
+            doc_ids (list[str]): Point ids retrieved for the new question.
+            sources_exist (Callable[[list[str]], Awaitable[bool]] | None): Checks whether the source points of an
+                entry stored with `source_ids` all still exist; entries whose sources are gone are not served.
+                Defaults to None (not checked).
+
+        Returns:
+            CachedAnswer | None: The cached answer, or None on a miss.
+        """
+        started_at = time.perf_counter()
+        self._stats.lookups += 1
+        try:
+            vector = await self.embeddings.aembed_query(question)
+            await self._ensure_collection(len(vector))
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                query=vector,
+                query_filter=self._filter(scope, time.time()),
+                score_threshold=self.threshold,
+                limit=_CANDIDATES,
+                with_payload=True,
+            )
+        except Exception as err:
+            self._stats.errors += 1
+            _logger.warning(f"Answer cache lookup failed: {err}")
+            return None
+        finally:
+            lookup_ms = (time.perf_counter() - started_at) * 1000
+            self._stats.lookup_ms += lookup_ms
+
+        wanted = set(doc_ids)
+        for point in response.points:
+            payload = point.payload or {}
+            if set(payload.get("doc_ids", [])) != wanted:
+                continue
+            source_ids = payload.get("source_ids")
+            if source_ids and sources_exist is not None:
+                try:
+                    if not await sources_exist(source_ids):
+                        continue
+                except Exception as err:
+                    self._stats.errors += 1
+                    _logger.warning(f"Answer cache source check failed: {err}")
+                    return None
+            cached = CachedAnswer(
+                question=payload["question"],
+                answer=payload["answer"],
+                generation_ms=payload.get("generation_ms", 0.0),
+                sources=payload.get("sources") or {},
+                similarity=point.score,
+            )
+            self._stats.hits += 1
+            self._stats.saved_ms += max(0.0, cached.generation_ms - lookup_ms)
+            _logger.info(
+                f"Answer cache hit ({scope}, similarity {point.score:.3f}) in {lookup_ms:.0f} ms, "
+                f"saving ~{cached.generation_ms - lookup_ms:.0f} ms"
+            )
+            return cached
+
+        self._stats.misses += 1
+        if response.points:
+            self._stats.stale += 1
+        return None
+
+    async def store(
+        self, scope: str, entry: CachedAnswer, doc_ids: list[str], source_ids: list[str] | None = None
+    ) -> None:
+        """Cache an answer with the documents it was generated from.
+
+        Storing the same question and documents again replaces the earlier entry.
+
+        Args:
+            scope (str): Who answered, e.g. the agent and model.
+            entry (CachedAnswer): The question, the generated answer, its sources and generation time.
+            doc_ids (list[str]): Point ids retrieved for the question, as `lookup` will compare them.
+            source_ids (list[str] | None): Point ids the answer was actually generated from, when the answering
+                agent retrieved on its own; checked by `lookup` through `sources_exist`. Defaults to None
+                (the answer was generated from `doc_ids`).
+        """
+        if not entry.answer.strip():
+            return
+        key = f"{scope}|{normalize_text(entry.question)}|{','.join(sorted(doc_ids))}"
+        payload: dict[str, Any] = {
+            "scope": scope,
+            "question": entry.question,
+            "answer": entry.answer,
+            "doc_ids": doc_ids,
+            "source_ids": source_ids,
+            "sources": entry.sources,
+            "generation_ms": round(entry.generation_ms, 1),
+            "created_at": time.time(),
+        }
+        try:
+            vector = await self.embeddings.aembed_query(entry.question)
+            await self._ensure_collection(len(vector))
+            await self.client.upsert(
+                collection_name=self.collection_name,
+                points=[models.PointStruct(id=str(uuid5(NAMESPACE_URL, key)), vector=vector, payload=payload)],
+                wait=False,
+            )
+            self._stats.stores += 1
+            if self._stats.stores % _PURGE_EVERY_STORES == 0:
+                await self.purge_expired()
+        except Exception as err:
+            self._stats.errors += 1
+            _logger.warning(f"Answer cache store failed: {err}")
+
+    async def purge_expired(self) -> None:
+        """Delete entries older than the TTL."""
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    must=[models.FieldCondition(key="created_at", range=models.Range(lt=time.time() - self.ttl_s))]
+                )
+            ),
+            wait=False,
+        )
+
+    def stats(self) -> dict[str, float]:
+        """Return the counters with the hit rate and the average lookup time."""
+        stats = asdict(self._stats)
+        lookups = self._stats.lookups
+        return {
+            **{name: round(value, 1) if isinstance(value, float) else value for name, value in stats.items()},
+            "hit_rate": round(self._stats.hits / lookups, 4) if lookups else 0.0,
+            "lookup_ms_avg": round(self._stats.lookup_ms / lookups, 1) if lookups else 0.0,
+        }
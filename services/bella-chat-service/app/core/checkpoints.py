@@ -0,0 +1,345 @@
+"""Pooled saver, connection pool statistics and retention for the LangGraph Postgres checkpoint store.
+
+Each step of a turn writes a new checkpoint, plus a blob for every channel whose value changed, and the saver never
+deletes anything. `prune_checkpoints` enforces a `CheckpointRetentionPolicy`:
+
+- threads idle for longer than `thread_ttl` are deleted entirely,
+- other idle threads keep only their `keep_last` latest checkpoints per namespace; a conversation continues from its
+  latest one,
+- pending writes recorded against deleted checkpoints and blobs no remaining checkpoint references are deleted.
+
+Threads with a checkpoint newer than `min_idle` are never touched, so a turn in progress cannot lose the blobs it has
+just written. `CheckpointRetention` runs the prune periodically in the background and keeps the counters and table
+sizes reported by `/health/checkpoints`. `PooledPostgresSaver` lets concurrent chat turns query the store on
+connections of their own, and `checkpointer_pool_stats` reports how long they wait for one, at `/health/checkpointer`.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from utilities.logger import GetAppLogger
+
+if TYPE_CHECKING:
+    from app.settings.base import BellaChatBaseSettings
+
+_logger = GetAppLogger().get_logger()
+
+CHECKPOINT_TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+# Every checkpoint of threads whose latest checkpoint is older than %(ttl)s
+_DELETE_EXPIRED_THREADS = """
+WITH expired AS (
+    SELECT thread_id
+    FROM checkpoints
+    GROUP BY thread_id
+    HAVING max((checkpoint ->> 'ts')::timestamptz) < now() - %(ttl)s
+)
+DELETE FROM checkpoints c
+USING expired e
+WHERE c.thread_id = e.thread_id
+RETURNING c.thread_id
+"""
+
+# All but the %(keep_last)s latest checkpoints of each (thread, namespace), on threads idle for at least %(min_idle)s
+_DELETE_SUPERSEDED_CHECKPOINTS = """
+WITH ranked AS (
+    SELECT
+        thread_id,
+        checkpoint_ns,
+        checkpoint_id,
+        row_number() OVER (PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC) AS recency,
+        max((checkpoint ->> 'ts')::timestamptz) OVER (PARTITION BY thread_id) AS last_active
+    FROM checkpoints
+)
+DELETE FROM checkpoints c
+USING ranked r
+WHERE c.thread_id = r.thread_id
+  AND c.checkpoint_ns = r.checkpoint_ns
+  AND c.checkpoint_id = r.checkpoint_id
+  AND r.recency > %(keep_last)s
+  AND r.last_active < now() - %(min_idle)s
+"""
+
+# Pending writes recorded against checkpoints that no longer exist, on threads idle for %(min_idle)s
+_DELETE_ORPHANED_WRITES = """
+DELETE FROM checkpoint_writes w
+WHERE NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = w.thread_id
+      AND c.checkpoint_ns = w.checkpoint_ns
+      AND c.checkpoint_id = w.checkpoint_id
+)
+AND NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = w.thread_id
+      AND (c.checkpoint ->> 'ts')::timestamptz >= now() - %(min_idle)s
+)
+"""
+
+# Channel values no remaining checkpoint of their (thread, namespace) points at, on threads idle for %(min_idle)s
+_DELETE_UNREFERENCED_BLOBS = """
+DELETE FROM checkpoint_blobs b
+WHERE NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = b.thread_id
+      AND c.checkpoint_ns = b.checkpoint_ns
+      AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+)
+AND NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = b.thread_id
+      AND (c.checkpoint ->> 'ts')::timestamptz >= now() - %(min_idle)s
+)
+"""
+
+_TABLE_SIZES = """
+SELECT relname, pg_total_relation_size(relid), n_live_tup, n_dead_tup
+FROM pg_stat_user_tables
+WHERE relname = ANY(%(tables)s)
+"""
+
+
+@dataclass(frozen=True)
+class CheckpointRetentionPolicy:
+    """How long and how much checkpoint history is kept.
+
+    Examples:
+        ### Imports
+        >>> from datetime import timedelta
+        >>> from app.core.checkpoints import CheckpointRetentionPolicy
+
+        ### Drop threads idle for 30 days; keep the last 3 checkpoints of the others
+        >>> policy = CheckpointRetentionPolicy(thread_ttl=timedelta(days=30), keep_last=3)
+    """
+
+    thread_ttl: timedelta | None = None  # None keeps threads forever
+    keep_last: int = 1
+    min_idle: timedelta = timedelta(minutes=15)
+
+    @classmethod
+    def from_settings(cls, settings: "BellaChatBaseSettings") -> "CheckpointRetentionPolicy":
+        """Build the policy from the `CHECKPOINT_*` settings."""
+        ttl_days = settings.CHECKPOINT_THREAD_TTL_DAYS
+        return cls(
+            thread_ttl=timedelta(days=ttl_days) if ttl_days > 0 else None,
+            keep_last=max(1, settings.CHECKPOINT_KEEP_LAST),
+            min_idle=timedelta(seconds=settings.CHECKPOINT_MIN_IDLE_S),
+        )
+
+
+@dataclass
+class CheckpointPruneResult:
+    """Rows deleted by one or more prune runs."""
+
+    threads: int = 0
+    checkpoints: int = 0
+    writes: int = 0
+    blobs: int = 0
+
+    def add(self, other: "CheckpointPruneResult") -> None:
+        """Add another run's counts to these."""
+        self.threads += other.threads
+        self.checkpoints += other.checkpoints
+        self.writes += other.writes
+        self.blobs += other.blobs
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain dict, e.g. for logging."""
+        return asdict(self)
+
+
+async def prune_checkpoints(conn: AsyncConnection, policy: CheckpointRetentionPolicy) -> CheckpointPruneResult:
+    """Delete expired threads, superseded checkpoints and the writes and blobs only they used.
+
+    Runs in a single transaction.
+
+    Args:
+        conn (AsyncConnection): Connection to the checkpoint database.
+        policy (CheckpointRetentionPolicy): What to keep.
+
+    Returns:
+        CheckpointPruneResult: Rows deleted from each table, and the number of expired threads.
+    """
+    result = CheckpointPruneResult()
+    params: dict[str, Any] = {"keep_last": policy.keep_last, "min_idle": policy.min_idle}
+    async with conn.transaction(), conn.cursor() as cur:
+        if policy.thread_ttl is not None:
+            await cur.execute(_DELETE_EXPIRED_THREADS, {"ttl": policy.thread_ttl})
+            rows = await cur.fetchall()
+            result.checkpoints += len(rows)
+            result.threads = len({row[0] for row in rows})
+        await cur.execute(_DELETE_SUPERSEDED_CHECKPOINTS, params)
+        result.checkpoints += cur.rowcount
+        await cur.execute(_DELETE_ORPHANED_WRITES, params)
+        result.writes = cur.rowcount
+        await cur.execute(_DELETE_UNREFERENCED_BLOBS, params)
+        result.blobs = cur.rowcount
+
+    _logger.info(f"Pruned checkpoints: {result.as_dict()}")
+    return result
+
+
+async def vacuum_checkpoints(conn: AsyncConnection) -> None:
+    """Run `VACUUM (ANALYZE)` on the checkpoint tables so deleted rows are reused and plans stay accurate.
+
+    `conn` must be in autocommit mode: VACUUM cannot run inside a transaction.
+    """
+    for table in CHECKPOINT_TABLES:
+        await conn.execute(f"VACUUM (ANALYZE) {table}")
+
+
+async def checkpoint_table_sizes(conn: AsyncConnection) -> dict[str, dict[str, int]]:
+    """Return the total size on disk and the live and dead row estimates of each checkpoint table."""
+    cursor = await conn.execute(_TABLE_SIZES, {"tables": list(CHECKPOINT_TABLES)})
+    return {
+        name: {"total_bytes": total_bytes, "live_rows": live_rows, "dead_rows": dead_rows}
+        for name, total_bytes, live_rows, dead_rows in await cursor.fetchall()
+    }
+
+
+class _PoolLock(asyncio.Lock):
+    """A lock that never blocks, for a saver whose every query checks out a connection of its own."""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+class PooledPostgresSaver(AsyncPostgresSaver):
+    """`AsyncPostgresSaver` running concurrent queries on separate connections of a pool.
+
+    The base saver serializes every query on one lock, which a single shared connection needs but which leaves a pool
+    no faster than one connection.
+
+    Examples:
+        ### Imports
+        >>> from psycopg_pool import AsyncConnectionPool
+        >>> from app.core.checkpoints import PooledPostgresSaver
+
+        ### Back the saver with a pool of up to 10 connections
+        >>> async with AsyncConnectionPool(dsn, max_size=10, kwargs=saver_connection_kwargs) as pool:
+        ...     checkpointer = PooledPostgresSaver(pool)
+    """
+
+    def __init__(self, pool: AsyncConnectionPool[AsyncConnection[DictRow]], serde: SerializerProtocol | None = None):
+        """Initialize the saver.
+
+        Args:
+            pool (AsyncConnectionPool): Pool of connections with the settings the saver expects: autocommit, no
+                prepared statements and dict rows.
+            serde (SerializerProtocol | None): Serializer of the checkpoints. Defaults to None (the saver's default).
+        """
+        super().__init__(conn=pool, serde=serde)
+        self.lock = _PoolLock()
+
+
+def checkpointer_pool_stats(pool: AsyncConnectionPool) -> dict[str, float]:
+    """Return the pool's size and request counters, with the average time spent waiting for a connection.
+
+    Requests served by an idle connection do not wait; `requests_queued` counts the ones that did.
+    """
+    stats = pool.get_stats()
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+    return {
+        **stats,
+        "requests_wait_ms_avg": round(wait_ms / requests, 2) if requests else 0.0,
+        "requests_queued_ratio": round(stats.get("requests_queued", 0) / requests, 4) if requests else 0.0,
+    }
+
+
+class CheckpointRetention:
+    """Periodically prune and vacuum the checkpoint store, and keep the numbers for monitoring.
+
+    Each run opens its own connection, so the deletes never queue behind the checkpointer used by chat turns.
+
+    Examples:
+        ### Imports
+        >>> from app.core.checkpoints import CheckpointRetention, CheckpointRetentionPolicy
+
+        ### Prune every hour in the background
+        >>> retention = CheckpointRetention(dsn, CheckpointRetentionPolicy(), interval_s=3600)
+        >>> retention.start()
+        >>> retention.stats()
+        >>> await retention.close()
+    """
+
+    def __init__(self, dsn: str, policy: CheckpointRetentionPolicy, interval_s: float = 3600.0, vacuum: bool = True):
+        """Initialize the retention job; nothing runs until `start` or `run_once` is called.
+
+        Args:
+            dsn (str): Checkpoint database connection string.
+            policy (CheckpointRetentionPolicy): What to keep.
+            interval_s (float): Time between background runs.
+            vacuum (bool): Whether to vacuum the tables after each run that deleted rows.
+        """
+        self.dsn = dsn
+        self.policy = policy
+        self.interval_s = interval_s
+        self.vacuum = vacuum
+        self._task: asyncio.Task | None = None
+        self._runs = 0
+        self._failures = 0
+        self._reclaimed = CheckpointPruneResult()
+        self._last_run: dict[str, Any] = {}
+        self._table_sizes: dict[str, dict[str, int]] = {}
+
+    async def run_once(self) -> CheckpointPruneResult:
+        """Prune once, vacuum if rows were deleted, and refresh the table sizes."""
+        started_at = time.perf_counter()
+        async with await AsyncConnection.connect(self.dsn, autocommit=True) as conn:
+            result = await prune_checkpoints(conn, self.policy)
+            if self.vacuum and (result.checkpoints or result.writes or result.blobs):
+                await vacuum_checkpoints(conn)
+            self._table_sizes = await checkpoint_table_sizes(conn)
+
+        self._runs += 1
+        self._reclaimed.add(result)
+        self._last_run = {
+            "finished_at": datetime.now(UTC).isoformat(),
+            "duration_ms": round((time.perf_counter() - started_at) * 1000),
+            **result.as_dict(),
+        }
+        return result
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                self._failures += 1
+                _logger.exception("Checkpoint retention run failed")
+            await asyncio.sleep(self.interval_s)
+
+    def start(self) -> None:
+        """Start the background runs; the first one starts immediately."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def close(self) -> None:
+        """Stop the background runs."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return run counts, rows reclaimed so far, the last run and the table sizes it measured."""
+        return {
+            "runs": self._runs,
+            "failures": self._failures,
+            "reclaimed": self._reclaimed.as_dict(),
+            "last_run": self._last_run,
+            "tables": self._table_sizes,
+        }
@@ -1,5 +1,6 @@
 """Embedding Module."""
 
+from .cache import CachedEmbeddingsClient, EmbeddingDiskCache, embedding_model_key
 from .factory import get_embedding_client
 
-__all__ = ["get_embedding_client"]
+__all__ = ["CachedEmbeddingsClient", "EmbeddingDiskCache", "embedding_model_key", "get_embedding_client"]
@@ -0,0 +1,246 @@
+"""Caching wrapper for embeddings clients."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+from app.core.embeddings.clients.base import EmbeddingsClientInterface
+from utilities.logger import GetAppLogger
+
+QUERY = "query"
+DOCUMENT = "document"
+
+
+def embedding_model_key(provider: str, model_name: str, dimension: int | None = None) -> str:
+    """Build the cache namespace for a model, so vectors of different models or dimensions never mix."""
+    return f"{provider}:{model_name}:{dimension or 'default'}"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups: Unicode NFKC, collapsed whitespace, case-folded."""
+    return " ".join(unicodedata.normalize("NFKC", text).split()).casefold()
+
+
+class EmbeddingDiskCache:
+    """SQLite-backed embedding store shared between processes (e.g. the chat service and the ETL).
+
+    Vectors are stored as float32 blobs keyed by (model key, kind, text hash). The database runs in WAL mode
+    so readers in one process do not block writers in another.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the cache database.
+
+        Args:
+            path (str | Path): Path of the SQLite file. Parent directories are created if missing.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, kind TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, kind, text_hash))"
+        )
+        self._conn.commit()
+
+    def get_many(self, model: str, kind: str, text_hashes: list[str]) -> dict[str, list[float]]:
+        """Return the stored vectors for the given hashes; missing hashes are omitted."""
+        if not text_hashes:
+            return {}
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(text_hashes), 500):
+                chunk = text_hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND kind = ? AND text_hash IN ({placeholders})",
+                    (model, kind, *chunk),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[text_hash] = vector.tolist()
+        return found
+
+    def put_many(self, model: str, kind: str, items: dict[str, list[float]]) -> None:
+        """Store vectors keyed by text hash, replacing existing entries."""
+        if not items:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, kind, text_hash, vector) VALUES (?, ?, ?, ?)",
+                [(model, kind, text_hash, array("f", vector).tobytes()) for text_hash, vector in items.items()],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddingsClient(Embeddings, EmbeddingsClientInterface):
+    """Embeddings client that serves repeated texts from an in-memory LRU and an optional disk tier.
+
+    Entries are keyed by (model key, query/document, text) so differently prompted query and document embeddings
+    never mix. Query keys use the normalized text, so whitespace or case variations of the same question share one
+    entry; document keys use the exact text, since a document differing only in case is a different document. Misses
+    are embedded with the original, un-normalized text.
+
+    Examples:
+        ### Imports
+        >>> from app.core.embeddings import (
+        ...     CachedEmbeddingsClient,
+        ...     EmbeddingDiskCache,
+        ...     embedding_model_key,
+        ...     get_embedding_client,
+        ... )
+
+        ### Wrap a client with a 1024-entry LRU and a shared on-disk tier
+        >>> client = CachedEmbeddingsClient(
+        ...     get_embedding_client(provider="ollama", model_name="qwen3-embedding:0.6b"),
+        ...     model_key=embedding_model_key("ollama", "qwen3-embedding:0.6b"),
+        ...     max_entries=1024,
+        ...     disk_cache=EmbeddingDiskCache("~/.cache/bella/embeddings.sqlite3"),
+        ... )
+    """
+
+    def __init__(
+        self,
+        client: EmbeddingsClientInterface,
+        model_key: str,
+        max_entries: int = 1024,
+        disk_cache: EmbeddingDiskCache | None = None,
+    ):
+        """Initialize the caching wrapper.
+
+        Args:
+            client (EmbeddingsClientInterface): The embeddings client to wrap.
+            model_key (str): Identifies the model and output dimension; part of every cache key.
+            max_entries (int): Capacity of the in-memory LRU. Defaults to 1024.
+            disk_cache (EmbeddingDiskCache | None): Optional persistent tier. Defaults to None.
+        """
+        self.client = client
+        self.model_key = model_key
+        self.max_entries = max_entries
+        self.disk_cache = disk_cache
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._logger = GetAppLogger().get_logger()
+
+    @staticmethod
+    def _hash(kind: str, text: str) -> str:
+        key = normalize_text(text) if kind == QUERY else text
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _remember(self, kind: str, text_hash: str, vector: list[float]) -> None:
+        self._memory[(kind, text_hash)] = vector
+        self._memory.move_to_end((kind, text_hash))
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup_memory(self, kind: str, hashes: list[str]) -> dict[str, list[float]]:
+        found = {}
+        for text_hash in hashes:
+            vector = self._memory.get((kind, text_hash))
+            if vector is not None:
+                self._memory.move_to_end((kind, text_hash))
+                found[text_hash] = vector
+        return found
+
+    def _finish(
+        self, kind: str, hashes: list[str], found: dict[str, list[float]], fresh: dict[str, list[float]]
+    ) -> list[list[float]]:
+        for text_hash, vector in fresh.items():
+            self._remember(kind, text_hash, vector)
+        # Copies, so callers mutating a result cannot corrupt the cache
+        return [list(found[text_hash]) for text_hash in hashes]
+
+    def _embed(self, kind: str, texts: list[str]) -> list[list[float]]:
+        hashes = [self._hash(kind, text) for text in texts]
+        found = self._lookup_memory(kind, hashes)
+        missing = [h for h in dict.fromkeys(hashes) if h not in found]
+
+        from_disk: dict[str, list[float]] = {}
+        if missing and self.disk_cache is not None:
+            from_disk = self.disk_cache.get_many(self.model_key, kind, missing)
+            found.update(from_disk)
+            missing = [h for h in missing if h not in from_disk]
+
+        computed: dict[str, list[float]] = {}
+        if missing:
+            missing_set = set(missing)
+            to_embed = {h: text for h, text in zip(hashes, texts, strict=True) if h in missing_set}
+            if kind == QUERY:
+                vectors = [self.client.embed_query(text) for text in to_embed.values()]
+            else:
+                vectors = self.client.embed_documents(list(to_embed.values()))
+            computed = dict(zip(to_embed, vectors, strict=True))
+            found.update(computed)
+            if self.disk_cache is not None:
+                self.disk_cache.put_many(self.model_key, kind, computed)
+
+        self._record(len(hashes), len(computed))
+        return self._finish(kind, hashes, found, {**from_disk, **computed})
+
+    async def _aembed(self, kind: str, texts: list[str]) -> list[list[float]]:
+        hashes = [self._hash(kind, text) for text in texts]
+        found = self._lookup_memory(kind, hashes)
+        missing = [h for h in dict.fromkeys(hashes) if h not in found]
+
+        from_disk: dict[str, list[float]] = {}
+        if missing and self.disk_cache is not None:
+            from_disk = await asyncio.to_thread(self.disk_cache.get_many, self.model_key, kind, missing)
+            found.update(from_disk)
+            missing = [h for h in missing if h not in from_disk]
+
+        computed: dict[str, list[float]] = {}
+        if missing:
+            missing_set = set(missing)
+            to_embed = {h: text for h, text in zip(hashes, texts, strict=True) if h in missing_set}
+            if kind == QUERY:
+                vectors = [await self.client.aembed_query(text) for text in to_embed.values()]
+            else:
+                vectors = await self.client.aembed_documents(list(to_embed.values()))
+            computed = dict(zip(to_embed, vectors, strict=True))
+            found.update(computed)
+            if self.disk_cache is not None:
+                await asyncio.to_thread(self.disk_cache.put_many, self.model_key, kind, computed)
+
+        self._record(len(hashes), len(computed))
+        return self._finish(kind, hashes, found, {**from_disk, **computed})
+
+    def _record(self, requested: int, computed: int) -> None:
+        self.hits += requested - computed
+        self.misses += computed
+        self._logger.debug("Embedding cache: %d/%d served from cache", requested - computed, requested)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for a list of texts, embedding only those not cached."""
+        return self._embed(DOCUMENT, texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Get embedding for a single text, from the cache when possible."""
+        return self._embed(QUERY, [text])[0]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for a list of texts asynchronously, embedding only those not cached."""
+        return await self._aembed(DOCUMENT, texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Get embedding for a single text asynchronously, from the cache when possible."""
+        return (await self._aembed(QUERY, [text]))[0]
@@ -15,3 +15,13 @@ class EmbeddingsClientInterface(ABC):
     def embed_query(self, text: str) -> list[float]:
         """Get embedding for a single text."""
         pass
+
+    @abstractmethod
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for a list of texts asynchronously."""
+        pass
+
+    @abstractmethod
+    async def aembed_query(self, text: str) -> list[float]:
+        """Get embedding for a single text asynchronously."""
+        pass
@@ -3,7 +3,7 @@
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 from app.core.embeddings.clients.base import EmbeddingsClientInterface
-from utilities.logger import GetAppLogger
+from utilities.logger import GetAppLogger, preview
 from utilities.time_profile import log_exec_time
 
 
@@ -24,17 +24,17 @@ class GoogleEmbeddingsClient(GoogleGenerativeAIEmbeddings, EmbeddingsClientInter
     @log_exec_time
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Get embeddings for a list of texts."""
-        self._logger.debug("Embedding documents via Google: %s", texts)
+        self._logger.debug("Embedding documents via Google: %s", preview(texts))
         embeddings = super().embed_documents(texts)
-        self._logger.debug("Generated embeddings: %s", embeddings)
+        self._logger.debug("Generated embeddings: %s", preview(embeddings))
         return embeddings
 
     @log_exec_time
     def embed_query(self, text: str) -> list[float]:
         """Get embedding for a single text."""
-        self._logger.debug("Embedding query via Google: %s", text)
+        self._logger.debug("Embedding query via Google: %s", preview(text))
         embedding = super().embed_query(text)
-        self._logger.debug("Generated embedding: %s", embedding)
+        self._logger.debug("Generated embedding: %s", preview(embedding))
         return embedding
 
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
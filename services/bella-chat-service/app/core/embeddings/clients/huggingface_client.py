@@ -1,20 +1,25 @@
 """Huggingface embeddings client implementation."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_huggingface.embeddings import HuggingFaceEmbeddings
 
 from app.core.embeddings.clients.base import EmbeddingsClientInterface
-from utilities.logger import GetAppLogger
-from utilities.time_profile import log_exec_time
+from utilities.logger import GetAppLogger, preview
+from utilities.time_profile import async_log_exec_time, log_exec_time
 
 
 class HuggingfaceEmbeddingsClient(HuggingFaceEmbeddings, EmbeddingsClientInterface):
     """Huggingface embeddings client implementation."""
 
-    def __init__(self, model_name: str, **kwargs):
+    def __init__(self, model_name: str, max_workers: int = 1, **kwargs):
         """Initialize the Huggingface client with model name.
 
         Args:
             model_name (str): The Huggingface model to use.
+            max_workers (int): Threads available to async embedding calls. The model is CPU/GPU bound, so
+                async calls are queued on this bounded pool instead of running on the event loop. Defaults to 1.
             **kwargs: Additional keyword arguments for the HuggingFaceEmbeddings.
 
         Examples:
@@ -39,23 +44,34 @@ class HuggingfaceEmbeddingsClient(HuggingFaceEmbeddings, EmbeddingsClientInterfa
             **kwargs,
         )
         self._logger = GetAppLogger().get_logger()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hf-embed")
 
     @log_exec_time
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Get embeddings for a list of texts."""
-        self._logger.debug("Embedding documents: %s", texts)
+        self._logger.debug("Embedding documents: %s", preview(texts))
         embeddings = super().embed_documents(texts)
-        self._logger.debug("Generated embeddings: %s", embeddings)
+        self._logger.debug("Generated embeddings: %s", preview(embeddings))
         return embeddings
 
     @log_exec_time
     def embed_query(self, text: str) -> list[float]:
         """Get embedding for a single text."""
-        self._logger.debug("Embedding query: %s", text)
+        self._logger.debug("Embedding query: %s", preview(text))
         embedding = super().embed_query(text)
-        self._logger.debug("Generated embedding: %s", embedding)
+        self._logger.debug("Generated embedding: %s", preview(embedding))
         return embedding
 
+    @async_log_exec_time
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for a list of texts on the bounded embedding thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.embed_documents, texts)
+
+    @async_log_exec_time
+    async def aembed_query(self, text: str) -> list[float]:
+        """Get embedding for a single text on the bounded embedding thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.embed_query, text)
+
 
 if __name__ == "__main__":
     # Example usage
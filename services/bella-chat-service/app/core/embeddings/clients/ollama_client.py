@@ -1,22 +1,33 @@
 """Ollama embeddings client implementation."""
 
+import time
+
 from langchain_ollama import OllamaEmbeddings
+from ollama import AsyncClient
 
 from app.core.embeddings.clients.base import EmbeddingsClientInterface
-from utilities.logger import GetAppLogger
-from utilities.time_profile import log_exec_time
+from utilities.logger import GetAppLogger, preview
+from utilities.time_profile import async_log_exec_time, log_exec_time
 
 
 class OllamaEmbeddingsClient(OllamaEmbeddings, EmbeddingsClientInterface):
     """Ollama embeddings client implementation."""
 
-    def __init__(self, model_name: str, base_url: str | None = None, **kwargs):
+    def __init__(
+        self,
+        model_name: str,
+        base_url: str | None = None,
+        async_client: AsyncClient | None = None,
+        **kwargs,
+    ):
         """Initialize the Ollama client with model name.
 
         Args:
             model_name (str): The Ollama model to use.
             base_url (str | None): The base URL for the Ollama server. Defaults to None (resolves to default).
-            **kwargs: Additional keyword arguments for the OllamaEmbeddings.
+            async_client (AsyncClient | None): Ollama async client to share with other Ollama clients, so they
+                reuse one HTTP connection pool. Defaults to None (a client of its own).
+            **kwargs: Additional keyword arguments for the OllamaEmbeddings (e.g. `keep_alive`).
 
         Examples:
             ### Imports
@@ -37,22 +48,54 @@ class OllamaEmbeddingsClient(OllamaEmbeddings, EmbeddingsClientInterface):
         """
         effective_base_url = base_url or "http://localhost:11434"
         super().__init__(model=model_name, base_url=effective_base_url, **kwargs)
+        if async_client is not None:
+            self._async_client = async_client
         self._logger = GetAppLogger().get_logger()
 
+    async def awarm_up(self) -> float:
+        """Load the model into Ollama's memory ahead of the first request.
+
+        Returns:
+            float: Time taken, in milliseconds.
+        """
+        if self._async_client is None:
+            raise ValueError("Ollama async client is not initialized")
+        started_at = time.perf_counter()
+        await self._async_client.embed(model=self.model, input="warm-up", keep_alive=self.keep_alive)
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        self._logger.info(f"Warmed up Ollama embedding model `{self.model}` in {elapsed_ms:.0f} ms")
+        return elapsed_ms
+
     @log_exec_time
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Get embeddings for a list of texts."""
-        self._logger.debug("Embedding documents: %s", texts)
+        self._logger.debug("Embedding documents: %s", preview(texts))
         embeddings = super().embed_documents(texts)
-        self._logger.debug("Generated embeddings: %s", embeddings)
+        self._logger.debug("Generated embeddings: %s", preview(embeddings))
         return embeddings
 
     @log_exec_time
     def embed_query(self, text: str) -> list[float]:
         """Get embedding for a single text."""
-        self._logger.debug("Embedding query: %s", text)
+        self._logger.debug("Embedding query: %s", preview(text))
         embedding = super().embed_query(text)
-        self._logger.debug("Generated embedding: %s", embedding)
+        self._logger.debug("Generated embedding: %s", preview(embedding))
+        return embedding
+
+    @async_log_exec_time
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for a list of texts asynchronously."""
+        self._logger.debug("Embedding documents: %s", preview(texts))
+        embeddings = await super().aembed_documents(texts)
+        self._logger.debug("Generated embeddings: %s", preview(embeddings))
+        return embeddings
+
+    @async_log_exec_time
+    async def aembed_query(self, text: str) -> list[float]:
+        """Get embedding for a single text asynchronously."""
+        self._logger.debug("Embedding query: %s", preview(text))
+        embedding = (await self.aembed_documents([text]))[0]
+        self._logger.debug("Generated embedding: %s", preview(embedding))
         return embedding
 
 
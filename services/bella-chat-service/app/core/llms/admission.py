@@ -0,0 +1,199 @@
+"""Admission control for local LLM inference.
+
+A single Ollama host serves every chat turn, every deep agent sub-agent and the background conversation summaries.
+Letting all of them hit the model at once thrashes its context cache and makes every caller slow. The
+`LLMAdmissionController` admits at most `max_concurrent` model calls at a time and queues the rest by priority:
+interactive turns ahead of background work, first come first served within a priority.
+
+Callers do not pass the priority or a queue listener around; both are read from context variables when a call asks
+for a slot, so they follow the request through LangGraph's tasks:
+
+- `llm_priority` (set with `use_priority`) selects the queue a call waits in,
+- `llm_queue_listener` is called with the call's queue position whenever it changes, and with 0 once admitted.
+
+`AdmissionControlledChatModel` gates a chat model's async generation and streaming through a controller.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from enum import IntEnum
+from typing import Any
+
+
+class Priority(IntEnum):
+    """Queue priority of a model call; lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 10
+
+
+llm_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.INTERACTIVE)
+llm_queue_listener: ContextVar[Callable[[int], None] | None] = ContextVar("llm_queue_listener", default=None)
+
+
+@contextmanager
+def use_priority(priority: Priority) -> Iterator[None]:
+    """Run the model calls made inside the block at `priority`."""
+    token = llm_priority.set(priority)
+    try:
+        yield
+    finally:
+        llm_priority.reset(token)
+
+
+@dataclass
+class AdmissionStats:
+    """Counters describing how much model calls queue."""
+
+    admitted: int = 0
+    queued: int = 0  # Admitted calls that had to wait
+    cancelled: int = 0  # Calls cancelled while waiting
+    wait_ms: float = 0.0
+    max_waiting: int = 0
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: asyncio.Future = field(compare=False)
+    listener: Callable[[int], None] | None = field(compare=False)
+    position: int = field(default=0, compare=False)
+
+
+class LLMAdmissionController:
+    """Bound concurrent model calls and queue the rest by priority.
+
+    Examples:
+        ### Imports
+        >>> from app.core.llms.admission import LLMAdmissionController, Priority
+
+        ### At most two calls at a time; summaries wait behind chat turns
+        >>> controller = LLMAdmissionController(max_concurrent=2)
+        >>> async with controller.slot(Priority.BACKGROUND):
+        ...     await model.ainvoke(messages)
+    """
+
+    def __init__(self, max_concurrent: int):
+        """Initialize the controller.
+
+        Args:
+            max_concurrent (int): Model calls admitted at the same time.
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self._active = 0
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._stats = AdmissionStats()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it for the duration of the block.
+
+        Args:
+            priority (Priority | None): Queue priority. Defaults to the `llm_priority` context variable.
+        """
+        priority = llm_priority.get() if priority is None else priority
+        listener = llm_queue_listener.get()
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+        else:
+            await self._wait(priority, listener)
+        self._stats.admitted += 1
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _wait(self, priority: Priority, listener: Callable[[int], None] | None) -> None:
+        started_at = time.perf_counter()
+        waiter = _Waiter(int(priority), next(self._seq), asyncio.get_running_loop().create_future(), listener)
+        heapq.heappush(self._waiters, waiter)
+        self._stats.max_waiting = max(self._stats.max_waiting, len(self._waiters))
+        self._notify_positions()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the caller was cancelled: hand the slot on
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._notify_positions()
+            self._stats.cancelled += 1
+            raise
+        self._stats.queued += 1
+        self._stats.wait_ms += (time.perf_counter() - started_at) * 1000
+        if listener is not None:
+            listener(0)
+
+    def _release(self) -> None:
+        """Hand the slot to the first waiter, or free it."""
+        while self._waiters:
+            waiter = heapq.heappop(self._waiters)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                self._notify_positions()
+                return
+        self._active -= 1
+
+    def _notify_positions(self) -> None:
+        """Tell every waiter whose queue position changed its new position."""
+        for position, waiter in enumerate(sorted(self._waiters), start=1):
+            if waiter.position != position:
+                waiter.position = position
+                if waiter.listener is not None:
+                    waiter.listener(position)
+
+    def stats(self) -> dict[str, float]:
+        """Return the counters with the current load and the average wait of queued calls."""
+        stats = asdict(self._stats)
+        return {
+            **stats,
+            "wait_ms": round(self._stats.wait_ms, 1),
+            "wait_ms_avg": round(self._stats.wait_ms / self._stats.queued, 1) if self._stats.queued else 0.0,
+            "active": self._active,
+            "waiting": len(self._waiters),
+            "max_concurrent": self.max_concurrent,
+        }
+
+
+class AdmissionControlledChatModel:
+    """Chat model mixin that runs every async generation and stream inside an admission slot.
+
+    List it before the chat model class; calls are gated once `_admission` is set, e.g. by the subclass
+    `__init__`. Without a controller, calls run as before.
+
+    Examples:
+        ### Imports
+        >>> from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        >>> from app.core.llms.admission import AdmissionControlledChatModel, LLMAdmissionController
+
+        ### Gate a fake model
+        >>> class FakeModel(AdmissionControlledChatModel, GenericFakeChatModel):
+        ...     pass
+        >>> model = FakeModel(messages=iter(["Hi!"]))
+        >>> model._admission = LLMAdmissionController(max_concurrent=1)
+    """
+
+    def _admission_slot(self):
+        admission: LLMAdmissionController | None = getattr(self, "_admission", None)
+        return admission.slot() if admission is not None else nullcontext()
+
+    async def _agenerate(self, messages: list, stop: list[str] | None = None, run_manager=None, **kwargs: Any):
+        """Generate inside an admission slot."""
+        async with self._admission_slot():
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)  # type: ignore[misc]
+
+    async def _astream(self, messages: list, stop: list[str] | None = None, run_manager=None, **kwargs: Any):
+        """Stream inside an admission slot, held until the stream ends or is closed."""
+        async with self._admission_slot():
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):  # type: ignore[misc]
+                yield chunk
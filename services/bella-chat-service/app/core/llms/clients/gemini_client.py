@@ -5,7 +5,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import BaseModel
 
 from app.core.llms.clients import LLMClientInterface
-from utilities.logger import GetAppLogger
+from utilities.logger import GetAppLogger, preview
 from utilities.time_profile import log_exec_time
 
 
@@ -54,55 +54,55 @@ class GeminiClient(ChatGoogleGenerativeAI, LLMClientInterface):
     @log_exec_time
     def query(self, messages: list[BaseMessage]) -> str:
         """Query the Gemini LLM with a list of messages and return the response as a string."""
-        self._logger.debug("Querying Gemini LLM with messages: %s", messages)
+        self._logger.debug("Querying Gemini LLM with messages: %s", preview(messages))
         response = self.invoke(messages)
-        self._logger.debug("Gemini LLM response: %s", response)
+        self._logger.debug("Gemini LLM response: %s", preview(response))
         return response.content
 
     @log_exec_time
     def query_structured(self, messages: list[BaseMessage], response_model: BaseModel) -> BaseModel:
         """Query the Gemini LLM and return the response as a structured pydantic model."""
-        self._logger.debug("Querying Gemini LLM with messages: %s", messages)
+        self._logger.debug("Querying Gemini LLM with messages: %s", preview(messages))
         structured_llm = self.with_structured_output(response_model)
         response = structured_llm.invoke(messages)
-        self._logger.debug("Gemini LLM response: %s", response)
+        self._logger.debug("Gemini LLM response: %s", preview(response))
         return response
 
     @log_exec_time
     def stream_query(self, messages: list[BaseMessage]):
         """Stream the Gemini LLM response for a list of messages."""
-        self._logger.debug("Streaming Gemini LLM response for messages: %s", messages)
+        self._logger.debug("Streaming Gemini LLM response for messages: %s", preview(messages))
         response = ""
         for chunk in self.stream(messages):
             response += chunk.content
             yield chunk.content
-        self._logger.debug("Completed streaming LLM response: %s", response)
+        self._logger.debug("Completed streaming LLM response: %s", preview(response))
 
     @log_exec_time
     async def aquery(self, messages: list[BaseMessage]) -> str:
         """Asynchronously query the Gemini LLM with a list of messages and return the response as a string."""
-        self._logger.debug("Asynchronously querying Gemini LLM with messages: %s", messages)
+        self._logger.debug("Asynchronously querying Gemini LLM with messages: %s", preview(messages))
         response = await self.ainvoke(messages)
-        self._logger.debug("Gemini LLM response: %s", response)
+        self._logger.debug("Gemini LLM response: %s", preview(response))
         return response.content
 
     @log_exec_time
     async def aquery_structured(self, messages: list[BaseMessage], response_model: BaseModel) -> BaseModel:
         """Asynchronously query the Gemini LLM and return the response as a structured pydantic model."""
-        self._logger.debug("Asynchronously querying Gemini LLM with messages: %s", messages)
+        self._logger.debug("Asynchronously querying Gemini LLM with messages: %s", preview(messages))
         structured_llm = self.with_structured_output(response_model)
         response = await structured_llm.ainvoke(messages)
-        self._logger.debug("Gemini LLM response: %s", response)
+        self._logger.debug("Gemini LLM response: %s", preview(response))
         return response
 
     async def astream_query(self, messages: list[BaseMessage]):
         """Asynchronously stream the Gemini LLM response for a list of messages."""
-        self._logger.debug("Asynchronously streaming Gemini LLM response for messages: %s", messages)
+        self._logger.debug("Asynchronously streaming Gemini LLM response for messages: %s", preview(messages))
         response = ""
         async for chunk in self.astream(messages):
             response += chunk.content
             yield chunk.content
-        self._logger.debug("Completed streaming LLM response: %s", response)
+        self._logger.debug("Completed streaming LLM response: %s", preview(response))
 
 
 if __name__ == "__main__":
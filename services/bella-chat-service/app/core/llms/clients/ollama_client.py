@@ -1,25 +1,41 @@
 """Ollama LLM client implementation."""
 
+import time
+
 from langchain_core.messages.base import BaseMessage
 from langchain_ollama import ChatOllama
+from ollama import AsyncClient
 from pydantic import BaseModel
 
+from app.core.llms.admission import AdmissionControlledChatModel, LLMAdmissionController
 from app.core.llms.clients import LLMClientInterface
-from utilities.logger import GetAppLogger
+from utilities.logger import GetAppLogger, preview
 from utilities.time_profile import log_exec_time
 
 
-class OllamaClient(ChatOllama, LLMClientInterface):
+class OllamaClient(AdmissionControlledChatModel, ChatOllama, LLMClientInterface):
     """Ollama LLM client implementation."""
 
-    def __init__(self, model: str, temperature: float = 0.1, base_url: str = "http://localhost:11434", **kwargs):
+    def __init__(
+        self,
+        model: str,
+        temperature: float = 0.1,
+        base_url: str = "http://localhost:11434",
+        async_client: AsyncClient | None = None,
+        admission: LLMAdmissionController | None = None,
+        **kwargs,
+    ):
         """Initialize the Ollama client with model and temperature.
 
         Args:
             model (str): The Ollama model to use.
             temperature (float): The temperature for response generation. Defaults to 0.1.
             base_url (str): The base URL for the Ollama server. Defaults to "http://localhost:11434".
-            **kwargs: Additional keyword arguments for the ChatOllama.
+            async_client (AsyncClient | None): Ollama async client to share with other Ollama clients, so they
+                reuse one HTTP connection pool. Defaults to None (a client of its own).
+            admission (LLMAdmissionController | None): Admission controller bounding the async model calls made
+                concurrently against the Ollama host. Defaults to None (calls are not queued).
+            **kwargs: Additional keyword arguments for the ChatOllama (e.g. `keep_alive`).
 
         Examples:
             ### Imports
@@ -50,62 +66,81 @@ class OllamaClient(ChatOllama, LLMClientInterface):
             Hello, how are you?
         """
         super().__init__(model=model, temperature=temperature, base_url=base_url, **kwargs)
+        if async_client is not None:
+            self._async_client = async_client
+        self._admission = admission
         self._logger = GetAppLogger().get_logger()
 
+    async def awarm_up(self) -> float:
+        """Load the model into Ollama's memory ahead of the first request.
+
+        Sends an empty prompt, which loads the model without generating, with the same context length as real
+        requests so they do not trigger a reload.
+
+        Returns:
+            float: Time taken, in milliseconds.
+        """
+        started_at = time.perf_counter()
+        options = {"num_ctx": self.num_ctx} if self.num_ctx else None
+        await self._async_client.generate(model=self.model, prompt="", options=options, keep_alive=self.keep_alive)
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        self._logger.info(f"Warmed up Ollama model `{self.model}` in {elapsed_ms:.0f} ms")
+        return elapsed_ms
+
     @log_exec_time
     def query(self, messages: list[BaseMessage]) -> str:
         """Query the Ollama LLM with a list of messages and return the response as a string."""
-        self._logger.debug("Querying Ollama LLM with messages: %s", messages)
+        self._logger.debug("Querying Ollama LLM with messages: %s", preview(messages))
         response = self.invoke(messages)
-        self._logger.debug("Ollama LLM response: %s", response)
-        self._logger.debug("Ollama LLM response metadata: %s", response.response_metadata)
+        self._logger.debug("Ollama LLM response: %s", preview(response))
+        self._logger.debug("Ollama LLM response metadata: %s", preview(response.response_metadata))
         return response.content
 
     @log_exec_time
     def query_structured(self, messages: list[BaseMessage], response_model: BaseModel) -> BaseModel:
         """Query the Ollama LLM and return the response as a structured pydantic model."""
-        self._logger.debug("Querying Ollama LLM with messages: %s", messages)
+        self._logger.debug("Querying Ollama LLM with messages: %s", preview(messages))
         structured_llm = self.with_structured_output(response_model)
         response = structured_llm.invoke(messages)
-        self._logger.debug("Ollama LLM response: %s", response)
+        self._logger.debug("Ollama LLM response: %s", preview(response))
         return response
 
     @log_exec_time
     def stream_query(self, messages: list[BaseMessage]):
         """Stream the Ollama LLM response for a list of messages."""
-        self._logger.debug("Streaming Ollama LLM response for messages: %s", messages)
+        self._logger.debug("Streaming Ollama LLM response for messages: %s", preview(messages))
         response = ""
         for chunk in self.stream(messages):
             response += chunk.content
             yield chunk.content
-        self._logger.debug("Completed streaming LLM response: %s", response)
+        self._logger.debug("Completed streaming LLM response: %s", preview(response))
 
     @log_exec_time
     async def aquery(self, messages: list[BaseMessage]) -> str:
         """Asynchronously query the Ollama LLM with a list of messages and return the response as a string."""
-        self._logger.debug("Asynchronously querying Ollama LLM with messages: %s", messages)
+        self._logger.debug("Asynchronously querying Ollama LLM with messages: %s", preview(messages))
         response = await self.ainvoke(messages)
-        self._logger.debug("Ollama LLM response: %s", response)
+        self._logger.debug("Ollama LLM response: %s", preview(response))
         return response.content
 
     @log_exec_time
     async def aquery_structured(self, messages: list[BaseMessage], response_model: BaseModel) -> BaseModel:
         """Asynchronously query the Ollama LLM and return the response as a structured pydantic model."""
-        self._logger.debug("Asynchronously querying Ollama LLM with messages: %s", messages)
+        self._logger.debug("Asynchronously querying Ollama LLM with messages: %s", preview(messages))
         structured_llm = self.with_structured_output(response_model)
         response = await structured_llm.ainvoke(messages)
-        self._logger.debug("Ollama LLM response: %s", response)
+        self._logger.debug("Ollama LLM response: %s", preview(response))
         return response
 
     @log_exec_time
     async def astream_query(self, messages: list[BaseMessage]):
         """Asynchronously stream the Ollama LLM response for a list of messages."""
-        self._logger.debug("Asynchronously streaming Ollama LLM response for messages: %s", messages)
+        self._logger.debug("Asynchronously streaming Ollama LLM response for messages: %s", preview(messages))
         response = ""
         async for chunk in self.astream(messages):
             response += chunk.content
             yield chunk.content
-        self._logger.debug("Completed streaming LLM response: %s", response)
+        self._logger.debug("Completed streaming LLM response: %s", preview(response))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""Per-request LLM timing and throughput metrics."""
+
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import ChatGenerationChunk, GenerationChunk, LLMResult
+
+
+class LLMTurnMetrics(AsyncCallbackHandler):
+    """Collect token counts and generation time over every model call of one request, sub-agents included.
+
+    Pass an instance in the run config's `callbacks`. Ollama reports the time spent generating (`eval_duration`)
+    and loading the model (`load_duration`); for other providers the generation time is measured from the first
+    streamed token, or from the call start when the call did not stream.
+
+    Examples:
+        ### Imports
+        >>> from app.core.llms.metrics import LLMTurnMetrics
+
+        ### Measure a run
+        >>> metrics = LLMTurnMetrics()
+        >>> await agent.ainvoke(inputs, {"callbacks": [metrics]})
+        >>> metrics.summary()
+        {'llm_calls': 2, 'input_tokens': 1830, 'output_tokens': 212, 'tokens_per_s': 38.4, 'model_load_ms': 0.0}
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        super().__init__()
+        self.llm_calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.generation_s = 0.0
+        self.model_load_ms = 0.0
+        self._started_at: dict[UUID, float] = {}
+        self._first_token_at: dict[UUID, float] = {}
+
+    async def on_chat_model_start(self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs) -> None:
+        """Record when a model call starts."""
+        self._started_at[run_id] = time.perf_counter()
+
+    async def on_llm_start(self, serialized: dict[str, Any], prompts: list[str], *, run_id: UUID, **kwargs) -> None:
+        """Record when a completion model call starts."""
+        self._started_at[run_id] = time.perf_counter()
+
+    async def on_llm_new_token(
+        self,
+        token: str | list[str | dict[str, Any]],
+        *,
+        chunk: GenerationChunk | ChatGenerationChunk | None = None,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs,
+    ) -> None:
+        """Record when a model call streams its first token."""
+        self._first_token_at.setdefault(run_id, time.perf_counter())
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        """Add the call's token counts and generation time."""
+        ended_at = time.perf_counter()
+        started_at = self._started_at.pop(run_id, ended_at)
+        first_token_at = self._first_token_at.pop(run_id, None)
+        self.llm_calls += 1
+
+        eval_ns = 0
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None) or {}
+                self.input_tokens += usage.get("input_tokens", 0)
+                self.output_tokens += usage.get("output_tokens", 0)
+                metadata = {**(generation.generation_info or {}), **(getattr(message, "response_metadata", None) or {})}
+                eval_ns += metadata.get("eval_duration") or 0
+                self.model_load_ms += (metadata.get("load_duration") or 0) / 1e6
+        self.generation_s += eval_ns / 1e9 if eval_ns else ended_at - (first_token_at or started_at)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        """Forget a failed call."""
+        self._started_at.pop(run_id, None)
+        self._first_token_at.pop(run_id, None)
+
+    @property
+    def tokens_per_s(self) -> float:
+        """Output tokens per second of generation time."""
+        return self.output_tokens / self.generation_s if self.generation_s else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Return the counters, rounded for the SSE `done` event and logs."""
+        return {
+            "llm_calls": self.llm_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "tokens_per_s": round(self.tokens_per_s, 1),
+            "model_load_ms": round(self.model_load_ms, 1),
+        }
@@ -0,0 +1,5 @@
+"""MCP Client Module."""
+
+from .session_pool import MCPSessionPool, MCPSessionPoolStats
+
+__all__ = ["MCPSessionPool", "MCPSessionPoolStats"]
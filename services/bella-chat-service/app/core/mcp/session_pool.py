@@ -0,0 +1,285 @@
+"""Pool of long-lived MCP client sessions shared across chat turns."""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import anyio
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.interceptors import MCPToolCallRequest
+from langchain_mcp_adapters.sessions import StreamableHttpConnection, create_session
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.types import CallToolResult, ServerNotification, ToolListChangedNotification
+
+from utilities.logger import GetAppLogger
+
+if TYPE_CHECKING:
+    from mcp import ClientSession
+
+_logger = GetAppLogger().get_logger()
+
+# Errors raised when a pooled session's streams are already gone, i.e. the request was never sent
+_DEAD_SESSION_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+
+@dataclass
+class MCPSessionPoolStats:
+    """Counters describing how well the pool reuses sessions and tool listings."""
+
+    sessions_opened: int = 0
+    sessions_reused: int = 0
+    sessions_closed: int = 0
+    tool_calls: int = 0
+    tool_list_refreshes: int = 0
+    tool_list_cache_hits: int = 0
+
+
+class _PooledSession:
+    """An MCP client session held open by a dedicated task until closed.
+
+    The transport's anyio task groups must be exited by the task that entered them, so each session
+    lives in its own task instead of in whichever request happened to open it.
+    """
+
+    def __init__(self, connection: StreamableHttpConnection):
+        self.connection = connection
+        self.session: ClientSession | None = None
+        self.last_used = time.monotonic()
+        self.in_flight = 0
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: BaseException | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the session task has finished."""
+        return self._task is None or self._task.done()
+
+    async def open(self) -> None:
+        """Start the session task and wait until the session is initialized."""
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with create_session(self.connection) as session:
+                await session.initialize()
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as exc:
+            if not self._ready.is_set():
+                self._error = exc
+            else:
+                _logger.warning(f"Pooled MCP session ended unexpectedly: {exc!r}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def close(self) -> None:
+        """Close the session and wait for its task to exit."""
+        self._closing.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPSessionPool:
+    """Long-lived MCP sessions keyed by caller token, with a cached tool listing.
+
+    Each distinct bearer token gets its own session (the MCP server authorizes per HTTP request), which is
+    reused across chat turns and tool calls over keep-alive connections. Sessions idle for longer than
+    `idle_ttl_s` or beyond `max_sessions` are closed, least recently used first.
+
+    Tools returned by `get_tools` are shared by every caller: their calls are routed through the pool by an
+    interceptor that resolves the caller's token from the LangGraph runtime via `token_from_runtime`.
+    The listing is cached for `tools_ttl_s` and dropped early when the server sends `tools/list_changed`.
+    """
+
+    server_name = "ems"
+
+    def __init__(
+        self,
+        url: str,
+        token_from_runtime: Callable[[object | None], str | None],
+        max_sessions: int = 16,
+        idle_ttl_s: float = 300.0,
+        tools_ttl_s: float = 600.0,
+    ):
+        """Initialize an empty pool; sessions are opened on first use."""
+        self.url = url
+        self.max_sessions = max_sessions
+        self.idle_ttl_s = idle_ttl_s
+        self.tools_ttl_s = tools_ttl_s
+        self._token_from_runtime = token_from_runtime
+        self._sessions: OrderedDict[str, _PooledSession] = OrderedDict()
+        self._session_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._tools: list[BaseTool] | None = None
+        self._tools_loaded_at = 0.0
+        self._tools_lock = asyncio.Lock()
+        self._stats = MCPSessionPoolStats()
+
+    def _connection(self, token: str | None) -> StreamableHttpConnection:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        return {
+            "url": self.url,
+            "transport": "streamable_http",
+            "headers": headers,
+            "session_kwargs": {"message_handler": self._handle_message},
+        }
+
+    @staticmethod
+    def _session_key(token: str | None) -> str:
+        return hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
+    async def _handle_message(self, message: object) -> None:
+        """Invalidate the cached tool listing when the server announces a change."""
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            _logger.info(f"MCP server '{self.server_name}' reported a tool list change; refreshing on next use")
+            self._tools_loaded_at = 0.0
+
+    async def _acquire(self, token: str | None) -> _PooledSession:
+        """Return the open session for `token`, opening one if needed."""
+        key = self._session_key(token)
+        while True:
+            lock = self._session_locks[key]
+            async with lock:
+                if self._session_locks.get(key) is not lock:
+                    continue  # The lock was pruned while we waited for it; take the current one
+                pooled = self._sessions.get(key)
+                if pooled is not None and not pooled.closed:
+                    self._sessions.move_to_end(key)
+                    self._stats.sessions_reused += 1
+                else:
+                    pooled = _PooledSession(self._connection(token))
+                    await pooled.open()
+                    self._sessions[key] = pooled
+                    self._stats.sessions_opened += 1
+                pooled.last_used = time.monotonic()
+                break
+        await self._evict()
+        return pooled
+
+    def _prune_lock(self, key: str) -> None:
+        """Drop the lock of a session that left the pool, unless a caller is opening a session under it."""
+        lock = self._session_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._session_locks[key]
+
+    async def _discard(self, token: str | None) -> None:
+        key = self._session_key(token)
+        pooled = self._sessions.pop(key, None)
+        self._prune_lock(key)
+        if pooled is not None:
+            await pooled.close()
+            self._stats.sessions_closed += 1
+
+    async def _evict(self) -> None:
+        """Close dead, idle and surplus sessions that have no call in flight."""
+        now = time.monotonic()
+        surplus = len(self._sessions) - self.max_sessions
+        for key, pooled in list(self._sessions.items()):
+            if pooled.in_flight:
+                continue
+            if pooled.closed or surplus > 0 or now - pooled.last_used > self.idle_ttl_s:
+                self._sessions.pop(key, None)
+                self._prune_lock(key)
+                surplus -= 1
+                await pooled.close()
+                self._stats.sessions_closed += 1
+
+    async def call_tool(self, token: str | None, name: str, arguments: dict[str, Any]) -> CallToolResult:
+        """Call an MCP tool on the caller's pooled session.
+
+        A session whose streams are already closed is replaced and the call retried once; any other error
+        discards the session and propagates, so non-idempotent tools are never sent twice.
+        """
+        self._stats.tool_calls += 1
+        for attempt in range(2):
+            pooled = await self._acquire(token)
+            session = pooled.session
+            pooled.in_flight += 1
+            try:
+                if session is None:
+                    raise anyio.ClosedResourceError
+                return await session.call_tool(name, arguments)
+            except _DEAD_SESSION_ERRORS:
+                await self._discard(token)
+                if attempt:
+                    raise
+            except Exception:
+                await self._discard(token)
+                raise
+            finally:
+                pooled.in_flight -= 1
+                pooled.last_used = time.monotonic()
+        raise AssertionError("unreachable")
+
+    async def _intercept(
+        self,
+        request: MCPToolCallRequest,
+        handler: Callable[[MCPToolCallRequest], Awaitable[Any]],
+    ) -> CallToolResult:
+        """Tool interceptor routing the call through the pool instead of a per-call session."""
+        token = self._token_from_runtime(request.runtime)
+        return await self.call_tool(token, request.name, request.args)
+
+    async def get_tools(self, token: str | None) -> list[BaseTool]:
+        """Return LangChain tools for the server, listing them with `token` when the cache is stale."""
+        if self._tools is not None and time.monotonic() - self._tools_loaded_at < self.tools_ttl_s:
+            self._stats.tool_list_cache_hits += 1
+            return self._tools
+
+        async with self._tools_lock:
+            if self._tools is not None and time.monotonic() - self._tools_loaded_at < self.tools_ttl_s:
+                self._stats.tool_list_cache_hits += 1
+                return self._tools
+
+            pooled = await self._acquire(token)
+            session = pooled.session
+            if session is None:
+                raise anyio.ClosedResourceError
+            # Count the listing as a call in flight, so the session is not evicted while it pages through tools
+            pooled.in_flight += 1
+            try:
+                listed = await session.list_tools()
+                mcp_tools = list(listed.tools)
+                while listed.nextCursor:
+                    listed = await session.list_tools(cursor=listed.nextCursor)
+                    mcp_tools.extend(listed.tools)
+            finally:
+                pooled.in_flight -= 1
+                pooled.last_used = time.monotonic()
+
+            self._tools = [
+                convert_mcp_tool_to_langchain_tool(
+                    None,
+                    tool,
+                    connection=self._connection(None),
+                    tool_interceptors=[self._intercept],
+                    server_name=self.server_name,
+                )
+                for tool in mcp_tools
+            ]
+            self._tools_loaded_at = time.monotonic()
+            self._stats.tool_list_refreshes += 1
+            _logger.info(f"Loaded {len(self._tools)} tools from MCP server '{self.server_name}'")
+            return self._tools
+
+    def stats(self) -> dict[str, int]:
+        """Return session reuse and tool listing counters."""
+        return {**asdict(self._stats), "active_sessions": sum(not s.closed for s in self._sessions.values())}
+
+    async def close(self) -> None:
+        """Close every pooled session."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._session_locks.clear()
+        await asyncio.gather(*(pooled.close() for pooled in sessions), return_exceptions=True)
+        self._stats.sessions_closed += len(sessions)
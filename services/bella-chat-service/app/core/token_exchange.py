@@ -0,0 +1,146 @@
+"""Cached RFC 8693 token exchange (On-Behalf-Of) against the auth service."""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+
+import httpx
+from jose import jwt
+
+from utilities.logger import GetAppLogger
+
+_logger = GetAppLogger().get_logger()
+
+GRANT_TYPE_TOKEN_EXCHANGE = "urn:ietf:params:oauth:grant-type:token-exchange"
+TOKEN_TYPE_ACCESS_TOKEN = "urn:ietf:params:oauth:token-type:access_token"
+
+
+class TokenExchangeClient:
+    """Exchange user tokens for resource-scoped tokens, caching each result until shortly before it expires.
+
+    Results are keyed by a hash of the subject token plus the target resource, so the raw user token is never
+    held as a dictionary key. Concurrent exchanges for the same key (e.g. overlapping turns of one conversation)
+    share a single request to the auth service.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        token_url: str,
+        client_id: str,
+        refresh_margin_s: float = 30.0,
+        max_entries: int = 1024,
+    ):
+        """Initialize the client.
+
+        Args:
+            http_client: Shared, pooled HTTP client used for every exchange request.
+            token_url: The auth service's `/oauth/token` endpoint.
+            client_id: OAuth client id presented as the acting party.
+            refresh_margin_s: Stop serving a cached token this many seconds before its expiry.
+            max_entries: Maximum number of cached tokens; the oldest are dropped first.
+        """
+        self._http_client = http_client
+        self._token_url = token_url
+        self._client_id = client_id
+        self._refresh_margin_s = refresh_margin_s
+        self._max_entries = max_entries
+        self._cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[tuple[str, float] | None]] = {}
+
+    @staticmethod
+    def _cache_key(subject_token: str, resource: str) -> str:
+        return hashlib.sha256(f"{resource}\n{subject_token}".encode()).hexdigest()
+
+    async def exchange(self, subject_token: str, resource: str) -> str | None:
+        """Return a token for `resource` acting on behalf of `subject_token`'s user.
+
+        Returns:
+            The exchanged access token, or None if the auth service did not issue one. Failures are not cached.
+        """
+        key = self._cache_key(subject_token, resource)
+        cached = self._cache.get(key)
+        if cached is not None:
+            token, expires_at = cached
+            if time.time() < expires_at - self._refresh_margin_s:
+                self._cache.move_to_end(key)
+                return token
+            del self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._request(subject_token, resource))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so a cancelled turn does not cancel the exchange other turns are waiting on
+        result = await asyncio.shield(task)
+        if result is None:
+            return None
+
+        token, expires_at = result
+        self._store(key, token, expires_at)
+        return token
+
+    def _store(self, key: str, token: str, expires_at: float) -> None:
+        now = time.time()
+        for stale_key in [k for k, (_, exp) in self._cache.items() if exp - self._refresh_margin_s <= now]:
+            del self._cache[stale_key]
+        self._cache[key] = (token, expires_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    async def _request(self, subject_token: str, resource: str) -> tuple[str, float] | None:
+        """POST the token-exchange grant and return the issued token with its expiry (epoch seconds)."""
+        requested_at = time.time()
+        try:
+            resp = await self._http_client.post(
+                self._token_url,
+                data={
+                    "grant_type": GRANT_TYPE_TOKEN_EXCHANGE,
+                    "subject_token": subject_token,
+                    "subject_token_type": TOKEN_TYPE_ACCESS_TOKEN,
+                    "client_id": self._client_id,
+                    "resource": resource,
+                },
+            )
+        except httpx.HTTPError as exc:
+            _logger.warning(f"OBO token exchange failed: {exc!r}")
+            return None
+
+        if resp.status_code != HTTPStatus.OK:
+            _logger.warning(f"OBO token exchange returned {resp.status_code}")
+            return None
+
+        try:
+            body = resp.json()
+        except ValueError as exc:
+            _logger.warning(f"OBO token exchange returned a non-JSON body: {exc!r}")
+            return None
+        if not isinstance(body, dict):
+            _logger.warning("OBO token exchange returned an unexpected response body")
+            return None
+
+        token = body.get("access_token")
+        if not token:
+            _logger.warning("OBO token exchange response did not include an access token")
+            return None
+
+        return token, self._expires_at(token, body.get("expires_in"), requested_at)
+
+    @staticmethod
+    def _expires_at(token: str, expires_in: object, requested_at: float) -> float:
+        """Read the expiry from the token's `exp` claim, falling back to the response's `expires_in`."""
+        try:
+            exp = jwt.get_unverified_claims(token).get("exp")
+        except Exception:
+            exp = None
+        if isinstance(exp, int | float):
+            return float(exp)
+        if isinstance(expires_in, int | float):
+            return requested_at + expires_in
+        # Unknown lifetime: use the token for this turn only
+        return requested_at
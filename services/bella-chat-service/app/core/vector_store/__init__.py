@@ -4,8 +4,10 @@ from .qdrant import (
     CustomQdrantClient,
     CustomQdrantVectorStore,
 )
+from .tuning import QdrantTuning
 
 __all__ = [
     "CustomQdrantClient",
     "CustomQdrantVectorStore",
+    "QdrantTuning",
 ]
@@ -1,5 +1,6 @@
 """Qdrant vector store implementation."""
 
+import asyncio
 from time import sleep
 
 from langchain_core.documents import Document
@@ -7,15 +8,18 @@ from langchain_qdrant import (
     QdrantVectorStore,
     RetrievalMode,
 )
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
 from qdrant_client.models import (
-    Distance,
-    VectorParams,
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
 )
 
+from app.core.vector_store.tuning import QdrantTuning
 from app.settings import get_settings
-from utilities.logger import GetAppLogger
-from utilities.time_profile import log_exec_time
+from utilities.logger import GetAppLogger, preview
+from utilities.time_profile import async_log_exec_time, log_exec_time
 
 
 class CustomQdrantClient(QdrantClient):
@@ -34,15 +38,25 @@ class CustomQdrantClient(QdrantClient):
         self._logger.info(f"Connecting to Qdrant at {url}...")
 
     @log_exec_time
-    def create_collection(self, collection_name: str, embedding_dimension: int, force_recreate: bool = False, **kwargs):
+    def create_collection(
+        self,
+        collection_name: str,
+        embedding_dimension: int,
+        force_recreate: bool = False,
+        tuning: QdrantTuning | None = None,
+        **kwargs,
+    ):
         """Create a Qdrant collection with specified parameters.
 
         Args:
             collection_name (str): Name of the collection to create.
             embedding_dimension (int): Dimension of the embedding vectors.
             force_recreate (bool): If True, delete existing collection and recreate. Defaults to False.
+            tuning (QdrantTuning | None): HNSW, quantization, on-disk and payload index settings. Defaults to
+                Qdrant's defaults plus keyword indexes on the metadata source, source type and path.
             **kwargs: Additional keyword arguments for create_collection method.
         """
+        tuning = tuning or QdrantTuning()
         if self.collection_exists(collection_name=collection_name):
             if force_recreate:
                 self._logger.info(f"Deleting existing collection `{collection_name}`...")
@@ -58,13 +72,21 @@ class CustomQdrantClient(QdrantClient):
         # Create collection if it does not exist or if force_recreate is True
         super().create_collection(
             collection_name=collection_name,
-            vectors_config=VectorParams(
-                size=embedding_dimension,
-                distance=Distance.COSINE,
-            ),
+            vectors_config=tuning.vector_params(embedding_dimension),
+            hnsw_config=tuning.hnsw_config(),
+            quantization_config=tuning.quantization_config(),
+            on_disk_payload=tuning.on_disk_payload or None,
             **kwargs,
         )
-        self._logger.info(f"Collection `{collection_name}` created with embedding dimension {embedding_dimension}.")
+        for field_name in tuning.payload_indexes:
+            self.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
+        self._logger.info(
+            f"Collection `{collection_name}` created with embedding dimension {embedding_dimension} ({tuning})."
+        )
 
     @log_exec_time
     def delete_collection(self, collection_name: str, **kwargs):
@@ -96,9 +118,46 @@ class CustomQdrantClient(QdrantClient):
             self._logger.info(f"- {collection.name}")
         return collections
 
+    @log_exec_time
+    def swap_alias(self, alias_name: str, collection_name: str, delete_previous: bool = True):
+        """Point an alias at a collection atomically, so readers switch over without downtime.
+
+        A physical collection still named like the alias (created before aliases were used) is deleted first,
+        as Qdrant cannot create an alias over it; that one-time migration is not atomic.
+
+        Args:
+            alias_name (str): Name readers use, e.g. the configured collection name.
+            collection_name (str): Collection the alias should point at.
+            delete_previous (bool): If True, delete the collection the alias pointed at before. Defaults to True.
+        """
+        previous = [alias.collection_name for alias in self.get_aliases().aliases if alias.alias_name == alias_name]
+        if not previous and self.collection_exists(collection_name=alias_name):
+            self._logger.warning(f"Replacing collection `{alias_name}` with an alias of the same name...")
+            self.delete_collection(collection_name=alias_name)
+
+        operations: list[models.AliasOperations] = []
+        if previous:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias_name)))
+        operations.append(
+            CreateAliasOperation(create_alias=CreateAlias(collection_name=collection_name, alias_name=alias_name))
+        )
+        self.update_collection_aliases(change_aliases_operations=operations)
+        self._logger.info(f"Alias `{alias_name}` now points to collection `{collection_name}`.")
+
+        if delete_previous:
+            for old_collection in previous:
+                if old_collection != collection_name:
+                    self.delete_collection(collection_name=old_collection)
+
 
 class CustomQdrantVectorStore(QdrantVectorStore):
-    """Custom Qdrant vector store with additional handling if needed."""
+    """Custom Qdrant vector store with additional handling if needed.
+
+    Set `search_params` (e.g. from `QdrantTuning.search_params()`) to apply HNSW `ef` and quantization rescoring to
+    every search that does not pass its own.
+    """
+
+    search_params: models.SearchParams | None = None
 
     def __init__(
         self,
@@ -106,6 +165,7 @@ class CustomQdrantVectorStore(QdrantVectorStore):
         collection_name: str,
         embedding,
         retrieval_mode: RetrievalMode,
+        async_client: AsyncQdrantClient | None = None,
         **kwargs,
     ):
         """Initialize the Qdrant vector store.
@@ -115,6 +175,8 @@ class CustomQdrantVectorStore(QdrantVectorStore):
             collection_name (str): Name of the collection to use.
             embedding: An embedding function or model.
             retrieval_mode (RetrievalMode): The retrieval mode (e.g., DENSE, HYBRID).
+            async_client (AsyncQdrantClient | None): Async client used by the async search methods.
+                Without it, async searches run the sync search in a worker thread. Defaults to None.
             **kwargs: Additional keyword arguments for QdrantVectorStore.
         """
         # Ensure collection exists before initializing QdrantVectorStore
@@ -123,6 +185,7 @@ class CustomQdrantVectorStore(QdrantVectorStore):
             client.create_collection(
                 collection_name=collection_name,
                 embedding_dimension=settings.EMBEDDING_MODEL_DIMENSION,
+                tuning=QdrantTuning.from_settings(settings),
             )
 
         super().__init__(
@@ -132,6 +195,7 @@ class CustomQdrantVectorStore(QdrantVectorStore):
             retrieval_mode=retrieval_mode,
             **kwargs,
         )
+        self._async_client = async_client
         self._logger = GetAppLogger(fallback_name="CustomQdrantVectorStore").get_logger()
         self._logger.info(f"Initializing Qdrant vector store for collection `{collection_name}`...")
 
@@ -147,7 +211,7 @@ class CustomQdrantVectorStore(QdrantVectorStore):
             list[str]: List of IDs of the added documents.
         """
         self._logger.info(f"Adding {len(documents)} documents to collection `{self.collection_name}`...")
-        self._logger.debug(f"Documents adding to collection `{self.collection_name}`: {documents}")
+        self._logger.debug("Documents adding to collection `%s`: %s", self.collection_name, preview(documents))
         try:
             added_documents = super().add_documents(documents, **kwargs)
             self._logger.info(f"Successfully added {len(documents)} documents to collection `{self.collection_name}`.")
@@ -156,6 +220,40 @@ class CustomQdrantVectorStore(QdrantVectorStore):
             self._logger.error(f"Failed to add documents to collection `{self.collection_name}`: {err}")
             raise err
 
+    @log_exec_time
+    def upsert_documents(
+        self,
+        documents: list[Document],
+        vectors: list[list[float]],
+        ids: list[str],
+        wait: bool = True,
+    ) -> list[str]:
+        """Upsert documents with precomputed dense vectors, e.g. embedded by a pipelined loader.
+
+        Args:
+            documents (list[Document]): Documents to store.
+            vectors (list[list[float]]): Dense vector of each document, in order.
+            ids (list[str]): Point id of each document, in order.
+            wait (bool): Wait until Qdrant has applied the upsert. With False the call returns once the
+                operation is queued; Qdrant applies queued operations in order. Defaults to True.
+
+        Returns:
+            list[str]: The point ids.
+        """
+        payloads = self._build_payloads(
+            [doc.page_content for doc in documents],
+            [doc.metadata for doc in documents],
+            self.content_payload_key,
+            self.metadata_payload_key,
+        )
+        points = [
+            models.PointStruct(id=point_id, vector={self.vector_name: vector}, payload=payload)
+            for point_id, vector, payload in zip(ids, vectors, payloads, strict=True)
+        ]
+        self.client.upsert(collection_name=self.collection_name, points=points, wait=wait)
+        self._logger.debug(f"Upserted {len(points)} points to collection `{self.collection_name}`.")
+        return ids
+
     @log_exec_time
     def similarity_search(self, query: str, k: int = 5, **kwargs) -> list[tuple[Document, float]]:
         """Perform a similarity search in the Qdrant collection.
@@ -170,21 +268,93 @@ class CustomQdrantVectorStore(QdrantVectorStore):
         """
         self._logger.info(f"Performing similarity search in collection `{self.collection_name}`...")
         self._logger.info(f"Searching for top {k} similar documents to query: {query}")
+        kwargs.setdefault("search_params", self.search_params)
         try:
             retrieved_documents = super().similarity_search_with_score(query, k=k, **kwargs)
             self._logger.info(f"Found {len(retrieved_documents)} similar documents.")
-            self._logger.debug(f"Similar documents: {retrieved_documents}")
+            self._logger.debug("Similar documents: %s", preview(retrieved_documents))
             return retrieved_documents
         except Exception as err:
             self._logger.error(f"Similarity search failed: {err}")
             raise err
 
+    @async_log_exec_time
+    async def asimilarity_search_with_score(
+        self,
+        query: str,
+        k: int = 5,
+        **kwargs,
+    ) -> list[tuple[Document, float]]:
+        """Perform a similarity search in the Qdrant collection without blocking the event loop.
+
+        Dense searches embed the query with the embedding client's async path and query Qdrant through
+        the async client. Other retrieval modes, or a store without an async client, run the sync search
+        in a worker thread.
+
+        Args:
+            query (str): The query string to search for similar documents.
+            k (int): The number of top similar documents to retrieve. Defaults to 5.
+            **kwargs: Additional keyword arguments for Qdrant `query_points` (e.g. `filter`, `score_threshold`).
+
+        Returns:
+            list[tuple[Document, float]]: A list of tuples containing the similar documents and their similarity scores.
+        """
+        embeddings = self.embeddings
+        if self._async_client is None or self.retrieval_mode != RetrievalMode.DENSE or embeddings is None:
+            return await asyncio.to_thread(self.similarity_search, query, k, **kwargs)
+
+        self._logger.info(f"Performing async similarity search in collection `{self.collection_name}`...")
+        self._logger.info(f"Searching for top {k} similar documents to query: {query}")
+        try:
+            query_embedding = await embeddings.aembed_query(query)
+            response = await self._async_client.query_points(
+                collection_name=self.collection_name,
+                query=query_embedding,
+                using=self.vector_name,
+                query_filter=kwargs.pop("filter", None),
+                search_params=kwargs.pop("search_params", self.search_params),
+                limit=k,
+                with_payload=True,
+                with_vectors=False,
+                **kwargs,
+            )
+            retrieved_documents = [
+                (
+                    self._document_from_point(
+                        point,
+                        self.collection_name,
+                        self.content_payload_key,
+                        self.metadata_payload_key,
+                    ),
+                    point.score,
+                )
+                for point in response.points
+            ]
+            self._logger.info(f"Found {len(retrieved_documents)} similar documents.")
+            self._logger.debug("Similar documents: %s", preview(retrieved_documents))
+            return retrieved_documents
+        except Exception as err:
+            self._logger.error(f"Async similarity search failed: {err}")
+            raise err
+
+    async def asimilarity_search(self, query: str, k: int = 5, **kwargs) -> list[Document]:
+        """Return the documents most similar to the query, without scores.
+
+        Used by `as_retriever()` for async retrieval.
+
+        Args:
+            query (str): The query string to search for similar documents.
+            k (int): The number of top similar documents to retrieve. Defaults to 5.
+            **kwargs: Additional keyword arguments for `asimilarity_search_with_score`.
+
+        Returns:
+            list[Document]: The similar documents.
+        """
+        return [doc for doc, _score in await self.asimilarity_search_with_score(query, k=k, **kwargs)]
+
 
 if __name__ == "__main__":
     # Example usage
-    # Imports
-    from qdrant_client import models
-
     from app.core.embeddings import get_embedding_client
 
     # Get Logger
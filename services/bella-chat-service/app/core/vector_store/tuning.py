@@ -0,0 +1,88 @@
+"""Qdrant collection and search tuning (HNSW, quantization, on-disk storage, payload indexes)."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from qdrant_client import models
+
+from app.settings.base import QUANTIZATION_MODES
+
+if TYPE_CHECKING:
+    from app.settings.base import BellaChatBaseSettings
+
+DEFAULT_PAYLOAD_INDEXES = ("metadata.source", "metadata.source_type", "metadata.path")
+
+
+@dataclass(frozen=True)
+class QdrantTuning:
+    """Index, storage and search parameters for a Qdrant collection.
+
+    Build-time parameters (HNSW graph, quantization, on-disk storage, payload indexes) apply when a collection is
+    created; search-time parameters (`hnsw_ef`, quantization rescoring) apply to every query. `None` keeps
+    Qdrant's default.
+
+    Examples:
+        ### Imports
+        >>> from app.core.vector_store import QdrantTuning
+
+        ### Denser graph, int8 quantization with rescoring and vectors on disk
+        >>> tuning = QdrantTuning(hnsw_m=32, hnsw_ef_construct=200, quantization="scalar", on_disk_vectors=True)
+        >>> tuning.search_params().quantization.rescore
+        True
+    """
+
+    hnsw_m: int | None = None
+    hnsw_ef_construct: int | None = None
+    hnsw_ef: int | None = None
+    quantization: QUANTIZATION_MODES = "none"
+    quantization_rescore: bool = True
+    quantization_oversampling: float | None = 2.0
+    on_disk_vectors: bool = False
+    on_disk_payload: bool = False
+    payload_indexes: tuple[str, ...] = DEFAULT_PAYLOAD_INDEXES
+
+    @classmethod
+    def from_settings(cls, settings: "BellaChatBaseSettings") -> "QdrantTuning":
+        """Build the tuning from the `QDRANT_*` settings."""
+        return cls(
+            hnsw_m=settings.QDRANT_HNSW_M,
+            hnsw_ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+            hnsw_ef=settings.QDRANT_HNSW_EF,
+            quantization=settings.QDRANT_QUANTIZATION,
+            quantization_rescore=settings.QDRANT_QUANTIZATION_RESCORE,
+            quantization_oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING,
+            on_disk_vectors=settings.QDRANT_ON_DISK_VECTORS,
+            on_disk_payload=settings.QDRANT_ON_DISK_PAYLOAD,
+        )
+
+    def vector_params(self, size: int) -> models.VectorParams:
+        """Return the cosine vector parameters for embeddings of `size` dimensions."""
+        return models.VectorParams(size=size, distance=models.Distance.COSINE, on_disk=self.on_disk_vectors or None)
+
+    def hnsw_config(self) -> models.HnswConfigDiff | None:
+        """Return the HNSW graph parameters, or None to keep the defaults."""
+        if self.hnsw_m is None and self.hnsw_ef_construct is None:
+            return None
+        return models.HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def quantization_config(self) -> models.QuantizationConfig | None:
+        """Return the quantization config; quantized vectors stay in RAM while originals may live on disk."""
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(binary=models.BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def search_params(self) -> models.SearchParams | None:
+        """Return the per-query search parameters, or None to keep the defaults."""
+        quantization = None
+        if self.quantization != "none":
+            quantization = models.QuantizationSearchParams(
+                rescore=self.quantization_rescore,
+                oversampling=self.quantization_oversampling,
+            )
+        if self.hnsw_ef is None and quantization is None:
+            return None
+        return models.SearchParams(hnsw_ef=self.hnsw_ef, quantization=quantization)
@@ -3,117 +3,170 @@
 These dependencies should not be used inside agents to avoid circular imports.
 """
 
+import hashlib
+import json
+import time
 from contextlib import asynccontextmanager
 from functools import lru_cache
-from http import HTTPStatus
 from typing import Any
+from uuid import UUID
 
 import httpx
 from langchain_core.tools import BaseTool
-from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
 from app.agents import (
     RAGAgent,
     SimpleChatAgent,
 )
-from app.agents.v2.deep_orchestrator import create_deep_orchestrator_agent
-from app.dependencies.ai_dependencies import get_app_synthesis_llm_client
+from app.agents.v2.answer_cache import AnswerCacheMiddleware
+from app.agents.v2.deep_orchestrator import DeepAgentContext, create_deep_orchestrator_agent
+from app.agents.v2.history import ConversationHistory, HistoryPolicy
+from app.agents.v2.routing import Route, RouteDecision, TurnRouter
+from app.core.checkpoints import (
+    CheckpointRetention,
+    CheckpointRetentionPolicy,
+    PooledPostgresSaver,
+    checkpointer_pool_stats,
+)
+from app.core.mcp import MCPSessionPool
+from app.core.token_exchange import TokenExchangeClient
+from app.dependencies.ai_dependencies import (
+    answer_cache_scope,
+    get_app_answer_cache,
+    get_app_fast_llm_client,
+    get_app_synthesis_llm_client,
+    get_app_vector_store,
+)
 from app.settings import get_settings
 from utilities.logger import GetAppLogger
 
 _logger = GetAppLogger().get_logger()
 
 
-async def exchange_token_for_ems(auth_header: str | None) -> str | None:
+async def exchange_token_for_ems(token_exchange: TokenExchangeClient, auth_header: str | None) -> str | None:
     """Exchange the user's bearer token for an EMS-MCP-scoped token via RFC 8693.
 
-    Returns the raw access token string (no 'Bearer ' prefix) or None if the
-    exchange fails, in which case the caller should fall back to the original token.
+    Exchanged tokens are cached until shortly before they expire, so most turns skip the auth service.
+
+    Returns the raw access token string (no 'Bearer ' prefix), or the original token if the
+    exchange fails.
     """
     if not auth_header:
         return None
 
     raw_token = auth_header.removeprefix("Bearer ").strip()
-    settings = get_settings()
-    auth_service_url = settings.AUTH_SERVICE_URL.rstrip("/")
-    ems_mcp_url = settings.EMS_MCP_SERVER_URL.split("/mcp")[0]  # base URL only
+    ems_mcp_url = get_settings().EMS_MCP_SERVER_URL.split("/mcp")[0]  # base URL only
 
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.post(
-                f"{auth_service_url}/oauth/token",
-                data={
-                    "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-                    "subject_token": raw_token,
-                    "subject_token_type": "urn:ietf:params:oauth:token-type:access_token",
-                    "client_id": "bella-chat-service",
-                    "resource": ems_mcp_url,
-                },
-            )
-            if resp.status_code == HTTPStatus.OK:
-                exchanged = resp.json().get("access_token")
-                if exchanged:
-                    _logger.debug("OBO token exchange succeeded for EMS MCP")
-                    return exchanged
-            _logger.warning(
-                f"OBO token exchange returned {resp.status_code}, "
-                "falling back to original token"
-            )
-    except Exception as exc:
-        _logger.warning(f"OBO token exchange failed: {exc!r}, falling back to original token")
+    exchanged = await token_exchange.exchange(raw_token, ems_mcp_url)
+    if exchanged:
+        return exchanged
 
     # Fallback: pass the original token through directly
+    _logger.warning("OBO token exchange did not issue a token, falling back to original token")
     return raw_token
 
 
-async def get_mcp_tools(auth_header: str | None) -> list[BaseTool]:
-    """Load EMS MCP tools for the current request.
+def _ems_token_from_runtime(runtime: object | None) -> str | None:
+    """Read the caller's EMS token from the LangGraph runtime context of a tool call.
 
-    Performs an OBO token exchange so the forwarded token is scoped to the
-    EMS MCP server, then creates a fresh MCP session with that token injected
-    as a static Authorization header.  langchain-mcp-adapters opens a new
-    HTTP session per tool call, so the header is picked up on every invocation.
+    Tools are shared by every request through the cached compiled graph, so the token is resolved
+    per call from `DeepAgentContext` instead of being baked into the tool's connection.
     """
-    settings = get_settings()
-    token = await exchange_token_for_ems(auth_header)
-    headers: dict[str, Any] = {}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    context = getattr(runtime, "context", None)
+    return context.ems_access_token if isinstance(context, DeepAgentContext) else None
 
+
+async def get_mcp_tools(mcp_pool: MCPSessionPool, ems_token: str | None) -> list[BaseTool]:
+    """Load EMS MCP tools for the current request.
+
+    The listing is cached by the pool and the token is only used when it needs refreshing. The returned
+    tools call the server over the caller's pooled session, so they can be shared across users.
+    """
     try:
-        mcp_client = MultiServerMCPClient(
-            {
-                "ems": {
-                    "url": settings.EMS_MCP_SERVER_URL,
-                    "transport": "streamable_http",
-                    "headers": headers,
-                }
-            }
-        )
-        return await mcp_client.get_tools()
+        return await mcp_pool.get_tools(ems_token)
     except Exception as exc:
         _logger.warning(f"Failed to load MCP tools: {exc!r}")
         return []
 
 
+def tool_schema_fingerprint(tools: list[BaseTool]) -> str:
+    """Fingerprint the names, descriptions and argument schemas of a tool set."""
+    schemas = sorted(
+        (tool.name, tool.description, json.dumps(tool.args, sort_keys=True, default=str)) for tool in tools
+    )
+    return hashlib.sha256(json.dumps(schemas).encode("utf-8")).hexdigest()
+
+
+# Compiled deep orchestrator graphs keyed by MCP tool-schema fingerprint, oldest first
+_MAX_COMPILED_AGENTS = 4
+_compiled_agents: dict[str, Any] = {}
+# Channel of the pending write LangGraph stores for a thread paused on an interrupt
+_INTERRUPT_CHANNEL = "__interrupt__"
+
+
 def build_agent(
     mcp_tools: list[BaseTool],
     checkpointer: AsyncPostgresSaver,
 ) -> Any:
-    """Assemble the deep orchestrator agent for a single request lifecycle."""
+    """Return the compiled deep orchestrator agent for the given MCP tool set.
+
+    The graph holds no per-request state (auth is injected through `DeepAgentContext`), so it is compiled
+    once per tool-schema fingerprint and reused across requests.
+    """
+    fingerprint = tool_schema_fingerprint(mcp_tools)
+    agent = _compiled_agents.get(fingerprint)
+    if agent is not None:
+        return agent
+
+    started_at = time.perf_counter()
     model = get_app_synthesis_llm_client()
-    return create_deep_orchestrator_agent(
+    agent = create_deep_orchestrator_agent(
         model=model,
         mcp_tools=mcp_tools,
         checkpointer=checkpointer,
+        history=get_conversation_history(),
+        wiki_answer_cache=get_wiki_answer_cache_middleware(),
+    )
+    _logger.info(
+        f"Compiled deep orchestrator graph with {len(mcp_tools)} MCP tools "
+        f"in {(time.perf_counter() - started_at) * 1000:.0f} ms (fingerprint {fingerprint[:12]})"
+    )
+
+    if len(_compiled_agents) >= _MAX_COMPILED_AGENTS:
+        _compiled_agents.pop(next(iter(_compiled_agents)))
+    _compiled_agents[fingerprint] = agent
+    return agent
+
+
+@lru_cache(maxsize=1)
+def get_conversation_history() -> ConversationHistory:
+    """Get the conversation history manager shared by every compiled deep orchestrator graph."""
+    return ConversationHistory(
+        model=get_app_synthesis_llm_client(),
+        policy=HistoryPolicy.from_settings(get_settings()),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_wiki_answer_cache_middleware() -> AnswerCacheMiddleware | None:
+    """Get the answer cache middleware of the knowledge_wiki sub-agent, or None when the cache is disabled."""
+    cache = get_app_answer_cache()
+    if cache is None:
+        return None
+    return AnswerCacheMiddleware(
+        cache=cache,
+        vector_store=get_app_vector_store(),
+        scope=answer_cache_scope("knowledge_wiki"),
     )
 
 
 @lru_cache(maxsize=1)
 def get_simple_chat_agent() -> SimpleChatAgent:
-    """Get the simple chat agent."""
-    llm_client = get_app_synthesis_llm_client()
+    """Get the simple chat agent, on the fast model."""
+    llm_client = get_app_fast_llm_client()
     return SimpleChatAgent(model=llm_client)
 
 
@@ -124,17 +177,136 @@ def get_rag_agent() -> RAGAgent:
     return RAGAgent(model=llm_client)
 
 
+@lru_cache(maxsize=1)
+def get_turn_router() -> TurnRouter:
+    """Get the turn router; it classifies with the fast model only when a separate one is configured."""
+    settings = get_settings()
+    use_classifier = settings.ROUTING_CLASSIFIER_ENABLED and bool(settings.FAST_MODEL_NAME)
+    return TurnRouter(
+        classifier=get_app_fast_llm_client() if use_classifier else None,
+        classifier_timeout_s=settings.ROUTING_CLASSIFIER_TIMEOUT_S,
+    )
+
+
+async def route_turn(
+    message: str,
+    conversation_id: UUID | None,
+    checkpointer: AsyncPostgresSaver,
+) -> RouteDecision | None:
+    """Route a chat turn, or return None when routing is disabled and every turn goes to the deep agent.
+
+    Whether the conversation already has turns, or waits for a tool approval, is read from its latest checkpoint.
+    """
+    if not get_settings().ROUTING_ENABLED:
+        return None
+    checkpoint = None
+    if conversation_id is not None:
+        checkpoint = await checkpointer.aget_tuple({"configurable": {"thread_id": str(conversation_id)}})
+    paused = checkpoint is not None and any(write[1] == _INTERRUPT_CHANNEL for write in checkpoint.pending_writes or ())
+    return await get_turn_router().route(message, follow_up=checkpoint is not None, paused=paused)
+
+
+def get_fast_path_agent(route: Route) -> SimpleChatAgent | RAGAgent:
+    """Get the agent answering turns routed off the deep agent."""
+    return get_simple_chat_agent() if route is Route.CHAT else get_rag_agent()
+
+
 @asynccontextmanager
 async def create_checkpointer():
     """Async context manager that initialises and yields the LangGraph Postgres checkpointer.
 
-    The checkpointer is a long-lived resource shared across all requests.
-    MCP tool loading and agent construction happen per-request in the router.
+    The checkpointer is a long-lived resource shared across all requests and by every
+    compiled deep orchestrator graph. It is backed by a connection pool, so concurrent chat
+    turns get their own connections instead of sharing one.
     """
     settings = get_settings()
 
     _logger.info("Connecting LangGraph Postgres checkpointer...")
-    async with AsyncPostgresSaver.from_conn_string(settings.langgraph_pg_db_dsn) as checkpointer:
+    async with AsyncConnectionPool(
+        conninfo=settings.langgraph_pg_db_dsn,
+        min_size=settings.CHECKPOINT_POOL_MIN_SIZE,
+        max_size=settings.CHECKPOINT_POOL_MAX_SIZE,
+        timeout=settings.CHECKPOINT_POOL_TIMEOUT_S,
+        max_idle=settings.CHECKPOINT_POOL_MAX_IDLE_S,
+        max_lifetime=settings.CHECKPOINT_POOL_MAX_LIFETIME_S,
+        check=AsyncConnectionPool.check_connection if settings.CHECKPOINT_POOL_CHECK else None,
+        # Connection settings the saver expects, as set by AsyncPostgresSaver.from_conn_string
+        kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        name="langgraph-checkpointer",
+        open=False,
+    ) as pool:
+        checkpointer = PooledPostgresSaver(pool)
         await checkpointer.setup()  # Idempotent — creates tables on first run
-        _logger.info("LangGraph Postgres checkpointer initialised.")
-        yield checkpointer
+        _logger.info(
+            f"LangGraph Postgres checkpointer initialised with a pool of "
+            f"{settings.CHECKPOINT_POOL_MIN_SIZE}-{settings.CHECKPOINT_POOL_MAX_SIZE} connections."
+        )
+        try:
+            yield checkpointer
+        finally:
+            _logger.info(f"LangGraph checkpointer pool closing: {checkpointer_pool_stats(pool)}")
+
+
+@asynccontextmanager
+async def create_checkpoint_retention():
+    """Async context manager that yields the checkpoint retention job, running in the background if enabled.
+
+    Must be entered after `create_checkpointer`, which creates the tables it prunes.
+    """
+    settings = get_settings()
+
+    retention = CheckpointRetention(
+        dsn=settings.langgraph_pg_db_dsn,
+        policy=CheckpointRetentionPolicy.from_settings(settings),
+        interval_s=settings.CHECKPOINT_RETENTION_INTERVAL_S,
+        vacuum=settings.CHECKPOINT_VACUUM,
+    )
+    if settings.CHECKPOINT_RETENTION_ENABLED:
+        retention.start()
+        _logger.info(f"Checkpoint retention started: {retention.policy}")
+    try:
+        yield retention
+    finally:
+        await retention.close()
+
+
+@asynccontextmanager
+async def create_mcp_session_pool():
+    """Async context manager that yields the EMS MCP session pool and closes its sessions on exit.
+
+    Sessions are opened lazily, so the service starts even when the MCP server is unavailable.
+    """
+    settings = get_settings()
+
+    pool = MCPSessionPool(
+        url=settings.EMS_MCP_SERVER_URL,
+        token_from_runtime=_ems_token_from_runtime,
+        max_sessions=settings.EMS_MCP_SESSION_POOL_SIZE,
+        idle_ttl_s=settings.EMS_MCP_SESSION_IDLE_TTL_S,
+        tools_ttl_s=settings.EMS_MCP_TOOLS_CACHE_TTL_S,
+    )
+    try:
+        yield pool
+    finally:
+        await pool.close()
+        _logger.info(f"EMS MCP session pool closed: {pool.stats()}")
+
+
+@asynccontextmanager
+async def create_token_exchange_client():
+    """Async context manager that yields the OBO token-exchange client and its pooled HTTP client.
+
+    The HTTP client keeps connections to the auth service alive across requests.
+    """
+    settings = get_settings()
+
+    async with httpx.AsyncClient(
+        timeout=5.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    ) as http_client:
+        yield TokenExchangeClient(
+            http_client=http_client,
+            token_url=f"{settings.AUTH_SERVICE_URL.rstrip('/')}/oauth/token",
+            client_id="bella-chat-service",
+            refresh_margin_s=settings.OBO_TOKEN_REFRESH_MARGIN_S,
+        )
@@ -1,40 +1,113 @@
 """AI related dependencies."""
 
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
+import httpx
 from langchain_qdrant import RetrievalMode
+from ollama import AsyncClient as OllamaAsyncClient
+from qdrant_client import AsyncQdrantClient
 
-from app.core.embeddings import get_embedding_client
+from app.core.answer_cache import SemanticAnswerCache
+from app.core.embeddings import (
+    CachedEmbeddingsClient,
+    EmbeddingDiskCache,
+    embedding_model_key,
+    get_embedding_client,
+)
+from app.core.embeddings.clients import OllamaEmbeddingsClient
 from app.core.llms import get_llm_client
+from app.core.llms.admission import LLMAdmissionController
+from app.core.llms.clients import OllamaClient
 from app.core.vector_store import (
     CustomQdrantClient,
     CustomQdrantVectorStore,
+    QdrantTuning,
 )
 from app.settings import get_settings
+from utilities.logger import GetAppLogger
 
 if TYPE_CHECKING:
     from app.core.embeddings.clients.base import EmbeddingsClientInterface
-    from app.core.llms.clients import (
-        GeminiClient,
-        OllamaClient,
+    from app.core.llms.clients import GeminiClient
+
+_logger = GetAppLogger().get_logger()
+
+
+@lru_cache(maxsize=1)
+def get_app_ollama_async_client() -> OllamaAsyncClient:
+    """Get the Ollama async client shared by the chat and embedding clients, with one pooled HTTP client."""
+    settings = get_settings()
+    return OllamaAsyncClient(
+        host=settings.OLLAMA_URL,
+        limits=httpx.Limits(
+            max_connections=settings.OLLAMA_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+        ),
     )
 
 
+def _ollama_client_kwargs() -> dict:
+    """Keyword arguments every app Ollama client is created with."""
+    return {"keep_alive": get_settings().OLLAMA_KEEP_ALIVE, "async_client": get_app_ollama_async_client()}
+
+
+@lru_cache(maxsize=1)
+def get_app_llm_admission() -> "LLMAdmissionController | None":
+    """Get the admission controller queueing calls to the Ollama synthesis model, or None when it is disabled."""
+    settings = get_settings()
+    if settings.SYNTHESIS_MODEL_PROVIDER != "ollama" or settings.LLM_MAX_CONCURRENT_CALLS <= 0:
+        return None
+    return LLMAdmissionController(max_concurrent=settings.LLM_MAX_CONCURRENT_CALLS)
+
+
+def _chat_model_provider() -> Literal["google", "ollama"]:
+    """The provider of the synthesis and fast models; Hugging Face only serves embeddings."""
+    provider = get_settings().SYNTHESIS_MODEL_PROVIDER
+    if provider == "huggingface":
+        raise ValueError("Unsupported chat model provider: huggingface")
+    return provider
+
+
 @lru_cache(maxsize=1)
 def get_app_synthesis_llm_client() -> "GeminiClient | OllamaClient":
     """Get the synthesis LLM client."""
     settings = get_settings()
     synthesis_llm_client = get_llm_client(
-        provider=settings.SYNTHESIS_MODEL_PROVIDER,
+        provider=_chat_model_provider(),
         model_name=settings.SYNTHESIS_MODEL_NAME,
         ollama_base_url=settings.OLLAMA_URL,
         temperature=0.1,
         context_window=settings.SYNTHESIS_MODEL_CTX_LENGTH,
+        **(
+            {**_ollama_client_kwargs(), "admission": get_app_llm_admission()}
+            if settings.SYNTHESIS_MODEL_PROVIDER == "ollama"
+            else {}
+        ),
     )
     return synthesis_llm_client
 
 
+@lru_cache(maxsize=1)
+def get_app_fast_llm_client() -> "GeminiClient | OllamaClient":
+    """Get the small LLM client for chit-chat and turn classification; the synthesis client when none is set."""
+    settings = get_settings()
+    if not settings.FAST_MODEL_NAME:
+        return get_app_synthesis_llm_client()
+    return get_llm_client(
+        provider=_chat_model_provider(),
+        model_name=settings.FAST_MODEL_NAME,
+        ollama_base_url=settings.OLLAMA_URL,
+        temperature=0.1,
+        context_window=settings.FAST_MODEL_CTX_LENGTH,
+        **(
+            {**_ollama_client_kwargs(), "admission": get_app_llm_admission()}
+            if settings.SYNTHESIS_MODEL_PROVIDER == "ollama"
+            else {}
+        ),
+    )
+
+
 @lru_cache(maxsize=1)
 def get_app_embedding_client() -> "EmbeddingsClientInterface":
     """Get the embedding client."""
@@ -45,8 +118,19 @@ def get_app_embedding_client() -> "EmbeddingsClientInterface":
         model_name=settings.EMBEDDING_MODEL_NAME,
         ollama_base_url=settings.OLLAMA_URL,
         output_dimensionality=settings.EMBEDDING_MODEL_DIMENSION,
+        **(_ollama_client_kwargs() if settings.EMBEDDING_MODEL_PROVIDER == "ollama" else {}),
+    )
+    if not settings.EMBEDDING_CACHE_SIZE and not settings.EMBEDDING_CACHE_PATH:
+        return embedding_client
+
+    return CachedEmbeddingsClient(
+        embedding_client,
+        model_key=embedding_model_key(
+            settings.EMBEDDING_MODEL_PROVIDER, settings.EMBEDDING_MODEL_NAME, settings.EMBEDDING_MODEL_DIMENSION
+        ),
+        max_entries=settings.EMBEDDING_CACHE_SIZE,
+        disk_cache=EmbeddingDiskCache(settings.EMBEDDING_CACHE_PATH) if settings.EMBEDDING_CACHE_PATH else None,
     )
-    return embedding_client
 
 
 @lru_cache(maxsize=1)
@@ -59,6 +143,13 @@ def get_app_vector_db_client() -> "CustomQdrantClient":
     return vector_db_client
 
 
+@lru_cache(maxsize=1)
+def get_app_async_vector_db_client() -> "AsyncQdrantClient":
+    """Get the async vector DB client used on the request path."""
+    settings = get_settings()
+    return AsyncQdrantClient(url=settings.QDRANT_URL)
+
+
 @lru_cache(maxsize=1)
 def get_app_vector_store() -> "CustomQdrantVectorStore":
     """Get the vector store."""
@@ -68,5 +159,46 @@ def get_app_vector_store() -> "CustomQdrantVectorStore":
         collection_name=settings.QDRANT_COLLECTION_NAME,
         embedding=get_app_embedding_client(),
         retrieval_mode=RetrievalMode.DENSE,
+        async_client=get_app_async_vector_db_client(),
     )
+    vector_store.search_params = QdrantTuning.from_settings(settings).search_params()
     return vector_store
+
+
+@lru_cache(maxsize=1)
+def get_app_answer_cache() -> "SemanticAnswerCache | None":
+    """Get the semantic answer cache for wiki questions, or None when it is disabled."""
+    settings = get_settings()
+    if not settings.ANSWER_CACHE_ENABLED:
+        return None
+    return SemanticAnswerCache(
+        client=get_app_async_vector_db_client(),
+        collection_name=settings.ANSWER_CACHE_COLLECTION_NAME,
+        embeddings=get_app_embedding_client(),
+        threshold=settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+        ttl_s=settings.ANSWER_CACHE_TTL_S,
+    )
+
+
+def answer_cache_scope(agent_name: str) -> str:
+    """Scope of cached answers: the answering agent and the synthesis model, so answers never cross either."""
+    settings = get_settings()
+    return f"{agent_name}:{settings.SYNTHESIS_MODEL_PROVIDER}:{settings.SYNTHESIS_MODEL_NAME}"
+
+
+async def warm_up_ollama_models() -> None:
+    """Load the Ollama synthesis, fast and embedding models, so the first request does not pay the model load.
+
+    Failures are logged and never stop the service; the model then loads on first use.
+    """
+    embedding_client = get_app_embedding_client()
+    clients = [get_app_synthesis_llm_client(), getattr(embedding_client, "client", embedding_client)]
+    if get_app_fast_llm_client() is not clients[0]:
+        clients.append(get_app_fast_llm_client())
+    for client in clients:
+        if not isinstance(client, OllamaClient | OllamaEmbeddingsClient):
+            continue
+        try:
+            await client.awarm_up()
+        except Exception as err:
+            _logger.warning(f"Ollama warm-up of `{client.model}` failed: {err}")
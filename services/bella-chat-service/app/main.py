@@ -5,6 +5,7 @@ import os
 import socket
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from typing import Any
 from urllib.parse import urlparse
 
 import uvicorn
@@ -17,12 +18,22 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-from app.dependencies.agents import create_checkpointer
+from app.core.checkpoints import checkpointer_pool_stats
+from app.dependencies.agents import (
+    create_checkpoint_retention,
+    create_checkpointer,
+    create_mcp_session_pool,
+    create_token_exchange_client,
+    get_turn_router,
+)
 from app.dependencies.ai_dependencies import (
+    get_app_answer_cache,
     get_app_embedding_client,
+    get_app_llm_admission,
     get_app_synthesis_llm_client,
     get_app_vector_db_client,
     get_app_vector_store,
+    warm_up_ollama_models,
 )
 from app.routers import app_router
 from app.settings import get_settings
@@ -99,10 +110,22 @@ async def lifespan(app: FastAPI):
     """Application lifespan context manager."""
     app.state.start_time = datetime.now()
 
-    # The Postgres checkpointer is long-lived and shared across all requests.
-    # MCP tool loading and agent construction happen per-request in the router.
-    async with create_checkpointer() as checkpointer:
+    # The Postgres checkpointer is long-lived and shared across all requests; old checkpoints are pruned in the
+    # background on a connection of their own.
+    # The deep orchestrator graph is compiled on first use and cached per MCP tool-schema fingerprint.
+    # EMS MCP sessions, the tool listing and exchanged OBO tokens are pooled for the lifetime of the app.
+    async with (
+        create_checkpointer() as checkpointer,
+        create_checkpoint_retention() as checkpoint_retention,
+        create_mcp_session_pool() as mcp_session_pool,
+        create_token_exchange_client() as token_exchange,
+    ):
         app.state.checkpointer = checkpointer
+        app.state.checkpoint_retention = checkpoint_retention
+        app.state.mcp_session_pool = mcp_session_pool
+        app.state.token_exchange = token_exchange
+        if get_settings().OLLAMA_WARM_UP:
+            await warm_up_ollama_models()
         yield
 
 
@@ -161,6 +184,38 @@ def create_app() -> FastAPI:
             "uptime": uptime_str,
         }
 
+    @app.get("/health/mcp")
+    async def mcp_health_check(request: Request) -> dict[str, int]:
+        """EMS MCP session pool reuse statistics."""
+        return request.app.state.mcp_session_pool.stats()
+
+    @app.get("/health/answer-cache")
+    async def answer_cache_health_check() -> dict[str, float]:
+        """Semantic answer cache hit rate, lookup time and model time saved."""
+        cache = get_app_answer_cache()
+        return cache.stats() if cache else {}
+
+    @app.get("/health/llm-admission")
+    async def llm_admission_health_check() -> dict[str, float]:
+        """Synthesis model calls running and queued, and how long queued calls waited."""
+        admission = get_app_llm_admission()
+        return admission.stats() if admission else {}
+
+    @app.get("/health/routing")
+    async def routing_health_check() -> dict[str, float]:
+        """Chat turns per route and per routing method, and the average routing time."""
+        return get_turn_router().stats()
+
+    @app.get("/health/checkpointer")
+    async def checkpointer_health_check(request: Request) -> dict[str, float]:
+        """Checkpointer connection pool size, requests and time spent waiting for a connection."""
+        return checkpointer_pool_stats(request.app.state.checkpointer.conn)
+
+    @app.get("/health/checkpoints")
+    async def checkpoints_health_check(request: Request) -> dict[str, Any]:
+        """Checkpoint retention runs, rows reclaimed and checkpoint table sizes."""
+        return request.app.state.checkpoint_retention.stats()
+
     return app
 
 
@@ -1,11 +1,24 @@
 """Chat endpoints for the chat bot (v1 Legacy)."""
 
+import time
+
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
-from app.agents.v2.deep_orchestrator import stream_deep_agent
-from app.dependencies.agents import build_agent, get_mcp_tools
+from app.agents.v2.deep_orchestrator import DeepAgentContext, stream_deep_agent, stream_routed_turn
+from app.agents.v2.routing import Route
+from app.agents.v2.streaming import StreamFraming
+from app.dependencies.agents import (
+    build_agent,
+    exchange_token_for_ems,
+    get_conversation_history,
+    get_fast_path_agent,
+    get_mcp_tools,
+    route_turn,
+)
 from app.routers.v1.models import ChatRequest
+from app.settings import get_settings
 from utilities.logger import GetAppLogger
 
 router = APIRouter(prefix="/chat")
@@ -18,16 +31,35 @@ async def stream_response(
     request: Request,
 ) -> StreamingResponse:
     """Send a message to Bella and get a streamed response (v1 Deprecated API)."""
+    started_at = time.perf_counter()
     query = chat_request.message.strip()
     conversation_id = chat_request.conversation_id
     auth_header = request.headers.get("Authorization")
 
     _logger.info(f"Deep agent (v1 compat) query: {query}")
 
-    mcp_tools = await get_mcp_tools(auth_header)
-    agent = build_agent(mcp_tools=mcp_tools, checkpointer=request.app.state.checkpointer)
-
-    response_gen = stream_deep_agent(
-        agent=agent, user_input=query, conversation_id=conversation_id
-    )
-    return StreamingResponse(response_gen, media_type="text/event-stream")
+    framing = StreamFraming.from_settings(get_settings())
+    decision = await route_turn(query, conversation_id, request.app.state.checkpointer)
+    if decision is not None and decision.route is not Route.DEEP:
+        agent = build_agent(mcp_tools=[], checkpointer=request.app.state.checkpointer)
+        response_gen = stream_routed_turn(
+            agent=agent,
+            fast_agent=get_fast_path_agent(decision.route),
+            user_input=query,
+            conversation_id=conversation_id,
+            context=DeepAgentContext(framing=framing, route=decision.route),
+        )
+    else:
+        ems_token = await exchange_token_for_ems(request.app.state.token_exchange, auth_header)
+        mcp_tools = await get_mcp_tools(request.app.state.mcp_session_pool, ems_token)
+        agent = build_agent(mcp_tools=mcp_tools, checkpointer=request.app.state.checkpointer)
+        response_gen = stream_deep_agent(
+            agent=agent,
+            user_input=query,
+            conversation_id=conversation_id,
+            context=DeepAgentContext(ems_access_token=ems_token, framing=framing),
+            started_at=started_at,
+        )
+    # Fold older turns into the conversation summary once the response has been sent
+    summarize = BackgroundTask(get_conversation_history().summarize, agent, conversation_id)
+    return StreamingResponse(response_gen, media_type="text/event-stream", background=summarize)
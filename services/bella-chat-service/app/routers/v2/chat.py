@@ -1,41 +1,84 @@
 """Next-Gen Chat Endpoints for Bella v2 powered by native deepagents harness."""
 
+import time
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
-
-from app.agents.v2.deep_orchestrator import resume_deep_agent, stream_deep_agent
+from starlette.background import BackgroundTask
+
+from app.agents.v2.deep_orchestrator import (
+    DeepAgentContext,
+    resume_deep_agent,
+    stream_deep_agent,
+    stream_routed_turn,
+)
+from app.agents.v2.routing import Route
+from app.agents.v2.streaming import StreamFraming
 from app.core.artifacts import artifact_manager
-from app.dependencies.agents import build_agent, get_mcp_tools
-from app.routers.v2.models import ChatRequestV2, ResumeRequest
+from app.dependencies.agents import (
+    build_agent,
+    exchange_token_for_ems,
+    get_conversation_history,
+    get_fast_path_agent,
+    get_mcp_tools,
+    route_turn,
+)
+from app.routers.v2.models import ChatRequestV2, ResumeRequest, StreamFramingOptions
+from app.settings import get_settings
 from utilities.logger import GetAppLogger
 
 router = APIRouter(prefix="/chat", tags=["v2-chat"])
 _logger = GetAppLogger().get_logger()
 
 
+def _stream_framing(options: StreamFramingOptions) -> StreamFraming:
+    """Resolve the response framing from the server settings and the request's overrides."""
+    return StreamFraming.from_settings(get_settings()).with_overrides(
+        interval_ms=options.stream_flush_interval_ms,
+        max_bytes=options.stream_flush_max_bytes,
+    )
+
+
 @router.post("/")
 async def stream_response_v2(
     chat_request: ChatRequestV2,
     request: Request,
 ) -> StreamingResponse:
     """Send a message to Bella v2 Deep Agent and stream responses."""
+    started_at = time.perf_counter()
     query = chat_request.message.strip()
     conversation_id = chat_request.conversation_id
     auth_header = request.headers.get("Authorization")
 
     _logger.info(f"Deep Agent v2 processing query: {query}")
 
-    mcp_tools = await get_mcp_tools(auth_header)
-    agent = build_agent(mcp_tools=mcp_tools, checkpointer=request.app.state.checkpointer)
-
-    response_gen = stream_deep_agent(
-        agent=agent,
-        user_input=query,
-        conversation_id=conversation_id,
-    )
-    return StreamingResponse(response_gen, media_type="text/event-stream")
+    decision = await route_turn(query, conversation_id, request.app.state.checkpointer)
+    if decision is not None and decision.route is not Route.DEEP:
+        # Chit-chat and standalone wiki questions need neither the EMS token nor the MCP tools; the tool-less
+        # graph only records the exchange in the conversation's thread
+        agent = build_agent(mcp_tools=[], checkpointer=request.app.state.checkpointer)
+        response_gen = stream_routed_turn(
+            agent=agent,
+            fast_agent=get_fast_path_agent(decision.route),
+            user_input=query,
+            conversation_id=conversation_id,
+            context=DeepAgentContext(framing=_stream_framing(chat_request), route=decision.route),
+        )
+    else:
+        ems_token = await exchange_token_for_ems(request.app.state.token_exchange, auth_header)
+        mcp_tools = await get_mcp_tools(request.app.state.mcp_session_pool, ems_token)
+        agent = build_agent(mcp_tools=mcp_tools, checkpointer=request.app.state.checkpointer)
+        response_gen = stream_deep_agent(
+            agent=agent,
+            user_input=query,
+            conversation_id=conversation_id,
+            context=DeepAgentContext(ems_access_token=ems_token, framing=_stream_framing(chat_request)),
+            started_at=started_at,
+        )
+    # Fold older turns into the conversation summary once the response has been sent
+    summarize = BackgroundTask(get_conversation_history().summarize, agent, conversation_id)
+    return StreamingResponse(response_gen, media_type="text/event-stream", background=summarize)
 
 
 @router.post("/resume")
@@ -51,7 +94,8 @@ async def resume_response_v2(
 
     _logger.info(f"Resuming deep agent thread {conversation_id} with decision: {decision_type}")
 
-    mcp_tools = await get_mcp_tools(auth_header)
+    ems_token = await exchange_token_for_ems(request.app.state.token_exchange, auth_header)
+    mcp_tools = await get_mcp_tools(request.app.state.mcp_session_pool, ems_token)
     agent = build_agent(mcp_tools=mcp_tools, checkpointer=request.app.state.checkpointer)
 
     response_gen = resume_deep_agent(
@@ -59,8 +103,11 @@ async def resume_response_v2(
         conversation_id=conversation_id,
         decision=decision_type,
         edited_args=edited_args,
+        context=DeepAgentContext(ems_access_token=ems_token, framing=_stream_framing(resume_request)),
     )
-    return StreamingResponse(response_gen, media_type="text/event-stream")
+    # Fold older turns into the conversation summary once the response has been sent
+    summarize = BackgroundTask(get_conversation_history().summarize, agent, conversation_id)
+    return StreamingResponse(response_gen, media_type="text/event-stream", background=summarize)
 
 
 @router.get("/artifacts/{conversation_id}/{artifact_id}")
@@ -6,7 +6,24 @@ from uuid import UUID, uuid4
 from pydantic import BaseModel, Field
 
 
-class ChatRequestV2(BaseModel):
+class StreamFramingOptions(BaseModel):
+    """Per-request overrides of how streamed response tokens are coalesced into SSE frames."""
+
+    stream_flush_interval_ms: int | None = Field(
+        default=None,
+        ge=0,
+        description="Hold response tokens up to this long before framing them; 0 frames every token. "
+        "Defaults to the server's STREAM_FLUSH_INTERVAL_MS.",
+    )
+    stream_flush_max_bytes: int | None = Field(
+        default=None,
+        ge=0,
+        description="Frame buffered response tokens once they reach this size; 0 frames every token. "
+        "Defaults to the server's STREAM_FLUSH_MAX_BYTES.",
+    )
+
+
+class ChatRequestV2(StreamFramingOptions):
     """Request body for v2 chat endpoint."""
 
     message: str = Field(..., description="User prompt or question.")
@@ -33,7 +50,7 @@ class ResumeDecision(BaseModel):
     )
 
 
-class ResumeRequest(BaseModel):
+class ResumeRequest(StreamFramingOptions):
     """Request body for resuming an interrupted conversation."""
 
     conversation_id: UUID = Field(..., description="Unique conversation thread ID.")
@@ -12,6 +12,7 @@ from pydantic_settings import (
 MODEL_PROVIDERS = Literal["google", "ollama", "huggingface"]
 ENV_TYPES = Literal["dev", "prod", "test"]
 LOG_LEVELS = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+QUANTIZATION_MODES = Literal["none", "scalar", "binary"]
 
 
 class BellaChatBaseSettings(BaseSettings):
@@ -28,11 +29,13 @@ class BellaChatBaseSettings(BaseSettings):
     # Authentication
     JWT_SECRET: SecretStr | None = None
     AUTH_SERVICE_URL: str = "http://localhost:8002"
+    OBO_TOKEN_REFRESH_MARGIN_S: int = 30  # Re-exchange cached OBO tokens this long before they expire
 
     # Logging settings
     FASTAPI_LOG_LEVEL: LOG_LEVELS = "INFO"
     CONSOLE_LOG_LEVEL: LOG_LEVELS = "INFO"
-    FILE_LOG_LEVEL: LOG_LEVELS = "DEBUG"
+    FILE_LOG_LEVEL: LOG_LEVELS = "INFO"  # DEBUG logs every embedding, search and LLM call
+    LOG_MAX_MESSAGE_CHARS: int = 4000  # Longer log messages are truncated
 
     # App Settings
     APP_NAME: str = "Bella"
@@ -43,6 +46,8 @@ class BellaChatBaseSettings(BaseSettings):
     ALLOWED_HOSTS: list[str] = ["*"]
     ALLOWED_METHODS: list[str] = ["GET", "POST", "PATCH", "PUT", "DELETE"]
     ALLOWED_HEADERS: list[str] = ["*"]
+    STREAM_FLUSH_INTERVAL_MS: int = 16  # Hold streamed response tokens up to this long before framing them; 0 disables
+    STREAM_FLUSH_MAX_BYTES: int = 512  # Frame buffered response tokens once they reach this size; 0 disables
 
     # CORS settings
     CORS_ORIGINS: list[str] = ["*"]
@@ -53,16 +58,33 @@ class BellaChatBaseSettings(BaseSettings):
     SYNTHESIS_MODEL_PROVIDER: MODEL_PROVIDERS = "ollama"
     SYNTHESIS_MODEL_NAME: str = "qwen2.5vl:7b"
     SYNTHESIS_MODEL_CTX_LENGTH: int = 32000
+    FAST_MODEL_NAME: str | None = None  # Small synthesis-provider model for chit-chat; None uses SYNTHESIS_MODEL_NAME
+    FAST_MODEL_CTX_LENGTH: int = 8192
     EMBEDDING_MODEL_PROVIDER: MODEL_PROVIDERS = "ollama"
     EMBEDDING_MODEL_NAME: str = "qwen3-embedding:0.6b"
     EMBEDDING_MODEL_DIMENSION: int = 1024
+    EMBEDDING_CACHE_SIZE: int = 1024  # In-memory LRU entries for query embeddings; 0 disables
+    EMBEDDING_CACHE_PATH: str | None = None  # SQLite file shared with the ETL, e.g. ~/.cache/bella/embeddings.sqlite3
     GOOGLE_API_KEY: SecretStr = ""
 
     # Ollama Settings
     OLLAMA_URL: str = "http://localhost:11434"
+    OLLAMA_KEEP_ALIVE: str = "30m"  # How long Ollama keeps models loaded after a request; "-1m" keeps them loaded
+    OLLAMA_WARM_UP: bool = True  # Load the synthesis and embedding models at startup
+    OLLAMA_MAX_CONNECTIONS: int = 16  # Shared HTTP connection pool for every Ollama client
+    OLLAMA_MAX_KEEPALIVE_CONNECTIONS: int = 8
+    LLM_MAX_CONCURRENT_CALLS: int = 2  # Synthesis model calls run at once; the rest queue by priority. 0 disables
 
     # QDRANT Settings
     QDRANT_URL: str = "http://localhost:6333"
+    QDRANT_HNSW_M: int | None = None  # HNSW graph degree at collection creation; None keeps Qdrant's default (16)
+    QDRANT_HNSW_EF_CONSTRUCT: int | None = None  # HNSW build beam width; None keeps Qdrant's default (100)
+    QDRANT_HNSW_EF: int | None = None  # HNSW search beam width per query; None keeps Qdrant's default
+    QDRANT_QUANTIZATION: QUANTIZATION_MODES = "none"  # int8 "scalar" or "binary" quantization at collection creation
+    QDRANT_QUANTIZATION_RESCORE: bool = True  # Rescore quantized candidates with the original vectors
+    QDRANT_QUANTIZATION_OVERSAMPLING: float | None = 2.0  # Fetch this many times `k` candidates before rescoring
+    QDRANT_ON_DISK_VECTORS: bool = False  # Keep original vectors on disk (quantized copies stay in RAM)
+    QDRANT_ON_DISK_PAYLOAD: bool = False  # Keep payloads on disk
 
     # Arize Settings
     ARIZE_ENABLED: bool = True
@@ -75,9 +97,16 @@ class BellaChatBaseSettings(BaseSettings):
 
     # Keys Personal Wiki Agent Settings
     QDRANT_COLLECTION_NAME: str = "keys-personal-wiki"
+    ANSWER_CACHE_ENABLED: bool = True  # Serve cached answers to near-duplicate wiki questions
+    ANSWER_CACHE_COLLECTION_NAME: str = "bella-answer-cache"
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float = 0.92  # Minimum cosine similarity between questions for a hit
+    ANSWER_CACHE_TTL_S: int = 604800  # Cached answers older than this (7 days) are not served
 
     # EMS MCP Server Settings
     EMS_MCP_SERVER_URL: str = "http://localhost:8001/mcp"
+    EMS_MCP_SESSION_POOL_SIZE: int = 16  # Long-lived sessions kept open, one per caller token
+    EMS_MCP_SESSION_IDLE_TTL_S: int = 300  # Close pooled sessions unused for this long
+    EMS_MCP_TOOLS_CACHE_TTL_S: int = 600  # Re-list tools after this long, or on tools/list_changed
 
     # Orchestrator Settings — LangGraph Postgres checkpointer
     LANGGRAPH_PG_DB_USER: str = "langgraph_user"
@@ -85,6 +114,33 @@ class BellaChatBaseSettings(BaseSettings):
     LANGGRAPH_PG_DB_HOST: str = "localhost"
     LANGGRAPH_PG_DB_NAME: str = "bella_chat_checkpoints"
     ORCHESTRATOR_MAX_ITERATIONS: int = 10
+    SUBAGENT_TIMEOUT_S: float = 180.0  # Give up on a sub-agent task after this long; concurrent tasks continue
+    TOOL_TIMEOUT_S: float = 60.0  # Give up on any other tool call, e.g. an MCP tool, after this long
+    CHECKPOINT_POOL_MIN_SIZE: int = 2  # Connections kept open to the checkpoint database
+    CHECKPOINT_POOL_MAX_SIZE: int = 10  # Upper bound on concurrent checkpoint reads and writes
+    CHECKPOINT_POOL_TIMEOUT_S: float = 10.0  # Fail a checkpoint operation after waiting this long for a connection
+    CHECKPOINT_POOL_MAX_IDLE_S: float = 300.0  # Close connections above the minimum idle for this long
+    CHECKPOINT_POOL_MAX_LIFETIME_S: float = 3600.0  # Replace connections older than this
+    CHECKPOINT_POOL_CHECK: bool = True  # Check a connection is alive before handing it out
+
+    # Checkpoint Retention Settings
+    CHECKPOINT_RETENTION_ENABLED: bool = True
+    CHECKPOINT_RETENTION_INTERVAL_S: int = 3600
+    CHECKPOINT_THREAD_TTL_DAYS: int = 90  # Delete threads idle for longer; 0 keeps them forever
+    CHECKPOINT_KEEP_LAST: int = 1  # Latest checkpoints kept per thread
+    CHECKPOINT_MIN_IDLE_S: int = 900  # Threads active more recently than this are not pruned
+    CHECKPOINT_VACUUM: bool = True
+
+    # Turn Routing Settings
+    ROUTING_ENABLED: bool = True  # Answer chit-chat and standalone wiki questions without the deep agent
+    ROUTING_CLASSIFIER_ENABLED: bool = True  # Classify turns the heuristics cannot place; needs FAST_MODEL_NAME
+    ROUTING_CLASSIFIER_TIMEOUT_S: float = 2.0  # Send the turn to the deep agent when classifying takes longer
+
+    # Conversation History Settings
+    HISTORY_KEEP_TURNS: int = 6  # Most recent turns of a thread kept verbatim
+    HISTORY_SUMMARY_BATCH_TURNS: int = 4  # Fold older turns into the rolling summary once this many accumulate
+    HISTORY_SUMMARY_MAX_WORDS: int = 250
+    HISTORY_MAX_TOOL_RESULT_CHARS: int = 8000  # Longer tool results are trimmed before they enter the state
 
     @property
     def arize_pg_db_dsn(self) -> str:
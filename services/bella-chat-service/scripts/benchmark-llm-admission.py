@@ -0,0 +1,181 @@
+"""LLM admission control benchmark.
+
+Sends concurrent chat turns and background summaries to a fake model host, once with every call let through at once
+and once through `LLMAdmissionController`. The fake host behaves like a single Ollama server: it decodes
+`--host-parallel` generations at full speed and shares its throughput between any more, and every generation that
+starts while it is oversubscribed pays `--swap-ms` to re-evaluate its prompt after its context was evicted.
+
+Chat turns run through `stream_deep_agent` with a stub agent that makes one model call, so the `queued` SSE events
+reported to the client are counted too. Summaries run at background priority and arrive first, as they do right
+after a burst of turns. Reports the latency of turns (p50/p95) and summaries, and the queue positions one turn saw.
+
+Usage:
+    python scripts/benchmark-llm-admission.py
+    python scripts/benchmark-llm-admission.py --turns 16 --summaries 8 --max-concurrent 2 --host-parallel 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from app.agents.v2.deep_orchestrator import DEEP_ORCHESTRATOR_NAME, stream_deep_agent
+from app.core.llms.admission import AdmissionControlledChatModel, LLMAdmissionController, Priority, use_priority
+
+parser = argparse.ArgumentParser(description="Compare unbounded and admission-controlled calls to one model host")
+parser.add_argument("--turns", type=int, default=12, help="Chat turns")
+parser.add_argument("--summaries", type=int, default=6, help="Background summaries, started before the turns")
+parser.add_argument("--arrival-ms", type=float, default=50, help="Time between chat turn arrivals")
+parser.add_argument("--tokens", type=int, default=150, help="Tokens generated per call")
+parser.add_argument("--tokens-per-s", type=float, default=60, help="Host decode speed of one generation")
+parser.add_argument("--host-parallel", type=int, default=2, help="Generations the host decodes at full speed")
+parser.add_argument("--swap-ms", type=float, default=400, help="Prompt re-evaluation paid when oversubscribed")
+parser.add_argument("--max-concurrent", type=int, default=2, help="Admission slots")
+args = parser.parse_args()
+
+TICK_S = 0.005
+
+
+class FakeModelHost:
+    """A single model server whose decode throughput is shared by the generations running on it."""
+
+    def __init__(self):
+        """Start idle."""
+        self.active = 0
+
+    async def generate(self, tokens: int) -> None:
+        """Decode `tokens`, slowed down by whatever else is running."""
+        self.active += 1
+        try:
+            if self.active > args.host_parallel:
+                await asyncio.sleep(args.swap_ms / 1000)
+            remaining = float(tokens)
+            while remaining > 0:
+                await asyncio.sleep(TICK_S)
+                remaining -= args.tokens_per_s * TICK_S * min(1.0, args.host_parallel / self.active)
+        finally:
+            self.active -= 1
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model answering every call from the fake host."""
+
+    host: Any
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-model-host"
+
+    def _generate(self, *_, **__) -> ChatResult:
+        raise NotImplementedError("The benchmark only makes async calls")
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await self.host.generate(args.tokens)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+
+class AdmittedFakeChatModel(AdmissionControlledChatModel, FakeChatModel):
+    """The fake chat model, gated like `OllamaClient`."""
+
+
+class StubAgent:
+    """Minimal stand-in for the deep agent graph: one model call per turn."""
+
+    def __init__(self, model: BaseChatModel):
+        """Answer with `model`."""
+        self._model = model
+
+    async def astream(self, *_, **__):
+        """Call the model and stream its answer as a v2 `messages` part."""
+        response = await self._model.ainvoke([HumanMessage(content="question")])
+        metadata = {"lc_agent_name": DEEP_ORCHESTRATOR_NAME}
+        yield {"type": "messages", "ns": (), "data": (AIMessageChunk(content=response.content), metadata)}
+
+    async def aget_state(self, *_):
+        """Report a finished thread."""
+        return SimpleNamespace(next=(), tasks=(), values={})
+
+
+async def turn(agent: StubAgent, delay_s: float) -> tuple[float, list[int]]:
+    """Run one chat turn after `delay_s`; return its latency in ms and the queue positions it was sent."""
+    await asyncio.sleep(delay_s)
+    started_at = time.perf_counter()
+    positions = []
+    async for frame in stream_deep_agent(agent, "question", uuid4()):
+        event = json.loads(frame.removeprefix("data: "))
+        if event["type"] == "queued":
+            positions.append(event["position"])
+    return (time.perf_counter() - started_at) * 1000, positions
+
+
+async def summary(model: BaseChatModel) -> float:
+    """Run one background summary; return its latency in ms."""
+    started_at = time.perf_counter()
+    with use_priority(Priority.BACKGROUND):
+        await model.ainvoke([HumanMessage(content="summarize")])
+    return (time.perf_counter() - started_at) * 1000
+
+
+async def run(admission: LLMAdmissionController | None) -> tuple[float, list[float], list[float], list[list[int]]]:
+    """Run the workload; return wall ms, turn latencies, summary latencies and the positions each turn saw."""
+    model = AdmittedFakeChatModel(host=FakeModelHost())
+    model._admission = admission
+    agent = StubAgent(model)
+    started_at = time.perf_counter()
+    summaries = [asyncio.create_task(summary(model)) for _ in range(args.summaries)]
+    await asyncio.sleep(0)
+    turns = await asyncio.gather(*(turn(agent, index * args.arrival_ms / 1000) for index in range(args.turns)))
+    summary_ms = await asyncio.gather(*summaries)
+    wall_ms = (time.perf_counter() - started_at) * 1000
+    return wall_ms, [latency for latency, _ in turns], list(summary_ms), [positions for _, positions in turns]
+
+
+def percentile(values: list[float], q: int) -> float:
+    """Return the q-th percentile of `values`."""
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+def report(name: str, wall_ms: float, turn_ms: list[float], summary_ms: list[float]) -> None:
+    """Print one result row."""
+    print(
+        f"{name:<16}{wall_ms:>9.0f}{percentile(turn_ms, 50):>10.0f}{percentile(turn_ms, 95):>10.0f}"
+        f"{percentile(summary_ms, 50):>13.0f}{max(summary_ms):>13.0f}"
+    )
+
+
+async def main() -> int:
+    """Run the workload unbounded and admission-controlled and print a summary."""
+    os.environ.setdefault("CONSOLE_LOG_LEVEL", "WARNING")
+    print(
+        f"{args.turns} turns every {args.arrival_ms:.0f} ms after {args.summaries} summaries, "
+        f"{args.tokens} tokens per call at {args.tokens_per_s:.0f} tokens/s, host parallel {args.host_parallel}\n"
+    )
+    print(f"{'setup':<16}{'wall ms':>9}{'turn p50':>10}{'turn p95':>10}{'summary p50':>13}{'summary max':>13}")
+    wall_ms, turn_ms, summary_ms, _ = await run(None)
+    report("unbounded", wall_ms, turn_ms, summary_ms)
+
+    admission = LLMAdmissionController(max_concurrent=args.max_concurrent)
+    wall_ms, turn_ms, summary_ms, positions = await run(admission)
+    report(f"admission ({args.max_concurrent})", wall_ms, turn_ms, summary_ms)
+
+    stats = admission.stats()
+    print(
+        f"\nadmission: {stats['queued']} of {stats['admitted']} calls queued, avg wait {stats['wait_ms_avg']} ms, "
+        f"max queue {stats['max_waiting']}"
+    )
+    print(f"`queued` events sent to the last turn: {positions[-1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
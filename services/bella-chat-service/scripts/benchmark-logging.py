@@ -0,0 +1,113 @@
+"""Logging overhead benchmark for the embed and search paths.
+
+Times `OllamaEmbeddingsClient.embed_query` and `CustomQdrantVectorStore.similarity_search` (local in-process Qdrant)
+under several logging setups. The Ollama HTTP call is replaced by a stub returning a fixed vector, so the numbers
+isolate the cost of the code path itself, including every log call it makes.
+
+Setups:
+    off          logging disabled; the floor
+    info         default levels; DEBUG records are dropped before formatting
+    debug        DEBUG to the log file through the background queue writer
+    debug-sync   DEBUG written synchronously by the calling thread, as before the queue writer
+
+Usage:
+    python scripts/benchmark-logging.py
+    python scripts/benchmark-logging.py --calls 5000 --dim 1024
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+from langchain_core.documents import Document
+from langchain_ollama import OllamaEmbeddings
+from langchain_qdrant import RetrievalMode
+
+from app.core.embeddings.clients import OllamaEmbeddingsClient
+from app.core.vector_store import CustomQdrantClient, CustomQdrantVectorStore
+from utilities.logger import GetAppLogger
+
+parser = argparse.ArgumentParser(description="Measure per-call logging overhead in the embed and search paths")
+parser.add_argument("--calls", type=int, default=2000, help="Calls per path and setup")
+parser.add_argument("--dim", type=int, default=1024, help="Embedding dimension")
+parser.add_argument("--docs", type=int, default=200, help="Documents in the search collection")
+args = parser.parse_args()
+
+
+def stub_embedding(self, texts: list[str]) -> list[list[float]]:
+    """Stand-in for the Ollama HTTP call."""
+    return [[0.1] * args.dim for _ in texts]
+
+
+def configure(setup: str) -> None:
+    """Rebuild the logging pipeline for one setup."""
+    GetAppLogger.shutdown()
+    logging.disable(logging.CRITICAL if setup == "off" else logging.NOTSET)
+    os.environ["FILE_LOG_LEVEL"] = "INFO" if setup in {"off", "info"} else "DEBUG"
+    logger = GetAppLogger().get_logger()
+    if setup == "debug-sync":
+        file_handler = logging.FileHandler(f"{os.environ['APP_NAME']}-sync.log", encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        logger.handlers = [file_handler]
+
+
+def per_call_us(func, calls: int) -> float:
+    """Median per-call time in microseconds over batches of calls."""
+    batch = max(1, calls // 20)
+    samples = []
+    for _ in range(calls // batch):
+        started_at = time.perf_counter()
+        for _ in range(batch):
+            func()
+        samples.append((time.perf_counter() - started_at) / batch * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    """Run both paths under every setup and print per-call times."""
+    # Log into a scratch directory, and keep the console quiet so terminal I/O does not dominate
+    os.chdir(tempfile.mkdtemp(prefix="bella-log-bench-"))
+    os.environ["APP_NAME"] = "bench"
+    os.environ["CONSOLE_LOG_LEVEL"] = "WARNING"
+    warnings.simplefilter("ignore")
+    OllamaEmbeddings.embed_documents = stub_embedding
+
+    results = {}
+    for setup in ("off", "info", "debug", "debug-sync"):
+        configure(setup)
+        embeddings = OllamaEmbeddingsClient(model_name="stub")
+        client = CustomQdrantClient(url=None, location=":memory:")
+        client.create_collection("bench", embedding_dimension=args.dim)
+        vector_store = CustomQdrantVectorStore(client, "bench", embeddings, RetrievalMode.DENSE)
+        vector_store.add_documents(
+            [
+                Document(page_content=f"Document {i} " + "lorem ipsum " * 150, metadata={"i": i})
+                for i in range(args.docs)
+            ]
+        )
+
+        results[setup] = (
+            per_call_us(lambda embeddings=embeddings: embeddings.embed_query("What is Bella?"), args.calls),
+            per_call_us(lambda store=vector_store: store.similarity_search("What is Bella?", k=5), args.calls // 10),
+        )
+        client.close()
+    GetAppLogger.shutdown()
+
+    floor_embed, floor_search = results["off"]
+    print(f"Per-call time (median), dim {args.dim}, {args.docs} documents")
+    print(f"{'setup':<12}{'embed_query us':>16}{'overhead':>10}{'search us':>12}{'overhead':>10}")
+    for setup, (embed_us, search_us) in results.items():
+        print(
+            f"{setup:<12}{embed_us:>16.1f}{embed_us - floor_embed:>+10.1f}"
+            f"{search_us:>12.1f}{search_us - floor_search:>+10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
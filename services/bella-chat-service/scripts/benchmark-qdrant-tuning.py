@@ -0,0 +1,145 @@
+"""Qdrant collection tuning benchmark.
+
+Loads the same vectors into one collection per tuning profile (HNSW parameters, int8 scalar or binary quantization,
+on-disk vectors) and reports query latency and recall@k against exact brute-force search, so the trade-offs of the
+`QDRANT_*` settings can be measured before rolling them out.
+
+Runs without a server in Qdrant's local in-process mode by default. Local mode always searches exactly, so there
+it only gives the exact-search baseline (recall 1.0 for every profile); point `--url` at a Qdrant server to measure
+HNSW and quantization.
+
+Usage:
+    # Local in-process mode, synthetic clustered vectors
+    python scripts/benchmark-qdrant-tuning.py
+
+    # Against a Qdrant server, sampling real embeddings from the wiki collection
+    python scripts/benchmark-qdrant-tuning.py --url http://localhost:6333 --source-collection keys-personal-wiki
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import numpy as np
+from qdrant_client import models
+
+from app.core.vector_store import CustomQdrantClient, QdrantTuning
+
+PROFILES = {
+    "baseline": QdrantTuning(),
+    "hnsw-m32-ef200": QdrantTuning(hnsw_m=32, hnsw_ef_construct=200, hnsw_ef=128),
+    "int8": QdrantTuning(quantization="scalar", quantization_rescore=False),
+    "int8-rescore": QdrantTuning(quantization="scalar"),
+    "int8-rescore-on-disk": QdrantTuning(quantization="scalar", on_disk_vectors=True, on_disk_payload=True),
+    "binary-rescore": QdrantTuning(quantization="binary", quantization_oversampling=3.0),
+}
+
+parser = argparse.ArgumentParser(description="Measure recall and latency of Qdrant tuning profiles")
+parser.add_argument("--url", default=None, help="Qdrant server URL; omit for local in-process mode")
+parser.add_argument("--path", default=":memory:", help="Local mode storage: ':memory:' or a directory")
+parser.add_argument("--source-collection", default=None, help="Sample vectors from this collection")
+parser.add_argument("--points", type=int, default=20000, help="Number of synthetic vectors")
+parser.add_argument("--dim", type=int, default=1024, help="Dimension of synthetic vectors")
+parser.add_argument("--queries", type=int, default=200, help="Number of queries per profile")
+parser.add_argument("--k", type=int, default=10, help="Results per query")
+parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES), help="Profiles to run")
+args = parser.parse_args()
+
+
+def synthetic_vectors(count: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """Clustered unit vectors, closer to real embeddings than uniform noise."""
+    centers = rng.normal(size=(64, dim))
+    vectors = centers[rng.integers(0, len(centers), size=count)] + 0.5 * rng.normal(size=(count, dim))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def sample_vectors(client: CustomQdrantClient, collection_name: str) -> np.ndarray:
+    """Read every dense vector of an existing collection."""
+    vectors = []
+    offset = None
+    while True:
+        points, offset = client.scroll(collection_name, limit=1000, offset=offset, with_vectors=True)
+        for point in points:
+            vector = point.vector if isinstance(point.vector, list) else next(iter(point.vector.values()))
+            vectors.append(vector)
+        if offset is None:
+            break
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def wait_until_indexed(client: CustomQdrantClient, collection_name: str) -> None:
+    """Block until the optimizers have built the index (a no-op in local mode)."""
+    while client.get_collection(collection_name).status != models.CollectionStatus.GREEN:
+        time.sleep(0.5)
+
+
+def run_profile(
+    client: CustomQdrantClient, name: str, data: np.ndarray, queries: np.ndarray, truth: np.ndarray
+) -> dict:
+    """Load the data under one profile and time the queries."""
+    tuning = PROFILES[name]
+    collection_name = f"bench-{name}"
+    started_at = time.perf_counter()
+    client.create_collection(collection_name, embedding_dimension=data.shape[1], force_recreate=True, tuning=tuning)
+    client.upload_collection(collection_name, vectors=data, ids=range(len(data)), batch_size=512, wait=True)
+    wait_until_indexed(client, collection_name)
+    build_s = time.perf_counter() - started_at
+
+    latencies, recalls = [], []
+    for query, expected in zip(queries, truth, strict=True):
+        started_at = time.perf_counter()
+        response = client.query_points(
+            collection_name, query=query.tolist(), limit=args.k, search_params=tuning.search_params()
+        )
+        latencies.append((time.perf_counter() - started_at) * 1000)
+        recalls.append(len({point.id for point in response.points} & set(expected.tolist())) / args.k)
+
+    client.delete_collection(collection_name)
+    ordered = sorted(latencies)
+    return {
+        "profile": name,
+        "build_s": build_s,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        "recall": statistics.mean(recalls),
+    }
+
+
+def main() -> int:
+    """Run the selected profiles and print a summary table."""
+    if args.url:
+        client = CustomQdrantClient(url=args.url)
+    elif args.path == ":memory:":
+        client = CustomQdrantClient(url=None, location=":memory:")
+    else:
+        client = CustomQdrantClient(url=None, path=args.path)
+
+    rng = np.random.default_rng(42)
+    if args.source_collection:
+        data = sample_vectors(client, args.source_collection)
+        queries = data[rng.choice(len(data), size=min(args.queries, len(data)), replace=False)]
+        # Perturb the queries so they are not exact copies of indexed points
+        queries = queries + 0.05 * rng.normal(size=queries.shape).astype(np.float32)
+    else:
+        data = synthetic_vectors(args.points, args.dim, rng)
+        queries = synthetic_vectors(args.queries, args.dim, rng)
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    truth = np.argsort(-(queries @ data.T), axis=1)[:, : args.k]
+
+    print(f"Points: {len(data)}  dim: {data.shape[1]}  queries: {len(queries)}  k: {args.k}")
+    if not args.url:
+        print("Local mode searches exactly: HNSW and quantization settings have no effect on these results.")
+    print(f"{'profile':<24}{'build s':>9}{'p50 ms':>9}{'p95 ms':>9}{'recall@k':>10}")
+    for name in args.profiles:
+        result = run_profile(client, name, data, queries, truth)
+        print(
+            f"{result['profile']:<24}{result['build_s']:>9.1f}{result['p50_ms']:>9.2f}"
+            f"{result['p95_ms']:>9.2f}{result['recall']:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
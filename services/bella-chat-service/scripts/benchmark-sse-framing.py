@@ -0,0 +1,120 @@
+"""SSE response framing benchmark.
+
+Drives `stream_deep_agent` with a stub agent that streams a long answer in one- or two-character chunks, as local
+Ollama models do, writes every frame to a local TCP socket (one write and drain per frame, as the ASGI server does)
+and parses the frames on the other end (as the chat client does). Reports the frames and bytes produced, frames per
+second and the CPU time of the whole pipeline, with per-token framing and with coalesced framing.
+
+Usage:
+    python scripts/benchmark-sse-framing.py
+    python scripts/benchmark-sse-framing.py --chars 20000 --tokens-per-s 400 --interval-ms 16 --max-bytes 512
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from langchain_core.messages import AIMessageChunk
+
+from app.agents.v2.deep_orchestrator import DEEP_ORCHESTRATOR_NAME, DeepAgentContext, stream_deep_agent
+from app.agents.v2.streaming import StreamFraming
+
+parser = argparse.ArgumentParser(description="Measure SSE frames and CPU for per-token and coalesced framing")
+parser.add_argument("--chars", type=int, default=20000, help="Length of the streamed answer")
+parser.add_argument("--tokens-per-s", type=float, default=0, help="Chunk arrival rate; 0 streams as fast as possible")
+parser.add_argument("--interval-ms", type=int, default=16, help="Coalescing time window")
+parser.add_argument("--max-bytes", type=int, default=512, help="Coalescing size threshold")
+parser.add_argument("--runs", type=int, default=5, help="Streams per setup; the median CPU time is reported")
+args = parser.parse_args()
+
+
+class StubAgent:
+    """Minimal stand-in for the compiled deep agent graph."""
+
+    def __init__(self, chunks: list[str]):
+        """Stream `chunks` as the orchestrator's response."""
+        self._chunks = chunks
+
+    async def astream(self, *_, **__):
+        """Yield the answer as v2 `messages` parts, with a sub-agent event halfway through."""
+        delay = 1 / args.tokens_per_s if args.tokens_per_s else 0
+        metadata = {"lc_agent_name": DEEP_ORCHESTRATOR_NAME}
+        for index, chunk in enumerate(self._chunks):
+            if index == len(self._chunks) // 2:
+                event = {"type": "subagent_call", "subagent": "knowledge_wiki", "status": "running"}
+                yield {"type": "custom", "ns": (), "data": event}
+            yield {"type": "messages", "ns": (), "data": (AIMessageChunk(content=chunk), metadata)}
+            await asyncio.sleep(delay)
+
+    async def aget_state(self, *_):
+        """Report a finished thread."""
+        return SimpleNamespace(next=(), tasks=(), values={})
+
+
+async def read_frames(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Client side: split the byte stream into SSE frames and parse each one."""
+    buffer = b""
+    while chunk := await reader.read(65536):
+        *frames, buffer = (buffer + chunk).split(b"\n\n")
+        for frame in frames:
+            json.loads(frame.removeprefix(b"data: "))
+    writer.close()
+
+
+async def run(agent: StubAgent, framing: StreamFraming, port: int) -> tuple[int, int, float, float]:
+    """Stream one answer over the socket and return (frames, bytes, wall seconds, CPU seconds)."""
+    frames = size = 0
+    _, writer = await asyncio.open_connection("127.0.0.1", port)
+    started_at, cpu_started_at = time.perf_counter(), time.process_time()
+    context = DeepAgentContext(framing=framing)
+    async for frame in stream_deep_agent(agent, "question", uuid4(), context=context):
+        payload = frame.encode()
+        writer.write(payload)
+        await writer.drain()
+        frames += 1
+        size += len(payload)
+    writer.close()
+    await writer.wait_closed()
+    return frames, size, time.perf_counter() - started_at, time.process_time() - cpu_started_at
+
+
+async def main() -> int:
+    """Stream the same answer under both framings and print a summary."""
+    os.environ.setdefault("CONSOLE_LOG_LEVEL", "WARNING")
+    rng = random.Random(42)
+    text = "".join(rng.choice("abcdefghij klmnopqrst uvwxyz.") for _ in range(args.chars))
+    chunks, position = [], 0
+    while position < len(text):
+        step = rng.choice((1, 2))
+        chunks.append(text[position : position + step])
+        position += step
+    agent = StubAgent(chunks)
+    server = await asyncio.start_server(read_frames, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    setups = {
+        "per-token": StreamFraming(interval_ms=0, max_bytes=0),
+        "coalesced": StreamFraming(interval_ms=args.interval_ms, max_bytes=args.max_bytes),
+    }
+    rate = f"{args.tokens_per_s:.0f} chunks/s" if args.tokens_per_s else "unthrottled"
+    print(f"Answer: {args.chars} chars in {len(chunks)} chunks, {rate}")
+    print(f"{'setup':<12}{'frames':>9}{'KiB':>9}{'frames/s':>11}{'CPU ms':>9}{'CPU us/chunk':>14}")
+    for name, framing in setups.items():
+        results = sorted([await run(agent, framing, port) for _ in range(args.runs)], key=lambda result: result[3])
+        frames, size, wall_s, cpu_s = results[len(results) // 2]
+        print(
+            f"{name:<12}{frames:>9}{size / 1024:>9.1f}{frames / wall_s:>11.0f}"
+            f"{cpu_s * 1000:>9.1f}{cpu_s / len(chunks) * 1e6:>14.2f}"
+        )
+    server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
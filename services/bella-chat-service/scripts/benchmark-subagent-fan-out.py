@@ -0,0 +1,185 @@
+"""Sub-agent fan-out benchmark.
+
+Runs a deep agent with the orchestrator's two sub-agents on scripted fake models, answering a turn that needs an
+expense figure and a wiki fact. The orchestrator delegates the two tasks once one after the other (one `task` call
+per model step, as it did without the fan-out instruction) and once together in a single step, where they run
+concurrently under `FanOutMiddleware`. Every model call takes `--model-ms` and every sub-agent tool call, the stand-in
+for an MCP or retriever call, takes `--tool-ms`; `--wiki-tool-ms` makes the wiki lookup slower than the other.
+
+The turns run through `stream_deep_agent`, so the SSE frames a client would receive are checked: reports the wall
+time of each turn and the `subagent_call` events in the order they were sent. With `--subagent-timeout-s` below the
+time a sub-agent needs, its task ends with a `timeout` event while the other one completes.
+
+Usage:
+    python scripts/benchmark-subagent-fan-out.py
+    python scripts/benchmark-subagent-fan-out.py --model-ms 800 --wiki-tool-ms 4000 --subagent-timeout-s 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from uuid import uuid4
+
+from deepagents import create_deep_agent
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agents.v2.deep_orchestrator import (
+    DEEP_ORCHESTRATOR_NAME,
+    DEEP_ORCHESTRATOR_PROMPT,
+    DeepAgentContext,
+    stream_deep_agent,
+)
+from app.agents.v2.fan_out import SUBAGENT_TOOL_NAME, FanOutMiddleware, ToolTimeouts
+
+parser = argparse.ArgumentParser(description="Compare sequential and concurrent sub-agent tasks on fake models")
+parser.add_argument("--model-ms", type=float, default=400, help="Latency of every model call")
+parser.add_argument("--tool-ms", type=float, default=1000, help="Latency of the expense sub-agent's tool call")
+parser.add_argument("--wiki-tool-ms", type=float, default=None, help="Latency of the wiki lookup; --tool-ms if unset")
+parser.add_argument("--subagent-timeout-s", type=float, default=180, help="Time limit of one sub-agent task")
+parser.add_argument("--tool-timeout-s", type=float, default=60, help="Time limit of any other tool call")
+args = parser.parse_args()
+
+TASKS = {
+    "expense_analyst": "Total grocery spending last month",
+    "knowledge_wiki": "The grocery budget noted in the wiki",
+}
+
+
+@tool
+async def get_spending_total(period: str) -> str:
+    """Return the total spending for a period."""
+    await asyncio.sleep(args.tool_ms / 1000)
+    return f"Spent 12,400 on groceries in {period}."
+
+
+@tool
+async def search_personal_wiki(query: str) -> str:
+    """Search the personal wiki."""
+    await asyncio.sleep((args.wiki_tool_ms if args.wiki_tool_ms is not None else args.tool_ms) / 1000)
+    return "The grocery budget is 15,000 a month."
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Fake model that answers after `--model-ms` with the next step of its script."""
+
+    script: str
+    parallel: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake-model"
+
+    def bind_tools(self, *_, **__) -> "ScriptedChatModel":
+        """Ignore the tool schemas: the script knows which tools to call."""
+        return self
+
+    def _generate(self, *_, **__) -> ChatResult:
+        raise NotImplementedError("The benchmark only makes async calls")
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(args.model_ms / 1000)
+        done = sum(isinstance(message, ToolMessage) for message in messages)
+        message = self._orchestrate(done) if self.script == "orchestrator" else self._delegate(done)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _orchestrate(self, done: int) -> AIMessage:
+        """Delegate the tasks one per step, or all in the first step, then answer."""
+        pending = list(TASKS.items())[done:]
+        calls = pending if self.parallel else pending[:1]
+        if not calls or (self.parallel and done):
+            return AIMessage(content="You spent 12,400 of your 15,000 grocery budget last month.")
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {
+                    "name": SUBAGENT_TOOL_NAME,
+                    "args": {"description": description, "subagent_type": subagent},
+                    "id": f"call_{subagent}",
+                    "type": "tool_call",
+                }
+                for subagent, description in calls
+            ],
+        )
+
+    def _delegate(self, done: int) -> AIMessage:
+        """Call the sub-agent's one tool, then report its result."""
+        if done:
+            return AIMessage(content="Found it.")
+        name, arg = ("get_spending_total", "period") if self.script == "expense" else ("search_personal_wiki", "query")
+        return AIMessage(
+            content="", tool_calls=[{"name": name, "args": {arg: "groceries"}, "id": name, "type": "tool_call"}]
+        )
+
+
+def build(parallel: bool):
+    """Build the deep agent with the orchestrator's sub-agents on scripted models."""
+    fan_out = FanOutMiddleware(ToolTimeouts(subagent_s=args.subagent_timeout_s, tool_s=args.tool_timeout_s))
+    subagents = [
+        {
+            "name": "expense_analyst",
+            "description": "Queries financial records, expense summaries, and budget entries.",
+            "system_prompt": "You analyze user expense queries and financial data.",
+            "tools": [get_spending_total],
+            "model": ScriptedChatModel(script="expense"),
+            "middleware": [fan_out],
+        },
+        {
+            "name": "knowledge_wiki",
+            "description": "Searches personal notes, wiki facts, and document archives.",
+            "system_prompt": "You retrieve answers from personal notes and wiki facts.",
+            "tools": [search_personal_wiki],
+            "model": ScriptedChatModel(script="wiki"),
+            "middleware": [fan_out],
+        },
+    ]
+    return create_deep_agent(
+        model=ScriptedChatModel(script="orchestrator", parallel=parallel),
+        tools=[],
+        system_prompt=DEEP_ORCHESTRATOR_PROMPT,
+        subagents=subagents,
+        middleware=[fan_out],
+        context_schema=DeepAgentContext,
+        checkpointer=InMemorySaver(),
+        name=DEEP_ORCHESTRATOR_NAME,
+    )
+
+
+async def run(name: str, parallel: bool) -> float:
+    """Stream one turn; print its `subagent_call` events and return its wall time in ms."""
+    agent = build(parallel)
+    print(f"== {name}")
+    started_at = time.perf_counter()
+    async for frame in stream_deep_agent(agent, "How does my grocery spending compare to my budget?", uuid4()):
+        event = json.loads(frame.removeprefix("data: "))
+        at_ms = (time.perf_counter() - started_at) * 1000
+        if event["type"] == "subagent_call":
+            took = f" after {event['duration_ms']} ms" if "duration_ms" in event else ""
+            print(f"{at_ms:>8.0f} ms  {event['subagent']:<16} {event['status']}{took}")
+        elif event["type"] == "error":
+            print(f"{at_ms:>8.0f} ms  error: {event['content']}")
+    wall_ms = (time.perf_counter() - started_at) * 1000
+    print(f"{wall_ms:>8.0f} ms  done\n")
+    return wall_ms
+
+
+async def main() -> int:
+    """Run the turn with sequential and concurrent delegation and print a summary."""
+    os.environ.setdefault("CONSOLE_LOG_LEVEL", "WARNING")
+    sequential_ms = await run("sequential: one task per step", parallel=False)
+    parallel_ms = await run("fan-out: both tasks in one step", parallel=True)
+    saved = sequential_ms - parallel_ms
+    print(
+        f"wall time {sequential_ms:.0f} ms -> {parallel_ms:.0f} ms ({saved:.0f} ms, {saved / sequential_ms:.0%} saved)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
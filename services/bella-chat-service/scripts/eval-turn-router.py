@@ -0,0 +1,180 @@
+"""Offline evaluation of the turn router.
+
+Routes a labelled set of chat turns with `TurnRouter`, once with the heuristics alone and once with a fake classifier
+model for the turns they cannot place. The fake classifier answers after `--classifier-ms` and gives the correct label
+with probability `--classifier-accuracy`, so the effect of a small, imperfect model can be studied without one.
+
+Reports accuracy, the confusion matrix, how many turns each method decided, the routing latency (p50/p95) and the
+expected turn time against sending every turn to the deep agent, using `--chat-ms`, `--rag-ms` and `--deep-ms` as the
+cost of each route. Deep turns routed elsewhere are counted separately: they are answered without the tools they need.
+
+Usage:
+    python scripts/eval-turn-router.py
+    python scripts/eval-turn-router.py --cases my-turns.jsonl --classifier-accuracy 0.8 --classifier-ms 150
+
+`--cases` is a JSON lines file of {"message": str, "route": "chat" | "rag" | "deep", "follow_up": bool}.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+from pathlib import Path
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from app.agents.v2.routing import Route, TurnRouter
+
+parser = argparse.ArgumentParser(description="Evaluate turn routing on labelled turns with a fake classifier")
+parser.add_argument("--cases", type=Path, default=None, help="JSON lines of labelled turns; defaults to a built-in set")
+parser.add_argument("--classifier-accuracy", type=float, default=0.9, help="Share of correct fake classifier labels")
+parser.add_argument("--classifier-ms", type=float, default=120, help="Fake classifier latency")
+parser.add_argument("--chat-ms", type=float, default=900, help="Turn time on the chat route")
+parser.add_argument("--rag-ms", type=float, default=3500, help="Turn time on the RAG route")
+parser.add_argument("--deep-ms", type=float, default=12000, help="Turn time on the deep agent")
+parser.add_argument("--seed", type=int, default=7)
+args = parser.parse_args()
+
+CASES = [
+    ("hi", "chat", False),
+    ("Hello Bella!", "chat", False),
+    ("good morning", "chat", False),
+    ("thanks a lot", "chat", True),
+    ("thank you, that helps", "chat", True),
+    ("ok got it", "chat", False),
+    ("who are you?", "chat", False),
+    ("what can you do for me?", "chat", False),
+    ("bye!", "chat", True),
+    ("how's it going", "chat", False),
+    ("What projects has Key worked on?", "rag", False),
+    ("Summarize Key's experience with Kubernetes", "rag", False),
+    ("What does my wiki say about home server backups?", "rag", False),
+    ("Which programming languages are in my resume?", "rag", False),
+    ("hello, tell me about Key's experience", "rag", False),
+    ("What do my notes say about the trip to Japan?", "rag", False),
+    ("Explain the homelab network setup from my docs", "rag", False),
+    ("what is the recipe for the banana bread I saved", "rag", False),
+    ("How much did I spend on groceries last month?", "deep", False),
+    ("Add an expense of 450 rupees for dinner yesterday", "deep", False),
+    ("compare my loan interest to what my wiki notes say about prepayment", "deep", False),
+    ("What is my biggest expense category this year?", "deep", False),
+    ("Show my transactions from Amazon in March", "deep", False),
+    ("Delete the duplicate Uber entry", "deep", False),
+    ("What's my average monthly EMI?", "deep", False),
+    ("Plan a budget for next month based on my spending", "deep", False),
+    ("and what about April?", "deep", True),
+    ("why is that so high?", "deep", True),
+    ("Okay, now show me the breakdown", "deep", True),
+    ("Can you break that down by week", "deep", True),
+    # Confirmations of an action the deep agent proposed
+    ("ok go ahead", "deep", True),
+    ("great, do that", "deep", True),
+    ("ok sure", "deep", True),
+    ("perfect, yes please", "deep", True),
+    ("thanks, go ahead", "deep", True),
+    ("ok", "deep", True),
+    ("Did I pay the electricity bill?", "deep", False),
+    ("How much rent did I pay in total last year?", "deep", False),
+]
+
+
+def load_cases() -> list[tuple[str, Route, bool]]:
+    """Return the labelled turns from `--cases`, or the built-in set."""
+    if args.cases is None:
+        return [(message, Route(route), follow_up) for message, route, follow_up in CASES]
+    cases = []
+    for line in args.cases.read_text().splitlines():
+        if line.strip():
+            case = json.loads(line)
+            cases.append((case["message"], Route(case["route"]), bool(case.get("follow_up", False))))
+    return cases
+
+
+class FakeClassifier(BaseChatModel):
+    """Classifier model answering with the gold label of the message it is asked about, or a wrong one."""
+
+    labels: dict[str, Route]
+    accuracy: float
+    latency_ms: float
+    rng: Any
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-route-classifier"
+
+    def _generate(self, *_, **__) -> ChatResult:
+        raise NotImplementedError("The router only classifies asynchronously")
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency_ms / 1000)
+        message = messages[-1].content.rsplit("Message: ", 1)[1].removesuffix("\nLabel:")
+        label = self.labels[message]
+        if self.rng.random() > self.accuracy:
+            label = self.rng.choice([route for route in Route if route is not label])
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=label.value))])
+
+
+def percentile(values: list[float], q: int) -> float:
+    """Return the q-th percentile of `values`."""
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+async def evaluate(name: str, router: TurnRouter, cases: list[tuple[str, Route, bool]]) -> None:
+    """Route every case and print the report."""
+    costs = {Route.CHAT: args.chat_ms, Route.RAG: args.rag_ms, Route.DEEP: args.deep_ms}
+    confusion = {gold: dict.fromkeys(Route, 0) for gold in Route}
+    methods: dict[str, int] = {}
+    latencies, turn_ms, misses = [], [], []
+    for message, gold, follow_up in cases:
+        decision = await router.route(message, follow_up=follow_up)
+        confusion[gold][decision.route] += 1
+        methods[decision.method] = methods.get(decision.method, 0) + 1
+        latencies.append(decision.latency_ms)
+        turn_ms.append(decision.latency_ms + costs[decision.route])
+        if decision.route is not gold:
+            misses.append((message, gold, decision))
+
+    correct = sum(confusion[route][route] for route in Route)
+    unsafe = sum(count for route, count in confusion[Route.DEEP].items() if route is not Route.DEEP)
+    all_deep_ms = args.deep_ms * len(cases)
+    print(f"== {name}")
+    print(f"accuracy {correct}/{len(cases)} ({correct / len(cases):.0%}), deep turns routed elsewhere: {unsafe}")
+    print(f"decided by: {', '.join(f'{method} {count}' for method, count in sorted(methods.items()))}")
+    print(f"routing latency p50 {percentile(latencies, 50):.2f} ms, p95 {percentile(latencies, 95):.2f} ms")
+    print(
+        f"expected turn time {statistics.mean(turn_ms):.0f} ms vs {args.deep_ms:.0f} ms all-deep "
+        f"({1 - sum(turn_ms) / all_deep_ms:.0%} saved)"
+    )
+    print(f"{'gold / routed':<15}" + "".join(f"{route.value:>8}" for route in Route))
+    for gold in Route:
+        print(f"{gold.value:<15}" + "".join(f"{confusion[gold][route]:>8}" for route in Route))
+    for message, gold, decision in misses:
+        routed = f"{decision.route.value} ({decision.method}: {decision.reason})"
+        print(f"  miss: {message!r} is {gold.value}, routed {routed}")
+    print()
+
+
+async def main() -> int:
+    """Evaluate the heuristics alone and with the fake classifier."""
+    os.environ.setdefault("CONSOLE_LOG_LEVEL", "WARNING")
+    cases = load_cases()
+    await evaluate("heuristics only", TurnRouter(), cases)
+    classifier = FakeClassifier(
+        labels={message: gold for message, gold, _ in cases},
+        accuracy=args.classifier_accuracy,
+        latency_ms=args.classifier_ms,
+        rng=random.Random(args.seed),
+    )
+    name = f"heuristics + fake classifier ({args.classifier_accuracy:.0%} accurate, {args.classifier_ms:.0f} ms)"
+    await evaluate(name, TurnRouter(classifier=classifier), cases)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
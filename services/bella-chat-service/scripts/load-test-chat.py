@@ -0,0 +1,91 @@
+"""Concurrent chat stream load test.
+
+Opens N parallel SSE streams against a running Bella chat service and reports time to first frame,
+total stream duration and errors. Blocking work on the event loop (e.g. sync embedding or vector search)
+shows up as time to first frame growing with concurrency instead of staying flat.
+
+Usage:
+    # 50 parallel v2 streams against a local service
+    python scripts/load-test-chat.py --token <jwt>
+
+    # Custom concurrency, endpoint and prompt
+    python scripts/load-test-chat.py --token <jwt> --streams 20 --url http://localhost:5000/v2/chat/ \
+        --message "What do my notes say about Bella?"
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+
+import httpx
+
+parser = argparse.ArgumentParser(description="Run parallel chat streams against the Bella chat service")
+parser.add_argument("--url", default="http://localhost:5000/v2/chat/", help="Chat streaming endpoint")
+parser.add_argument("--token", required=True, help="Bearer token with the bella-chat:write scope")
+parser.add_argument("--streams", type=int, default=50, help="Number of parallel streams")
+parser.add_argument("--message", default="Search my personal wiki for what Bella is.", help="Prompt to send")
+parser.add_argument("--timeout", type=float, default=300.0, help="Per-stream timeout in seconds")
+args = parser.parse_args()
+
+
+async def run_stream(client: httpx.AsyncClient, index: int) -> tuple[float | None, float, str | None]:
+    """Run one chat stream and return (time to first frame, total duration, error)."""
+    started_at = time.perf_counter()
+    first_frame_at = None
+    try:
+        async with client.stream(
+            "POST",
+            args.url,
+            json={"message": args.message, "conversation_id": str(uuid.uuid4())},
+            headers={"Authorization": f"Bearer {args.token}"},
+        ) as resp:
+            if resp.status_code != httpx.codes.OK:
+                return None, time.perf_counter() - started_at, f"HTTP {resp.status_code}"
+            async for line in resp.aiter_lines():
+                if line.startswith("data:") and first_frame_at is None:
+                    first_frame_at = time.perf_counter()
+    except httpx.HTTPError as exc:
+        return None, time.perf_counter() - started_at, f"stream {index}: {exc!r}"
+
+    ttff = first_frame_at - started_at if first_frame_at else None
+    return ttff, time.perf_counter() - started_at, None
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def main() -> int:
+    """Run the streams concurrently and print a latency summary."""
+    limits = httpx.Limits(max_connections=args.streams, max_keepalive_connections=args.streams)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        started_at = time.perf_counter()
+        results = await asyncio.gather(*(run_stream(client, i) for i in range(args.streams)))
+        wall = time.perf_counter() - started_at
+
+    ttffs = [ttff for ttff, _, error in results if ttff is not None and error is None]
+    durations = [duration for _, duration, error in results if error is None]
+    errors = [error for _, _, error in results if error is not None]
+
+    print(f"Streams: {args.streams}  wall: {wall:.2f}s  errors: {len(errors)}")
+    if ttffs:
+        print(
+            f"Time to first frame  p50 {statistics.median(ttffs):.2f}s  "
+            f"p95 {_percentile(ttffs, 95):.2f}s  max {max(ttffs):.2f}s"
+        )
+    if durations:
+        print(
+            f"Stream duration      p50 {statistics.median(durations):.2f}s  "
+            f"p95 {_percentile(durations, 95):.2f}s  max {max(durations):.2f}s"
+        )
+    for error in errors[:5]:
+        print(f"  {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,84 @@
+"""LangGraph Postgres checkpoint retention script.
+
+Applies the checkpoint retention policy once: deletes threads idle for longer than the TTL, keeps only the latest
+checkpoints of the other idle threads, deletes the pending writes and channel blobs nothing references any more, then
+vacuums the tables and prints their sizes. Threads active within `--min-idle-minutes` are not touched.
+
+Defaults come from the `CHECKPOINT_*` settings, the same policy the service applies in the background. Safe to run
+while the service is up, e.g. nightly from cron.
+
+Usage:
+    python scripts/prune-checkpoints.py
+    python scripts/prune-checkpoints.py --ttl-days 30 --keep-last 3 --min-idle-minutes 60
+    python scripts/prune-checkpoints.py --sizes-only
+"""
+
+import argparse
+import asyncio
+import sys
+from dataclasses import replace
+from datetime import timedelta
+
+import psycopg
+
+from app.core.checkpoints import CheckpointRetention, CheckpointRetentionPolicy, checkpoint_table_sizes
+from app.settings import get_settings
+
+parser = argparse.ArgumentParser(description="Apply the LangGraph checkpoint retention policy once")
+parser.add_argument("--ttl-days", type=float, default=None, help="Delete threads idle for longer; 0 keeps them")
+parser.add_argument("--keep-last", type=int, default=None, help="Latest checkpoints kept per thread")
+parser.add_argument("--min-idle-minutes", type=float, default=None, help="Skip threads active more recently")
+parser.add_argument("--no-vacuum", action="store_true", help="Do not vacuum the tables after deleting")
+parser.add_argument("--sizes-only", action="store_true", help="Only print the table sizes")
+args = parser.parse_args()
+
+
+def print_sizes(sizes: dict[str, dict[str, int]]) -> None:
+    """Print the size and row estimates of each checkpoint table."""
+    for table, size in sizes.items():
+        print(
+            f"  {table:<18}: {size['total_bytes'] / 1024 / 1024:8.1f} MiB, "
+            f"{size['live_rows']} live rows, {size['dead_rows']} dead rows"
+        )
+
+
+async def main() -> int:
+    """Prune the checkpoint database and print the rows deleted and the table sizes."""
+    settings = get_settings()
+    policy = CheckpointRetentionPolicy.from_settings(settings)
+    if args.ttl_days is not None:
+        policy = replace(policy, thread_ttl=timedelta(days=args.ttl_days) if args.ttl_days > 0 else None)
+    if args.keep_last is not None:
+        policy = replace(policy, keep_last=max(1, args.keep_last))
+    if args.min_idle_minutes is not None:
+        policy = replace(policy, min_idle=timedelta(minutes=args.min_idle_minutes))
+
+    print(f"=== Checkpoint retention for '{settings.LANGGRAPH_PG_DB_NAME}' ===")
+    try:
+        if args.sizes_only:
+            async with await psycopg.AsyncConnection.connect(settings.langgraph_pg_db_dsn) as conn:
+                print_sizes(await checkpoint_table_sizes(conn))
+            return 0
+
+        print(f"  Policy: {policy}")
+        retention = CheckpointRetention(settings.langgraph_pg_db_dsn, policy, vacuum=not args.no_vacuum)
+        result = await retention.run_once()
+    except Exception as e:
+        print(f"\n❌ Retention run failed: {e}")
+        return 1
+
+    stats = retention.stats()
+    print(f"\n  Threads expired     : {result.threads}")
+    print(f"  Checkpoints deleted : {result.checkpoints}")
+    print(f"  Writes deleted      : {result.writes}")
+    print(f"  Blobs deleted       : {result.blobs}")
+    print(f"  Duration            : {stats['last_run']['duration_ms']} ms\n")
+    print_sizes(stats["tables"])
+    print("\n✅ Retention run complete.")
+    return 0
+
+
+if __name__ == "__main__":
+    import selectors
+
+    sys.exit(asyncio.run(main(), loop_factory=lambda: asyncio.SelectorEventLoop(selectors.SelectSelector())))
@@ -0,0 +1 @@
+"""Conftest for bella-chat-service."""
@@ -0,0 +1,119 @@
+"""Integration tests for checkpoint retention.
+
+Runs against the Postgres of the `LANGGRAPH_PG_DB_*` settings, in a schema of its own that is dropped afterwards, and
+is skipped when it is not reachable.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import psycopg
+import pytest
+import pytest_asyncio
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg import AsyncConnection
+from psycopg.rows import dict_row
+
+from app.core.checkpoints import CheckpointPruneResult, CheckpointRetentionPolicy, prune_checkpoints
+from app.settings import get_settings
+
+# Constants & Helpers
+
+POLICY = CheckpointRetentionPolicy(thread_ttl=timedelta(days=30), keep_last=2, min_idle=timedelta(minutes=15))
+
+
+@pytest_asyncio.fixture
+async def checkpoint_db():
+    """A connection string whose search path is a fresh schema holding the checkpoint tables."""
+    dsn = get_settings().langgraph_pg_db_dsn
+    try:
+        with psycopg.connect(dsn, connect_timeout=3):
+            pass
+    except psycopg.OperationalError as exc:
+        pytest.skip(f"Checkpoint Postgres is not available: {exc}")
+
+    schema = f"retention_test_{uuid.uuid4().hex}"
+    async with await AsyncConnection.connect(dsn, autocommit=True) as conn:
+        await conn.execute(f"CREATE SCHEMA {schema}")
+        try:
+            yield {"conninfo": dsn, "options": f"-c search_path={schema}"}
+        finally:
+            await conn.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+async def _seed(saver: AsyncPostgresSaver, thread_id: str, turns: int, age: timedelta) -> list[str]:
+    """Save `turns` checkpoints `age` old, each with a new `messages` blob and a pending write; return their ids."""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    version = None
+    checkpoint_ids = []
+    for turn in range(turns):
+        version = saver.get_next_version(version, None)
+        checkpoint = empty_checkpoint()
+        checkpoint["ts"] = (datetime.now(UTC) - age).isoformat()
+        # Lists are stored as blobs; primitive values would be inlined in the checkpoint
+        checkpoint["channel_values"] = {"messages": [f"turn {turn}"]}
+        checkpoint["channel_versions"] = {"messages": version}
+        config = await saver.aput(config, checkpoint, {}, {"messages": version})
+        await saver.aput_writes(config, [("messages", [f"pending {turn}"])], task_id=str(uuid.uuid4()))
+        checkpoint_ids.append(checkpoint["id"])
+    return checkpoint_ids
+
+
+async def _write_without_checkpoint(saver: AsyncPostgresSaver, thread_id: str) -> str:
+    """Record a pending write against a checkpoint that does not exist; return its checkpoint id."""
+    checkpoint_id = empty_checkpoint()["id"]
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": "", "checkpoint_id": checkpoint_id}}
+    await saver.aput_writes(config, [("messages", ["pending"])], task_id=str(uuid.uuid4()))
+    return checkpoint_id
+
+
+async def _remaining(conn: AsyncConnection, table: str, column: str) -> dict[str, set[str]]:
+    """Return the remaining `column` values of `table` per thread."""
+    cursor = await conn.execute(f"SELECT thread_id, {column} FROM {table}")
+    remaining: dict[str, set[str]] = {}
+    for thread_id, value in await cursor.fetchall():
+        remaining.setdefault(thread_id, set()).add(value)
+    return remaining
+
+
+# Retention
+
+
+class TestPruneCheckpoints:
+    """Tests for `prune_checkpoints` against a seeded checkpoint store."""
+
+    async def test__prunes_expired_superseded_and_orphaned_rows(self, checkpoint_db):
+        async with await AsyncConnection.connect(**checkpoint_db, autocommit=True, row_factory=dict_row) as conn:
+            saver = AsyncPostgresSaver(conn)
+            await saver.setup()
+            await _seed(saver, "expired", turns=3, age=timedelta(days=40))
+            idle = await _seed(saver, "idle", turns=4, age=timedelta(days=1))
+            await _write_without_checkpoint(saver, "idle")
+            active = await _seed(saver, "active", turns=4, age=timedelta(0))
+            # A turn in progress may record writes before its checkpoint
+            in_progress = await _write_without_checkpoint(saver, "active")
+
+        async with await AsyncConnection.connect(**checkpoint_db, autocommit=True) as conn:
+            result = await prune_checkpoints(conn, POLICY)
+
+            checkpoints = await _remaining(conn, "checkpoints", "checkpoint_id")
+            writes = await _remaining(conn, "checkpoint_writes", "checkpoint_id")
+            blob_versions = await _remaining(conn, "checkpoint_blobs", "version")
+
+        assert result == CheckpointPruneResult(threads=1, checkpoints=3 + 2, writes=3 + 2 + 1, blobs=3 + 2)
+        assert checkpoints == {"idle": set(idle[-2:]), "active": set(active)}
+        assert writes == {"idle": set(idle[-2:]), "active": {*active, in_progress}}
+        assert {thread_id: len(versions) for thread_id, versions in blob_versions.items()} == {"idle": 2, "active": 4}
+
+    async def test__keeps_everything_of_active_threads(self, checkpoint_db):
+        async with await AsyncConnection.connect(**checkpoint_db, autocommit=True, row_factory=dict_row) as conn:
+            saver = AsyncPostgresSaver(conn)
+            await saver.setup()
+            await _seed(saver, "active", turns=5, age=timedelta(minutes=1))
+            await _write_without_checkpoint(saver, "active")
+
+        async with await AsyncConnection.connect(**checkpoint_db, autocommit=True) as conn:
+            result = await prune_checkpoints(conn, POLICY)
+
+        assert result == CheckpointPruneResult()
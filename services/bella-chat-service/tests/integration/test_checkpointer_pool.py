@@ -0,0 +1,82 @@
+"""Integration tests for the pooled LangGraph checkpointer.
+
+Runs against the Postgres of the `LANGGRAPH_PG_DB_*` settings and is skipped when it is not reachable.
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+
+import psycopg
+import pytest
+from psycopg_pool import AsyncConnectionPool
+
+from app.dependencies import agents
+from app.settings import get_settings
+
+# Constants & Helpers
+
+CONCURRENT_TURNS = 6
+# How long every checkout holds its connection, so that concurrent turns overlap
+HOLD_S = 0.05
+
+
+@pytest.fixture
+def checkpointer_settings(monkeypatch):
+    """Settings for a pool of one to `CONCURRENT_TURNS` connections; skips when Postgres is unavailable."""
+    settings = get_settings().model_copy(
+        update={"CHECKPOINT_POOL_MIN_SIZE": 1, "CHECKPOINT_POOL_MAX_SIZE": CONCURRENT_TURNS}
+    )
+    try:
+        with psycopg.connect(settings.langgraph_pg_db_dsn, connect_timeout=3):
+            pass
+    except psycopg.OperationalError as exc:
+        pytest.skip(f"Checkpoint Postgres is not available: {exc}")
+    monkeypatch.setattr(agents, "get_settings", lambda: settings)
+    return settings
+
+
+def _track_checkouts(pool: AsyncConnectionPool) -> tuple[set[int], list[int]]:
+    """Record the backend pid of every connection checked out of `pool` and the peak number held at once."""
+    backend_pids: set[int] = set()
+    peak = [0]
+    held = [0]
+    connection = pool.connection
+
+    @asynccontextmanager
+    async def tracked_connection(*args, **kwargs):
+        async with connection(*args, **kwargs) as conn:
+            backend_pids.add(conn.info.backend_pid)
+            held[0] += 1
+            peak[0] = max(peak[0], held[0])
+            try:
+                await asyncio.sleep(HOLD_S)
+                yield conn
+            finally:
+                held[0] -= 1
+
+    pool.connection = tracked_connection
+    return backend_pids, peak
+
+
+# Checkpointer Pool
+
+
+class TestCheckpointerPool:
+    """Tests for `create_checkpointer`."""
+
+    async def test__concurrent_turns_use_separate_connections(self, checkpointer_settings):
+        thread_ids = [str(uuid.uuid4()) for _ in range(CONCURRENT_TURNS)]
+        async with agents.create_checkpointer() as checkpointer:
+            assert isinstance(checkpointer.conn, AsyncConnectionPool)
+            backend_pids, peak = _track_checkouts(checkpointer.conn)
+
+            # What a chat turn does first: read its thread's latest checkpoint
+            results = await asyncio.gather(
+                *(checkpointer.aget_tuple({"configurable": {"thread_id": thread_id}}) for thread_id in thread_ids)
+            )
+
+            assert results == [None] * CONCURRENT_TURNS
+            assert peak[0] > 1
+            assert len(backend_pids) > 1
+            assert checkpointer.conn.get_stats()["connections_num"] > 1
@@ -0,0 +1,97 @@
+"""Unit tests for the knowledge_wiki answer cache middleware."""
+
+import pytest
+import pytest_asyncio
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from qdrant_client import AsyncQdrantClient
+
+from app.agents.v2.answer_cache import AnswerCacheMiddleware
+from app.core.answer_cache import SemanticAnswerCache
+
+# Constants & Helpers
+
+TASK = "What is the grocery budget noted in the wiki?"
+SCOPE = "knowledge_wiki|test-model"
+
+
+class FakeWikiStore:
+    """Wiki vector store returning fixed top-k documents for every query."""
+
+    def __init__(self, top_k: list[str], indexed: set[str]):
+        self.top_k = top_k
+        self.indexed = indexed
+
+    async def asimilarity_search_with_score(self, query: str, k: int = 3) -> list[tuple[Document, float]]:
+        return [(Document(page_content=point_id, metadata={"_id": point_id}), 0.9) for point_id in self.top_k[:k]]
+
+    async def aget_by_ids(self, ids: list[str]) -> list[Document]:
+        return [Document(page_content=point_id, id=point_id) for point_id in set(ids) & self.indexed]
+
+
+def _retriever_result(call_id: str, point_ids: list[str]) -> ToolMessage:
+    """A retriever tool message carrying its documents as the artifact."""
+    documents = [Document(page_content=point_id, metadata={"_id": point_id}) for point_id in point_ids]
+    return ToolMessage(content="...", tool_call_id=call_id, artifact=documents)
+
+
+async def _answer(middleware: AnswerCacheMiddleware, tool_messages: list[ToolMessage]) -> dict | None:
+    """Run one sub-agent task through the middleware, answering it when the cache misses."""
+    state = {"messages": [HumanMessage(content=TASK)]}
+    update = await middleware.abefore_agent(state, None)
+    if update and update.get("jump_to") == "end":
+        return update
+    state = {**state, **update, "messages": [*state["messages"], *tool_messages, AIMessage(content="15,000")]}
+    await middleware.aafter_agent(state, None)
+    return None
+
+
+# Answer Cache Middleware
+
+
+class TestAnswerCacheMiddleware:
+    """Tests for caching sub-agent answers under the lookup's documents."""
+
+    @pytest_asyncio.fixture
+    async def cache(self) -> SemanticAnswerCache:
+        """Provide an answer cache over an in-memory Qdrant collection."""
+        return SemanticAnswerCache(
+            client=AsyncQdrantClient(location=":memory:"),
+            collection_name="answer-cache",
+            embeddings=DeterministicFakeEmbedding(size=16),
+        )
+
+    async def test__reformulated_retrieval_hits_on_the_next_task(self, cache: SemanticAnswerCache):
+        store = FakeWikiStore(top_k=["p1", "p2", "p3"], indexed={"p1", "p2", "p3", "p4"})
+        middleware = AnswerCacheMiddleware(cache, store, SCOPE)
+
+        # The sub-agent searched twice with its own queries and used other points than the top-k
+        assert await _answer(middleware, [_retriever_result("1", ["p4"]), _retriever_result("2", ["p1", "p4"])]) is None
+        hit = await _answer(middleware, [])
+
+        assert hit is not None
+        assert hit["messages"][0].content == "15,000"
+        assert cache.stats()["stores"] == 1
+
+    async def test__changed_source_is_not_served(self, cache: SemanticAnswerCache):
+        store = FakeWikiStore(top_k=["p1", "p2", "p3"], indexed={"p1", "p2", "p3", "p4"})
+        middleware = AnswerCacheMiddleware(cache, store, SCOPE)
+        await _answer(middleware, [_retriever_result("1", ["p4"])])
+
+        # The file behind p4 was edited, so the ETL replaced the point with a new id
+        store.indexed.discard("p4")
+
+        assert await _answer(middleware, []) is None
+        assert cache.stats()["stale"] == 1
+
+    @pytest.mark.parametrize("tool_messages", [[], [ToolMessage(content="no documents", tool_call_id="1")]])
+    async def test__answers_without_retrieval_are_not_cached(
+        self, cache: SemanticAnswerCache, tool_messages: list[ToolMessage]
+    ):
+        store = FakeWikiStore(top_k=["p1"], indexed={"p1"})
+        middleware = AnswerCacheMiddleware(cache, store, SCOPE)
+
+        await _answer(middleware, tool_messages)
+
+        assert cache.stats()["stores"] == 0
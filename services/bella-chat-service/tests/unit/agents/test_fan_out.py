@@ -0,0 +1,87 @@
+"""Unit tests for the fan-out middleware."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import ToolMessage
+from langgraph.prebuilt.tool_node import ToolCallRequest
+
+from app.agents.v2.fan_out import FanOutMiddleware, ToolTimeouts
+
+# Constants & Helpers
+
+TIMEOUT_S = 0.05
+TIMEOUTS = ToolTimeouts(subagent_s=TIMEOUT_S, tool_s=TIMEOUT_S)
+
+
+def _request(name: str, events: list[dict], args: dict | None = None) -> ToolCallRequest:
+    """A tool call request whose stream events are collected in `events`."""
+    tool_call = {"name": name, "args": args or {}, "id": f"call-{name}", "type": "tool_call"}
+    return ToolCallRequest(
+        tool_call=tool_call, tool=None, state={}, runtime=SimpleNamespace(stream_writer=events.append)
+    )
+
+
+def _handler(delay_s: float, error: Exception | None = None):
+    """A tool handler answering after `delay_s`, or raising `error`."""
+
+    async def handle(request: ToolCallRequest) -> ToolMessage:
+        await asyncio.sleep(delay_s)
+        if error is not None:
+            raise error
+        return ToolMessage(content="done", tool_call_id=request.tool_call["id"], name=request.tool_call["name"])
+
+    return handle
+
+
+# Timeouts and events
+
+
+class TestFanOutMiddleware:
+    """Tests for the per-call timeout and the `subagent_call` events."""
+
+    async def test__slow_subagent_returns_timeout_result(self):
+        events: list[dict] = []
+        request = _request("task", events, {"subagent_type": "expenses", "description": "Sum last month"})
+
+        result = await FanOutMiddleware(TIMEOUTS).awrap_tool_call(request, _handler(delay_s=1))
+
+        assert isinstance(result, ToolMessage)
+        assert (result.status, result.tool_call_id, result.name) == ("error", "call-task", "task")
+        assert "The expenses sub-agent did not finish within 0.05 s" in result.text
+        assert [(event["subagent"], event["task_id"], event["status"]) for event in events] == [
+            ("expenses", "call-task", "running"),
+            ("expenses", "call-task", "timeout"),
+        ]
+        assert events[0]["details"] == "Sum last month"
+        assert events[1]["duration_ms"] >= TIMEOUT_S * 1000
+
+    async def test__slow_tool_returns_timeout_result_without_events(self):
+        events: list[dict] = []
+
+        result = await FanOutMiddleware(TIMEOUTS).awrap_tool_call(_request("get_expenses", events), _handler(1))
+
+        assert isinstance(result, ToolMessage)
+        assert result.status == "error"
+        assert "The get_expenses tool did not finish" in result.text
+        assert events == []
+
+    async def test__failing_subagent_reports_error_and_raises(self):
+        events: list[dict] = []
+        request = _request("task", events, {"subagent_type": "expenses"})
+
+        with pytest.raises(RuntimeError):
+            await FanOutMiddleware(TIMEOUTS).awrap_tool_call(request, _handler(0, RuntimeError("boom")))
+
+        assert [event["status"] for event in events] == ["running", "error"]
+
+    async def test__fast_subagent_completes(self):
+        events: list[dict] = []
+        request = _request("task", events, {"subagent_type": "expenses"})
+
+        result = await FanOutMiddleware(TIMEOUTS).awrap_tool_call(request, _handler(0))
+
+        assert isinstance(result, ToolMessage)
+        assert result.text == "done"
+        assert [event["status"] for event in events] == ["running", "completed"]
@@ -0,0 +1,143 @@
+"""Unit tests for the bounded conversation history."""
+
+import uuid
+
+import pytest
+from langchain.agents import create_agent
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agents.v2.history import ConversationHistory, HistoryPolicy, split_turns, trim_tool_result
+
+# Constants & Helpers
+
+SUMMARY = "The user is saving for a trip to Goa."
+
+
+class RecordingChatModel(GenericFakeChatModel):
+    """Fake chat model keeping the messages of every call."""
+
+    calls: list[list[BaseMessage]] = []
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls.append(list(messages))
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+def _turn(number: int, with_tool: bool = False) -> list[BaseMessage]:
+    """The messages of one turn, optionally with a tool call and its result."""
+    messages: list[BaseMessage] = [HumanMessage(content=f"question {number}", id=f"human-{number}")]
+    if with_tool:
+        call = {"name": "get_expenses", "args": {}, "id": f"call-{number}"}
+        messages.append(AIMessage(content="", tool_calls=[call], id=f"call-ai-{number}"))
+        messages.append(ToolMessage(content="[]", tool_call_id=f"call-{number}", id=f"tool-{number}"))
+    messages.append(AIMessage(content=f"answer {number}", id=f"ai-{number}"))
+    return messages
+
+
+def _answers(count: int) -> RecordingChatModel:
+    """An agent model giving `count` plain answers."""
+    return RecordingChatModel(
+        messages=iter([AIMessage(content=f"answer {number}") for number in range(count)]), calls=[]
+    )
+
+
+# Helpers
+
+
+class TestSplitTurns:
+    """Tests for cutting the history at turn boundaries."""
+
+    def test__keeps_everything_when_there_are_few_turns(self):
+        messages = [*_turn(1), *_turn(2)]
+
+        assert split_turns(messages, keep_turns=2) == ([], messages)
+
+    def test__cuts_at_the_user_message_of_the_kept_turns(self):
+        messages = [*_turn(1, with_tool=True), *_turn(2, with_tool=True), *_turn(3)]
+
+        older, recent = split_turns(messages, keep_turns=2)
+
+        assert older == _turn(1, with_tool=True)
+        assert recent == [*_turn(2, with_tool=True), *_turn(3)]
+
+    def test__zero_keeps_no_turn(self):
+        messages = [*_turn(1), *_turn(2)]
+
+        assert split_turns(messages, keep_turns=0) == (messages, [])
+
+
+class TestTrimToolResult:
+    """Tests for trimming oversized tool results."""
+
+    def test__short_result_is_unchanged(self):
+        message = ToolMessage(content="[1, 2, 3]", tool_call_id="call-1")
+
+        assert trim_tool_result(message, max_chars=100) is message
+
+    def test__long_result_is_cut_with_a_note(self):
+        message = ToolMessage(content="x" * 150, tool_call_id="call-1", name="get_expenses")
+
+        trimmed = trim_tool_result(message, max_chars=100)
+
+        assert trimmed.content == f"{'x' * 100}\n... [50 of 150 characters trimmed; ask for a narrower result]"
+        assert (trimmed.tool_call_id, trimmed.name) == ("call-1", "get_expenses")
+
+    def test__text_blocks_are_trimmed_to_text(self):
+        message = ToolMessage(content=[{"type": "text", "text": "x" * 150}], tool_call_id="call-1")
+
+        assert trim_tool_result(message, max_chars=100).content.startswith("x" * 100 + "\n... [50 of 150")
+
+
+# Summary flow
+
+
+class TestConversationHistory:
+    """Tests for summarizing older turns and applying the summary on the next turn."""
+
+    @pytest.fixture
+    def thread_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    async def test__summary_replaces_older_turns_on_the_next_turn(self, thread_id):
+        summarizer = GenericFakeChatModel(messages=iter([AIMessage(content=SUMMARY)]))
+        history = ConversationHistory(summarizer, HistoryPolicy(keep_turns=1, summary_batch_turns=2))
+        model = _answers(4)
+        agent = create_agent(model, middleware=history.middleware, checkpointer=InMemorySaver())
+        config = {"configurable": {"thread_id": str(thread_id)}}
+        for number in range(3):
+            await agent.ainvoke({"messages": [HumanMessage(content=f"question {number}")]}, config)
+
+        await history.summarize(agent, thread_id)
+        # Applied inside the graph on the next turn only
+        assert [message.text for message in (await agent.aget_state(config)).values["messages"]][::2] == [
+            "question 0",
+            "question 1",
+            "question 2",
+        ]
+
+        await agent.ainvoke({"messages": [HumanMessage(content="question 3")]}, config)
+
+        state = (await agent.aget_state(config)).values
+        assert state["history_summary"] == SUMMARY
+        assert [message.text for message in state["messages"]] == ["question 2", "answer 2", "question 3", "answer 3"]
+        system = model.calls[-1][0]
+        assert isinstance(system, SystemMessage)
+        assert SUMMARY in system.text
+        assert history.pop_summary(str(thread_id)) is None
+
+    async def test__too_few_older_turns_are_not_summarized(self, thread_id):
+        summarizer = RecordingChatModel(messages=iter([AIMessage(content=SUMMARY)]), calls=[])
+        history = ConversationHistory(summarizer, HistoryPolicy(keep_turns=1, summary_batch_turns=2))
+        agent = create_agent(_answers(2), middleware=history.middleware, checkpointer=InMemorySaver())
+        for number in range(2):
+            await agent.ainvoke(
+                {"messages": [HumanMessage(content=f"question {number}")]},
+                {"configurable": {"thread_id": str(thread_id)}},
+            )
+
+        await history.summarize(agent, thread_id)
+
+        assert summarizer.calls == []
+        assert history.pop_summary(str(thread_id)) is None
@@ -0,0 +1,119 @@
+"""Unit tests for the turn router."""
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from app.agents.v2.routing import Route, TurnRouter, _chit_chat, heuristic_route, parse_route_label
+
+# Constants & Helpers
+
+LONG_REQUEST = " ".join(["word"] * 41)
+
+
+def _classifier(*answers: str) -> GenericFakeChatModel:
+    """A classifier model giving the answers in order."""
+    return GenericFakeChatModel(messages=iter([AIMessage(content=answer) for answer in answers]))
+
+
+# Heuristics
+
+
+class TestHeuristicRoute:
+    """Tests for the keyword routing table."""
+
+    @pytest.mark.parametrize(
+        ("message", "follow_up", "expected"),
+        [
+            ("Hi Bella!", False, (Route.CHAT, "chit-chat")),
+            ("Thanks a lot!", True, (Route.CHAT, "chit-chat")),
+            ("ok, sounds good", False, (Route.CHAT, "chit-chat")),
+            ("Who are you?", False, (Route.CHAT, "about Bella")),
+            ("How much did I spend on groceries last month?", False, (Route.DEEP, "financial or action terms")),
+            ("Thanks! Now add a budget for travel", False, (Route.DEEP, "financial or action terms")),
+            ("What projects are in my wiki?", False, (Route.RAG, "wiki terms")),
+            ("What projects are in my wiki?", True, (Route.DEEP, "follow-up")),
+            (LONG_REQUEST, False, (Route.DEEP, "long request")),
+            ("Tell me something interesting", False, None),
+        ],
+    )
+    def test__routes_by_wording(self, message: str, follow_up: bool, expected: tuple[Route, str] | None):
+        assert heuristic_route(message, follow_up) == expected
+
+    @pytest.mark.parametrize("message", ["ok, go ahead", "ok", "great, do that", "sure", "thanks, go ahead", "yes"])
+    def test__follow_up_acknowledgements_go_to_the_deep_agent(self, message: str):
+        assert heuristic_route(message, follow_up=True) == (Route.DEEP, "follow-up")
+
+
+class TestChitChat:
+    """Tests for telling chit-chat apart."""
+
+    def test__acknowledgements_are_chit_chat_only_at_the_start(self):
+        assert _chit_chat("ok, go ahead", follow_up=False) == "chit-chat"
+        assert _chit_chat("ok, go ahead", follow_up=True) is None
+
+    def test__thanks_in_a_follow_up_allow_only_filler_words(self):
+        assert _chit_chat("thank you so much Bella", follow_up=True) == "chit-chat"
+        assert _chit_chat("thanks, go ahead", follow_up=True) is None
+
+    def test__long_greeting_tails_are_not_chit_chat(self):
+        assert _chit_chat("hi, what did I note about the trip to Goa", follow_up=False) is None
+
+    def test__long_questions_about_bella_are_not_chit_chat(self):
+        assert _chit_chat("who are you going to ask about the notes I wrote last week", follow_up=False) is None
+
+
+class TestParseRouteLabel:
+    """Tests for reading the classifier answer."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("chat", Route.CHAT), ("Label: RAG", Route.RAG), ("Deep.", Route.DEEP), ("not sure", None), ("chatter", None)],
+    )
+    def test__parses_label(self, text: str, expected: Route | None):
+        assert parse_route_label(text) == expected
+
+
+# Router
+
+
+class TestTurnRouter:
+    """Tests for the router combining heuristics and the classifier."""
+
+    async def test__paused_conversation_goes_to_the_deep_agent(self):
+        router = TurnRouter(classifier=_classifier("chat"))
+
+        decision = await router.route("Hi Bella!", follow_up=True, paused=True)
+
+        assert (decision.route, decision.method, decision.reason) == (Route.DEEP, "heuristic", "awaiting approval")
+
+    async def test__unplaced_turn_without_classifier_falls_back_to_deep(self):
+        decision = await TurnRouter().route("Tell me something interesting")
+
+        assert (decision.route, decision.method) == (Route.DEEP, "fallback")
+
+    async def test__unplaced_turn_is_classified(self):
+        decision = await TurnRouter(classifier=_classifier("rag")).route("Tell me something interesting")
+
+        assert (decision.route, decision.method) == (Route.RAG, "classifier")
+
+    async def test__classifier_without_label_falls_back_to_deep(self):
+        decision = await TurnRouter(classifier=_classifier("no idea")).route("Tell me something interesting")
+
+        assert (decision.route, decision.reason) == (Route.DEEP, "classifier gave no label")
+
+    async def test__stats_count_routes_and_methods(self):
+        router = TurnRouter()
+        for message in ("Hi Bella!", "What projects are in my wiki?", "Tell me something interesting"):
+            await router.route(message)
+
+        stats = router.stats()
+
+        assert {key: stats[key] for key in ("decisions", "chat", "rag", "deep", "heuristic", "fallback")} == {
+            "decisions": 3,
+            "chat": 1,
+            "rag": 1,
+            "deep": 1,
+            "heuristic": 2,
+            "fallback": 1,
+        }
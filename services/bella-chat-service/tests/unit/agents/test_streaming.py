@@ -0,0 +1,88 @@
+"""Unit tests for coalescing streamed response tokens into frames."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents.v2 import streaming
+from app.agents.v2.streaming import ResponseCoalescer, StreamFraming
+
+# Constants & Helpers
+
+# Never reached by a test, so only the byte threshold flushes
+NO_INTERVAL_MS = 60_000
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    """The coalescer's clock, in seconds; tests move it by changing the only item."""
+    now = [0.0]
+    monkeypatch.setattr(streaming, "time", SimpleNamespace(perf_counter=lambda: now[0]))
+    return now
+
+
+# Framing
+
+
+class TestStreamFraming:
+    """Tests for the flush thresholds."""
+
+    @pytest.mark.parametrize(("interval_ms", "max_bytes"), [(0, 512), (16, 0)])
+    def test__zero_threshold_disables_coalescing(self, interval_ms: int, max_bytes: int):
+        assert not StreamFraming(interval_ms=interval_ms, max_bytes=max_bytes).enabled
+
+    def test__overrides_keep_values_given_none(self):
+        framing = StreamFraming(interval_ms=50, max_bytes=2048)
+
+        assert framing.with_overrides(interval_ms=None, max_bytes=256) == StreamFraming(interval_ms=50, max_bytes=256)
+        assert framing.with_overrides() == framing
+        assert framing.with_overrides(interval_ms=0).interval_ms == 0
+
+
+# Coalescer
+
+
+class TestResponseCoalescer:
+    """Tests for when buffered text is released."""
+
+    def test__first_token_is_framed_immediately(self, clock):
+        coalescer = ResponseCoalescer(StreamFraming(interval_ms=NO_INTERVAL_MS, max_bytes=512))
+
+        assert coalescer.add("Hel") == "Hel"
+        assert coalescer.add("lo") is None
+        assert coalescer.pending
+
+    def test__flushes_at_max_bytes(self, clock):
+        coalescer = ResponseCoalescer(StreamFraming(interval_ms=NO_INTERVAL_MS, max_bytes=8))
+        coalescer.add("A")
+
+        assert [coalescer.add(token) for token in ("bc", "de", "fg")] == [None, None, None]
+        # Counted in bytes: "é" is two
+        assert coalescer.add("hé") == "bcdefghé"
+        assert not coalescer.pending
+
+    def test__flushes_after_interval(self, clock):
+        coalescer = ResponseCoalescer(StreamFraming(interval_ms=16, max_bytes=512))
+        coalescer.add("A")
+
+        assert coalescer.add("b") is None
+        clock[0] += 0.010
+        assert coalescer.time_to_flush() == pytest.approx(0.006)
+        assert coalescer.add("c") is None
+        clock[0] += 0.007
+        assert coalescer.add("d") == "bcd"
+        assert coalescer.time_to_flush() is None
+
+    def test__disabled_framing_frames_every_token(self, clock):
+        coalescer = ResponseCoalescer(StreamFraming(interval_ms=0, max_bytes=512))
+
+        assert [coalescer.add(token) for token in ("A", "b", "c")] == ["A", "b", "c"]
+
+    def test__flush_releases_the_buffer(self, clock):
+        coalescer = ResponseCoalescer(StreamFraming(interval_ms=NO_INTERVAL_MS, max_bytes=512))
+        coalescer.add("A")
+        coalescer.add("b")
+        coalescer.add("c")
+
+        assert coalescer.flush() == "bc"
+        assert coalescer.flush() is None
@@ -0,0 +1,150 @@
+"""Unit tests for LLM admission control."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+
+from app.core.llms.admission import (
+    AdmissionControlledChatModel,
+    LLMAdmissionController,
+    Priority,
+    llm_queue_listener,
+    use_priority,
+)
+
+# Constants & Helpers
+
+REPLIES = ["first", "second", "third", "fourth"]
+
+
+class FakeModel(AdmissionControlledChatModel, GenericFakeChatModel):
+    """Fake chat model gated by an admission controller; its replies show the order calls were admitted in."""
+
+
+def _model(controller: LLMAdmissionController) -> FakeModel:
+    model = FakeModel(messages=iter(REPLIES))
+    model._admission = controller
+    return model
+
+
+async def _call(
+    model: FakeModel, priority: Priority = Priority.INTERACTIVE, listener: Callable[[int], None] | None = None
+) -> str:
+    """Invoke the model at `priority`, reporting queue positions to `listener`."""
+    llm_queue_listener.set(listener)
+    with use_priority(priority):
+        return (await model.ainvoke("hello")).text
+
+
+async def _until_waiting(controller: LLMAdmissionController, count: int) -> None:
+    """Yield to the event loop until `count` calls wait for a slot."""
+    for _ in range(100):
+        if controller.stats()["waiting"] == count:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError(f"expected {count} waiting calls, got {controller.stats()['waiting']}")
+
+
+# Admission Controller
+
+
+class TestAdmissionControlledChatModel:
+    """Tests for queueing model calls through an `LLMAdmissionController`."""
+
+    async def test__admits_immediately_when_a_slot_is_free(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+
+        assert await _call(_model(controller)) == "first"
+        assert controller.stats()["admitted"] == 1
+        assert controller.stats()["queued"] == 0
+        assert controller.stats()["active"] == 0
+
+    async def test__interactive_before_background(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        model = _model(controller)
+
+        async with controller.slot():
+            background = asyncio.create_task(_call(model, Priority.BACKGROUND))
+            await _until_waiting(controller, 1)
+            interactive = asyncio.create_task(_call(model, Priority.INTERACTIVE))
+            await _until_waiting(controller, 2)
+
+        assert await interactive == "first"
+        assert await background == "second"
+
+    async def test__first_come_first_served_within_a_priority(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        model = _model(controller)
+
+        async with controller.slot():
+            calls = []
+            for waiting in range(1, 4):
+                calls.append(asyncio.create_task(_call(model)))
+                await _until_waiting(controller, waiting)
+
+        assert await asyncio.gather(*calls) == REPLIES[:3]
+        assert controller.stats()["queued"] == 3
+
+    async def test__cancelled_waiter_is_removed(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        model = _model(controller)
+
+        async with controller.slot():
+            cancelled = asyncio.create_task(_call(model))
+            await _until_waiting(controller, 1)
+            waiting = asyncio.create_task(_call(model))
+            await _until_waiting(controller, 2)
+
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            assert controller.stats()["waiting"] == 1
+
+        assert await waiting == "first"
+        stats = controller.stats()
+        assert (stats["cancelled"], stats["active"], stats["waiting"]) == (1, 0, 0)
+
+    async def test__slot_admitted_on_cancellation_is_handed_on(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        model = _model(controller)
+
+        held = controller.slot()
+        await held.__aenter__()
+        admitted = asyncio.create_task(_call(model))
+        await _until_waiting(controller, 1)
+        next_call = asyncio.create_task(_call(model))
+        await _until_waiting(controller, 2)
+
+        # Releasing admits the first waiter; it is cancelled before it gets to run
+        await held.__aexit__(None, None, None)
+        admitted.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await admitted
+        assert await asyncio.wait_for(next_call, timeout=1) == "first"
+        stats = controller.stats()
+        assert (stats["cancelled"], stats["active"], stats["waiting"]) == (1, 0, 0)
+
+    async def test__queue_position_listener(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        model = _model(controller)
+        background_positions: list[int] = []
+        interactive_positions: list[int] = []
+
+        async with controller.slot():
+            background = asyncio.create_task(_call(model, Priority.BACKGROUND, background_positions.append))
+            await _until_waiting(controller, 1)
+            interactive = asyncio.create_task(_call(model, Priority.INTERACTIVE, interactive_positions.append))
+            await _until_waiting(controller, 2)
+
+        await asyncio.gather(background, interactive)
+        # The interactive call overtakes the background one, which moves back to second place
+        assert interactive_positions == [1, 0]
+        assert background_positions == [1, 2, 1, 0]
+
+    async def test__without_a_controller_calls_are_not_gated(self):
+        model = FakeModel(messages=iter(REPLIES))
+
+        assert await _call(model) == "first"
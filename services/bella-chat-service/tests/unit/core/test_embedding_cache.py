@@ -0,0 +1,62 @@
+"""Unit tests for the caching embeddings client."""
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from app.core.embeddings import CachedEmbeddingsClient, EmbeddingDiskCache
+
+# Constants & Helpers
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings counting the texts they embed."""
+
+    embedded: int = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded += len(texts)
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        self.embedded += 1
+        return super().embed_query(text)
+
+
+def _client(disk_cache: EmbeddingDiskCache | None = None) -> tuple[CachedEmbeddingsClient, CountingEmbeddings]:
+    embeddings = CountingEmbeddings(size=8)
+    return CachedEmbeddingsClient(embeddings, model_key="fake:8", disk_cache=disk_cache), embeddings
+
+
+# Cache keys
+
+
+class TestCachedEmbeddingsClient:
+    """Tests for the cache keys of queries and documents."""
+
+    async def test__query_variations_share_one_entry(self):
+        client, embeddings = _client()
+
+        first = await client.aembed_query("What is my  grocery budget?")
+        second = await client.aembed_query("what is my grocery budget?")
+
+        assert first == second
+        assert (embeddings.embedded, client.hits) == (1, 1)
+
+    async def test__documents_are_keyed_on_their_exact_text(self):
+        client, embeddings = _client()
+
+        await client.aembed_documents(["Budget: 500", "budget:  500"])
+        await client.aembed_documents(["Budget: 500"])
+
+        assert (embeddings.embedded, client.hits) == (2, 1)
+
+    def test__disk_tier_serves_another_client(self, tmp_path):
+        disk_cache = EmbeddingDiskCache(tmp_path / "embeddings.sqlite3")
+        writer, _ = _client(disk_cache)
+        reader, embeddings = _client(disk_cache)
+
+        [vector] = writer.embed_documents(["Budget: 500"])
+
+        # Stored as float32
+        assert reader.embed_documents(["Budget: 500"])[0] == pytest.approx(vector, rel=1e-6)
+        assert embeddings.embedded == 0
@@ -0,0 +1,193 @@
+"""Unit tests for the pool of MCP client sessions."""
+
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.types import (
+    CallToolResult,
+    ListToolsResult,
+    ServerNotification,
+    TextContent,
+    Tool,
+    ToolListChangedNotification,
+)
+
+from app.core.mcp import session_pool
+from app.core.mcp.session_pool import MCPSessionPool
+
+# Constants & Helpers
+
+TOOLS = [
+    Tool(name="get_expenses", inputSchema={"type": "object"}),
+    Tool(name="add_expense", inputSchema={"type": "object"}),
+]
+
+
+class FakeSession:
+    """MCP client session answering tool calls, or failing the next ones with queued errors."""
+
+    def __init__(self, token: str | None, errors: list[Exception]):
+        self.token = token
+        self.errors = errors
+        self.calls: list[str] = []
+        self.closed = False
+
+    async def initialize(self) -> None:
+        pass
+
+    async def call_tool(self, name: str, arguments: dict) -> CallToolResult:
+        self.calls.append(name)
+        if self.errors:
+            raise self.errors.pop(0)
+        return CallToolResult(content=[TextContent(type="text", text=f"{name} for {self.token}")])
+
+    async def list_tools(self, cursor: str | None = None) -> ListToolsResult:
+        # One tool per page
+        index = int(cursor or 0)
+        next_cursor = str(index + 1) if index + 1 < len(TOOLS) else None
+        return ListToolsResult(tools=[TOOLS[index]], nextCursor=next_cursor)
+
+
+class FakeServer:
+    """Stands in for `create_session`, keeping every session it opened."""
+
+    def __init__(self):
+        self.sessions: list[FakeSession] = []
+        self.errors: list[Exception] = []
+
+    @asynccontextmanager
+    async def create_session(self, connection):
+        authorization = connection["headers"].get("Authorization", "")
+        session = FakeSession(authorization.removeprefix("Bearer ") or None, self.errors)
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+
+@pytest.fixture
+def server(monkeypatch) -> FakeServer:
+    """A fake MCP server the pool opens its sessions on."""
+    fake = FakeServer()
+    monkeypatch.setattr(session_pool, "create_session", fake.create_session)
+    return fake
+
+
+def _pool(**kwargs) -> MCPSessionPool:
+    """A pool of sessions with the callers' tokens passed explicitly."""
+    return MCPSessionPool("http://ems-mcp/mcp", token_from_runtime=lambda runtime: None, **kwargs)
+
+
+# Tool calls
+
+
+class TestCallTool:
+    """Tests for routing tool calls through pooled sessions."""
+
+    async def test__reuses_the_session_of_a_token(self, server):
+        pool = _pool()
+
+        await pool.call_tool("alice", "get_expenses", {})
+        result = await pool.call_tool("alice", "get_expenses", {})
+
+        assert result.content[0].text == "get_expenses for alice"
+        assert len(server.sessions) == 1
+        assert pool.stats()["sessions_reused"] == 1
+        await pool.close()
+
+    async def test__dead_session_is_replaced_and_the_call_retried_once(self, server):
+        pool = _pool()
+        await pool.call_tool("alice", "get_expenses", {})
+        server.errors.append(anyio.ClosedResourceError())
+
+        result = await pool.call_tool("alice", "add_expense", {})
+
+        assert result.content[0].text == "add_expense for alice"
+        assert [session.calls for session in server.sessions] == [["get_expenses", "add_expense"], ["add_expense"]]
+        assert server.sessions[0].closed
+        await pool.close()
+
+    async def test__dead_session_is_retried_only_once(self, server):
+        pool = _pool()
+        server.errors.extend([anyio.ClosedResourceError(), anyio.BrokenResourceError()])
+
+        with pytest.raises(anyio.BrokenResourceError):
+            await pool.call_tool("alice", "add_expense", {})
+
+        assert len(server.sessions) == 2
+        assert pool.stats()["active_sessions"] == 0
+
+    async def test__other_errors_are_not_retried(self, server):
+        pool = _pool()
+        server.errors.append(RuntimeError("server error"))
+
+        with pytest.raises(RuntimeError):
+            await pool.call_tool("alice", "add_expense", {})
+
+        assert [session.calls for session in server.sessions] == [["add_expense"]]
+        assert server.sessions[0].closed
+
+
+# Eviction
+
+
+class TestEviction:
+    """Tests for closing idle and least recently used sessions."""
+
+    async def test__least_recently_used_session_is_closed_beyond_max_sessions(self, server):
+        pool = _pool(max_sessions=2)
+
+        for token in ("alice", "bob", "alice", "carol"):
+            await pool.call_tool(token, "get_expenses", {})
+
+        assert {session.token: session.closed for session in server.sessions} == {
+            "alice": False,
+            "bob": True,
+            "carol": False,
+        }
+        assert pool.stats()["active_sessions"] == 2
+        await pool.close()
+
+    async def test__idle_sessions_are_closed(self, server):
+        pool = _pool(idle_ttl_s=60)
+        await pool.call_tool("alice", "get_expenses", {})
+        for pooled in pool._sessions.values():
+            pooled.last_used -= 61
+
+        await pool.call_tool("bob", "get_expenses", {})
+
+        assert [session.closed for session in server.sessions] == [True, False]
+        await pool.close()
+        assert all(session.closed for session in server.sessions)
+
+
+# Tool listing
+
+
+class TestGetTools:
+    """Tests for the cached tool listing."""
+
+    async def test__listing_is_cached_across_pages(self, server):
+        pool = _pool()
+
+        tools = await pool.get_tools("alice")
+        again = await pool.get_tools("bob")
+
+        assert [tool.name for tool in tools] == ["get_expenses", "add_expense"]
+        assert again is tools
+        assert (pool.stats()["tool_list_refreshes"], pool.stats()["tool_list_cache_hits"]) == (1, 1)
+        await pool.close()
+
+    async def test__tool_list_change_invalidates_the_listing(self, server):
+        pool = _pool()
+        tools = await pool.get_tools("alice")
+
+        await pool._handle_message(
+            ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed"))
+        )
+
+        assert await pool.get_tools("alice") is not tools
+        assert pool.stats()["tool_list_refreshes"] == 2
+        await pool.close()
@@ -0,0 +1,123 @@
+"""Unit tests for the cached On-Behalf-Of token exchange, with the auth service mocked by respx."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+from jose import jwt
+
+from app.core.token_exchange import GRANT_TYPE_TOKEN_EXCHANGE, TokenExchangeClient
+
+# Constants & Helpers
+
+TOKEN_URL = "http://auth-service/oauth/token"
+RESOURCE = "ems-mcp"
+USER_TOKEN = "user-token"
+
+
+def _jwt(expires_in_s: float) -> str:
+    """An exchanged token whose `exp` claim is `expires_in_s` from now."""
+    return jwt.encode({"sub": "user-1", "exp": int(time.time() + expires_in_s)}, "secret", algorithm="HS256")
+
+
+@pytest_asyncio.fixture
+async def client():
+    """A token exchange client on its own HTTP client."""
+    async with httpx.AsyncClient() as http_client:
+        yield TokenExchangeClient(http_client, TOKEN_URL, client_id="bella-chat-service")
+
+
+@pytest.fixture
+def auth_service():
+    """The mocked auth service; routes are added by each test."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+# Exchange
+
+
+class TestTokenExchangeClient:
+    """Tests for exchanging and caching tokens."""
+
+    async def test__exchanged_token_is_cached(self, client, auth_service):
+        token = _jwt(3600)
+        route = auth_service.post(TOKEN_URL).respond(json={"access_token": token, "expires_in": 3600})
+
+        assert await client.exchange(USER_TOKEN, RESOURCE) == token
+        assert await client.exchange(USER_TOKEN, RESOURCE) == token
+        assert route.call_count == 1
+        form = dict(httpx.QueryParams(route.calls.last.request.content.decode()))
+        assert form["grant_type"] == GRANT_TYPE_TOKEN_EXCHANGE
+        assert (form["subject_token"], form["resource"]) == (USER_TOKEN, RESOURCE)
+
+    async def test__each_resource_gets_its_own_token(self, client, auth_service):
+        route = auth_service.post(TOKEN_URL).respond(json={"access_token": _jwt(3600)})
+
+        await client.exchange(USER_TOKEN, RESOURCE)
+        await client.exchange(USER_TOKEN, "other-resource")
+
+        assert route.call_count == 2
+
+    async def test__concurrent_callers_share_one_exchange(self, client, auth_service):
+        token = _jwt(3600)
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"access_token": token})
+
+        route = auth_service.post(TOKEN_URL).mock(side_effect=respond)
+
+        tokens = await asyncio.gather(*(client.exchange(USER_TOKEN, RESOURCE) for _ in range(5)))
+
+        assert tokens == [token] * 5
+        assert route.call_count == 1
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            # Expires within the refresh margin
+            {"access_token": "opaque-token", "expires_in": 10},
+            # Unknown lifetime
+            {"access_token": "opaque-token"},
+        ],
+    )
+    async def test__token_near_expiry_is_exchanged_again(self, client, auth_service, body):
+        route = auth_service.post(TOKEN_URL).respond(json=body)
+
+        await client.exchange(USER_TOKEN, RESOURCE)
+        await client.exchange(USER_TOKEN, RESOURCE)
+
+        assert route.call_count == 2
+
+    async def test__exp_claim_wins_over_expires_in(self, client, auth_service):
+        route = auth_service.post(TOKEN_URL).respond(json={"access_token": _jwt(10), "expires_in": 3600})
+
+        await client.exchange(USER_TOKEN, RESOURCE)
+        await client.exchange(USER_TOKEN, RESOURCE)
+
+        assert route.call_count == 2
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            httpx.Response(200, text="not json"),
+            httpx.Response(200, json=["access_token"]),
+            httpx.Response(200, json={"token_type": "Bearer"}),
+            httpx.Response(401, json={"detail": "invalid subject token"}),
+        ],
+    )
+    async def test__malformed_or_failed_response_gives_none_and_is_not_cached(self, client, auth_service, response):
+        route = auth_service.post(TOKEN_URL).mock(return_value=response)
+
+        assert await client.exchange(USER_TOKEN, RESOURCE) is None
+        assert await client.exchange(USER_TOKEN, RESOURCE) is None
+        assert route.call_count == 2
+
+    async def test__transport_error_gives_none(self, client, auth_service):
+        auth_service.post(TOKEN_URL).mock(side_effect=httpx.ConnectError("auth service down"))
+
+        assert await client.exchange(USER_TOKEN, RESOURCE) is None
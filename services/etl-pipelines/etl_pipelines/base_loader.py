@@ -0,0 +1,452 @@
+"""Shared incremental loading logic for file-based ETL sources.
+
+A source lists its supported files with a content hash (the git blob sha), and this base class syncs them into a
+Qdrant vector store: every point id is derived from the file path and its sha, so unchanged files are skipped,
+changed files are upserted and points of removed files are deleted. Every point records how many points its file
+version has, so a file whose load was interrupted is loaded again instead of being taken as unchanged.
+
+Loading is pipelined: documents stream out of the fetch stage into embedding batches while earlier batches are
+still being upserted, so network reads, embedding and Qdrant writes overlap instead of running back to back.
+"""
+
+import asyncio
+import hashlib
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import NAMESPACE_URL, uuid5
+
+from langchain_core.documents import Document
+from qdrant_client import models
+from tqdm import tqdm
+from utilities.logger import GetAppLogger
+
+from etl_pipelines.chunking import MarkdownChunker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from app.core.vector_store.qdrant import CustomQdrantVectorStore
+
+_END_OF_STREAM = object()
+
+
+@dataclass
+class ETLRunStats:
+    """Outcome of an incremental ETL run over one directory."""
+
+    unchanged: int = 0
+    upserted: int = 0
+    removed: int = 0
+    documents: int = 0  # Documents (chunks) embedded and upserted
+    elapsed_s: float = 0.0
+    peak_rss_mib: float | None = None
+
+    @property
+    def docs_per_s(self) -> float:
+        """Loaded documents per second over the whole run."""
+        return self.documents / self.elapsed_s if self.elapsed_s else 0.0
+
+
+@dataclass
+class IndexedFile:
+    """The points a vector store holds for one file path."""
+
+    shas: set[str] = field(default_factory=set)
+    points: int = 0
+    point_counts: set[int] = field(default_factory=set)  # Points per file version, as recorded on each point
+
+    def is_complete(self, sha: str) -> bool:
+        """Return whether every point of version `sha`, and nothing else, is indexed for the file."""
+        return self.shas == {sha} and self.point_counts == {self.points}
+
+
+def git_blob_sha(content: bytes) -> str:
+    """Return the git blob sha of `content`, identical to the `sha` GitHub reports for the file."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content, usedforsecurity=False).hexdigest()
+
+
+def peak_rss_mib() -> float | None:
+    """Return the peak resident set size of this process in MiB, or None where it is not available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class BaseFileETL(ABC):
+    """Base class for ETL sources that load text files into a vector store incrementally.
+
+    Subclasses list files as dicts with at least `path`, `sha` and `source` keys, optionally carrying the file
+    text under `content` when it was already read while listing. With a chunker, every file is stored as one point
+    per chunk; all chunks of a file share its `path` and `sha`, so incremental syncs treat them as a unit.
+    """
+
+    SOURCE_TYPE: str
+    SUPPORTED_FILE_TYPES = (".md", ".txt", ".py")
+    DEFAULT_MAX_CONCURRENCY = 8
+    DEFAULT_EMBED_BATCH_SIZE = 32
+    DEFAULT_UPSERT_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        source_key: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        chunker: MarkdownChunker | None = None,
+    ):
+        """Initialize the ETL source.
+
+        Args:
+            source_key (str): Identifies the source (e.g. the repository); part of every point id.
+            max_concurrency (int): Maximum number of concurrent fetches. Defaults to 8.
+            chunker (MarkdownChunker | None): Splits files into chunks before embedding. Defaults to None
+                (one document per file).
+        """
+        self._source_key = source_key
+        self._chunker = chunker
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._logger = GetAppLogger(fallback_name=type(self).__name__).get_logger()
+
+    @abstractmethod
+    async def extract_supported_files(self, directory: str) -> list[dict]:
+        """Extract:
+
+        - List the supported files in the given directory, recursively.
+
+        Args:
+            directory (str): Path to the directory within the source.
+
+        Returns:
+            list[dict]: Files with `path`, `sha` and `source` keys, and optionally `content`.
+        """
+
+    @abstractmethod
+    async def fetch_content(self, file: dict) -> str:
+        """Return the text of a listed file that does not carry its `content`."""
+
+    def point_id(self, path: str, sha: str, chunk_index: int | None = None) -> str:
+        """Return the stable vector store point id of a file version, or of one of its chunks."""
+        name = f"{self.SOURCE_TYPE}:{self._source_key}/{path}@{sha}"
+        if chunk_index is not None:
+            name = f"{name}#{chunk_index}"
+        return str(uuid5(NAMESPACE_URL, name))
+
+    def is_supported(self, name: str) -> bool:
+        """Return whether a file name has one of the supported extensions."""
+        return name.endswith(self.SUPPORTED_FILE_TYPES)
+
+    def indexed_files(self, vector_store: "CustomQdrantVectorStore", directory: str) -> dict[str, IndexedFile]:
+        """Return the content shas and point counts currently indexed for each file path under `directory`.
+
+        Args:
+            vector_store (CustomQdrantVectorStore): The vector store to inspect.
+            directory (str): Path to the directory within the source.
+
+        Returns:
+            dict[str, IndexedFile]: Indexed points keyed by file path. Points loaded before shas or point counts
+                were recorded leave the file incomplete, so it is treated as changed.
+        """
+        prefix = f"{directory.rstrip('/')}/"
+        indexed: dict[str, IndexedFile] = {}
+        offset = None
+        while True:
+            points, offset = vector_store.client.scroll(
+                collection_name=vector_store.collection_name,
+                scroll_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key=f"{vector_store.metadata_payload_key}.source_type",
+                            match=models.MatchValue(value=self.SOURCE_TYPE),
+                        )
+                    ]
+                ),
+                with_payload=[vector_store.metadata_payload_key],
+                limit=256,
+                offset=offset,
+            )
+            for point in points:
+                metadata = point.payload.get(vector_store.metadata_payload_key) or {}
+                path = metadata.get("path", "")
+                if path.startswith(prefix):
+                    indexed_file = indexed.setdefault(path, IndexedFile())
+                    indexed_file.points += 1
+                    if metadata.get("sha"):
+                        indexed_file.shas.add(metadata["sha"])
+                    if metadata.get("point_count"):
+                        indexed_file.point_counts.add(metadata["point_count"])
+            if offset is None:
+                return indexed
+
+    async def _to_documents(self, file: dict) -> list[Document]:
+        content = file.get("content")
+        if content is None:
+            content = await self.fetch_content(file)
+        metadata = {
+            "source": file["source"],
+            "source_type": self.SOURCE_TYPE,
+            "path": file["path"],
+            "sha": file["sha"],
+        }
+        if self._chunker is None:
+            metadata["id"] = self.point_id(file["path"], file["sha"])
+            metadata["point_count"] = 1
+            return [Document(page_content=content, metadata=metadata)]
+        chunks = self._chunker.split(content)
+        return [
+            Document(
+                page_content=chunk.text,
+                metadata={
+                    **metadata,
+                    "heading": chunk.heading,
+                    "chunk_index": index,
+                    "start_index": chunk.start,
+                    "end_index": chunk.end,
+                    "point_count": len(chunks),
+                    "id": self.point_id(file["path"], file["sha"], chunk_index=index),
+                },
+            )
+            for index, chunk in enumerate(chunks)
+        ]
+
+    async def iter_documents(self, files: list[dict]) -> AsyncIterator[Document]:
+        """Transform:
+
+        - Fetch file contents concurrently, bounded by `max_concurrency`.
+        - Yield Document objects with file content (or its chunks) and metadata as soon as each file is fetched.
+        - Fetches pause while the consumer is behind, so only a bounded number of documents is held in memory.
+
+        Args:
+            files (list[dict]): Files as returned by `extract_supported_files`.
+
+        Yields:
+            Document: Documents in completion order.
+        """
+        self._logger.info(f"Transforming {len(files)} files...")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_concurrency)
+        remaining = iter(files)
+
+        async def _worker() -> None:
+            # Workers share one iterator, so each file is fetched exactly once
+            for file in remaining:
+                await queue.put(await self._to_documents(file))
+
+        async def _run_workers() -> None:
+            try:
+                await asyncio.gather(*(_worker() for _ in range(self._max_concurrency)))
+            finally:
+                await queue.put(_END_OF_STREAM)
+
+        runner = asyncio.create_task(_run_workers())
+        try:
+            with tqdm(total=len(files), desc="Transforming files:") as progress:
+                while (docs := await queue.get()) is not _END_OF_STREAM:
+                    progress.update()
+                    for doc in docs:
+                        yield doc
+            await runner  # Re-raise a failed fetch
+        finally:
+            runner.cancel()
+
+    async def transform(self, files: list[dict]) -> list[Document]:
+        """Transform all files at once; see `iter_documents`.
+
+        Args:
+            files (list[dict]): Files as returned by `extract_supported_files`.
+
+        Returns:
+            list[Document]: List of Document objects with file content and metadata, in completion order.
+        """
+        return [doc async for doc in self.iter_documents(files)]
+
+    async def load_documents(
+        self,
+        vector_store: "CustomQdrantVectorStore",
+        documents: AsyncIterator[Document],
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        upsert_concurrency: int = DEFAULT_UPSERT_CONCURRENCY,
+    ) -> int:
+        """Load:
+
+        - Embed streamed documents in batches of `embed_batch_size` while earlier batches are upserted.
+        - Upserts run in worker threads, up to `upsert_concurrency` at a time, with `wait=False`.
+        - The last batch is upserted with `wait=True` once all others were sent. Qdrant applies operations in
+          order, so every point is indexed when this returns (before stale points are deleted).
+        - Point ids come from the document metadata, so re-loading a document replaces it.
+        - A failed upsert stops the load and is re-raised, so callers never delete stale points after a partial load.
+
+        Args:
+            vector_store (CustomQdrantVectorStore): The vector store instance to load documents into.
+            documents (AsyncIterator[Document]): Documents to load, e.g. from `iter_documents`.
+            embed_batch_size (int, optional): Number of documents embedded per request. Defaults to 32.
+            upsert_concurrency (int, optional): Maximum number of concurrent upserts. Defaults to 4.
+
+        Returns:
+            int: Number of documents loaded.
+        """
+        upsert_slots = asyncio.Semaphore(upsert_concurrency)
+        # Successful upserts are dropped when they finish; failed ones stay until they are re-raised
+        upserts: set[asyncio.Task] = set()
+        held: tuple[list[Document], list[list[float]]] | None = None
+        loaded = 0
+
+        async def _upsert(batch: list[Document], vectors: list[list[float]]) -> None:
+            try:
+                await asyncio.to_thread(
+                    vector_store.upsert_documents,
+                    documents=batch,
+                    vectors=vectors,
+                    ids=[doc.metadata["id"] for doc in batch],
+                    wait=False,
+                )
+            finally:
+                upsert_slots.release()
+
+        def _forget_if_succeeded(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is None:
+                upserts.discard(task)
+
+        async def _embed(batch: list[Document]) -> None:
+            nonlocal held, loaded
+            for task in upserts:
+                if task.done():
+                    task.result()  # Re-raise a failed upsert before embedding more
+            if held is not None:
+                # Another batch follows, so the held one is not the last; acquiring here also stops embedding
+                # from running ahead while `upsert_concurrency` upserts are in flight
+                await upsert_slots.acquire()
+                task = asyncio.create_task(_upsert(*held))
+                upserts.add(task)
+                task.add_done_callback(_forget_if_succeeded)
+            vectors = await vector_store.embeddings.aembed_documents([doc.page_content for doc in batch])
+            held = (batch, vectors)
+            loaded += len(batch)
+
+        batch: list[Document] = []
+        try:
+            async for doc in documents:
+                batch.append(doc)
+                if len(batch) >= embed_batch_size:
+                    await _embed(batch)
+                    batch = []
+            if batch:
+                await _embed(batch)
+            await asyncio.gather(*upserts)
+        finally:
+            for task in upserts:
+                task.cancel()
+
+        if held is not None:
+            last_batch, last_vectors = held
+            await asyncio.to_thread(
+                vector_store.upsert_documents,
+                documents=last_batch,
+                vectors=last_vectors,
+                ids=[doc.metadata["id"] for doc in last_batch],
+                wait=True,
+            )
+        return loaded
+
+    def delete_stale_points(
+        self, vector_store: "CustomQdrantVectorStore", current_shas: dict[str, str], removed_paths: set[str]
+    ) -> None:
+        """Delete points of older file versions and of files no longer in the source.
+
+        Args:
+            vector_store (CustomQdrantVectorStore): The vector store to clean up.
+            current_shas (dict[str, str]): Current sha of each re-loaded file, keyed by path.
+            removed_paths (set[str]): Paths that are indexed but no longer exist.
+        """
+        path_key = f"{vector_store.metadata_payload_key}.path"
+        sha_key = f"{vector_store.metadata_payload_key}.sha"
+        source_type_condition = models.FieldCondition(
+            key=f"{vector_store.metadata_payload_key}.source_type",
+            match=models.MatchValue(value=self.SOURCE_TYPE),
+        )
+        for path, sha in current_shas.items():
+            vector_store.client.delete(
+                collection_name=vector_store.collection_name,
+                points_selector=models.Filter(
+                    must=[
+                        source_type_condition,
+                        models.FieldCondition(key=path_key, match=models.MatchValue(value=path)),
+                    ],
+                    must_not=[models.FieldCondition(key=sha_key, match=models.MatchValue(value=sha))],
+                ),
+            )
+        if removed_paths:
+            vector_store.client.delete(
+                collection_name=vector_store.collection_name,
+                points_selector=models.Filter(
+                    must=[
+                        source_type_condition,
+                        models.FieldCondition(key=path_key, match=models.MatchAny(any=sorted(removed_paths))),
+                    ]
+                ),
+            )
+
+    async def run_etl(
+        self,
+        directory: str,
+        vector_store: "CustomQdrantVectorStore",
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        upsert_concurrency: int = DEFAULT_UPSERT_CONCURRENCY,
+    ) -> ETLRunStats:
+        """Sync supported files from a source directory into a vector store.
+
+        Only files whose sha differs from the indexed one, or whose points are not all indexed (e.g. after an
+        interrupted run), are fetched and embedded.
+
+        Args:
+            directory (str): Path to the directory within the source.
+            vector_store (CustomQdrantVectorStore): The vector store instance to load documents into.
+            embed_batch_size (int, optional): Number of documents embedded per request. Defaults to 32.
+            upsert_concurrency (int, optional): Maximum number of concurrent upserts. Defaults to 4.
+
+        Returns:
+            ETLRunStats: File counts, duration and peak memory of the run.
+        """
+        self._logger.info(f"Starting ETL process for directory: {directory}...")
+        started_at = time.perf_counter()
+
+        files = await self.extract_supported_files(directory=directory)
+        indexed = self.indexed_files(vector_store=vector_store, directory=directory)
+        changed = [
+            file for file in files if file["path"] not in indexed or not indexed[file["path"]].is_complete(file["sha"])
+        ]
+        removed_paths = set(indexed) - {file["path"] for file in files}
+
+        documents = await self.load_documents(
+            vector_store=vector_store,
+            documents=self.iter_documents(changed),
+            embed_batch_size=embed_batch_size,
+            upsert_concurrency=upsert_concurrency,
+        )
+        self.delete_stale_points(
+            vector_store=vector_store,
+            current_shas={file["path"]: file["sha"] for file in changed if file["path"] in indexed},
+            removed_paths=removed_paths,
+        )
+
+        stats = ETLRunStats(
+            unchanged=len(files) - len(changed),
+            upserted=len(changed),
+            removed=len(removed_paths),
+            documents=documents,
+            elapsed_s=time.perf_counter() - started_at,
+            peak_rss_mib=peak_rss_mib(),
+        )
+        self._logger.info(
+            f"Synced `{directory}`: {stats.upserted} upserted, {stats.unchanged} unchanged, {stats.removed} removed "
+            f"in {stats.elapsed_s:.1f}s: {stats.documents} documents at {stats.docs_per_s:.1f} docs/s, "
+            f"peak RSS {stats.peak_rss_mib or 0:.0f} MiB."
+        )
+        return stats
@@ -0,0 +1,143 @@
+"""Markdown-aware chunking of source files before embedding.
+
+Files are first split into sections at markdown headings (headings inside fenced code blocks are ignored), then each
+section is packed into chunks of at most `chunk_size` tokens, preferring paragraph, then line, then word boundaries,
+with `chunk_overlap` tokens repeated between consecutive chunks of a section. Chunks keep their character offsets in
+the original file and the heading path they belong to.
+"""
+
+import math
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
+_HEADING = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$")
+_FENCE = re.compile(r"^ {0,3}(```|~~~)")
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+_LINE_BREAK = re.compile(r"\n")
+_WORD_BREAK = re.compile(r"\s+")
+
+
+def approx_token_count(text: str) -> int:
+    """Estimate the number of tokens in `text` (about four characters per token for English prose and markdown)."""
+    return math.ceil(len(text) / 4)
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A slice of a source file."""
+
+    text: str
+    heading: str  # Heading path, e.g. "Setup > Docker"; empty before the first heading
+    start: int  # Character offset of the chunk in the file
+    end: int
+
+
+class MarkdownChunker:
+    """Split markdown (or plain text) into heading-scoped, token-bounded chunks with overlap.
+
+    Examples:
+        ### Imports
+        >>> from etl_pipelines.chunking import MarkdownChunker
+
+        ### Chunk a page into pieces of at most 512 tokens with 64 tokens of overlap
+        >>> chunker = MarkdownChunker(chunk_size=512, chunk_overlap=64)
+        >>> chunks = chunker.split("# Title\\n\\nIntro.\\n\\n## Setup\\n\\nRun it.")
+        >>> [chunk.heading for chunk in chunks]
+        ['Title', 'Title > Setup']
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        chunk_overlap: int = 64,
+        length_function: Callable[[str], int] = approx_token_count,
+    ):
+        """Initialize the chunker.
+
+        Args:
+            chunk_size (int): Maximum chunk length in tokens. Defaults to 512.
+            chunk_overlap (int): Tokens repeated at the start of the next chunk of the same section. Defaults to 64.
+            length_function (Callable[[str], int]): Counts the tokens of a text. Defaults to `approx_token_count`.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be non-negative and smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self._length = length_function
+
+    def split(self, text: str) -> list[Chunk]:
+        """Split `text` into chunks, in document order."""
+        chunks = []
+        for heading, start, end in self._sections(text):
+            for chunk_start, chunk_end in self._pack(text, self._units(text, start, end)):
+                chunks.append(Chunk(text[chunk_start:chunk_end], heading, chunk_start, chunk_end))
+        return chunks
+
+    @staticmethod
+    def _sections(text: str) -> list[tuple[str, int, int]]:
+        """Return (heading path, start, end) of each section; a section starts at its heading line."""
+        sections = []
+        headings: list[tuple[int, str]] = []
+        section_start = 0
+        offset = 0
+        in_fence = False
+        for line in text.splitlines(keepends=True):
+            if _FENCE.match(line):
+                in_fence = not in_fence
+            elif not in_fence and (match := _HEADING.match(line.rstrip("\r\n"))):
+                sections.append((" > ".join(title for _, title in headings), section_start, offset))
+                level = len(match.group(1))
+                headings = [(lvl, title) for lvl, title in headings if lvl < level] + [(level, match.group(2))]
+                section_start = offset
+            offset += len(line)
+        sections.append((" > ".join(title for _, title in headings), section_start, len(text)))
+        return [(heading, start, end) for heading, start, end in sections if text[start:end].strip()]
+
+    def _units(self, text: str, start: int, end: int) -> list[tuple[int, int]]:
+        """Break a span into pieces of at most `chunk_size` tokens at the coarsest boundary that allows it."""
+        if self._length(text[start:end]) <= self.chunk_size:
+            return [(start, end)]
+        for separator in (_PARAGRAPH_BREAK, _LINE_BREAK, _WORD_BREAK):
+            pieces = self._split_span(text, start, end, separator)
+            if len(pieces) > 1:
+                return [unit for piece_start, piece_end in pieces for unit in self._units(text, piece_start, piece_end)]
+        # A single word longer than a chunk: cut it by characters
+        step = max(1, len(text[start:end]) * self.chunk_size // self._length(text[start:end]))
+        return [(pos, min(pos + step, end)) for pos in range(start, end, step)]
+
+    @staticmethod
+    def _split_span(text: str, start: int, end: int, separator: re.Pattern) -> list[tuple[int, int]]:
+        """Split a span after each separator match, keeping the separators so offsets stay contiguous."""
+        pieces = []
+        piece_start = start
+        for match in separator.finditer(text, start, end):
+            if match.end() < end and match.end() > piece_start:
+                pieces.append((piece_start, match.end()))
+                piece_start = match.end()
+        pieces.append((piece_start, end))
+        return [(s, e) for s, e in pieces if text[s:e].strip()]
+
+    def _pack(self, text: str, units: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Greedily merge consecutive units into chunks, starting each chunk with up to `chunk_overlap` tokens."""
+        chunks = []
+        first = 0
+        while first < len(units):
+            last = first
+            while last + 1 < len(units) and self._length(text[units[first][0] : units[last + 1][1]]) <= self.chunk_size:
+                last += 1
+            chunks.append((units[first][0], units[last][1]))
+            if last + 1 == len(units):
+                break
+            # Step back over trailing units that fit in the overlap, leaving room for the next new unit
+            next_first = last + 1
+            while (
+                next_first - 1 > first
+                and self._length(text[units[next_first - 1][0] : units[last][1]]) <= self.chunk_overlap
+                and self._length(text[units[next_first - 1][0] : units[last + 1][1]]) <= self.chunk_size
+            ):
+                next_first -= 1
+            first = next_first
+        return [(start, end) for start, end in chunks if text[start:end].strip()]
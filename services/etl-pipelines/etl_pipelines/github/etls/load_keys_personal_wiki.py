@@ -1,15 +1,25 @@
 """ETL pipeline to load contents from keys personal wiki GitHub repo."""
 
+import argparse
 import asyncio
 import os
+from datetime import UTC, datetime
 
-from app.core.embeddings import get_embedding_client
+from app.core.embeddings import (
+    CachedEmbeddingsClient,
+    EmbeddingDiskCache,
+    embedding_model_key,
+    get_embedding_client,
+)
 from app.core.vector_store.qdrant import (
     CustomQdrantClient,
     CustomQdrantVectorStore,
     RetrievalMode,
 )
+from app.core.vector_store.tuning import QdrantTuning
+from etl_pipelines.chunking import MarkdownChunker
 from etl_pipelines.github.loader import AsyncGitHubETL
+from etl_pipelines.local.loader import LocalDirectoryETL
 from etl_pipelines.settings import settings
 
 
@@ -26,12 +36,41 @@ class GitHubKeysPersonalWikiETL:
 
         Args:
             git_pat (str): GitHub Personal Access Token.
+            qdrant_url (str): Qdrant URL. Defaults to the configured QDRANT_URL.
         """
         self.qdrant_url = qdrant_url or settings.QDRANT_URL
-        self.github_etl = AsyncGitHubETL(token=git_pat, repo=self.REPO)
+        chunker = (
+            MarkdownChunker(chunk_size=settings.CHUNK_SIZE_TOKENS, chunk_overlap=settings.CHUNK_OVERLAP_TOKENS)
+            if settings.CHUNK_SIZE_TOKENS
+            else None
+        )
+        if settings.WIKI_LOCAL_PATH:
+            # Offline: read a local clone of the repository instead of the GitHub API
+            self.source_etl = LocalDirectoryETL(
+                root=settings.WIKI_LOCAL_PATH,
+                max_concurrency=settings.ETL_MAX_CONCURRENCY,
+                chunker=chunker,
+            )
+        else:
+            self.source_etl = AsyncGitHubETL(
+                token=git_pat,
+                repo=self.REPO,
+                max_concurrency=settings.ETL_MAX_CONCURRENCY,
+                etag_cache_path=settings.GITHUB_ETAG_CACHE_PATH,
+                use_archive=settings.GITHUB_USE_ARCHIVE,
+                chunker=chunker,
+            )
+
+    async def pipeline(self, full_rebuild: bool = False):
+        """Run the ETL pipeline to load contents from specified folders into the vector store.
+
+        By default the configured collection is synced incrementally. A full rebuild (or a first run) loads
+        everything into a new timestamped collection and then atomically points the configured collection name,
+        an alias, at it, so the chat service keeps serving the old index until the new one is complete.
 
-    async def pipeline(self):
-        """Run the ETL pipeline to load contents from specified folders into the vector store."""
+        Args:
+            full_rebuild (bool): Rebuild the index from scratch instead of syncing changes. Defaults to False.
+        """
         # Ensure GOOGLE_API_KEY is in the environment for Google GenAI libraries
         if settings.GOOGLE_API_KEY:
             os.environ["GOOGLE_API_KEY"] = settings.GOOGLE_API_KEY.get_secret_value()
@@ -46,32 +85,69 @@ class GitHubKeysPersonalWikiETL:
             ollama_base_url=settings.OLLAMA_URL,
             output_dimensionality=settings.EMBEDDING_MODEL_DIMENSION,
         )
-
-        # Step 3: Create collection if it does not exist
-        qdrant_client.create_collection(
-            collection_name=settings.QDRANT_COLLECTION_NAME,
-            embedding_dimension=settings.EMBEDDING_MODEL_DIMENSION,
-            force_recreate=True,
-        )
+        if settings.EMBEDDING_CACHE_PATH:
+            # Unchanged documents are served from the on-disk cache instead of being re-embedded
+            embedding = CachedEmbeddingsClient(
+                embedding,
+                model_key=embedding_model_key(
+                    settings.EMBEDDING_MODEL_PROVIDER,
+                    settings.EMBEDDING_MODEL_NAME,
+                    settings.EMBEDDING_MODEL_DIMENSION,
+                ),
+                max_entries=0,
+                disk_cache=EmbeddingDiskCache(settings.EMBEDDING_CACHE_PATH),
+            )
+
+        # Step 3: Pick the target collection; rebuilds go to a fresh collection behind the alias
+        alias_name = settings.QDRANT_COLLECTION_NAME
+        full_rebuild = full_rebuild or not qdrant_client.collection_exists(collection_name=alias_name)
+        if full_rebuild:
+            collection_name = f"{alias_name}-{datetime.now(UTC):%Y%m%d%H%M%S}"
+            qdrant_client.create_collection(
+                collection_name=collection_name,
+                embedding_dimension=settings.EMBEDDING_MODEL_DIMENSION,
+                tuning=QdrantTuning(
+                    hnsw_m=settings.QDRANT_HNSW_M,
+                    hnsw_ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+                    quantization=settings.QDRANT_QUANTIZATION,
+                    on_disk_vectors=settings.QDRANT_ON_DISK_VECTORS,
+                    on_disk_payload=settings.QDRANT_ON_DISK_PAYLOAD,
+                ),
+            )
+        else:
+            collection_name = alias_name
 
         # Step 4: Create a Qdrant vector store
         vector_store = CustomQdrantVectorStore(
             client=qdrant_client,
-            collection_name=settings.QDRANT_COLLECTION_NAME,
+            collection_name=collection_name,
             embedding=embedding,
             retrieval_mode=RetrievalMode.DENSE,
         )
 
         # Step 5: Run the ETL process for each folder
         for folder in self.FOLDERS:
-            await self.github_etl.run_etl(directory=folder, vector_store=vector_store)
+            await self.source_etl.run_etl(
+                directory=folder,
+                vector_store=vector_store,
+                embed_batch_size=settings.EMBED_BATCH_SIZE,
+                upsert_concurrency=settings.UPSERT_CONCURRENCY,
+            )
+
+        # Step 6: Switch readers over to the rebuilt collection
+        if full_rebuild:
+            qdrant_client.swap_alias(alias_name=alias_name, collection_name=collection_name)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync the keys personal wiki into the vector store")
+    parser.add_argument("--full-rebuild", action="store_true", help="Rebuild the index and swap it in atomically")
+    args = parser.parse_args()
+
     GIT_PAT = settings.GIT_PAT.get_secret_value()
     etl = GitHubKeysPersonalWikiETL(
         git_pat=GIT_PAT,
         qdrant_url=settings.QDRANT_URL,
     )
 
-    asyncio.run(etl.pipeline())
+    asyncio.run(etl.pipeline(full_rebuild=args.full_rebuild))
@@ -6,47 +6,110 @@ Loads files of selected format from a GitHub repository folder into the vector s
 
 Depends on:
 - GitHub Personal Access Token (PAT) with repo access.
-- Uses GitHub REST API to fetch files from the repository.
+- Uses GitHub REST API to fetch files from the repository, either by crawling the contents API with bounded
+  concurrency and conditional (ETag) requests, or by streaming a single repository tarball.
 """
 
-from typing import TYPE_CHECKING
-from uuid import uuid4
+import asyncio
+import json
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
 
 import httpx
+from etl_pipelines.base_loader import BaseFileETL, ETLRunStats, git_blob_sha
+from etl_pipelines.chunking import MarkdownChunker
 from etl_pipelines.settings import ETLSourceTypes
-from langchain_core.documents import Document
-from tqdm import tqdm
-from utilities.logger import GetAppLogger
 
 if TYPE_CHECKING:
-    from langchain_core.vectorstores import VectorStore
+    from app.core.vector_store.qdrant import CustomQdrantVectorStore
 
+try:
+    import h2  # noqa: F401
 
-class AsyncGitHubETL:
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class AsyncGitHubETL(BaseFileETL):
     """Async ETL pipeline to load files from a GitHub repository folder into a vector store."""
 
+    SOURCE_TYPE = ETLSourceTypes.GITHUB
     HTTP_CLIENT_TIMEOUT_S = 30
-    SUPPORTED_FILE_TYPES = [".md", ".txt", ".py"]
-
-    def __init__(self, token: str, repo: str):
+    ARCHIVE_SPOOL_MAX_BYTES = 64 * 1024 * 1024  # Larger tarballs spill to a temporary file
+
+    def __init__(
+        self,
+        token: str,
+        repo: str,
+        max_concurrency: int = BaseFileETL.DEFAULT_MAX_CONCURRENCY,
+        etag_cache_path: str | None = None,
+        use_archive: bool = False,
+        chunker: MarkdownChunker | None = None,
+    ):
         """Initialize the AsyncGitHubETL instance.
 
         Args:
             token (str): GitHub Personal Access Token (PAT) with repo access.
             repo (str): GitHub repository in the format "user_name/repository_name".
+            max_concurrency (int): Maximum number of concurrent GitHub requests. Defaults to 8.
+            etag_cache_path (str | None): JSON file persisting ETags and bodies between runs, so unchanged
+                listings and files are answered with `304 Not Modified`. Defaults to None (per-run only).
+            use_archive (bool): Download the repository as one tarball instead of crawling the contents API.
+                Defaults to False.
+            chunker (MarkdownChunker | None): Splits files into chunks before embedding. Defaults to None.
         """
+        super().__init__(source_key=repo, max_concurrency=max_concurrency, chunker=chunker)
+        self._repo = repo
         self._api_url = f"https://api.github.com/repos/{repo}/contents"
+        self._archive_url = f"https://api.github.com/repos/{repo}/tarball"
         self._headers = {"Authorization": f"token {token}"}
-        self._logger = GetAppLogger(fallback_name="GitHubETL").get_logger()
-        self._aclient = httpx.AsyncClient(timeout=self.HTTP_CLIENT_TIMEOUT_S)
+        self._use_archive = use_archive
+        self._aclient = httpx.AsyncClient(
+            timeout=self.HTTP_CLIENT_TIMEOUT_S,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+
+        self._etag_cache_path = Path(etag_cache_path).expanduser() if etag_cache_path else None
+        self._etag_cache: dict[str, dict[str, str]] = {}
+        if self._etag_cache_path and self._etag_cache_path.exists():
+            self._etag_cache = json.loads(self._etag_cache_path.read_text(encoding="utf-8"))
+
+        self._logger.info(f"Initialized AsyncGitHubETL for repo: {repo} (HTTP/2: {HTTP2_AVAILABLE})")
+
+    async def _get_text(self, url: str) -> str:
+        """GET a URL with bounded concurrency, revalidating a cached body with `If-None-Match`."""
+        headers = dict(self._headers)
+        cached = self._etag_cache.get(url)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+
+        async with self._semaphore:
+            resp = await self._aclient.get(url, headers=headers)
+
+        if resp.status_code == httpx.codes.NOT_MODIFIED and cached:
+            return cached["body"]
+        resp.raise_for_status()
+        if etag := resp.headers.get("ETag"):
+            self._etag_cache[url] = {"etag": etag, "body": resp.text}
+        return resp.text
 
-        self._logger.info(f"Initialized AsyncGitHubETL for repo: {repo}")
+    def save_etag_cache(self) -> None:
+        """Persist the ETag cache, if a cache path was configured."""
+        if self._etag_cache_path is None:
+            return
+        self._etag_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._etag_cache_path.write_text(json.dumps(self._etag_cache), encoding="utf-8")
 
     async def extract_supported_files(self, directory: str) -> list[dict]:
         """Extract:
 
         - Recursively fetch supported files in the given GitHub repository folder.
-        - Collects all files urls with extensions in SUPPORTED_FILE_TYPES.
+        - Collects all files with extensions in SUPPORTED_FILE_TYPES.
+        - Sub-directories are listed concurrently; in archive mode the tarball is read instead.
 
         Args:
             directory (str): Path to the directory in the repository.
@@ -57,84 +120,86 @@ class AsyncGitHubETL:
         self._logger.info(f"Extracting supported files from folder: {directory}...")
         self._logger.debug(f"Supported file types: {self.SUPPORTED_FILE_TYPES}")
 
-        files = []
-
-        url = f"{self._api_url}/{directory}"
-        resp = await self._aclient.get(url, headers=self._headers)
-        resp.raise_for_status()
-        contents = resp.json()
-        for content_file in contents:
-            if content_file["type"] == "file" and content_file["name"].endswith(tuple(self.SUPPORTED_FILE_TYPES)):
-                files.append(content_file)
-            elif content_file["type"] == "dir":
-                sub_files = await self.extract_supported_files(content_file["path"])
-                files.extend(sub_files)
+        if self._use_archive:
+            return await self._extract_from_archive(directory)
+
+        contents = json.loads(await self._get_text(f"{self._api_url}/{directory}"))
+        files = [
+            {
+                "path": content_file["path"],
+                "sha": content_file["sha"],
+                "source": content_file["html_url"],
+                "download_url": content_file["download_url"],
+            }
+            for content_file in contents
+            if content_file["type"] == "file" and self.is_supported(content_file["name"])
+        ]
+        sub_directories = [content_file["path"] for content_file in contents if content_file["type"] == "dir"]
+        for sub_files in await asyncio.gather(*(self.extract_supported_files(path) for path in sub_directories)):
+            files.extend(sub_files)
 
         return files
 
-    async def transform(self, files: list[dict]) -> list[Document]:
-        """Transform:
-
-        - Fetch file contents from the download URLs.
-        - Create Document objects with file content and metadata.
-
-        Args:
-            files (list[dict]): List of files with download URLs.
-
-        Returns:
-            list[Document]: List of Document objects with file content and metadata.
-        """
-        self._logger.info(f"Transforming {len(files)} files...")
-
-        docs = []
-        for file in tqdm(files, desc="Transforming files:"):
-            resp = await self._aclient.get(file["download_url"], headers=self._headers)
-            resp.raise_for_status()
-            docs.append(
-                Document(
-                    page_content=resp.text,
-                    metadata={
-                        "source": file["html_url"],
-                        "source_type": ETLSourceTypes.GITHUB,
-                        "path": file["path"],
-                        "id": str(uuid4()),
-                    },
-                ),
-            )
-
-        return docs
-
-    async def load_documents_in_batches(self, vector_store: "VectorStore", docs: list[Document], batch_size: int = 4):
-        """Load:
-
-        - Load documents to the vector store in batches to avoid GPU Overload.
-
-        Args:
-            vector_store (VectorStore): The vector store instance to load documents into.
-            docs (list[Document]): List of Document objects to be loaded.
-            batch_size (int, optional): Number of documents to load in each batch. Defaults to 4.
+    async def _extract_from_archive(self, directory: str) -> list[dict]:
+        """Stream the repository tarball and read the supported files under `directory`."""
+        with tempfile.SpooledTemporaryFile(max_size=self.ARCHIVE_SPOOL_MAX_BYTES) as buffer:
+            async with (
+                self._semaphore,
+                self._aclient.stream("GET", self._archive_url, headers=self._headers, follow_redirects=True) as resp,
+            ):
+                resp.raise_for_status()
+                async for chunk in resp.aiter_bytes():
+                    buffer.write(chunk)
+            buffer.seek(0)
+            return await asyncio.to_thread(self._read_archive, buffer, directory)
+
+    def _read_archive(self, buffer: IO[bytes], directory: str) -> list[dict]:
+        prefix = f"{directory.rstrip('/')}/"
+        files = []
+        with tarfile.open(fileobj=buffer, mode="r|gz") as archive:
+            for member in archive:
+                # Members are rooted at "<owner>-<repo>-<commit>/"
+                path = member.name.split("/", 1)[-1]
+                if not member.isfile() or not path.startswith(prefix) or not self.is_supported(path):
+                    continue
+                data = archive.extractfile(member).read()
+                files.append(
+                    {
+                        "path": path,
+                        "sha": git_blob_sha(data),
+                        "source": f"https://github.com/{self._repo}/blob/HEAD/{path}",
+                        "content": data.decode("utf-8", errors="replace"),
+                    }
+                )
+        return files
 
-        """
-        for start_idx in tqdm(range(0, len(docs), batch_size), desc="Loading documents:"):
-            batch_docs = docs[start_idx : start_idx + batch_size]
-            vector_store.add_documents(documents=batch_docs)
+    async def fetch_content(self, file: dict) -> str:
+        """Download a file listed by the contents API."""
+        return await self._get_text(file["download_url"])
 
-    async def run_etl(self, directory: str, vector_store: "VectorStore") -> list[Document]:
-        """Run the ETL pipeline to load files from a GitHub repository directory into a vector store.
+    async def run_etl(
+        self,
+        directory: str,
+        vector_store: "CustomQdrantVectorStore",
+        embed_batch_size: int = BaseFileETL.DEFAULT_EMBED_BATCH_SIZE,
+        upsert_concurrency: int = BaseFileETL.DEFAULT_UPSERT_CONCURRENCY,
+    ) -> ETLRunStats:
+        """Sync files from a GitHub repository directory into a vector store and persist the ETag cache.
 
         Args:
             directory (str): Path to the directory in the repository.
-            vector_store (VectorStore): The vector store instance to load documents into.
+            vector_store (CustomQdrantVectorStore): The vector store instance to load documents into.
+            embed_batch_size (int, optional): Number of documents embedded per request. Defaults to 32.
+            upsert_concurrency (int, optional): Maximum number of concurrent upserts. Defaults to 4.
 
         Returns:
-            list[Document]: List of Document objects loaded into the vector store.
+            ETLRunStats: File counts, duration and peak memory of the run.
         """
-        self._logger.info(f"Starting ETL process for directory: {directory}...")
-
-        files = await self.extract_supported_files(directory=directory)
-        docs = await self.transform(files)
-        await self.load_documents_in_batches(vector_store=vector_store, docs=docs)
-
-        self._logger.info(f"Loaded {len(docs)} documents into the vector store.")
-
-        return docs
+        stats = await super().run_etl(
+            directory=directory,
+            vector_store=vector_store,
+            embed_batch_size=embed_batch_size,
+            upsert_concurrency=upsert_concurrency,
+        )
+        self.save_etag_cache()
+        return stats
@@ -0,0 +1,70 @@
+"""ETL pipeline for loading files from a local directory into the vector store.
+
+Mirrors `AsyncGitHubETL` for offline runs and tests, e.g. against a local clone of the wiki repository.
+Content shas are git blob shas, so a clone produces the same shas as the GitHub API.
+"""
+
+import asyncio
+from pathlib import Path
+
+from etl_pipelines.base_loader import BaseFileETL, git_blob_sha
+from etl_pipelines.chunking import MarkdownChunker
+from etl_pipelines.settings import ETLSourceTypes
+
+
+class LocalDirectoryETL(BaseFileETL):
+    """ETL pipeline to load files from a local directory tree into a vector store."""
+
+    SOURCE_TYPE = ETLSourceTypes.LOCAL
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_concurrency: int = BaseFileETL.DEFAULT_MAX_CONCURRENCY,
+        chunker: MarkdownChunker | None = None,
+    ):
+        """Initialize the LocalDirectoryETL instance.
+
+        Args:
+            root (str | Path): Root directory; extracted paths are relative to it.
+            max_concurrency (int): Maximum number of files read concurrently. Defaults to 8.
+            chunker (MarkdownChunker | None): Splits files into chunks before embedding. Defaults to None.
+        """
+        self._root = Path(root).expanduser().resolve()
+        super().__init__(source_key=str(self._root), max_concurrency=max_concurrency, chunker=chunker)
+        self._logger.info(f"Initialized LocalDirectoryETL for directory: {self._root}")
+
+    async def extract_supported_files(self, directory: str) -> list[dict]:
+        """Extract:
+
+        - Recursively collect supported files under `root/directory`, with their contents and git blob shas.
+
+        Args:
+            directory (str): Path to the directory, relative to the root.
+
+        Returns:
+            list[dict]: List of supported files in the directory.
+        """
+        self._logger.info(f"Extracting supported files from folder: {directory}...")
+        return await asyncio.to_thread(self._scan, directory)
+
+    def _scan(self, directory: str) -> list[dict]:
+        files = []
+        for file_path in sorted((self._root / directory).rglob("*")):
+            if not file_path.is_file() or not self.is_supported(file_path.name):
+                continue
+            data = file_path.read_bytes()
+            files.append(
+                {
+                    "path": file_path.relative_to(self._root).as_posix(),
+                    "sha": git_blob_sha(data),
+                    "source": file_path.as_uri(),
+                    "content": data.decode("utf-8", errors="replace"),
+                }
+            )
+        return files
+
+    async def fetch_content(self, file: dict) -> str:
+        """Read a listed file; contents are normally read while listing."""
+        async with self._semaphore:
+            return await asyncio.to_thread((self._root / file["path"]).read_text, encoding="utf-8", errors="replace")
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from app.settings.base import QUANTIZATION_MODES
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -22,15 +23,38 @@ class ETLPipelineSettings(BaseSettings):
     EMBEDDING_MODEL_PROVIDER: str = "google"
     EMBEDDING_MODEL_NAME: str = "gemini-embedding-2"
     EMBEDDING_MODEL_DIMENSION: int = 1536
+    EMBEDDING_CACHE_PATH: str | None = None  # SQLite embedding cache, shareable with the chat service
     OLLAMA_URL: str = "http://localhost:11434"
     QDRANT_URL: str = "http://localhost:6333"
     QDRANT_COLLECTION_NAME: str = "keys-personal-wiki"
 
+    # Qdrant collection settings, applied when a collection is (re)built
+    QDRANT_HNSW_M: int | None = None  # HNSW graph degree; None keeps Qdrant's default (16)
+    QDRANT_HNSW_EF_CONSTRUCT: int | None = None  # HNSW build beam width; None keeps Qdrant's default (100)
+    QDRANT_QUANTIZATION: QUANTIZATION_MODES = "none"  # int8 "scalar" or "binary" quantization
+    QDRANT_ON_DISK_VECTORS: bool = False  # Keep original vectors on disk (quantized copies stay in RAM)
+    QDRANT_ON_DISK_PAYLOAD: bool = False  # Keep payloads on disk
+
+    # Extraction settings
+    ETL_MAX_CONCURRENCY: int = 8  # Concurrent GitHub requests / file reads
+    GITHUB_USE_ARCHIVE: bool = False  # Download one repository tarball instead of crawling the contents API
+    GITHUB_ETAG_CACHE_PATH: str | None = None  # JSON file reused between runs for conditional requests
+    WIKI_LOCAL_PATH: str | None = None  # Load from a local clone instead of GitHub (offline runs)
+
+    # Chunking settings
+    CHUNK_SIZE_TOKENS: int = 512  # Maximum tokens per chunk; 0 embeds every file as a single document
+    CHUNK_OVERLAP_TOKENS: int = 64  # Tokens repeated between consecutive chunks of a section
+
+    # Load settings
+    EMBED_BATCH_SIZE: int = 32  # Documents per embedding request
+    UPSERT_CONCURRENCY: int = 4  # Concurrent Qdrant upserts
+
 
 class ETLSourceTypes:
     """Supported ETL source types."""
 
     GITHUB = "github"
+    LOCAL = "local"
 
 
 settings = ETLPipelineSettings()
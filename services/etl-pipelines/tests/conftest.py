@@ -0,0 +1,35 @@
+"""Conftest for etl-pipelines."""
+
+from pathlib import Path
+
+import pytest
+from app.core.vector_store.qdrant import CustomQdrantVectorStore
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_qdrant import RetrievalMode
+from qdrant_client import QdrantClient, models
+
+EMBEDDING_DIMENSION = 8
+COLLECTION_NAME = "test-wiki"
+
+
+@pytest.fixture
+def vector_store() -> CustomQdrantVectorStore:
+    """Provide a vector store over an in-memory Qdrant collection with fake embeddings."""
+    client = QdrantClient(location=":memory:")
+    client.create_collection(
+        collection_name=COLLECTION_NAME,
+        vectors_config=models.VectorParams(size=EMBEDDING_DIMENSION, distance=models.Distance.COSINE),
+    )
+    return CustomQdrantVectorStore(
+        client=client,
+        collection_name=COLLECTION_NAME,
+        embedding=DeterministicFakeEmbedding(size=EMBEDDING_DIMENSION),
+        retrieval_mode=RetrievalMode.DENSE,
+    )
+
+
+@pytest.fixture
+def wiki_root(tmp_path: Path) -> Path:
+    """Provide a local source root with an empty `wiki` directory."""
+    (tmp_path / "wiki").mkdir()
+    return tmp_path
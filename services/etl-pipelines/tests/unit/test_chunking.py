@@ -0,0 +1,140 @@
+"""Unit tests for markdown chunking."""
+
+from itertools import pairwise
+
+import pytest
+
+from etl_pipelines.chunking import Chunk, MarkdownChunker, approx_token_count
+
+# Constants & Helpers
+
+PAGE = """Intro before any heading.
+
+# Setup
+
+Install the tools.
+
+## Docker
+
+Run `docker compose up`.
+
+```bash
+# not a heading
+docker ps
+```
+
+### Volumes
+
+Mount the data directory.
+
+# Usage
+
+Ask Bella.
+"""
+
+
+def _assert_offsets(text: str, chunks: list[Chunk]) -> None:
+    """Every chunk is the slice of `text` its offsets point at."""
+    for chunk in chunks:
+        assert text[chunk.start : chunk.end] == chunk.text
+
+
+# Sections
+
+
+class TestSections:
+    """Tests for heading paths and offsets of whole sections."""
+
+    def test__heading_paths(self):
+        chunks = MarkdownChunker().split(PAGE)
+
+        assert [chunk.heading for chunk in chunks] == [
+            "",
+            "Setup",
+            "Setup > Docker",
+            "Setup > Docker > Volumes",
+            "Usage",
+        ]
+
+    def test__sections_start_at_their_heading(self):
+        chunks = MarkdownChunker().split(PAGE)
+
+        _assert_offsets(PAGE, chunks)
+        assert chunks[0].start == 0
+        assert chunks[1].text.startswith("# Setup\n")
+        assert chunks[-1].end == len(PAGE)
+        # Sections are contiguous
+        assert all(prev.end == nxt.start for prev, nxt in pairwise(chunks))
+
+    def test__headings_in_code_fences_are_ignored(self):
+        chunks = MarkdownChunker().split(PAGE)
+
+        docker = next(chunk for chunk in chunks if chunk.heading == "Setup > Docker")
+        assert "# not a heading" in docker.text
+        assert all("not a heading" not in chunk.heading for chunk in chunks)
+
+    def test__closing_hashes_and_deeper_levels(self):
+        text = "# Title #\n\nA.\n\n### Deep ###\n\nB.\n\n## Mid\n\nC.\n"
+        chunks = MarkdownChunker().split(text)
+
+        assert [chunk.heading for chunk in chunks] == ["Title", "Title > Deep", "Title > Mid"]
+
+    def test__blank_text_has_no_chunks(self):
+        assert MarkdownChunker().split("") == []
+        assert MarkdownChunker().split("\n \n\t\n") == []
+
+
+# Packing
+
+
+class TestPacking:
+    """Tests for splitting long sections into bounded, overlapping chunks."""
+
+    def test__chunks_fit_the_chunk_size(self):
+        paragraphs = [f"Paragraph {index} " + "word " * 30 for index in range(20)]
+        text = "# Long\n\n" + "\n\n".join(paragraphs) + "\n"
+        chunker = MarkdownChunker(chunk_size=64, chunk_overlap=16)
+
+        chunks = chunker.split(text)
+
+        assert len(chunks) > 1
+        _assert_offsets(text, chunks)
+        assert all(approx_token_count(chunk.text) <= 64 for chunk in chunks)
+        assert all(chunk.heading == "Long" for chunk in chunks)
+        # Together the chunks cover the whole section
+        assert chunks[0].start == 0
+        assert chunks[-1].end == len(text)
+        assert all(nxt.start <= prev.end for prev, nxt in pairwise(chunks))
+
+    def test__consecutive_chunks_overlap(self):
+        text = "\n".join(f"line {index:03d} of the section" for index in range(60))
+        chunker = MarkdownChunker(chunk_size=40, chunk_overlap=10)
+
+        chunks = chunker.split(text)
+
+        assert len(chunks) > 1
+        for prev, nxt in pairwise(chunks):
+            assert nxt.start < prev.end
+            assert approx_token_count(text[nxt.start : prev.end]) <= 10
+
+    def test__no_overlap(self):
+        text = "\n".join(f"line {index:03d} of the section" for index in range(60))
+
+        chunks = MarkdownChunker(chunk_size=40, chunk_overlap=0).split(text)
+
+        assert all(prev.end == nxt.start for prev, nxt in pairwise(chunks))
+
+    def test__word_longer_than_a_chunk_is_cut(self):
+        text = "x" * 1000
+        chunks = MarkdownChunker(chunk_size=50, chunk_overlap=0).split(text)
+
+        assert "".join(chunk.text for chunk in chunks) == text
+        assert all(approx_token_count(chunk.text) <= 50 for chunk in chunks)
+
+    @pytest.mark.parametrize(
+        ("chunk_size", "chunk_overlap"),
+        [(0, 0), (-1, 0), (10, 10), (10, -1)],
+    )
+    def test__invalid_sizes(self, chunk_size: int, chunk_overlap: int):
+        with pytest.raises(ValueError):
+            MarkdownChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
@@ -0,0 +1,148 @@
+"""Unit tests for incremental loading from a local directory."""
+
+from pathlib import Path
+
+import pytest
+from app.core.vector_store.qdrant import CustomQdrantVectorStore
+
+from etl_pipelines.base_loader import git_blob_sha
+from etl_pipelines.chunking import MarkdownChunker
+from etl_pipelines.local.loader import LocalDirectoryETL
+
+# Constants & Helpers
+
+DIRECTORY = "wiki"
+SETUP_PAGE = "# Setup\n\nInstall the tools.\n\n## Docker\n\nRun `docker compose up`.\n"
+USAGE_PAGE = "# Usage\n\nAsk Bella.\n"
+
+
+def _points(vector_store: CustomQdrantVectorStore) -> dict[str, dict]:
+    """Return the payload of every point in the collection, keyed by point id."""
+    points, _ = vector_store.client.scroll(collection_name=vector_store.collection_name, limit=1000)
+    return {str(point.id): point.payload for point in points}
+
+
+def _etl(root: Path) -> LocalDirectoryETL:
+    return LocalDirectoryETL(root, chunker=MarkdownChunker(chunk_size=64, chunk_overlap=8))
+
+
+# Local Directory ETL
+
+
+class TestLocalDirectoryETL:
+    """Tests for `LocalDirectoryETL.run_etl` against an in-memory Qdrant collection."""
+
+    async def test__extracts_supported_files_with_git_shas(self, wiki_root: Path):
+        (wiki_root / "wiki" / "setup.md").write_text(SETUP_PAGE)
+        (wiki_root / "wiki" / "image.png").write_bytes(b"\x89PNG")
+
+        files = await _etl(wiki_root).extract_supported_files(DIRECTORY)
+
+        assert [file["path"] for file in files] == ["wiki/setup.md"]
+        assert files[0]["sha"] == git_blob_sha(SETUP_PAGE.encode())
+        assert files[0]["content"] == SETUP_PAGE
+
+    async def test__chunks_keep_headings_and_offsets(self, wiki_root: Path, vector_store: CustomQdrantVectorStore):
+        (wiki_root / "wiki" / "setup.md").write_text(SETUP_PAGE)
+
+        stats = await _etl(wiki_root).run_etl(DIRECTORY, vector_store)
+
+        payloads = sorted(_points(vector_store).values(), key=lambda payload: payload["metadata"]["chunk_index"])
+        assert stats.documents == len(payloads) == 2
+        assert [payload["metadata"]["heading"] for payload in payloads] == ["Setup", "Setup > Docker"]
+        for payload in payloads:
+            metadata = payload["metadata"]
+            assert SETUP_PAGE[metadata["start_index"] : metadata["end_index"]] == payload["page_content"]
+            assert metadata["path"] == "wiki/setup.md"
+            assert metadata["sha"] == git_blob_sha(SETUP_PAGE.encode())
+            assert metadata["point_count"] == 2
+
+    async def test__point_ids_are_stable(self, wiki_root: Path, vector_store: CustomQdrantVectorStore):
+        (wiki_root / "wiki" / "setup.md").write_text(SETUP_PAGE)
+        sha = git_blob_sha(SETUP_PAGE.encode())
+        etl = _etl(wiki_root)
+
+        await etl.run_etl(DIRECTORY, vector_store)
+
+        assert set(_points(vector_store)) == {etl.point_id("wiki/setup.md", sha, chunk_index=index) for index in (0, 1)}
+        # A loader over the same root derives the same ids; a different content sha does not
+        assert _etl(wiki_root).point_id("wiki/setup.md", sha, 0) == etl.point_id("wiki/setup.md", sha, 0)
+        assert etl.point_id("wiki/setup.md", git_blob_sha(b"other"), 0) != etl.point_id("wiki/setup.md", sha, 0)
+
+    async def test__skips_unchanged_files(self, wiki_root: Path, vector_store: CustomQdrantVectorStore):
+        (wiki_root / "wiki" / "setup.md").write_text(SETUP_PAGE)
+        (wiki_root / "wiki" / "usage.md").write_text(USAGE_PAGE)
+        etl = _etl(wiki_root)
+        await etl.run_etl(DIRECTORY, vector_store)
+        before = _points(vector_store)
+
+        stats = await etl.run_etl(DIRECTORY, vector_store)
+
+        assert (stats.unchanged, stats.upserted, stats.removed, stats.documents) == (2, 0, 0, 0)
+        assert _points(vector_store) == before
+
+    async def test__reloads_partially_loaded_files(self, wiki_root: Path, vector_store: CustomQdrantVectorStore):
+        (wiki_root / "wiki" / "setup.md").write_text(SETUP_PAGE)
+        etl = _etl(wiki_root)
+        await etl.run_etl(DIRECTORY, vector_store)
+        before = _points(vector_store)
+        # An interrupted run left one of the file's chunks unindexed
+        vector_store.client.delete(collection_name=vector_store.collection_name, points_selector=[min(before)])
+
+        stats = await etl.run_etl(DIRECTORY, vector_store)
+
+        assert (stats.unchanged, stats.upserted) == (0, 1)
+        assert _points(vector_store) == before
+
+    async def test__replaces_points_of_changed_files(self, wiki_root: Path, vector_store: CustomQdrantVectorStore):
+        page = wiki_root / "wiki" / "usage.md"
+        page.write_text(USAGE_PAGE)
+        etl = _etl(wiki_root)
+        await etl.run_etl(DIRECTORY, vector_store)
+
+        page.write_text(USAGE_PAGE + "\nAsk anything.\n")
+        stats = await etl.run_etl(DIRECTORY, vector_store)
+
+        assert (stats.unchanged, stats.upserted) == (0, 1)
+        payloads = list(_points(vector_store).values())
+        assert len(payloads) == 1
+        assert payloads[0]["metadata"]["sha"] == git_blob_sha(page.read_bytes())
+
+    async def test__deletes_points_of_removed_files(self, wiki_root: Path, vector_store: CustomQdrantVectorStore):
+        (wiki_root / "wiki" / "setup.md").write_text(SETUP_PAGE)
+        (wiki_root / "wiki" / "usage.md").write_text(USAGE_PAGE)
+        etl = _etl(wiki_root)
+        await etl.run_etl(DIRECTORY, vector_store)
+
+        (wiki_root / "wiki" / "setup.md").unlink()
+        stats = await etl.run_etl(DIRECTORY, vector_store)
+
+        assert (stats.unchanged, stats.upserted, stats.removed) == (1, 0, 1)
+        assert {payload["metadata"]["path"] for payload in _points(vector_store).values()} == {"wiki/usage.md"}
+
+    async def test__failed_upsert_aborts_before_deleting_stale_points(
+        self, wiki_root: Path, vector_store: CustomQdrantVectorStore, monkeypatch
+    ):
+        page = wiki_root / "wiki" / "setup.md"
+        page.write_text(SETUP_PAGE)
+        etl = _etl(wiki_root)
+        await etl.run_etl(DIRECTORY, vector_store)
+        before = set(_points(vector_store))
+
+        upsert_documents = vector_store.upsert_documents
+        failures = ["qdrant down"]
+
+        def _upsert_failing_once(*args, **kwargs):
+            if failures:
+                raise RuntimeError(failures.pop())
+            return upsert_documents(*args, **kwargs)
+
+        monkeypatch.setattr(vector_store, "upsert_documents", _upsert_failing_once)
+        # Enough chunks that the failed upsert finishes while later batches are still being embedded
+        page.write_text(SETUP_PAGE + "".join(f"\n## Step {index}\n\nDo step {index}.\n" for index in range(8)))
+
+        with pytest.raises(RuntimeError, match="qdrant down"):
+            await etl.run_etl(DIRECTORY, vector_store, embed_batch_size=1)
+
+        # The previous version of the file is still indexed
+        assert before <= set(_points(vector_store))
@@ -91,3 +91,34 @@ class SpendingEntryFilter(BaseModel):
     month: int | None = Field(default=None, description="Filter by month (1-12)")
     year: int | None = Field(default=None, description="Filter by year")
     account_name: str | None = Field(default=None, description="Filter by account name")
+
+
+class SpendingTotalsGroupBy(StrEnum):
+    """Dimensions spending totals can be grouped by."""
+
+    MONTH = "month"
+    YEAR = "year"
+    ACCOUNT = "account"
+
+
+class SpendingTotal(BaseModel):
+    """Entity representing aggregated spending for one group (month, year, account or overall)."""
+
+    account_name: str | None = Field(default=None, description="Account name, set when grouped by account")
+    year: int | None = Field(default=None, description="Year, set when grouped by year or month")
+    month: int | None = Field(default=None, description="Month, set when grouped by month")
+    total_spent: float = Field(description="Sum of total spent across the grouped entries")
+    total_credit: float = Field(description="Sum of current credit across the grouped entries")
+    entry_count: int = Field(description="Number of spending entries in the group")
+    rolling_average_spent: float | None = Field(
+        default=None, description="Average total spent over the trailing window of groups, if requested"
+    )
+
+
+class SpendingSummary(BaseModel):
+    """Entity representing overall, per-year, per-month and per-account spending totals."""
+
+    total: SpendingTotal = Field(description="Totals across all matching entries")
+    by_year: list[SpendingTotal] = Field(description="Totals per year")
+    by_month: list[SpendingTotal] = Field(description="Totals per month")
+    by_account: list[SpendingTotal] = Field(description="Totals per account")
@@ -10,6 +10,9 @@ from app.entities.models.spending_entry import (
     SpendingEntrySort,
     SpendingEntryWithCalc,
     SpendingEntryWithCalcPage,
+    SpendingSummary,
+    SpendingTotal,
+    SpendingTotalsGroupBy,
 )
 
 
@@ -96,3 +99,20 @@ class SpendingEntryRepositoryInterface(ABC):
     async def edit_entry_with_details(self, entry_id: str, entry: SpendingEntry) -> SpendingEntryDetailWithCalc:
         """Edit an existing entry and return it with joined account and date details."""
         pass
+
+    # Aggregations
+
+    @abstractmethod
+    async def get_spending_totals(
+        self,
+        group_by: SpendingTotalsGroupBy,
+        filters: SpendingEntryFilter | None = None,
+        rolling_window: int | None = None,
+    ) -> list[SpendingTotal]:
+        """Aggregate total spent per month, year or account in a single grouped query."""
+        pass
+
+    @abstractmethod
+    async def get_spending_summary(self, filters: SpendingEntryFilter | None = None) -> SpendingSummary:
+        """Aggregate overall, per-year, per-month and per-account totals in a single query."""
+        pass
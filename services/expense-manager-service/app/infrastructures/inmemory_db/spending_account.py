@@ -88,3 +88,10 @@ class SpendingAccountRepository(SpendingEntryRepositoryInterface):
 
     async def edit_entry_with_details(self, entry_id: str, entry):
         raise NotImplementedError("InMemory repository does not support optimized JOIN methods")
+
+    # Aggregations - not implemented for InMemory
+    async def get_spending_totals(self, group_by, filters=None, rolling_window=None):
+        raise NotImplementedError("InMemory repository does not support aggregation queries")
+
+    async def get_spending_summary(self, filters=None):
+        raise NotImplementedError("InMemory repository does not support aggregation queries")
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from utilities.request_metrics import instrument_sqlalchemy_engine
 
 from app.settings import get_settings
 
@@ -16,10 +17,13 @@ from app.settings import get_settings
 def get_engine():
     """Get the database engine."""
     postgres_url = get_settings().DATABASE_URL.get_secret_value()
-    return create_async_engine(
+    engine = create_async_engine(
         postgres_url,
         echo=get_settings().LOG_DB_QUERIES,
     )
+    if get_settings().REQUEST_METRICS_ENABLED:
+        instrument_sqlalchemy_engine(engine)
+    return engine
 
 
 # Create async session factory
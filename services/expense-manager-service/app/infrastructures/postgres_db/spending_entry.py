@@ -1,8 +1,11 @@
 """Postgres repository implementation for spending accounts."""
 
+from typing import Any
+
 from sqlalchemy import (
     func,
     select,
+    tuple_,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +20,9 @@ from app.entities.models.spending_entry import (
     SpendingEntrySortField,
     SpendingEntryWithCalc,
     SpendingEntryWithCalcPage,
+    SpendingSummary,
+    SpendingTotal,
+    SpendingTotalsGroupBy,
 )
 from app.entities.repositories.spending_entry import SpendingEntryRepositoryInterface
 from app.infrastructures.postgres_db.database import get_async_session
@@ -24,6 +30,11 @@ from app.infrastructures.postgres_db.models.account import AccountModel
 from app.infrastructures.postgres_db.models.period import PeriodModel
 from app.infrastructures.postgres_db.models.spending_entry import SpendingEntryModel
 
+# Total spent per entry, as computed by SpendingEntryWithCalc
+TOTAL_SPENT = (
+    SpendingEntryModel.starting_balance - SpendingEntryModel.current_balance
+) + SpendingEntryModel.current_credit
+
 # Mapping of sort fields to SQLAlchemy column expressions
 SORT_COLUMN_MAP = {
     SpendingEntrySortField.MONTH: PeriodModel.month,
@@ -35,11 +46,22 @@ SORT_COLUMN_MAP = {
     SpendingEntrySortField.BALANCE_AFTER_CREDIT: (
         SpendingEntryModel.current_balance - SpendingEntryModel.current_credit
     ),
-    SpendingEntrySortField.TOTAL_SPENT: (
-        (SpendingEntryModel.starting_balance - SpendingEntryModel.current_balance) + SpendingEntryModel.current_credit
-    ),
+    SpendingEntrySortField.TOTAL_SPENT: TOTAL_SPENT,
+}
+
+# Mapping of totals groupings to their GROUP BY columns, in chronological/alphabetical order
+GROUP_BY_COLUMN_MAP = {
+    SpendingTotalsGroupBy.MONTH: (PeriodModel.year, PeriodModel.month),
+    SpendingTotalsGroupBy.YEAR: (PeriodModel.year,),
+    SpendingTotalsGroupBy.ACCOUNT: (AccountModel.account_name,),
 }
 
+# GROUPING(year, month, account_name) bitmask of each grouping set in the summary query
+_SUMMARY_BY_MONTH = 0b001
+_SUMMARY_BY_YEAR = 0b011
+_SUMMARY_BY_ACCOUNT = 0b110
+_SUMMARY_TOTAL = 0b111
+
 
 class PostgresSpendingEntryRepository(SpendingEntryRepositoryInterface):
     """Postgres implementation of the SpendingEntryRepositoryInterface."""
@@ -510,3 +532,103 @@ class PostgresSpendingEntryRepository(SpendingEntryRepositoryInterface):
                 month=month,
                 year=year,
             )
+
+    # Aggregations
+
+    def _aggregate_base(self, *columns):
+        """Select grouping columns with summed totals over entries joined to account and period."""
+        return (
+            select(
+                *columns,
+                func.coalesce(func.sum(TOTAL_SPENT), 0.0).label("total_spent"),
+                func.coalesce(func.sum(SpendingEntryModel.current_credit), 0.0).label("total_credit"),
+                func.count(SpendingEntryModel.id).label("entry_count"),
+            )
+            .select_from(SpendingEntryModel)
+            .join(AccountModel, SpendingEntryModel.account_id == AccountModel.id)
+            .join(PeriodModel, SpendingEntryModel.period_id == PeriodModel.id)
+        )
+
+    async def get_spending_totals(
+        self,
+        group_by: SpendingTotalsGroupBy,
+        filters: SpendingEntryFilter | None = None,
+        rolling_window: int | None = None,
+    ) -> list[SpendingTotal]:
+        """Aggregate total spent per month, year or account in a single GROUP BY query.
+
+        The rolling average is a window function over the grouped rows, so it is only computed for the
+        chronological groupings (month and year).
+        """
+        group_cols = GROUP_BY_COLUMN_MAP[group_by]
+        columns: list[Any] = list(group_cols)
+        if rolling_window and group_by != SpendingTotalsGroupBy.ACCOUNT:
+            columns.append(
+                func.avg(func.sum(TOTAL_SPENT))
+                .over(order_by=group_cols, rows=(-(rolling_window - 1), 0))
+                .label("rolling_average_spent")
+            )
+
+        filter_clauses = self._build_filter_clauses(filters) if filters else []
+        stmt = self._aggregate_base(*columns).where(*filter_clauses).group_by(*group_cols).order_by(*group_cols)
+
+        async with await self._get_session() as session:
+            rows = (await session.execute(stmt)).mappings().all()
+
+        return [
+            SpendingTotal(
+                account_name=row.get("account_name"),
+                year=row.get("year"),
+                month=row.get("month"),
+                total_spent=row["total_spent"],
+                total_credit=row["total_credit"],
+                entry_count=row["entry_count"],
+                rolling_average_spent=row.get("rolling_average_spent"),
+            )
+            for row in rows
+        ]
+
+    async def get_spending_summary(self, filters: SpendingEntryFilter | None = None) -> SpendingSummary:
+        """Aggregate overall, per-year, per-month and per-account totals in one GROUPING SETS query."""
+        grouping = func.grouping(PeriodModel.year, PeriodModel.month, AccountModel.account_name).label("grouping_id")
+        filter_clauses = self._build_filter_clauses(filters) if filters else []
+        stmt = (
+            self._aggregate_base(PeriodModel.year, PeriodModel.month, AccountModel.account_name, grouping)
+            .where(*filter_clauses)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(PeriodModel.year, PeriodModel.month),
+                    tuple_(PeriodModel.year),
+                    tuple_(AccountModel.account_name),
+                    tuple_(),
+                )
+            )
+            .order_by(grouping, PeriodModel.year, PeriodModel.month, AccountModel.account_name)
+        )
+
+        async with await self._get_session() as session:
+            rows = (await session.execute(stmt)).all()
+
+        total = SpendingTotal(total_spent=0.0, total_credit=0.0, entry_count=0)
+        by_year: list[SpendingTotal] = []
+        by_month: list[SpendingTotal] = []
+        by_account: list[SpendingTotal] = []
+        for year, month, account_name, grouping_id, total_spent, total_credit, entry_count in rows:
+            spending_total = SpendingTotal(
+                account_name=account_name,
+                year=year,
+                month=month,
+                total_spent=total_spent,
+                total_credit=total_credit,
+                entry_count=entry_count,
+            )
+            if grouping_id == _SUMMARY_BY_MONTH:
+                by_month.append(spending_total)
+            elif grouping_id == _SUMMARY_BY_YEAR:
+                by_year.append(spending_total)
+            elif grouping_id == _SUMMARY_BY_ACCOUNT:
+                by_account.append(spending_total)
+            elif grouping_id == _SUMMARY_TOTAL:
+                total = spending_total
+
+        return SpendingSummary(total=total, by_year=by_year, by_month=by_month, by_account=by_account)
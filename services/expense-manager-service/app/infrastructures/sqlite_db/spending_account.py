@@ -194,3 +194,10 @@ class SQLiteSpendingAccountRepository(SpendingEntryRepositoryInterface):
 
     async def edit_entry_with_details(self, entry_id: str, entry):
         raise NotImplementedError("SQLite repository does not support optimized JOIN methods")
+
+    # Aggregations - not implemented for SQLite
+    async def get_spending_totals(self, group_by, filters=None, rolling_window=None):
+        raise NotImplementedError("SQLite repository does not support aggregation queries")
+
+    async def get_spending_summary(self, filters=None):
+        raise NotImplementedError("SQLite repository does not support aggregation queries")
@@ -6,7 +6,9 @@ from datetime import datetime, timedelta
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from utilities.auth_middleware import JWTAuthMiddleware
+from fastapi.responses import PlainTextResponse
+from utilities.auth_middleware import DEFAULT_EXCLUDE_PATHS, JWTAuthMiddleware
+from utilities.request_metrics import RequestMetricsMiddleware, request_metrics_registry
 
 from app.routers.v1 import router as v1_router
 from app.settings import get_settings
@@ -24,11 +26,33 @@ def setup_middlewares(app: FastAPI, settings) -> None:
     )
 
     # Add JWT Auth Middleware for protecting endpoints
+    exclude_paths = list(DEFAULT_EXCLUDE_PATHS)
+    if settings.REQUEST_METRICS_ENABLED:
+        # Allow Prometheus to scrape the metrics endpoint without a bearer token
+        exclude_paths.append(r"^/metrics$")
     app.add_middleware(
         JWTAuthMiddleware,
+        exclude_paths=exclude_paths,
         secret_key=settings.JWT_SECRET.get_secret_value() if hasattr(settings, "JWT_SECRET") else None,
     )
 
+    # Added last so it is the outermost middleware and times the full request, auth included
+    if settings.REQUEST_METRICS_ENABLED:
+        app.add_middleware(
+            RequestMetricsMiddleware,
+            registry=request_metrics_registry,
+            enable_profiler=settings.REQUEST_PROFILER_ENABLED,
+        )
+
+
+async def metrics() -> PlainTextResponse:
+    """Prometheus metrics endpoint.
+
+    Returns per-route request counts, wall time, database time, SQL statement counts and rows
+    fetched. Only registered when `REQUEST_METRICS_ENABLED` is set.
+    """
+    return PlainTextResponse(request_metrics_registry.render_prometheus(), media_type="text/plain; version=0.0.4")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,9 +63,9 @@ async def lifespan(app: FastAPI):
     yield
 
 
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application."""
-    settings = get_settings()
+def create_app(settings=None) -> FastAPI:
+    """Create and configure the FastAPI application from `settings`, or the service settings when not given."""
+    settings = settings or get_settings()
 
     app = FastAPI(
         lifespan=lifespan,
@@ -53,6 +77,9 @@ def create_app() -> FastAPI:
     # Setup middlewares
     setup_middlewares(app, settings)
 
+    if settings.REQUEST_METRICS_ENABLED:
+        app.add_api_route("/metrics", metrics, response_class=PlainTextResponse, include_in_schema=False)
+
     return app
 
 
@@ -7,6 +7,7 @@ from app.routers.v1.mappers.spending_entry import (
     SpendingEntryMapper,
     SpendingEntryQueryParamsMapper,
     SpendingEntryWithCalcMapper,
+    SpendingTotalMapper,
 )
 from app.routers.v1.schemas.errors import HTTPErrorResponse
 from app.routers.v1.schemas.pagination import (
@@ -19,6 +20,9 @@ from app.routers.v1.schemas.spending_entry import (
     SpendingEntrySortParams,
     SpendingEntryWithCalcPageResponse,
     SpendingEntryWithCalcResponse,
+    SpendingSummaryResponse,
+    SpendingTotalsParams,
+    SpendingTotalsResponse,
 )
 from app.routers.v1.services import get_spending_entry_service
 from app.use_cases.errors.account import (
@@ -96,6 +100,38 @@ async def get_all_entries(
     )
 
 
+@router.get("/totals", response_model=SpendingTotalsResponse)
+async def get_spending_totals(
+    params: SpendingTotalsParams = Depends(),
+    filters: SpendingEntryFilterParams = Depends(),
+    spending_account_service: SpendingEntryService = Depends(get_spending_entry_service),
+) -> SpendingTotalsResponse:
+    """Retrieve total spent per month, year or account, aggregated server-side.
+
+    Use instead of paging through `/list` to compute spending trends. An optional rolling window adds the
+    trailing average of total spent for month and year groupings.
+    """
+    filters_model = SpendingEntryQueryParamsMapper.to_filters_model(filters=filters)
+    totals = await spending_account_service.get_spending_totals(
+        group_by=params.group_by, filters=filters_model, rolling_window=params.rolling_window
+    )
+    return SpendingTotalsResponse(
+        group_by=params.group_by,
+        totals=[SpendingTotalMapper.to_response_model(total=total) for total in totals],
+    )
+
+
+@router.get("/summary", response_model=SpendingSummaryResponse)
+async def get_spending_summary(
+    filters: SpendingEntryFilterParams = Depends(),
+    spending_account_service: SpendingEntryService = Depends(get_spending_entry_service),
+) -> SpendingSummaryResponse:
+    """Retrieve overall, per-year, per-month and per-account spending totals in a single round trip."""
+    filters_model = SpendingEntryQueryParamsMapper.to_filters_model(filters=filters)
+    summary = await spending_account_service.get_spending_summary(filters=filters_model)
+    return SpendingTotalMapper.to_summary_response_model(summary=summary)
+
+
 @router.get(
     "/{account_id}/list",
     response_model=SpendingEntryWithCalcPageResponse,
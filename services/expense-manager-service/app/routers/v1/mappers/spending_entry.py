@@ -9,11 +9,15 @@ from app.routers.v1.schemas.spending_entry import (
     SpendingEntryRequest,
     SpendingEntrySortParams,
     SpendingEntryWithCalcResponse,
+    SpendingSummaryResponse,
+    SpendingTotalResponse,
 )
 from app.use_cases.models.spending_entry import (
     SpendingEntry,
     SpendingEntryCreate,
     SpendingEntryWithCalc,
+    SpendingSummary,
+    SpendingTotal,
 )
 
 
@@ -90,3 +94,30 @@ class SpendingEntryQueryParamsMapper:
             sort_by=sort.sort_by,
             sort_order=sort.sort_order,
         )
+
+
+class SpendingTotalMapper:
+    """Mapper for aggregated spending totals."""
+
+    @staticmethod
+    def to_response_model(total: SpendingTotal) -> SpendingTotalResponse:
+        """Map the use case model to the response model."""
+        return SpendingTotalResponse(
+            account_name=total.account_name,
+            year=total.year,
+            month=total.month,
+            total_spent=total.total_spent,
+            total_credit=total.total_credit,
+            entry_count=total.entry_count,
+            rolling_average_spent=total.rolling_average_spent,
+        )
+
+    @staticmethod
+    def to_summary_response_model(summary: SpendingSummary) -> SpendingSummaryResponse:
+        """Map the use case summary model to the response model."""
+        return SpendingSummaryResponse(
+            total=SpendingTotalMapper.to_response_model(total=summary.total),
+            by_year=[SpendingTotalMapper.to_response_model(total=total) for total in summary.by_year],
+            by_month=[SpendingTotalMapper.to_response_model(total=total) for total in summary.by_month],
+            by_account=[SpendingTotalMapper.to_response_model(total=total) for total in summary.by_account],
+        )
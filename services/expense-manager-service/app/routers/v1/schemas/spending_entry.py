@@ -3,7 +3,7 @@
 from pydantic import Field
 
 from app.entities.models.sort import SortOrder
-from app.entities.models.spending_entry import SpendingEntrySortField
+from app.entities.models.spending_entry import SpendingEntrySortField, SpendingTotalsGroupBy
 from app.routers.v1.schemas.base import BaseSchema
 from app.routers.v1.schemas.pagination import PaginationResponse
 
@@ -70,3 +70,50 @@ class SpendingEntryFilterParams(BaseSchema):
         None, ge=2000, le=2100, description="Filter by year between 2000 and 2100", examples=[2024, 2025]
     )
     account_name: str | None = Field(None, description="Filter by account name", examples=["ICICI", "SBI"])
+
+
+class SpendingTotalsParams(BaseSchema):
+    """Schema for grouping parameters when aggregating spending account entries."""
+
+    group_by: SpendingTotalsGroupBy = Field(
+        SpendingTotalsGroupBy.MONTH,
+        description="Dimension to aggregate totals by",
+        examples=[SpendingTotalsGroupBy.MONTH, SpendingTotalsGroupBy.YEAR, SpendingTotalsGroupBy.ACCOUNT],
+    )
+    rolling_window: int | None = Field(
+        None,
+        ge=2,
+        le=36,
+        description="Trailing number of groups to average total spent over (month and year groupings only)",
+        examples=[3, 12],
+    )
+
+
+class SpendingTotalResponse(BaseSchema):
+    """Schema for aggregated spending of one group."""
+
+    account_name: str | None = Field(None, description="Account name, set when grouped by account", examples=["ICICI"])
+    year: int | None = Field(None, description="Year, set when grouped by year or month", examples=[2025])
+    month: int | None = Field(None, description="Month, set when grouped by month", examples=[1])
+    total_spent: float = Field(..., description="Sum of total spent across the grouped entries", examples=[4000.0])
+    total_credit: float = Field(..., description="Sum of current credit across the grouped entries", examples=[2000.0])
+    entry_count: int = Field(..., description="Number of spending entries in the group", examples=[3])
+    rolling_average_spent: float | None = Field(
+        None, description="Average total spent over the trailing window of groups, if requested", examples=[3500.0]
+    )
+
+
+class SpendingTotalsResponse(BaseSchema):
+    """Schema for spending totals grouped by a single dimension."""
+
+    group_by: SpendingTotalsGroupBy = Field(..., description="Dimension the totals are grouped by")
+    totals: list[SpendingTotalResponse] = Field(..., description="Totals per group, in chronological/name order")
+
+
+class SpendingSummaryResponse(BaseSchema):
+    """Schema for overall, per-year, per-month and per-account spending totals."""
+
+    total: SpendingTotalResponse = Field(..., description="Totals across all matching entries")
+    by_year: list[SpendingTotalResponse] = Field(..., description="Totals per year")
+    by_month: list[SpendingTotalResponse] = Field(..., description="Totals per month")
+    by_account: list[SpendingTotalResponse] = Field(..., description="Totals per account")
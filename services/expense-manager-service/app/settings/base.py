@@ -47,6 +47,10 @@ class ExpenseManagerBaseSettings(BaseSettings):
     # Logging settings
     LOG_LEVEL: str = "INFO"
 
+    # Observability settings
+    REQUEST_METRICS_ENABLED: bool = False
+    REQUEST_PROFILER_ENABLED: bool = False
+
     # App Settings
     APP_NAME: str = "Expense Manager Service"
     APP_VERSION: str = _app_version
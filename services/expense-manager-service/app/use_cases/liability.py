@@ -4,6 +4,8 @@
 import calendar
 import math
 import uuid
+from array import array
+from collections.abc import Iterator, Mapping
 from datetime import UTC, datetime
 
 from app.entities.models.liability import (
@@ -46,6 +48,102 @@ def add_months(sourcedate: datetime, months: int) -> datetime:
     )
 
 
+def _month_index(date: datetime) -> int:
+    """Map a date to a zero-based absolute month index (``year * 12 + month - 1``)."""
+    return date.year * 12 + date.month - 1
+
+
+def _month_key(index: int) -> str:
+    """Format an absolute month index as a ``"YYYY-MM"`` key."""
+    year, month0 = divmod(index, 12)
+    return f"{year:04d}-{month0 + 1:02d}"
+
+
+def _parse_month_key(key: str) -> int | None:
+    """Parse a ``"YYYY-MM"`` key into an absolute month index, or None if malformed."""
+    try:
+        year, month = key.split("-")
+        year_i, month_i = int(year), int(month)
+    except (AttributeError, ValueError):
+        return None
+    if not 1 <= month_i <= 12:
+        return None
+    return year_i * 12 + month_i - 1
+
+
+def _first_payment_month(start_date: datetime, emi_start_date: datetime | None) -> int:
+    """Return the first month offset ``m`` from ``start_date`` on which scheduled EMI applies.
+
+    Equivalent to the smallest ``m`` for which ``add_months(start_date, m) >= emi_start_date``, computed
+    without materialising a date per simulated month.
+    """
+    if emi_start_date is None:
+        return 0
+    offset = _month_index(emi_start_date) - _month_index(start_date)
+    if offset < 0:
+        return 0
+    # Only the EMI start month itself needs a day-level comparison
+    return offset if add_months(start_date, offset) >= emi_start_date else offset + 1
+
+
+class AmortizationSchedule(Mapping[str, tuple[float, float, float]]):
+    """Month-by-month amortization snapshots backed by contiguous arrays.
+
+    Months are addressed by absolute month index (see ``_month_index``); the balance, cumulative
+    interest and cumulative repaid columns are stored as ``array("d")``. The mapping interface keeps
+    the ``"YYYY-MM"`` → ``(balance, cumulative_interest, cumulative_repaid)`` view for API-facing code.
+    """
+
+    __slots__ = ("balances", "cumulative_interest", "cumulative_repaid", "start_index")
+
+    def __init__(self, start_index: int = 0):
+        """Initialize an empty schedule starting at ``start_index``."""
+        self.start_index = start_index
+        self.balances = array("d")
+        self.cumulative_interest = array("d")
+        self.cumulative_repaid = array("d")
+
+    def append(self, balance: float, cumulative_interest: float, cumulative_repaid: float) -> None:
+        """Record the closing values of the next month."""
+        self.balances.append(balance)
+        self.cumulative_interest.append(cumulative_interest)
+        self.cumulative_repaid.append(cumulative_repaid)
+
+    @property
+    def end_index(self) -> int:
+        """Absolute month index of the last recorded month (``start_index - 1`` when empty)."""
+        return self.start_index + len(self.balances) - 1
+
+    def at(self, index: int) -> tuple[float, float, float] | None:
+        """Return the snapshot for an absolute month index, or None if it is outside the schedule."""
+        offset = index - self.start_index
+        if 0 <= offset < len(self.balances):
+            return self.balances[offset], self.cumulative_interest[offset], self.cumulative_repaid[offset]
+        return None
+
+    def latest(self) -> tuple[float, float, float] | None:
+        """Return the snapshot of the last simulated month in O(1)."""
+        if not self.balances:
+            return None
+        return self.balances[-1], self.cumulative_interest[-1], self.cumulative_repaid[-1]
+
+    def __getitem__(self, key: str) -> tuple[float, float, float]:
+        """Return the snapshot for a ``"YYYY-MM"`` key."""
+        index = _parse_month_key(key)
+        snapshot = self.at(index) if index is not None else None
+        if snapshot is None:
+            raise KeyError(key)
+        return snapshot
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate ``"YYYY-MM"`` keys in chronological order."""
+        return (_month_key(index) for index in range(self.start_index, self.end_index + 1))
+
+    def __len__(self) -> int:
+        """Return the number of simulated months."""
+        return len(self.balances)
+
+
 def _get_compounding_months(compounding: CompoundingFrequency | None) -> int:
     """Map compounding frequency to the number of months."""
     return {
@@ -64,7 +162,7 @@ def _simulate_amortization(
     up_to_date: datetime,
     emi_start_date: datetime | None = None,
     compounding: CompoundingFrequency | None = None,
-) -> dict[str, tuple[float, float, float]]:
+) -> AmortizationSchedule:
     """Core amortization simulation engine (single source of truth).
 
     Simulates month-by-month amortization from the first BORROW date up to ``up_to_date``,
@@ -87,8 +185,9 @@ def _simulate_amortization(
         compounding: Compounding frequency. Defaults to MONTHLY.
 
     Returns:
-        Dict of ``"YYYY-MM"`` → ``(balance, cumulative_interest, cumulative_repaid)`` at
-        the *closing* of each simulated month. Month 0 (disbursal month) is also included.
+        AmortizationSchedule of ``(balance, cumulative_interest, cumulative_repaid)`` at the
+        *closing* of each simulated month, indexed by absolute month. Month 0 (disbursal month) is
+        also included. It also reads as a ``"YYYY-MM"`` keyed mapping.
     """
     compounding_months = _get_compounding_months(compounding)
 
@@ -98,7 +197,7 @@ def _simulate_amortization(
     sorted_txs = sorted(transactions, key=lambda t: (t.transaction_date, t.created_at or datetime.min))
     borrow_txs = [t for t in sorted_txs if t.transaction_type == LiabilityTransactionType.BORROW]
     if not borrow_txs:
-        return {}
+        return AmortizationSchedule()
 
     first_borrow = borrow_txs[0]
     start_date = first_borrow.transaction_date
@@ -109,16 +208,14 @@ def _simulate_amortization(
     if emi_start_date and emi_start_date.tzinfo is None:
         emi_start_date = emi_start_date.replace(tzinfo=UTC)
 
-    # Group all transactions by YYYY-MM
-    txs_by_month: dict[str, list[LiabilityTransaction]] = {}
+    # Group all transactions by absolute month index
+    txs_by_month: dict[int, list[LiabilityTransaction]] = {}
     for t in sorted_txs:
-        tx_date = t.transaction_date
-        if tx_date.tzinfo is None:
-            tx_date = tx_date.replace(tzinfo=UTC)
-        key = tx_date.strftime("%Y-%m")
-        txs_by_month.setdefault(key, []).append(t)
+        txs_by_month.setdefault(_month_index(t.transaction_date), []).append(t)
 
-    snapshots: dict[str, tuple[float, float, float]] = {}
+    start_index = _month_index(start_date)
+    first_payment_month = _first_payment_month(start_date, emi_start_date)
+    snapshots = AmortizationSchedule(start_index)
 
     # Month 0: Disbursal month
     p = first_borrow.amount  # opening principal from first borrow
@@ -126,8 +223,7 @@ def _simulate_amortization(
     accum_interest = 0.0
     accum_repaid = 0.0
 
-    m0_str = start_date.strftime("%Y-%m")
-    m0_other = [t for t in txs_by_month.get(m0_str, []) if t.id != first_borrow.id]
+    m0_other = [t for t in txs_by_month.get(start_index, []) if t.id != first_borrow.id]
 
     # Extra borrows in disbursal month
     extra_borrows_0 = sum(t.amount for t in m0_other if t.transaction_type == LiabilityTransactionType.BORROW)
@@ -153,24 +249,21 @@ def _simulate_amortization(
         i_acc = 0.0
 
     p = max(0.0, p)
-    snapshots[m0_str] = (round(p + i_acc, 2), round(accum_interest, 2), round(accum_repaid, 2))
+    snapshots.append(round(p + i_acc, 2), round(accum_interest, 2), round(accum_repaid, 2))
 
     # Months 1 … N (up_to_date)
-    elapsed = max(0, (up_to_date.year - start_date.year) * 12 + (up_to_date.month - start_date.month))
+    elapsed = max(0, _month_index(up_to_date) - start_index)
 
     for m in range(1, elapsed + 1):
-        date_m = add_months(start_date, m)
-        m_str = date_m.strftime("%Y-%m")
-
         # Step 1 — Gather any manual transactions in this month
-        month_txs = txs_by_month.get(m_str, [])
+        month_txs = txs_by_month.get(start_index + m, [])
         borrows_m = sum(t.amount for t in month_txs if t.transaction_type == LiabilityTransactionType.BORROW)
         repays_m = sum(t.amount for t in month_txs if t.transaction_type == LiabilityTransactionType.REPAY)
         revals_m = [t for t in month_txs if t.transaction_type == LiabilityTransactionType.REVALUE]
 
         if p <= 0.0 and i_acc <= 0.0 and borrows_m == 0.0 and not revals_m:
             # Loan already paid off — record zero balance going forward
-            snapshots[m_str] = (0.0, round(accum_interest, 2), round(accum_repaid, 2))
+            snapshots.append(0.0, round(accum_interest, 2), round(accum_repaid, 2))
             continue
 
         if revals_m:
@@ -187,10 +280,7 @@ def _simulate_amortization(
             i_acc += interest_m
             accum_interest += interest_m
 
-            if emi_start_date and date_m < emi_start_date:
-                auto_emi = 0.0
-            else:
-                auto_emi = min(emi, p + i_acc)
+            auto_emi = 0.0 if m < first_payment_month else min(emi, p + i_acc)
 
             total_repayment = auto_emi + repays_m
             p += borrows_m
@@ -208,7 +298,7 @@ def _simulate_amortization(
                 p += i_acc
                 i_acc = 0.0
 
-        snapshots[m_str] = (round(p + i_acc, 2), round(accum_interest, 2), round(accum_repaid, 2))
+        snapshots.append(round(p + i_acc, 2), round(accum_interest, 2), round(accum_repaid, 2))
 
     return snapshots
 
@@ -242,18 +332,15 @@ def _calculate_remaining_tenure(
         today = today.replace(tzinfo=UTC)
     if emi_start_date and emi_start_date.tzinfo is None:
         emi_start_date = emi_start_date.replace(tzinfo=UTC)
+    first_payment_month = _first_payment_month(today, emi_start_date)
 
     while p > 0 and months < max_months:
         months += 1
-        date_m = add_months(today, months)
 
         interest_m = p * monthly_rate
         i_acc += interest_m
 
-        if emi_start_date and date_m < emi_start_date:
-            payment = 0.0
-        else:
-            payment = min(emi_amount, p + i_acc)
+        payment = 0.0 if months < first_payment_month else min(emi_amount, p + i_acc)
 
         if payment <= 0:
             return None
@@ -343,12 +430,12 @@ def calculate_current_outstanding(
         compounding=interest_compounding,
     )
 
-    if not snapshots:
+    # The last simulated month is "today"
+    latest = snapshots.latest()
+    if latest is None:
         return {"current_value": 0.0, "total_repaid": 0.0, "accumulated_interest": 0.0}
 
-    # The last snapshot key (sorted by date) is "today"
-    last_key = sorted(snapshots.keys())[-1]
-    balance, cum_interest, cum_repaid = snapshots[last_key]
+    balance, cum_interest, cum_repaid = latest
 
     return {
         "current_value": round(balance, 2),
@@ -779,28 +866,24 @@ class LiabilityService:
 
         compounding_months = _get_compounding_months(liability.interest_compounding)
 
-        # A. Ideal Curve (no prepayments, pure scheduled amortization)
-        ideal_points: dict[str, float] = {}
-        ideal_interest_points: dict[str, float] = {}
-        ideal_points[start_date.strftime("%Y-%m")] = original_value
-        ideal_interest_points[start_date.strftime("%Y-%m")] = 0.0
+        # A. Ideal Curve (no prepayments, pure scheduled amortization), indexed by months since disbursal
+        start_index = _month_index(start_date)
+        ideal_balances = [original_value]
+        ideal_interest = [0.0]
 
         p_ideal = original_value
         i_acc_ideal = 0.0
         n_ideal = 0
         total_interest_ideal = 0.0
+        ideal_first_payment = _first_payment_month(start_date, liability.emi_start_date)
 
         while p_ideal > 0 and n_ideal < 360:
             n_ideal += 1
-            date_m = add_months(start_date, n_ideal)
             interest_m = p_ideal * monthly_rate
             i_acc_ideal += interest_m
             total_interest_ideal += interest_m
 
-            if liability.emi_start_date and date_m < liability.emi_start_date:
-                payment = 0.0
-            else:
-                payment = min(emi, p_ideal + i_acc_ideal)
+            payment = 0.0 if n_ideal < ideal_first_payment else min(emi, p_ideal + i_acc_ideal)
 
             if payment <= 0:
                 break
@@ -815,9 +898,8 @@ class LiabilityService:
                 p_ideal += i_acc_ideal
                 i_acc_ideal = 0.0
 
-            n_str = date_m.strftime("%Y-%m")
-            ideal_points[n_str] = round(p_ideal + i_acc_ideal, 2)
-            ideal_interest_points[n_str] = round(total_interest_ideal, 2)
+            ideal_balances.append(round(p_ideal + i_acc_ideal, 2))
+            ideal_interest.append(round(total_interest_ideal, 2))
 
             # Prevent loop from hanging if loan is not amortizing (interest >= emi)
             if p_ideal + i_acc_ideal >= original_value + 1e-2 and n_ideal >= 12:
@@ -840,50 +922,39 @@ class LiabilityService:
             compounding=liability.interest_compounding,
         )
 
-        actual_points: dict[str, float] = {}
-        actual_interest_points: dict[str, float] = {}
-        for m_str, (bal, cum_int, _cum_repaid) in historical_snapshots.items():
-            actual_points[m_str] = round(bal, 2)
-            actual_interest_points[m_str] = round(max(0.0, cum_int), 2)
-
         # Today's closing values from the simulation
-        today_str = today.strftime("%Y-%m")
-        today_snap = historical_snapshots.get(today_str)
+        today_index = _month_index(today)
+        today_snap = historical_snapshots.at(today_index)
+        if today_snap is None:
+            # Fallback: use the last available snapshot
+            today_snap = historical_snapshots.latest()
         if today_snap:
             p_today, interest_today, _repaid_today = today_snap
         else:
-            # Fallback: use the last available snapshot
-            last_snap_key = sorted(historical_snapshots.keys())[-1] if historical_snapshots else None
-            if last_snap_key:
-                p_today, interest_today, _repaid_today = historical_snapshots[last_snap_key]
-            else:
-                p_today, interest_today = 0.0, 0.0
+            p_today, interest_today = 0.0, 0.0
 
         p_today = max(0.0, p_today)
         total_interest_historical = max(0.0, interest_today)
 
-        # C. Future Projection (from today, scheduled/resolved EMI only)
+        # C. Future Projection (from today, scheduled/resolved EMI only), indexed by months after today
         k_projected = 0
         total_interest_projected_future = 0.0
-        projected_future_points: dict[str, float] = {}
-        projected_future_interest_points: dict[str, float] = {}
+        projected_balances: list[float] = []
+        projected_interest: list[float] = []
 
         if p_today > 0:
             p_proj = p_today
             i_acc_proj = 0.0
             cum_int_proj = total_interest_historical
+            projected_first_payment = _first_payment_month(today, liability.emi_start_date)
             while p_proj > 0 and k_projected < 360:
                 k_projected += 1
-                date_m = add_months(today, k_projected)
                 interest_m = p_proj * monthly_rate
                 i_acc_proj += interest_m
                 total_interest_projected_future += interest_m
                 cum_int_proj += interest_m
 
-                if liability.emi_start_date and date_m < liability.emi_start_date:
-                    payment = 0.0
-                else:
-                    payment = min(emi, p_proj + i_acc_proj)
+                payment = 0.0 if k_projected < projected_first_payment else min(emi, p_proj + i_acc_proj)
 
                 if payment <= 0:
                     break
@@ -898,9 +969,8 @@ class LiabilityService:
                     p_proj += i_acc_proj
                     i_acc_proj = 0.0
 
-                k_str = date_m.strftime("%Y-%m")
-                projected_future_points[k_str] = round(p_proj + i_acc_proj, 2)
-                projected_future_interest_points[k_str] = round(cum_int_proj, 2)
+                projected_balances.append(round(p_proj + i_acc_proj, 2))
+                projected_interest.append(round(cum_int_proj, 2))
 
                 # Prevent loops from hanging on negative amortization
                 if p_proj + i_acc_proj >= p_today + 1e-2 and k_projected >= 12:
@@ -910,7 +980,7 @@ class LiabilityService:
                     break
 
         # D. Derived Metrics
-        elapsed_months = max(0, (today.year - start_date.year) * 12 + (today.month - start_date.month))
+        elapsed_months = max(0, today_index - start_index)
 
         # Determine if the projection successfully paid off the liability
         is_paid_off = p_today <= 0 or (p_proj <= 0 and i_acc_proj <= 0)
@@ -922,29 +992,40 @@ class LiabilityService:
         total_interest_projected = total_interest_historical + total_interest_projected_future
         interest_saved = total_interest_ideal - total_interest_projected
 
-        # E. Combine into projection point list
-        limit_end_date = add_months(today, k_projected) if p_today > 0 else today
-        max_end_date = max(ideal_end_date, limit_end_date)
-        total_span = max(0, (max_end_date.year - start_date.year) * 12 + (max_end_date.month - start_date.month))
+        # E. Combine into projection point list; month indices become "YYYY-MM" keys only here
+        limit_end_index = today_index + k_projected if p_today > 0 else today_index
+        total_span = max(0, max(start_index + n_ideal, limit_end_index) - start_index)
 
         projection_points_list: list[LiabilityProjectionPoint] = []
         for step in range(total_span + 1):
-            date_step = add_months(start_date, step)
-            step_str = date_step.strftime("%Y-%m")
+            step_index = start_index + step
 
-            ideal_bal = ideal_points.get(step_str, 0.0)
-            ideal_int = ideal_interest_points.get(step_str, 0.0)
+            if step < len(ideal_balances):
+                ideal_bal, ideal_int = ideal_balances[step], ideal_interest[step]
+            else:
+                ideal_bal, ideal_int = 0.0, 0.0
 
-            if date_step <= today:
-                actual_bal = actual_points.get(step_str, 0.0)
-                actual_int = actual_interest_points.get(step_str, 0.0)
+            if step_index < today_index:
+                is_historical = True
+            elif step_index > today_index:
+                is_historical = False
+            else:
+                # Same calendar month as today: the disbursal day decides which curve applies
+                is_historical = add_months(start_date, step) <= today
+
+            actual_bal, actual_int = 0.0, 0.0
+            if is_historical:
+                snap = historical_snapshots.at(step_index)
+                if snap is not None:
+                    actual_bal, actual_int = snap[0], max(0.0, snap[1])
             else:
-                actual_bal = projected_future_points.get(step_str, 0.0)
-                actual_int = projected_future_interest_points.get(step_str, 0.0)
+                k = step_index - today_index
+                if 1 <= k <= len(projected_balances):
+                    actual_bal, actual_int = projected_balances[k - 1], projected_interest[k - 1]
 
             projection_points_list.append(
                 LiabilityProjectionPoint(
-                    date=step_str,
+                    date=_month_key(step_index),
                     ideal_balance=round(ideal_bal, 2),
                     actual_balance=round(actual_bal, 2),
                     ideal_interest_paid=round(ideal_int, 2),
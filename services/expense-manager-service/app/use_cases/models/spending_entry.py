@@ -2,7 +2,7 @@
 
 from pydantic import Field
 
-from app.use_cases.models.base import BaseEntity
+from app.use_cases.models.base import BaseEntity, BaseInput
 from app.use_cases.models.pagination import Page
 
 
@@ -37,3 +37,26 @@ class SpendingEntryWithCalcPage(BaseEntity):
         description="List of flattened spending account entries with calculated fields"
     )
     page: Page = Field(description="Pagination metadata for the current page")
+
+
+class SpendingTotal(BaseInput):
+    """Model for aggregated spending of one group (month, year, account or overall)."""
+
+    account_name: str | None = Field(default=None, description="Account name, set when grouped by account")
+    year: int | None = Field(default=None, description="Year, set when grouped by year or month")
+    month: int | None = Field(default=None, description="Month, set when grouped by month")
+    total_spent: float = Field(description="Sum of total spent across the grouped entries")
+    total_credit: float = Field(description="Sum of current credit across the grouped entries")
+    entry_count: int = Field(description="Number of spending entries in the group")
+    rolling_average_spent: float | None = Field(
+        default=None, description="Average total spent over the trailing window of groups, if requested"
+    )
+
+
+class SpendingSummary(BaseInput):
+    """Model for overall, per-year, per-month and per-account spending totals."""
+
+    total: SpendingTotal = Field(description="Totals across all matching entries")
+    by_year: list[SpendingTotal] = Field(description="Totals per year")
+    by_month: list[SpendingTotal] = Field(description="Totals per month")
+    by_account: list[SpendingTotal] = Field(description="Totals per account")
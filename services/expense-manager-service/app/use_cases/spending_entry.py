@@ -12,6 +12,10 @@ from app.entities.models.spending_entry import (
 from app.entities.models.spending_entry import (
     SpendingEntryFilter,
     SpendingEntrySort,
+    SpendingTotalsGroupBy,
+)
+from app.entities.models.spending_entry import (
+    SpendingTotal as SpendingTotalEntity,
 )
 from app.use_cases.errors.account import (
     AccountNotFoundError,
@@ -26,6 +30,8 @@ from app.use_cases.models.pagination import Page
 from app.use_cases.models.spending_entry import (
     SpendingEntryWithCalc,
     SpendingEntryWithCalcPage,
+    SpendingSummary,
+    SpendingTotal,
 )
 
 if TYPE_CHECKING:
@@ -286,3 +292,38 @@ class SpendingEntryService:
             await self.spending_account_repository.delete_entry(entry_id=entry_id)
         except EntitySpendingAccountEntryNotFoundError as error:
             raise SpendingAccountEntryNotFoundError(entry_id=error.entry_id) from error
+
+    @staticmethod
+    def _convert_spending_total_entity(total: SpendingTotalEntity) -> SpendingTotal:
+        """Convert an aggregated spending total entity to the use case model."""
+        return SpendingTotal(
+            account_name=total.account_name,
+            year=total.year,
+            month=total.month,
+            total_spent=total.total_spent,
+            total_credit=total.total_credit,
+            entry_count=total.entry_count,
+            rolling_average_spent=total.rolling_average_spent,
+        )
+
+    async def get_spending_totals(
+        self,
+        group_by: SpendingTotalsGroupBy,
+        filters: SpendingEntryFilter | None = None,
+        rolling_window: int | None = None,
+    ) -> list[SpendingTotal]:
+        """Retrieve total spent per month, year or account, aggregated by the database."""
+        totals = await self.spending_account_repository.get_spending_totals(
+            group_by=group_by, filters=filters, rolling_window=rolling_window
+        )
+        return [self._convert_spending_total_entity(total) for total in totals]
+
+    async def get_spending_summary(self, filters: SpendingEntryFilter | None = None) -> SpendingSummary:
+        """Retrieve overall, per-year, per-month and per-account totals, aggregated by the database."""
+        summary = await self.spending_account_repository.get_spending_summary(filters=filters)
+        return SpendingSummary(
+            total=self._convert_spending_total_entity(summary.total),
+            by_year=[self._convert_spending_total_entity(total) for total in summary.by_year],
+            by_month=[self._convert_spending_total_entity(total) for total in summary.by_month],
+            by_account=[self._convert_spending_total_entity(total) for total in summary.by_account],
+        )
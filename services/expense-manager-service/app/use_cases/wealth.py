@@ -314,10 +314,10 @@ class WealthService:
             emi_start_date=liability.emi_start_date,
             compounding=liability.interest_compounding,
         )
-        if not snapshots:
+        latest = snapshots.latest()
+        if latest is None:
             return 0.0
-        last_key = sorted(snapshots.keys())[-1]
-        balance, _, _ = snapshots[last_key]
+        balance, _, _ = latest
         return round(balance, 2)
 
     def _calculate_interest_free_liability_value(self, txs: list) -> float:
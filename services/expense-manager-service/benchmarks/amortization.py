@@ -0,0 +1,314 @@
+"""Database-free micro-benchmarks for the liability amortization engine.
+
+Generates synthetic loan ledgers and measures per-call latency and allocations of the pure amortization
+functions in `app.use_cases.liability`. Used both by `test_amortization.py` (pytest-benchmark) and as a
+standalone report:
+
+    python -m benchmarks.amortization [--repeat N]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from app.entities.models.liability import (
+    CompoundingFrequency,
+    Liability,
+    LiabilityTransaction,
+    LiabilityTransactionType,
+)
+from app.use_cases.liability import (
+    LiabilityService,
+    _calculate_remaining_tenure,
+    _simulate_amortization,
+    add_months,
+    calculate_current_outstanding,
+)
+
+
+@dataclass(frozen=True)
+class LedgerProfile:
+    """Shape of a synthetic loan ledger."""
+
+    name: str
+    tenure_months: int
+    elapsed_months: int
+    compounding: CompoundingFrequency = CompoundingFrequency.MONTHLY
+    revalue_every: int | None = None  # months between REVALUE bank statements
+    prepayment_probability: float = 0.0  # chance of an extra REPAY in a given month
+    principal: float = 2_500_000.0
+    interest_rate: float = 9.5
+
+
+PROFILES = [
+    LedgerProfile(name="personal_3y", tenure_months=60, elapsed_months=36),
+    LedgerProfile(
+        name="vehicle_5y_quarterly",
+        tenure_months=84,
+        elapsed_months=60,
+        compounding=CompoundingFrequency.QUARTERLY,
+        prepayment_probability=0.1,
+    ),
+    LedgerProfile(name="home_20y", tenure_months=300, elapsed_months=240, revalue_every=24),
+    LedgerProfile(
+        name="home_20y_dense",
+        tenure_months=300,
+        elapsed_months=240,
+        compounding=CompoundingFrequency.HALF_YEARLY,
+        revalue_every=3,
+        prepayment_probability=0.25,
+    ),
+    LedgerProfile(
+        name="home_30y_yearly",
+        tenure_months=360,
+        elapsed_months=359,
+        compounding=CompoundingFrequency.YEARLY,
+        revalue_every=12,
+        prepayment_probability=0.05,
+    ),
+]
+
+
+@dataclass
+class SyntheticLoan:
+    """A liability together with its generated ledger."""
+
+    profile: LedgerProfile
+    liability: Liability
+    transactions: list[LiabilityTransaction]
+    today: datetime
+
+
+def _scheduled_emi(principal: float, annual_rate: float, tenure_months: int) -> float:
+    r_monthly = annual_rate / 100 / 12
+    return principal * r_monthly * (1 + r_monthly) ** tenure_months / ((1 + r_monthly) ** tenure_months - 1)
+
+
+def build_loan(profile: LedgerProfile, seed: int = 7, today: datetime | None = None) -> SyntheticLoan:
+    """Generate a deterministic liability and ledger matching `profile`.
+
+    Args:
+        profile: Ledger shape to generate.
+        seed: Random seed for prepayment placement and amounts.
+        today: Reference date; the ledger ends in this month. Defaults to now.
+
+    Returns:
+        SyntheticLoan with the liability entity and its chronological transactions.
+    """
+    rng = random.Random(seed)
+    today = today or datetime.now(UTC)
+    anchor = datetime(today.year, today.month, 5, 10, 0, tzinfo=UTC)
+    start = add_months(anchor, -profile.elapsed_months)
+    emi = round(_scheduled_emi(profile.principal, profile.interest_rate, profile.tenure_months), 2)
+    liability_id = uuid.uuid4().hex
+
+    def _tx(tx_type: LiabilityTransactionType, amount: float, when: datetime) -> LiabilityTransaction:
+        return LiabilityTransaction(
+            liability_id=liability_id,
+            transaction_type=tx_type,
+            amount=amount,
+            transaction_date=when,
+            created_at=when,
+        )
+
+    transactions = [_tx(LiabilityTransactionType.BORROW, profile.principal, start)]
+    for m in range(1, profile.elapsed_months + 1):
+        tx_date = add_months(start, m)
+        transactions.append(_tx(LiabilityTransactionType.REPAY, emi, tx_date))
+        if rng.random() < profile.prepayment_probability:
+            transactions.append(_tx(LiabilityTransactionType.REPAY, float(rng.choice([10_000, 50_000])), tx_date))
+        if profile.revalue_every and m % profile.revalue_every == 0:
+            remaining = max(0.0, profile.principal * (1 - m / profile.tenure_months))
+            transactions.append(_tx(LiabilityTransactionType.REVALUE, round(remaining, 2), tx_date))
+
+    liability = Liability(
+        id=liability_id,
+        category_id="benchmark",
+        name=profile.name,
+        original_value=profile.principal,
+        current_value=profile.principal,
+        interest_rate=profile.interest_rate,
+        interest_compounding=profile.compounding,
+        emi_amount=emi,
+        emi_start_date=add_months(start, 1),
+        maturity_date=add_months(start, profile.tenure_months),
+    )
+    return SyntheticLoan(profile=profile, liability=liability, transactions=transactions, today=today)
+
+
+class InMemoryLiabilityRepository:
+    """Minimal repository serving a fixed set of loans to `LiabilityService`."""
+
+    def __init__(self, loans: list[SyntheticLoan]):
+        """Index the loans by liability id."""
+        self._loans = {loan.liability.id: loan for loan in loans}
+
+    async def get_liability_by_id(self, liability_id: str) -> Liability | None:
+        """Return the liability with the given id."""
+        loan = self._loans.get(liability_id)
+        return loan.liability if loan else None
+
+    async def get_transactions_for_liability(self, liability_id: str) -> list[LiabilityTransaction]:
+        """Return the ledger of the given liability."""
+        return self._loans[liability_id].transactions
+
+
+def simulate_call(loan: SyntheticLoan) -> Callable[[], object]:
+    """Build a zero-argument callable running `_simulate_amortization` over the full ledger."""
+    liability = loan.liability
+
+    def _call():
+        return _simulate_amortization(
+            original_value=liability.original_value,
+            interest_rate=liability.interest_rate,
+            emi_amount=liability.emi_amount,
+            transactions=loan.transactions,
+            up_to_date=loan.today,
+            emi_start_date=liability.emi_start_date,
+            compounding=liability.interest_compounding,
+        )
+
+    return _call
+
+
+def outstanding_call(loan: SyntheticLoan) -> Callable[[], object]:
+    """Build a zero-argument callable running `calculate_current_outstanding`."""
+    liability = loan.liability
+
+    def _call():
+        return calculate_current_outstanding(
+            original_value=liability.original_value,
+            interest_rate=liability.interest_rate,
+            emi_amount=liability.emi_amount,
+            transactions=loan.transactions,
+            today=loan.today,
+            emi_start_date=liability.emi_start_date,
+            interest_compounding=liability.interest_compounding,
+        )
+
+    return _call
+
+
+def remaining_tenure_call(loan: SyntheticLoan) -> Callable[[], object]:
+    """Build a zero-argument callable running `_calculate_remaining_tenure` from the original principal."""
+    liability = loan.liability
+
+    def _call():
+        return _calculate_remaining_tenure(
+            current_value=liability.original_value,
+            interest_rate=liability.interest_rate,
+            compounding=liability.interest_compounding,
+            emi_amount=liability.emi_amount,
+            emi_start_date=None,
+            today=loan.today,
+        )
+
+    return _call
+
+
+def projections_call(loan: SyntheticLoan, run: Callable) -> Callable[[], object]:
+    """Build a zero-argument callable running `LiabilityService.get_liability_projections`.
+
+    Args:
+        loan: Loan to project.
+        run: Runs a coroutine to completion, e.g. `loop.run_until_complete`.
+    """
+    service = LiabilityService(liability_repository=InMemoryLiabilityRepository([loan]))
+    liability_id = loan.liability.id
+    return lambda: run(service.get_liability_projections(liability_id))
+
+
+@dataclass
+class Measurement:
+    """Latency and allocation statistics of a callable.
+
+    `peak_kib` is the high-water mark of traced memory during one call; `retained_kib`/`retained_blocks` cover
+    the memory still alive when the call returns (its result).
+    """
+
+    mean_us: float
+    median_us: float
+    retained_kib: float
+    peak_kib: float
+    retained_blocks: int
+
+
+def measure(func: Callable[[], object], repeat: int = 50) -> Measurement:
+    """Time `func` and record the memory it allocates during a single traced call.
+
+    Args:
+        func: Zero-argument callable to measure.
+        repeat: Number of timed calls.
+
+    Returns:
+        Measurement with per-call latency (microseconds) and tracemalloc statistics of one call.
+    """
+    func()  # warm-up
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1e6)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = func()
+        _current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    diff = after.compare_to(before, "filename")
+    return Measurement(
+        mean_us=statistics.fmean(timings),
+        median_us=statistics.median(timings),
+        retained_kib=sum(max(0, d.size_diff) for d in diff) / 1024,
+        peak_kib=peak / 1024,
+        retained_blocks=sum(max(0, d.count_diff) for d in diff),
+    )
+
+
+def main() -> None:
+    """Print a latency/allocation table for every profile and engine entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="Timed calls per measurement")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    header = (
+        f"{'profile':<22} {'function':<30} {'txs':>5} {'mean µs':>10} {'median µs':>10} {'peak KiB':>9} {'retained':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    try:
+        for profile in PROFILES:
+            loan = build_loan(profile)
+            calls = {
+                "_simulate_amortization": simulate_call(loan),
+                "calculate_current_outstanding": outstanding_call(loan),
+                "_calculate_remaining_tenure": remaining_tenure_call(loan),
+                "get_liability_projections": projections_call(loan, loop.run_until_complete),
+            }
+            for name, func in calls.items():
+                m = measure(func, repeat=args.repeat)
+                print(
+                    f"{profile.name:<22} {name:<30} {len(loan.transactions):>5} {m.mean_us:>10.1f} "
+                    f"{m.median_us:>10.1f} {m.peak_kib:>9.1f} {m.retained_blocks:>8}"
+                )
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
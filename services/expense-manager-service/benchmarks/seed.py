@@ -0,0 +1,401 @@
+"""Bulk data generators for the EMS performance benchmarks.
+
+The shapes mirror the portfolio demo seeder in `scripts/screenshots/seed_portfolio_data.py` (account templates
+with a year-end spend spike, SIP-style asset ledgers with quarterly revaluations, EMI-driven loan ledgers), but the
+volumes are scaled up and rows are inserted in bulk through the ORM tables instead of one idempotent
+`SELECT`/`INSERT` pair per row. Generation is deterministic (seeded `random.Random`) so that runs are comparable.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import insert
+
+from app.infrastructures.postgres_db.database import get_async_session
+from app.infrastructures.postgres_db.models.account import AccountModel
+from app.infrastructures.postgres_db.models.asset import AssetModel
+from app.infrastructures.postgres_db.models.asset_category import AssetCategoryModel
+from app.infrastructures.postgres_db.models.asset_subcategory import AssetSubcategoryModel
+from app.infrastructures.postgres_db.models.asset_transaction import AssetTransactionModel
+from app.infrastructures.postgres_db.models.liability import LiabilityModel
+from app.infrastructures.postgres_db.models.liability_category import LiabilityCategoryModel
+from app.infrastructures.postgres_db.models.liability_subcategory import LiabilitySubcategoryModel
+from app.infrastructures.postgres_db.models.liability_transaction import LiabilityTransactionModel
+from app.infrastructures.postgres_db.models.period import PeriodModel
+from app.infrastructures.postgres_db.models.spending_entry import SpendingEntryModel
+from app.use_cases.liability import add_months
+
+# Same template as the screenshot seeder: (name, base_balance, base_credit_ratio)
+ACCOUNT_TEMPLATES = [
+    ("HDFC Salary", 120_000, 0.70),
+    ("ICICI Savings", 45_000, 0.30),
+    ("Zerodha", 82_000, 0.15),
+]
+SPEND_SPIKE = {12: 1.20, 1: 1.15, 11: 1.05}
+
+ASSET_CATEGORIES = [
+    ("EQUITY", "Equity", "Stocks, Mutual Funds, ETFs"),
+    ("DEBT", "Debt", "Fixed Deposits, PPF, Bonds, EPF"),
+    ("REAL_ESTATE", "Real Estate", "Land, Residential/Commercial Properties"),
+    ("COMMODITIES", "Commodities", "Physical/Digital Gold, Silver"),
+    ("CASH_BANK", "Cash / Bank", "Savings accounts, Cash"),
+]
+# (code, name, category_code, valuation_type, has_interest, has_maturity)
+ASSET_SUBCATEGORIES = [
+    ("MF_INDEX", "Index Fund", "EQUITY", "VALUE_BASED", False, False),
+    ("STOCKS", "Stocks", "EQUITY", "UNIT_BASED", False, False),
+    ("BANK_FD", "Bank FD", "DEBT", "VALUE_BASED", True, True),
+    ("GOLD_24K", "Gold 24K", "COMMODITIES", "UNIT_BASED", False, False),
+    ("LAND", "Land", "REAL_ESTATE", "VALUE_BASED", False, False),
+    ("SAVINGS_AC", "Savings Account", "CASH_BANK", "VALUE_BASED", True, False),
+]
+
+LIABILITY_CATEGORIES = [
+    ("SECURED_LOAN", "Secured Loans", "Loans backed by collateral like home, vehicle"),
+    ("UNSECURED_LOAN", "Unsecured Loans", "Loans with no collateral like personal, education loans"),
+]
+# (code, name, category_code)
+LIABILITY_SUBCATEGORIES = [
+    ("HOME_LOAN", "Home Loan", "SECURED_LOAN"),
+    ("VEHICLE_LOAN", "Vehicle Loan", "SECURED_LOAN"),
+    ("PERSONAL_LOAN", "Personal Loan", "UNSECURED_LOAN"),
+]
+COMPOUNDING_CHOICES = ["MONTHLY", "MONTHLY", "QUARTERLY", "HALF_YEARLY", "YEARLY"]
+
+INSERT_CHUNK_SIZE = 2_000
+
+
+@dataclass(frozen=True)
+class SeedVolumes:
+    """Row volumes generated by `seed_benchmark_data`."""
+
+    accounts: int = 50
+    spending_years: int = 10
+    assets: int = 200
+    asset_ledger_months: int = 36
+    loans: int = 50
+    loan_ledger_years: int = 20
+
+
+@dataclass(frozen=True)
+class SeedResult:
+    """Identifiers of seeded rows needed by the benchmarks."""
+
+    account_ids: list[str]
+    asset_ids: list[str]
+    liability_ids: list[str]
+    row_counts: dict[str, int]
+
+
+def _uid() -> str:
+    return uuid.uuid4().hex
+
+
+def _month_start(months_ago: int, today: datetime) -> datetime:
+    anchor = datetime(today.year, today.month, 1, 10, 0, tzinfo=UTC)
+    return add_months(anchor, -months_ago)
+
+
+async def _bulk_insert(session, model, rows: list[dict]) -> None:
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        await session.execute(insert(model), rows[start : start + INSERT_CHUNK_SIZE])
+
+
+def _generate_categories() -> tuple[dict[str, list[dict]], dict[str, str], dict[str, str]]:
+    now = datetime.now(UTC)
+    asset_cat_ids = {code: _uid() for code, _, _ in ASSET_CATEGORIES}
+    liability_cat_ids = {code: _uid() for code, _, _ in LIABILITY_CATEGORIES}
+    asset_sub_ids = {code: _uid() for code, *_ in ASSET_SUBCATEGORIES}
+    liability_sub_ids = {code: _uid() for code, _, _ in LIABILITY_SUBCATEGORIES}
+
+    rows = {
+        "asset_category": [
+            {"id": asset_cat_ids[code], "name": name, "code": code, "description": desc, "created_at": now}
+            for code, name, desc in ASSET_CATEGORIES
+        ],
+        "asset_subcategory": [
+            {
+                "id": asset_sub_ids[code],
+                "category_id": asset_cat_ids[cat_code],
+                "name": name,
+                "code": code,
+                "valuation_type": val_type,
+                "has_interest": has_int,
+                "has_maturity": has_mat,
+                "created_at": now,
+            }
+            for code, name, cat_code, val_type, has_int, has_mat in ASSET_SUBCATEGORIES
+        ],
+        "liability_category": [
+            {"id": liability_cat_ids[code], "name": name, "code": code, "description": desc, "created_at": now}
+            for code, name, desc in LIABILITY_CATEGORIES
+        ],
+        "liability_subcategory": [
+            {
+                "id": liability_sub_ids[code],
+                "category_id": liability_cat_ids[cat_code],
+                "name": name,
+                "code": code,
+                "valuation_type": "VALUE_BASED",
+                "has_interest": True,
+                "has_maturity": True,
+                "created_at": now,
+            }
+            for code, name, cat_code in LIABILITY_SUBCATEGORIES
+        ],
+    }
+    return rows, {**asset_cat_ids, **asset_sub_ids}, {**liability_cat_ids, **liability_sub_ids}
+
+
+def _generate_spending(
+    rng: random.Random, volumes: SeedVolumes, today: datetime
+) -> tuple[list[dict], list[dict], list[dict]]:
+    now = datetime.now(UTC)
+    total_months = volumes.spending_years * 12
+
+    periods = []
+    period_ids = []
+    for months_ago in range(total_months - 1, -1, -1):
+        date_m = _month_start(months_ago, today)
+        pid = _uid()
+        period_ids.append((pid, date_m.month))
+        periods.append({"id": pid, "month": date_m.month, "year": date_m.year, "created_at": now})
+
+    accounts = []
+    entries = []
+    for idx in range(volumes.accounts):
+        template_name, base_bal, credit_ratio = ACCOUNT_TEMPLATES[idx % len(ACCOUNT_TEMPLATES)]
+        aid = _uid()
+        accounts.append({"id": aid, "account_name": f"{template_name.upper()} {idx:03d}", "created_at": now})
+
+        running_bal = float(base_bal)
+        for i, (pid, month) in enumerate(period_ids):
+            factor = SPEND_SPIKE.get(month, 1.0) * (1 + i * 0.002) * rng.uniform(0.9, 1.1)
+            spend = round(base_bal * credit_ratio * factor, 2)
+            current_bal = round(running_bal - spend * 0.6, 2)
+            entries.append(
+                {
+                    "id": _uid(),
+                    "account_id": aid,
+                    "period_id": pid,
+                    "starting_balance": round(running_bal, 2),
+                    "current_balance": current_bal,
+                    "current_credit": spend,
+                    "created_at": now,
+                }
+            )
+            running_bal = current_bal + base_bal * 0.05
+
+    return periods, accounts, entries
+
+
+def _generate_assets(
+    rng: random.Random, volumes: SeedVolumes, today: datetime, asset_refs: dict[str, str]
+) -> tuple[list[dict], list[dict]]:
+    assets = []
+    transactions = []
+    for idx in range(volumes.assets):
+        sub_code, _, cat_code, val_type, has_int, _ = ASSET_SUBCATEGORIES[idx % len(ASSET_SUBCATEGORIES)]
+        aid = _uid()
+        monthly_buy = float(rng.choice([2_500, 5_000, 10_000, 25_000]))
+        invested = 0.0
+        current = 0.0
+        units_held = 0.0
+        price = rng.uniform(100.0, 3_000.0)
+
+        for months_ago in range(volumes.asset_ledger_months - 1, -1, -1):
+            tx_date = _month_start(months_ago, today)
+            price *= rng.uniform(0.97, 1.04)
+            if val_type == "UNIT_BASED":
+                units = round(monthly_buy / price, 4)
+                units_held += units
+                transactions.append(
+                    {
+                        "id": _uid(),
+                        "asset_id": aid,
+                        "transaction_type": "BUY",
+                        "amount": monthly_buy,
+                        "units": units,
+                        "price_per_unit": round(price, 2),
+                        "transaction_date": tx_date,
+                        "created_at": tx_date,
+                    }
+                )
+                current = units_held * price
+            else:
+                current = current * rng.uniform(1.0, 1.015) + monthly_buy
+                transactions.append(
+                    {
+                        "id": _uid(),
+                        "asset_id": aid,
+                        "transaction_type": "BUY",
+                        "amount": monthly_buy,
+                        "transaction_date": tx_date,
+                        "created_at": tx_date,
+                    }
+                )
+                if months_ago % 3 == 0:
+                    transactions.append(
+                        {
+                            "id": _uid(),
+                            "asset_id": aid,
+                            "transaction_type": "REVALUE",
+                            "amount": round(current, 2),
+                            "transaction_date": tx_date,
+                            "created_at": tx_date,
+                        }
+                    )
+            invested += monthly_buy
+
+        assets.append(
+            {
+                "id": aid,
+                "category_id": asset_refs[cat_code],
+                "name": f"{sub_code} Holding {idx:03d}",
+                "subcategory_id": asset_refs[sub_code],
+                "invested_value": round(invested, 2),
+                "current_value": round(current, 2),
+                "interest_rate": 7.1 if has_int else None,
+                "interest_compounding": "QUARTERLY" if has_int else None,
+            }
+        )
+    return assets, transactions
+
+
+def _generate_liabilities(
+    rng: random.Random, volumes: SeedVolumes, today: datetime, liability_refs: dict[str, str]
+) -> tuple[list[dict], list[dict]]:
+    liabilities = []
+    transactions = []
+    ledger_months = volumes.loan_ledger_years * 12
+    for idx in range(volumes.loans):
+        sub_code, _, cat_code = LIABILITY_SUBCATEGORIES[idx % len(LIABILITY_SUBCATEGORIES)]
+        lid = _uid()
+        principal = float(rng.choice([650_000, 1_200_000, 3_500_000, 5_000_000]))
+        rate = round(rng.uniform(7.5, 12.5), 2)
+        # 25-year schedule so the loan is still running after 20 years of ledger history
+        r_monthly = rate / 100 / 12
+        tenure = 300
+        emi = round(principal * r_monthly * (1 + r_monthly) ** tenure / ((1 + r_monthly) ** tenure - 1), 2)
+        start = _month_start(ledger_months, today)
+
+        transactions.append(
+            {
+                "id": _uid(),
+                "liability_id": lid,
+                "transaction_type": "BORROW",
+                "amount": principal,
+                "transaction_date": start,
+                "description": "Initial disbursal/borrowing",
+                "created_at": start,
+            }
+        )
+        for m in range(1, ledger_months + 1):
+            tx_date = add_months(start, m)
+            transactions.append(
+                {
+                    "id": _uid(),
+                    "liability_id": lid,
+                    "transaction_type": "REPAY",
+                    "amount": emi,
+                    "transaction_date": tx_date,
+                    "description": "Monthly EMI",
+                    "created_at": tx_date,
+                }
+            )
+            if rng.random() < 0.05:
+                prepay = float(rng.choice([25_000, 50_000, 100_000]))
+                transactions.append(
+                    {
+                        "id": _uid(),
+                        "liability_id": lid,
+                        "transaction_type": "REPAY",
+                        "amount": prepay,
+                        "transaction_date": tx_date,
+                        "description": "Prepayment",
+                        "created_at": tx_date,
+                    }
+                )
+            if m % 24 == 0:
+                # Periodic bank statement override, roughly tracking the scheduled balance
+                remaining = max(0.0, principal * (1 - m / tenure))
+                transactions.append(
+                    {
+                        "id": _uid(),
+                        "liability_id": lid,
+                        "transaction_type": "REVALUE",
+                        "amount": round(remaining, 2),
+                        "transaction_date": tx_date,
+                        "description": "Bank statement",
+                        "created_at": tx_date,
+                    }
+                )
+
+        liabilities.append(
+            {
+                "id": lid,
+                "category_id": liability_refs[cat_code],
+                "name": f"{sub_code} {idx:03d}",
+                "subcategory_id": liability_refs[sub_code],
+                "original_value": principal,
+                "current_value": principal,
+                "interest_rate": rate,
+                "interest_compounding": rng.choice(COMPOUNDING_CHOICES),
+                "emi_amount": emi,
+                "emi_start_date": add_months(start, 1),
+                "maturity_date": add_months(start, tenure),
+            }
+        )
+    return liabilities, transactions
+
+
+async def seed_benchmark_data(volumes: SeedVolumes | None = None, seed: int = 42) -> SeedResult:
+    """Populate the configured database with benchmark volumes.
+
+    Args:
+        volumes: Row volumes to generate. Defaults to `SeedVolumes()`.
+        seed: Random seed for deterministic generation.
+
+    Returns:
+        SeedResult with the identifiers of the seeded accounts, assets and liabilities.
+    """
+    volumes = volumes or SeedVolumes()
+    rng = random.Random(seed)
+    today = datetime.now(UTC)
+
+    category_rows, asset_refs, liability_refs = _generate_categories()
+    periods, accounts, entries = _generate_spending(rng, volumes, today)
+    assets, asset_txs = _generate_assets(rng, volumes, today, asset_refs)
+    liabilities, liability_txs = _generate_liabilities(rng, volumes, today, liability_refs)
+
+    async_session_factory = get_async_session()
+    async with async_session_factory() as session:
+        await _bulk_insert(session, AssetCategoryModel, category_rows["asset_category"])
+        await _bulk_insert(session, AssetSubcategoryModel, category_rows["asset_subcategory"])
+        await _bulk_insert(session, LiabilityCategoryModel, category_rows["liability_category"])
+        await _bulk_insert(session, LiabilitySubcategoryModel, category_rows["liability_subcategory"])
+        await _bulk_insert(session, PeriodModel, periods)
+        await _bulk_insert(session, AccountModel, accounts)
+        await _bulk_insert(session, SpendingEntryModel, entries)
+        await _bulk_insert(session, AssetModel, assets)
+        await _bulk_insert(session, AssetTransactionModel, asset_txs)
+        await _bulk_insert(session, LiabilityModel, liabilities)
+        await _bulk_insert(session, LiabilityTransactionModel, liability_txs)
+        await session.commit()
+
+    return SeedResult(
+        account_ids=[a["id"] for a in accounts],
+        asset_ids=[a["id"] for a in assets],
+        liability_ids=[liab["id"] for liab in liabilities],
+        row_counts={
+            "period": len(periods),
+            "account": len(accounts),
+            "spending_entry": len(entries),
+            "asset": len(assets),
+            "asset_transaction": len(asset_txs),
+            "liability": len(liabilities),
+            "liability_transaction": len(liability_txs),
+        },
+    )
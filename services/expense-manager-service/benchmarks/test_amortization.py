@@ -0,0 +1,39 @@
+"""Database-free benchmarks for the liability amortization engine."""
+
+import pytest
+
+from benchmarks.amortization import (
+    PROFILES,
+    build_loan,
+    measure,
+    outstanding_call,
+    projections_call,
+    remaining_tenure_call,
+    simulate_call,
+)
+
+ENTRY_POINTS = {
+    "simulate_amortization": lambda loan, _run: simulate_call(loan),
+    "calculate_current_outstanding": lambda loan, _run: outstanding_call(loan),
+    "calculate_remaining_tenure": lambda loan, _run: remaining_tenure_call(loan),
+    "get_liability_projections": projections_call,
+}
+
+
+@pytest.mark.parametrize("profile", PROFILES, ids=lambda p: p.name)
+@pytest.mark.parametrize("entry_point", list(ENTRY_POINTS))
+def test_amortization_engine(benchmark, event_loop_runner, entry_point, profile):
+    """Benchmark an amortization entry point and attach tracemalloc statistics to the report."""
+    loan = build_loan(profile)
+    func = ENTRY_POINTS[entry_point](loan, event_loop_runner)
+
+    allocations = measure(func, repeat=1)
+    benchmark.extra_info.update(
+        transactions=len(loan.transactions),
+        peak_kib=round(allocations.peak_kib, 1),
+        retained_kib=round(allocations.retained_kib, 1),
+        retained_blocks=allocations.retained_blocks,
+    )
+
+    result = benchmark(func)
+    assert result is not None
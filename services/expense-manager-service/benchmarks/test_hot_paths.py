@@ -0,0 +1,117 @@
+"""Benchmarks for the expense-manager-service hot paths against a seeded database."""
+
+import json
+import os
+
+import pytest
+
+from app.infrastructures.postgres_db.backup import PostgresBackupRepository
+from app.use_cases.asset import AssetService
+from app.use_cases.liability import LiabilityService
+from app.use_cases.spending_entry import SpendingEntryService
+from app.use_cases.wealth import WealthService
+
+ROUNDS = int(os.getenv("EMS_BENCH_ROUNDS", "5"))
+SPENDING_PAGE_SIZE = 100
+
+
+@pytest.fixture(scope="module")
+def wealth_service(asset_repo, liability_repo):
+    """Provide an instance of WealthService."""
+    return WealthService(asset_repository=asset_repo, liability_repository=liability_repo)
+
+
+@pytest.fixture(scope="module")
+def liability_service(liability_repo):
+    """Provide an instance of LiabilityService."""
+    return LiabilityService(liability_repository=liability_repo)
+
+
+@pytest.fixture(scope="module")
+def asset_service(asset_repo):
+    """Provide an instance of AssetService."""
+    return AssetService(asset_repository=asset_repo)
+
+
+@pytest.fixture(scope="module")
+def spending_entry_service(account_repo, period_repo, spending_entry_repo):
+    """Provide an instance of SpendingEntryService."""
+    return SpendingEntryService(
+        account_repository=account_repo,
+        period_repository=period_repo,
+        spending_account_repository=spending_entry_repo,
+    )
+
+
+@pytest.fixture
+def backup_repo(tmp_path):
+    """Provide a backup repository writing into a temporary directory."""
+    return PostgresBackupRepository(backup_dir=str(tmp_path))
+
+
+def test_get_wealth_summary(benchmark, event_loop_runner, wealth_service, seeded_db):
+    """Benchmark the dashboard wealth aggregation."""
+    summary = benchmark.pedantic(
+        lambda: event_loop_runner(wealth_service.get_wealth_summary()), rounds=ROUNDS, warmup_rounds=1
+    )
+    assert summary.total_liabilities > 0
+
+
+def test_get_historical_net_worth(benchmark, event_loop_runner, wealth_service, seeded_db):
+    """Benchmark the 12-month net worth history."""
+    points = benchmark.pedantic(
+        lambda: event_loop_runner(wealth_service.get_historical_net_worth(months=12)), rounds=ROUNDS, warmup_rounds=1
+    )
+    assert len(points) == 12
+
+
+def test_get_liability_projections(benchmark, event_loop_runner, liability_service, seeded_db):
+    """Benchmark projections for a single loan with a 20-year ledger."""
+    liability_id = seeded_db.liability_ids[0]
+    projections = benchmark.pedantic(
+        lambda: event_loop_runner(liability_service.get_liability_projections(liability_id)),
+        rounds=ROUNDS,
+        warmup_rounds=1,
+    )
+    assert projections is not None
+
+
+def test_list_assets(benchmark, event_loop_runner, asset_service, seeded_db):
+    """Benchmark listing every asset with computed returns."""
+    assets = benchmark.pedantic(lambda: event_loop_runner(asset_service.list_assets()), rounds=ROUNDS, warmup_rounds=1)
+    assert len(assets) == len(seeded_db.asset_ids)
+
+
+def test_spending_entries_pagination(benchmark, event_loop_runner, spending_entry_service, seeded_db):
+    """Benchmark walking every page of the spending entry list."""
+
+    async def walk_all_pages() -> int:
+        fetched = 0
+        page = 0
+        while True:
+            result = await spending_entry_service.get_all_entries(page=page, size=SPENDING_PAGE_SIZE)
+            fetched += len(result.spending_entries)
+            page += 1
+            if page >= result.page.total_pages:
+                return fetched
+
+    fetched = benchmark.pedantic(lambda: event_loop_runner(walk_all_pages()), rounds=ROUNDS, warmup_rounds=1)
+    assert fetched == seeded_db.row_counts["spending_entry"]
+
+
+def test_backup_export(benchmark, event_loop_runner, backup_repo, seeded_db):
+    """Benchmark exporting the full database to a JSON backup."""
+    result = benchmark.pedantic(lambda: event_loop_runner(backup_repo.export_backup()), rounds=ROUNDS)
+    record_counts = result.metadata["record_counts"]
+    assert record_counts["liability_transaction"] == seeded_db.row_counts["liability_transaction"]
+
+
+def test_backup_restore(benchmark, event_loop_runner, backup_repo, seeded_db):
+    """Benchmark restoring the full database from a JSON backup, including the pre-restore snapshot."""
+    export = event_loop_runner(backup_repo.export_backup())
+    # Round-trip through the file on disk, as the restore endpoint receives an uploaded JSON document
+    with open(export.file_path, encoding="utf-8") as f:
+        payload = json.load(f)
+
+    result = benchmark.pedantic(lambda: event_loop_runner(backup_repo.restore_from_payload(payload)), rounds=ROUNDS)
+    assert result.restored_records == export.metadata["total_records"]
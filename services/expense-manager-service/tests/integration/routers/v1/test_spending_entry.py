@@ -3,6 +3,8 @@
 Endpoints under test:
     POST   /v1/spending_account
     GET    /v1/spending_account/list
+    GET    /v1/spending_account/totals
+    GET    /v1/spending_account/summary
     GET    /v1/spending_account/{id}/list
     PUT    /v1/spending_account/{id}
     DELETE /v1/spending_account/{id}
@@ -502,6 +504,114 @@ class TestListPagination:
         assert len(data["spendingEntries"]) == 0
 
 
+# GET /v1/spending_account/totals and /v1/spending_account/summary
+
+
+class TestSpendingTotals:
+    """GET /v1/spending_account/totals -- server-side totals per month, year or account.
+
+    Seed: total spent per entry is startingBalance - currentBalance + currentCredit.
+        ACC1: 2024-03 -> 4000, 2025-03 -> 1000
+        ACC2: 2025-03 -> 500
+    """
+
+    account_1: str = ""
+    account_2: str = ""
+
+    @pytest_asyncio.fixture(autouse=True, scope="class", loop_scope="session")
+    async def seed(self, client: AsyncClient):
+        suffix = uuid4().hex[:8]
+        TestSpendingTotals.account_1 = f"TOT1-{suffix}"
+        TestSpendingTotals.account_2 = f"TOT2-{suffix}"
+        await _post_entry(client, _entry_payload(TestSpendingTotals.account_1, month=3, year=2024))
+        await _post_entry(
+            client,
+            _entry_payload(
+                TestSpendingTotals.account_1, month=3, year=2025, current_credit=0.0, current_balance=9000.0
+            ),
+        )
+        await _post_entry(
+            client,
+            _entry_payload(
+                TestSpendingTotals.account_2, month=3, year=2025, current_credit=0.0, current_balance=9500.0
+            ),
+        )
+        yield
+        await _delete_all(client)
+
+    async def test__defaults_to_month_grouping(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["groupBy"] == "month"
+        assert [(t["year"], t["month"], t["totalSpent"], t["entryCount"]) for t in data["totals"]] == [
+            (2024, 3, 4000.0, 1),
+            (2025, 3, 1500.0, 2),
+        ]
+
+    async def test__total_has_all_expected_fields(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals")
+        total = resp.json()["totals"][0]
+        for field in (
+            "accountName",
+            "year",
+            "month",
+            "totalSpent",
+            "totalCredit",
+            "entryCount",
+            "rollingAverageSpent",
+        ):
+            assert field in total, f"Missing field: {field}"
+
+    async def test__group_by_year(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals", params={"groupBy": "year"})
+        assert resp.status_code == 200
+        assert [(t["year"], t["totalSpent"]) for t in resp.json()["totals"]] == [(2024, 4000.0), (2025, 1500.0)]
+
+    async def test__group_by_account(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals", params={"groupBy": "account"})
+        assert resp.status_code == 200
+        assert [(t["accountName"], t["totalSpent"]) for t in resp.json()["totals"]] == [
+            (self.account_1.upper(), 5000.0),
+            (self.account_2.upper(), 500.0),
+        ]
+
+    async def test__filters_are_applied(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals", params={"groupBy": "account", "year": 2025})
+        assert resp.status_code == 200
+        assert [t["totalSpent"] for t in resp.json()["totals"]] == [1000.0, 500.0]
+
+    async def test__rolling_average(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals", params={"groupBy": "year", "rollingWindow": 2})
+        assert resp.status_code == 200
+        assert [t["rollingAverageSpent"] for t in resp.json()["totals"]] == [4000.0, 2750.0]
+
+    async def test__invalid_group_by_returns_422(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals", params={"groupBy": "week"})
+        assert resp.status_code == 422
+
+    async def test__rolling_window_below_minimum_returns_422(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/totals", params={"rollingWindow": 1})
+        assert resp.status_code == 422
+
+    async def test__summary_returns_every_grouping(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/summary")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"]["totalSpent"] == 5500.0
+        assert data["total"]["entryCount"] == 3
+        assert [(t["year"], t["totalSpent"]) for t in data["byYear"]] == [(2024, 4000.0), (2025, 1500.0)]
+        assert [(t["year"], t["month"]) for t in data["byMonth"]] == [(2024, 3), (2025, 3)]
+        assert [t["totalSpent"] for t in data["byAccount"]] == [5000.0, 500.0]
+
+    async def test__summary_filters_are_applied(self, client: AsyncClient):
+        resp = await client.get(f"{BASE_URL}/summary", params={"accountName": self.account_2.upper()})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"]["totalSpent"] == 500.0
+        assert [t["accountName"] for t in data["byAccount"]] == [self.account_2.upper()]
+
+
 # GET /v1/spending_account/{id}/list
 
 
@@ -14,13 +14,20 @@ They exercise every scenario the simulation engine must handle:
      scheduled EMI is auto-applied (same as the "no transactions" path)
   8. REVALUE after missed payments — correctly absorbs the extra accrued interest
   9. Real-world personal loan walkthrough (₹12L, 11.95%, 3 REPAYs, 1 REVALUE)
+ 10. Month-indexed schedule — array-backed snapshots with "YYYY-MM" access at the edge
 """
 
 from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
 from app.entities.models.liability import LiabilityTransaction, LiabilityTransactionType
-from app.use_cases.liability import _simulate_amortization, calculate_current_outstanding
+from app.use_cases.liability import (
+    AmortizationSchedule,
+    _first_payment_month,
+    _month_index,
+    _simulate_amortization,
+    calculate_current_outstanding,
+)
 
 # Helpers
 
@@ -687,3 +694,71 @@ class TestPaidOffSkipRevival:
         assert snaps["2024-03"][0] > 0.0
         assert abs(snaps["2024-03"][0] - 10_000.0) < 100.0
 
+
+
+# Scenario 10: Month-indexed schedule
+
+
+class TestAmortizationSchedule:
+    """Verify the array-backed schedule returned by the simulation engine."""
+
+    def test_month_index_addressing_matches_keys(self):
+        principal = 500_000.0
+        txs = [_make_tx(BORROW, principal, 2023, 11)]
+        up_to = datetime(2024, 2, 1, tzinfo=UTC)
+
+        snaps = _simulate_amortization(principal, 12.0, 15_000.0, txs, up_to)
+
+        assert isinstance(snaps, AmortizationSchedule)
+        assert list(snaps) == ["2023-11", "2023-12", "2024-01", "2024-02"]
+        assert snaps.start_index == _month_index(datetime(2023, 11, 1, tzinfo=UTC))
+        assert snaps.end_index == _month_index(up_to)
+        assert snaps.at(snaps.start_index + 2) == snaps["2024-01"]
+        assert snaps.at(snaps.end_index + 1) is None
+
+    def test_latest_is_last_simulated_month(self):
+        principal = 300_000.0
+        txs = [_make_tx(BORROW, principal, 2024, 1)]
+        up_to = datetime(2024, 12, 1, tzinfo=UTC)
+
+        snaps = _simulate_amortization(principal, 10.0, 10_000.0, txs, up_to)
+
+        assert snaps.latest() == snaps["2024-12"]
+        assert snaps.latest() == snaps[sorted(snaps.keys())[-1]]
+
+    def test_empty_schedule_without_borrow(self):
+        txs = [_make_tx(REPAY, 1_000.0, 2024, 1)]
+
+        snaps = _simulate_amortization(0.0, 12.0, 1_000.0, txs, datetime(2024, 6, 1, tzinfo=UTC))
+
+        assert not snaps
+        assert snaps.latest() is None
+        assert snaps.get("2024-01") is None
+
+    def test_malformed_keys_are_missing(self):
+        txs = [_make_tx(BORROW, 10_000.0, 2024, 1)]
+
+        snaps = _simulate_amortization(10_000.0, 12.0, 1_000.0, txs, datetime(2024, 3, 1, tzinfo=UTC))
+
+        assert "2024-13" not in snaps
+        assert "garbage" not in snaps
+        assert snaps.get("2024-1") == snaps["2024-01"]
+
+
+class TestFirstPaymentMonth:
+    """Verify the month offset from which scheduled EMI applies."""
+
+    def test_no_emi_start_date(self):
+        assert _first_payment_month(datetime(2024, 1, 15, tzinfo=UTC), None) == 0
+
+    def test_emi_start_before_disbursal(self):
+        assert _first_payment_month(datetime(2024, 5, 15, tzinfo=UTC), datetime(2024, 1, 1, tzinfo=UTC)) == 0
+
+    def test_emi_start_day_on_or_before_monthly_anniversary(self):
+        start = datetime(2024, 1, 15, tzinfo=UTC)
+        assert _first_payment_month(start, datetime(2024, 3, 15, tzinfo=UTC)) == 2
+        assert _first_payment_month(start, datetime(2024, 3, 10, tzinfo=UTC)) == 2
+
+    def test_emi_start_day_after_monthly_anniversary(self):
+        start = datetime(2024, 1, 15, tzinfo=UTC)
+        assert _first_payment_month(start, datetime(2024, 3, 20, tzinfo=UTC)) == 3
@@ -15,6 +15,7 @@ from app.entities.models.spending_entry import (
     SpendingEntryFilter,
     SpendingEntrySort,
     SpendingEntrySortField,
+    SpendingTotalsGroupBy,
 )
 from app.use_cases.account import AccountService
 from app.use_cases.errors.account import (
@@ -973,6 +974,158 @@ class TestSpendingEntrySortingAndFiltering:
         assert len(results.spending_entries) == 3
 
 
+class TestSpendingTotals:
+    """Test server-side spending aggregations."""
+
+    async def _seed_totals(self, spending_account_service):
+        """Create entries with known total spent: ALPHA 100/200 in 2024 and 300 in 2025, BETA 50 in 2024."""
+        await delete_all_entries(spending_account_service)
+        await add_account(spending_account_service, account_name="TOTALS_ALPHA")
+        await add_account(spending_account_service, account_name="TOTALS_BETA")
+        for account_name, month, year, spent, credit in [
+            ("TOTALS_ALPHA", 1, 2024, 100.0, 10.0),
+            ("TOTALS_ALPHA", 2, 2024, 200.0, 20.0),
+            ("TOTALS_ALPHA", 1, 2025, 300.0, 30.0),
+            ("TOTALS_BETA", 1, 2024, 50.0, 5.0),
+        ]:
+            entry_data = get_entry_data(
+                account_name=account_name,
+                month=month,
+                year=year,
+                starting_balance=1000.0,
+                current_balance=1000.0 - spent + credit,
+                current_credit=credit,
+            )
+            await add_entry(spending_account_service, entry_data)
+
+    async def test__get_spending_totals__by_month(
+        self,
+        spending_account_service,
+    ):
+        """Test totals grouped by month are ordered chronologically and sum across accounts."""
+        await self._seed_totals(spending_account_service)
+
+        totals = await spending_account_service.get_spending_totals(group_by=SpendingTotalsGroupBy.MONTH)
+
+        assert [(t.year, t.month) for t in totals] == [(2024, 1), (2024, 2), (2025, 1)]
+        assert [t.total_spent for t in totals] == pytest.approx([150.0, 200.0, 300.0])
+        assert [t.total_credit for t in totals] == pytest.approx([15.0, 20.0, 30.0])
+        assert [t.entry_count for t in totals] == [2, 1, 1]
+        assert all(t.account_name is None and t.rolling_average_spent is None for t in totals)
+
+    async def test__get_spending_totals__by_year(
+        self,
+        spending_account_service,
+    ):
+        """Test totals grouped by year."""
+        await self._seed_totals(spending_account_service)
+
+        totals = await spending_account_service.get_spending_totals(group_by=SpendingTotalsGroupBy.YEAR)
+
+        assert [(t.year, t.month) for t in totals] == [(2024, None), (2025, None)]
+        assert [t.total_spent for t in totals] == pytest.approx([350.0, 300.0])
+        assert [t.entry_count for t in totals] == [3, 1]
+
+    async def test__get_spending_totals__by_account_with_filters(
+        self,
+        spending_account_service,
+    ):
+        """Test totals grouped by account honour the entry filters."""
+        await self._seed_totals(spending_account_service)
+
+        totals = await spending_account_service.get_spending_totals(
+            group_by=SpendingTotalsGroupBy.ACCOUNT, filters=SpendingEntryFilter(year=2024)
+        )
+
+        assert [t.account_name for t in totals] == ["TOTALS_ALPHA", "TOTALS_BETA"]
+        assert [t.total_spent for t in totals] == pytest.approx([300.0, 50.0])
+        assert all(t.year is None and t.month is None for t in totals)
+
+    async def test__get_spending_totals__rolling_average(
+        self,
+        spending_account_service,
+    ):
+        """Test the rolling average covers the trailing window of months."""
+        await self._seed_totals(spending_account_service)
+
+        totals = await spending_account_service.get_spending_totals(
+            group_by=SpendingTotalsGroupBy.MONTH, rolling_window=2
+        )
+
+        assert [t.rolling_average_spent for t in totals] == pytest.approx([150.0, 175.0, 250.0])
+
+    async def test__get_spending_totals__rolling_average_ignored_for_account(
+        self,
+        spending_account_service,
+    ):
+        """Test the rolling average is not computed for the non-chronological account grouping."""
+        await self._seed_totals(spending_account_service)
+
+        totals = await spending_account_service.get_spending_totals(
+            group_by=SpendingTotalsGroupBy.ACCOUNT, rolling_window=2
+        )
+
+        assert all(t.rolling_average_spent is None for t in totals)
+
+    async def test__get_spending_totals__empty(
+        self,
+        spending_account_service,
+    ):
+        """Test totals are empty when there are no entries."""
+        await delete_all_entries(spending_account_service)
+
+        totals = await spending_account_service.get_spending_totals(group_by=SpendingTotalsGroupBy.MONTH)
+
+        assert totals == []
+
+    async def test__get_spending_summary__success(
+        self,
+        spending_account_service,
+    ):
+        """Test the summary returns every grouping from a single query."""
+        await self._seed_totals(spending_account_service)
+
+        summary = await spending_account_service.get_spending_summary()
+
+        assert summary.total.total_spent == pytest.approx(650.0)
+        assert summary.total.total_credit == pytest.approx(65.0)
+        assert summary.total.entry_count == 4
+        assert [(t.year, t.total_spent) for t in summary.by_year] == [(2024, 350.0), (2025, 300.0)]
+        assert [(t.year, t.month) for t in summary.by_month] == [(2024, 1), (2024, 2), (2025, 1)]
+        assert [(t.account_name, t.total_spent) for t in summary.by_account] == [
+            ("TOTALS_ALPHA", 600.0),
+            ("TOTALS_BETA", 50.0),
+        ]
+
+    async def test__get_spending_summary__with_filters(
+        self,
+        spending_account_service,
+    ):
+        """Test the summary honours the entry filters."""
+        await self._seed_totals(spending_account_service)
+
+        summary = await spending_account_service.get_spending_summary(
+            filters=SpendingEntryFilter(account_name="TOTALS_BETA")
+        )
+
+        assert summary.total.total_spent == pytest.approx(50.0)
+        assert [t.year for t in summary.by_year] == [2024]
+        assert [t.account_name for t in summary.by_account] == ["TOTALS_BETA"]
+
+    async def test__get_spending_summary__empty(
+        self,
+        spending_account_service,
+    ):
+        """Test the summary of no entries is all zeros."""
+        await delete_all_entries(spending_account_service)
+
+        summary = await spending_account_service.get_spending_summary()
+
+        assert summary.total.total_spent == 0
+        assert summary.total.entry_count == 0
+        assert summary.by_year == summary.by_month == summary.by_account == []
+
+
 class TestEditSpendingAccountEntry:
     async def test__edit_entry__success(
         self,
@@ -8,6 +8,13 @@ from fastapi.responses import JSONResponse
 from jose import JWTError, jwt
 from starlette.middleware.base import BaseHTTPMiddleware
 
+DEFAULT_EXCLUDE_PATHS = [
+    r"^/health$",
+    r"^/openapi\.json$",
+    r"^/docs$",
+    r"^/redoc$",
+]
+
 
 class JWTAuthMiddleware(BaseHTTPMiddleware):
     """Middleware to validate JWT tokens on protected routes."""
@@ -15,12 +22,7 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, exclude_paths: list[str] | None = None, secret_key: str | None = None):
         """Initialize middleware with optional paths to exclude and a JWT secret."""
         super().__init__(app)
-        self.exclude_paths = exclude_paths or [
-            r"^/health$",
-            r"^/openapi\.json$",
-            r"^/docs$",
-            r"^/redoc$"
-        ]
+        self.exclude_paths = exclude_paths or DEFAULT_EXCLUDE_PATHS
         self.secret_key = secret_key or os.getenv("JWT_SECRET")
 
     def _get_error_response(self, status_code: int, detail: str, request: Request) -> JSONResponse:
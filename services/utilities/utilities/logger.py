@@ -1,30 +1,157 @@
-"""App level logger utility."""
+"""App level logger utility.
 
+Loggers hand records to a `QueueHandler`; a background `QueueListener` thread formats them and does the console and
+file I/O, so a log call on the request path costs rendering its message and a queue put instead of a synchronous disk
+write. Messages are capped at `LOG_MAX_MESSAGE_CHARS` characters, and `preview()` renders large payloads (embedding
+vectors, document lists) size-capped, and only if the record is actually emitted.
+"""
+
+import atexit
 import logging
 import os
-from typing import ClassVar
+import queue
+import reprlib
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, ClassVar
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_DEFAULT_MAX_MESSAGE_CHARS = 4000
+
+
+def _to_level(level: int | str) -> int:
+    """Convert a level name such as `"DEBUG"` (as read from the environment) to its numeric value."""
+    if isinstance(level, int):
+        return level
+    if level.isdigit():
+        return int(level)
+    return logging.getLevelNamesMapping()[level.upper()]
+
+
+class _PayloadRepr(reprlib.Repr):
+    """`reprlib.Repr` that only renders the first few items of long sequences and caps long strings."""
+
+    def __init__(self):
+        super().__init__(maxlevel=3, maxlist=8, maxtuple=8, maxdict=8, maxset=8, maxstring=200, maxother=200)
+
+
+_payload_repr = _PayloadRepr()
+
+
+class _Preview:
+    """Lazily rendered, size-capped view of a log payload."""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: Any):
+        self._payload = payload
+
+    def __str__(self) -> str:
+        rendered = _payload_repr.repr(self._payload)
+        if isinstance(self._payload, list | tuple | set | dict):
+            rendered = f"{rendered} ({len(self._payload)} items)"
+        return rendered
+
+    __repr__ = __str__
+
+
+def preview(payload: Any) -> _Preview:
+    """Wrap a log payload so it is rendered lazily and size-capped.
+
+    Rendering happens only when the record is emitted, and walks at most a few items of each sequence, so logging
+    an embedding matrix or a list of documents stays cheap even at DEBUG level.
+
+    Args:
+        payload (Any): The object to render, e.g. a vector, a list of vectors or a list of documents.
+
+    Returns:
+        _Preview: An object whose `str()` is the capped rendering, with the full length of sized containers.
+
+    Examples:
+        >>> from utilities.logger import preview
+        >>> str(preview([0.125] * 1024))
+        '[0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, ...] (1024 items)'
+    """
+    return _Preview(payload)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """Queue handler that renders the message on the calling thread and caps its length.
+
+    Arguments are rendered before the record is enqueued, as `QueueHandler` does, since the caller may mutate them
+    right after the call; `preview()` keeps rendering large payloads cheap. Formatting (timestamp, exception
+    traceback) and the I/O are left to the listener thread. The queue never leaves the process, so records are not
+    otherwise made picklable.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, max_message_chars: int):
+        super().__init__(log_queue)
+        self._max_message_chars = max_message_chars
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        try:
+            message = record.getMessage()
+        except (TypeError, ValueError) as err:
+            # A malformed call must not raise from the logging call
+            message = f"{record.msg!r} % {record.args!r} (log formatting failed: {err!r})"
+        if len(message) > self._max_message_chars:
+            omitted = len(message) - self._max_message_chars
+            message = f"{message[: self._max_message_chars]}... [{omitted} chars truncated]"
+        record.msg, record.args = message, None
+        return record
+
+
+class _LogPipeline:
+    """One background writer (console + file) shared by every logger writing to the same file."""
+
+    def __init__(self, log_file_path: str, console_log_level: int, file_log_level: int):
+        formatter = logging.Formatter(_LOG_FORMAT)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(console_log_level)
+        console_handler.setFormatter(formatter)
+
+        file_handler = logging.FileHandler(log_file_path, encoding="utf-8", delay=True)
+        file_handler.setLevel(file_log_level)
+        file_handler.setFormatter(formatter)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handler = _InProcessQueueHandler(
+            log_queue,
+            max_message_chars=int(os.getenv("LOG_MAX_MESSAGE_CHARS", str(_DEFAULT_MAX_MESSAGE_CHARS))),
+        )
+        self.level = min(console_log_level, file_log_level)
+        self.listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        self.listener.start()
+
 
 class GetAppLogger:
     """Get Application Logger to manage logging.
 
     App logger precedence:
     1. Retrieve logger name from environment variable `APP_NAME`. Return singleton instance of app logger.
-    2. If `APP_NAME` is not set, use the provided `fallback_name` parameter to create a new logger instance.
-       2.1. If `fallback_name` is not provided, default to "default" as the logger name and return a new instance.
+    2. If `APP_NAME` is not set, use the provided `fallback_name` parameter to get a logger of that name.
+       2.1. If `fallback_name` is not provided, default to "default" as the logger name.
+
+    Loggers are configured once per name and cached, so instantiating `GetAppLogger` on a hot path is a dictionary
+    lookup. Records below both the console and the file level are dropped before any formatting.
     """
 
     APP_LOGGER_INSTANCE: ClassVar[logging.Logger | None] = None
 
+    _loggers: ClassVar[dict[str, logging.Logger]] = {}
+    _pipelines: ClassVar[dict[tuple[str, int, int], _LogPipeline]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         fallback_name: str = "default",
         console_log_level: int = logging.INFO,
-        file_log_level: int = logging.DEBUG,
+        file_log_level: int = logging.INFO,
         log_file_path: str = "app.log",
     ):
         """Initialize the GetAppLogger instance.
@@ -37,7 +164,7 @@ class GetAppLogger:
             fallback_name (str): Fallback name for the logger if `APP_NAME` is not set. Defaults to "default".
             console_log_level (int): Log level for console output. Defaults to logging.INFO. Precedence is given to the
                                      `CONSOLE_LOG_LEVEL` environment variable if set.
-            file_log_level (int): Log level for file output. Defaults to logging.DEBUG. Precedence is given to the
+            file_log_level (int): Log level for file output. Defaults to logging.INFO. Precedence is given to the
                                   `FILE_LOG_LEVEL` environment variable if set.
             log_file_path (str): Path to the log file. Defaults to 'app.log'. When `APP_NAME` is set, it will be
                                  overridden to `<APP_NAME>.log`.
@@ -61,67 +188,69 @@ class GetAppLogger:
             >>> bella_logger.info("This is an info message from bella.")
             2025-10-04 21:40:45,939 - bella - INFO - This is an info message from bella.
         """
-        self._logger = None
-        self._name = os.getenv("APP_NAME", fallback_name)
-        self._console_log_level = os.getenv("CONSOLE_LOG_LEVEL", console_log_level)
-        self._file_log_level = os.getenv("FILE_LOG_LEVEL", file_log_level)
-        if os.getenv("APP_NAME", None) is not None:
-            self._log_file_path = f"{self._name}.log"
-        else:
-            self._log_file_path = log_file_path
-
-        # Default Settings
-        self._DEFAULT_ROOT_LOG_LEVEL = logging.DEBUG
-        self._LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-        # Initialize logger based on APP_NAME presence
-        # If APP_NAME is set, return singleton instance
-        if os.getenv("APP_NAME", None) is not None:
-            # Singleton pattern: Only one instance of the app logger
-            if GetAppLogger.APP_LOGGER_INSTANCE is None:
-                GetAppLogger.APP_LOGGER_INSTANCE = self._get_logger()
+        app_name = os.getenv("APP_NAME", None)
+        if app_name is not None and GetAppLogger.APP_LOGGER_INSTANCE is not None:
             self._logger = GetAppLogger.APP_LOGGER_INSTANCE
-        else:
-            # If APP_NAME is not set, create a new logger instance with the provided fallback_name
-            self._logger = self._get_logger()
-
-    def _configure_logger(self):
-        """Configure the logger settings."""
-        self._logger = logging.getLogger(self._name)
-        self._logger.setLevel(self._DEFAULT_ROOT_LOG_LEVEL)
-        # Prevent log records from bubbling up to the root logger (avoids
-        # duplicate output when uvicorn/gunicorn also attaches a root handler).
-        self._logger.propagate = False
-
-        # Create formatter and add it to the handlers
-        formatter = logging.Formatter(self._LOG_FORMAT)
-
-        # Remove existing handlers to avoid duplicate logs (iterate over a
-        # copy so that removing items does not skip any entries).
-        for handler in self._logger.handlers[:]:
-            self._logger.removeHandler(handler)
-
-        # Create console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(self._console_log_level)
-        console_handler.setFormatter(formatter)
-        self._logger.addHandler(console_handler)
+            return
 
-        # Create file handler
-        file_handler = logging.FileHandler(self._log_file_path, encoding="utf-8")
-        file_handler.setLevel(self._file_log_level)
-        file_handler.setFormatter(formatter)
-        self._logger.addHandler(file_handler)
+        self._name = app_name or fallback_name
+        cached = GetAppLogger._loggers.get(self._name)
+        if cached is None:
+            cached = self._configure_logger(
+                console_log_level=_to_level(os.getenv("CONSOLE_LOG_LEVEL", console_log_level)),
+                file_log_level=_to_level(os.getenv("FILE_LOG_LEVEL", file_log_level)),
+                log_file_path=f"{app_name}.log" if app_name is not None else log_file_path,
+            )
+        self._logger = cached
 
-    def _get_logger(self):
-        """Get the configured logger instance."""
-        self._configure_logger()
-        return self._logger
+        # Singleton pattern: Only one instance of the app logger
+        if app_name is not None:
+            GetAppLogger.APP_LOGGER_INSTANCE = self._logger
+
+    def _configure_logger(self, console_log_level: int, file_log_level: int, log_file_path: str) -> logging.Logger:
+        """Attach the logger to the background writer of its log file, once per logger name."""
+        with GetAppLogger._lock:
+            if self._name in GetAppLogger._loggers:
+                return GetAppLogger._loggers[self._name]
+
+            pipeline_key = (os.path.abspath(log_file_path), console_log_level, file_log_level)
+            pipeline = GetAppLogger._pipelines.get(pipeline_key)
+            if pipeline is None:
+                pipeline = _LogPipeline(log_file_path, console_log_level, file_log_level)
+                GetAppLogger._pipelines[pipeline_key] = pipeline
+
+            logger = logging.getLogger(self._name)
+            logger.setLevel(pipeline.level)
+            # Prevent log records from bubbling up to the root logger (avoids
+            # duplicate output when uvicorn/gunicorn also attaches a root handler).
+            logger.propagate = False
+
+            # Remove existing handlers to avoid duplicate logs (iterate over a
+            # copy so that removing items does not skip any entries).
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+            logger.addHandler(pipeline.handler)
+
+            GetAppLogger._loggers[self._name] = logger
+            return logger
 
     def get_logger(self):
         """Return the logger instance."""
         return self._logger
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush queued records and stop the background writers. Registered to run at interpreter exit."""
+        with cls._lock:
+            for pipeline in cls._pipelines.values():
+                pipeline.listener.stop()
+            cls._pipelines.clear()
+            cls._loggers.clear()
+            cls.APP_LOGGER_INSTANCE = None
+
+
+atexit.register(GetAppLogger.shutdown)
+
 
 if __name__ == "__main__":
     # Example usage
@@ -132,7 +261,7 @@ if __name__ == "__main__":
         os.environ["CONSOLE_LOG_LEVEL"] = "INFO"
         os.environ["FILE_LOG_LEVEL"] = "DEBUG"
     else:
-        os.environ.pop("APP_NAME")
+        os.environ.pop("APP_NAME", None)
 
     logger1 = GetAppLogger(fallback_name="logger1").get_logger()
     logger1.debug("This is a debug message from logger1.")
@@ -144,4 +273,4 @@ if __name__ == "__main__":
 
     logger3 = GetAppLogger().get_logger()
     logger3.debug("This is a debug message from logger3.")
-    logger3.info("This is an info message from logger3.")
+    logger3.info("This is an info message from logger3: %s", preview(list(range(1000))))
@@ -0,0 +1,290 @@
+"""Request-level profiling and query-count instrumentation for Bella Keys services.
+
+Collects, per route template, the wall time of each request together with the time spent in the
+database, the number of SQL statements executed and the number of rows they returned. The numbers
+are surfaced in two places:
+
+  1. A `Server-Timing` response header on every request, readable from browser dev tools.
+  2. A Prometheus text exposition rendered by `RequestMetricsRegistry.render_prometheus()`, which
+     services serve from a `/metrics` endpoint.
+
+Database statistics are gathered through SQLAlchemy `before_cursor_execute`/`after_cursor_execute`
+engine events (see `instrument_sqlalchemy_engine`) and attributed to the request running in the
+current context via a `ContextVar`.
+
+An optional sampling profiler (pyinstrument when installed, cProfile otherwise) can be enabled for a
+single request by sending the `X-Profile-Request` header.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from utilities.logger import GetAppLogger
+
+PROFILE_REQUEST_HEADER = "X-Profile-Request"
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class RequestStats:
+    """Database statistics accumulated while serving a single request."""
+
+    db_time: float = 0.0
+    query_count: int = 0
+    rows_fetched: int = 0
+
+
+@dataclass
+class RouteMetrics:
+    """Aggregated metrics for a single (method, route) pair."""
+
+    request_count: int = 0
+    wall_time_sum: float = 0.0
+    wall_time_max: float = 0.0
+    db_time_sum: float = 0.0
+    query_count_sum: int = 0
+    rows_fetched_sum: int = 0
+    status_counts: dict[int, int] = field(default_factory=dict)
+
+
+_current_request_stats: ContextVar[RequestStats | None] = ContextVar("current_request_stats", default=None)
+
+
+class RequestMetricsRegistry:
+    """In-process registry of per-route request metrics."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+
+    def record(self, method: str, route: str, status_code: int, wall_time: float, stats: RequestStats) -> None:
+        """Record the outcome of a single request."""
+        with self._lock:
+            metrics = self._routes.setdefault((method, route), RouteMetrics())
+            metrics.request_count += 1
+            metrics.wall_time_sum += wall_time
+            metrics.wall_time_max = max(metrics.wall_time_max, wall_time)
+            metrics.db_time_sum += stats.db_time
+            metrics.query_count_sum += stats.query_count
+            metrics.rows_fetched_sum += stats.rows_fetched
+            metrics.status_counts[status_code] = metrics.status_counts.get(status_code, 0) + 1
+
+    def snapshot(self) -> dict[tuple[str, str], RouteMetrics]:
+        """Return a copy of the current per-route metrics."""
+        with self._lock:
+            return {
+                key: RouteMetrics(
+                    request_count=m.request_count,
+                    wall_time_sum=m.wall_time_sum,
+                    wall_time_max=m.wall_time_max,
+                    db_time_sum=m.db_time_sum,
+                    query_count_sum=m.query_count_sum,
+                    rows_fetched_sum=m.rows_fetched_sum,
+                    status_counts=dict(m.status_counts),
+                )
+                for key, m in self._routes.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._routes.clear()
+
+    def render_prometheus(self) -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: list[str] = []
+
+        def _labels(method: str, route: str, **extra: str) -> str:
+            pairs = {"method": method, "route": route, **extra}
+            rendered = ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs.items())
+            return "{" + rendered + "}"
+
+        lines.append("# HELP http_requests_total Total HTTP requests by route and status code.")
+        lines.append("# TYPE http_requests_total counter")
+        for (method, route), m in sorted(snapshot.items()):
+            for status_code, count in sorted(m.status_counts.items()):
+                lines.append(f"http_requests_total{_labels(method, route, status=str(status_code))} {count}")
+
+        lines.append("# HELP http_request_duration_seconds Wall time spent serving requests.")
+        lines.append("# TYPE http_request_duration_seconds summary")
+        for (method, route), m in sorted(snapshot.items()):
+            lines.append(f"http_request_duration_seconds_sum{_labels(method, route)} {m.wall_time_sum:.6f}")
+            lines.append(f"http_request_duration_seconds_count{_labels(method, route)} {m.request_count}")
+
+        lines.append("# HELP http_request_duration_seconds_max Slowest request observed per route.")
+        lines.append("# TYPE http_request_duration_seconds_max gauge")
+        for (method, route), m in sorted(snapshot.items()):
+            lines.append(f"http_request_duration_seconds_max{_labels(method, route)} {m.wall_time_max:.6f}")
+
+        lines.append("# HELP http_request_db_duration_seconds_total Time spent executing SQL statements.")
+        lines.append("# TYPE http_request_db_duration_seconds_total counter")
+        for (method, route), m in sorted(snapshot.items()):
+            lines.append(f"http_request_db_duration_seconds_total{_labels(method, route)} {m.db_time_sum:.6f}")
+
+        lines.append("# HELP http_request_db_queries_total SQL statements executed.")
+        lines.append("# TYPE http_request_db_queries_total counter")
+        for (method, route), m in sorted(snapshot.items()):
+            lines.append(f"http_request_db_queries_total{_labels(method, route)} {m.query_count_sum}")
+
+        lines.append("# HELP http_request_db_rows_fetched_total Rows returned by SQL statements.")
+        lines.append("# TYPE http_request_db_rows_fetched_total counter")
+        for (method, route), m in sorted(snapshot.items()):
+            lines.append(f"http_request_db_rows_fetched_total{_labels(method, route)} {m.rows_fetched_sum}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+request_metrics_registry = RequestMetricsRegistry()
+
+
+def instrument_sqlalchemy_engine(engine) -> None:
+    """Attach cursor execution listeners that attribute SQL statistics to the current request.
+
+    Accepts either a synchronous `Engine` or an `AsyncEngine`; for the latter, the listeners are
+    registered on the underlying `sync_engine`. Statements executed outside of a request served by
+    `RequestMetricsMiddleware` are ignored.
+
+    Args:
+        engine: The SQLAlchemy engine to instrument.
+    """
+    # Imported here: sqlalchemy is optional for consumers of utilities
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("request_metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start_stack = conn.info.get("request_metrics_query_start")
+        if not start_stack:
+            return
+        elapsed = time.perf_counter() - start_stack.pop()
+
+        stats = _current_request_stats.get()
+        if stats is None:
+            return
+        stats.db_time += elapsed
+        stats.query_count += 1
+        # Only count rows for statements that return a result set; rowcount is -1 when unknown.
+        if cursor.description is not None and cursor.rowcount > 0:
+            stats.rows_fetched += cursor.rowcount
+
+
+class _RequestProfiler:
+    """Wrap pyinstrument when available, falling back to cProfile."""
+
+    _active_lock = threading.Lock()
+
+    def __init__(self):
+        """Select the profiling backend."""
+        try:
+            from pyinstrument import Profiler  # type: ignore[import-not-found]
+
+            self._profiler = Profiler(async_mode="enabled")
+            self._backend = "pyinstrument"
+        except ImportError:
+            self._profiler = cProfile.Profile()
+            self._backend = "cProfile"
+
+    def start(self) -> bool:
+        """Start profiling. Returns False when another request is already being profiled."""
+        # Only one interpreter-wide profiler can be active at a time.
+        if not _RequestProfiler._active_lock.acquire(blocking=False):
+            return False
+        if self._backend == "pyinstrument":
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+        return True
+
+    def stop(self) -> str:
+        """Stop profiling and return a text report."""
+        try:
+            if self._backend == "pyinstrument":
+                self._profiler.stop()
+                return self._profiler.output_text(unicode=True, color=False)
+            self._profiler.disable()
+            buffer = io.StringIO()
+            pstats.Stats(self._profiler, stream=buffer).sort_stats("cumulative").print_stats(40)
+            return buffer.getvalue()
+        finally:
+            _RequestProfiler._active_lock.release()
+
+
+class RequestMetricsMiddleware(BaseHTTPMiddleware):
+    """Middleware recording wall time and database statistics for every request."""
+
+    def __init__(
+        self,
+        app,
+        registry: RequestMetricsRegistry | None = None,
+        enable_profiler: bool = False,
+        exclude_paths: list[str] | None = None,
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: The ASGI application.
+            registry: Registry to record metrics into. Defaults to the module-level registry.
+            enable_profiler: Honour the `X-Profile-Request` header. Keep disabled in production.
+            exclude_paths: Exact paths that should not be recorded (e.g. the metrics endpoint itself).
+        """
+        super().__init__(app)
+        self.registry = registry or request_metrics_registry
+        self.enable_profiler = enable_profiler
+        self.exclude_paths = set(exclude_paths or ["/metrics"])
+        self.logger = GetAppLogger(fallback_name="RequestMetrics").get_logger()
+
+    async def dispatch(self, request: Request, call_next):
+        """Time the request and attach a Server-Timing header to the response."""
+        if request.url.path in self.exclude_paths:
+            return await call_next(request)
+
+        stats = RequestStats()
+        token = _current_request_stats.set(stats)
+
+        profiler = None
+        if self.enable_profiler and request.headers.get(PROFILE_REQUEST_HEADER):
+            profiler = _RequestProfiler()
+            if not profiler.start():
+                self.logger.warning("Skipping profile for %s: another request is being profiled", request.url.path)
+                profiler = None
+
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            wall_time = time.perf_counter() - start
+            _current_request_stats.reset(token)
+            if profiler is not None:
+                report = profiler.stop()
+                self.logger.info("Profile for %s %s:\n%s", request.method, request.url.path, report)
+
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", UNMATCHED_ROUTE)
+        self.registry.record(request.method, route_path, response.status_code, wall_time, stats)
+
+        response.headers.append(
+            "Server-Timing",
+            f'app;dur={wall_time * 1000:.2f}, db;dur={stats.db_time * 1000:.2f};desc="{stats.query_count} queries, '
+            f'{stats.rows_fetched} rows"',
+        )
+        return response
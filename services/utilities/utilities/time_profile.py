@@ -16,7 +16,7 @@ def log_exec_time(func):
         result = func(*args, **kwargs)
         end_time = time.perf_counter()
         execution_time = end_time - start_time
-        logger.debug(f"Execution time for {func.__name__}: {execution_time:.2f} seconds")
+        logger.debug("Execution time for %s: %.2f seconds", func.__name__, execution_time)
         return result
 
     return wrapper
@@ -32,7 +32,7 @@ def async_log_exec_time(func):
         result = await func(*args, **kwargs)
         end_time = time.perf_counter()
         execution_time = end_time - start_time
-        logger.debug(f"Execution time for {func.__name__}: {execution_time:.2f} seconds")
+        logger.debug("Execution time for %s: %.2f seconds", func.__name__, execution_time)
         return result
 
     return wrapper